@@ -0,0 +1,447 @@
+"""Accounting of the AWS API calls made by Runway.
+
+When enabled (e.g. with the ``--api-stats`` option), calls made by clients of
+sessions from :func:`runway.cfngin.session_cache.get_session` are counted
+per service, operation, and region along with their latency, retries, and
+throttled responses.
+
+Stats of forked processes (e.g. modules or deployments run in parallel) are
+written to a temporary directory when the process exits and merged into the
+stats of the main process when accounting is stopped.
+
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import multiprocessing.util
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import boto3
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+#: Upper bound (in milliseconds) of each latency histogram bucket.
+#: Calls that take longer are counted in an additional bucket.
+LATENCY_BUCKETS: Tuple[int, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+#: Error codes of throttled responses (same as botocore's standard retry mode).
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "BandwidthLimitExceeded",
+        "EC2ThrottledException",
+        "LimitExceededException",
+        "PriorRequestNotComplete",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "TooManyRequestsException",
+        "TransactionInProgressException",
+    ]
+)
+
+_CONTEXT_KEY = "runway_api_stats"
+
+OperationKey = Tuple[str, str, str]
+
+
+class OperationStats:
+    """Stats of the calls made to one operation in one region."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "histogram",
+        "max_ms",
+        "retries",
+        "throttles",
+        "total_ms",
+    )
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.calls = 0
+        self.errors = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.max_ms = 0.0
+        self.retries = 0
+        self.throttles = 0
+        self.total_ms = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average latency of a call in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add the stats of another process.
+
+        Args:
+            data: Output of :meth:`to_dict`.
+
+        """
+        self.calls += data["calls"]
+        self.errors += data["errors"]
+        self.histogram = [
+            count + other for count, other in zip(self.histogram, data["histogram"])
+        ]
+        self.max_ms = max(self.max_ms, data["max_ms"])
+        self.retries += data["retries"]
+        self.throttles += data["throttles"]
+        self.total_ms += data["total_ms"]
+
+    def percentile(self, percent: float) -> Optional[int]:
+        """Estimate a latency percentile from the histogram.
+
+        Args:
+            percent: Percentile to estimate (e.g. ``95``).
+
+        Returns:
+            Upper bound of the histogram bucket containing the percentile or
+            ``None`` if it is in the last bucket.
+
+        """
+        target = self.calls * percent / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def record(
+        self, latency_ms: float, *, error: bool, retries: int, throttles: int
+    ) -> None:
+        """Record a call.
+
+        Args:
+            latency_ms: Duration of the call, including retries.
+            error: Whether the call failed.
+            retries: Number of times the request was retried.
+            throttles: Number of throttled responses received.
+
+        """
+        self.calls += 1
+        self.errors += int(error)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency_ms)] += 1
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.retries += retries
+        self.throttles += throttles
+        self.total_ms += latency_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict that can be serialized as JSON."""
+        return {
+            "avg_ms": round(self.avg_ms, 3),
+            "calls": self.calls,
+            "errors": self.errors,
+            "histogram": self.histogram,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "total_ms": round(self.total_ms, 3),
+        }
+
+
+class ApiStats:
+    """Thread-safe stats of AWS API calls."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self._lock = threading.Lock()
+        self.operations: Dict[OperationKey, OperationStats] = {}
+
+    def __iter__(self) -> Iterator[Tuple[OperationKey, OperationStats]]:
+        """Iterate over operations, those with the most calls first."""
+        with self._lock:
+            items = list(self.operations.items())
+        return iter(sorted(items, key=lambda item: (-item[1].calls, item[0])))
+
+    @property
+    def total(self) -> OperationStats:
+        """Stats of all operations combined."""
+        total = OperationStats()
+        for _, stats in self:
+            total.merge(stats.to_dict())
+        return total
+
+    def clear(self) -> None:
+        """Remove all stats."""
+        with self._lock:
+            self.operations.clear()
+
+    def format_table(self) -> str:
+        """Format the stats as a table."""
+        header = (
+            "SERVICE",
+            "OPERATION",
+            "REGION",
+            "CALLS",
+            "ERRORS",
+            "RETRIES",
+            "THROTTLES",
+            "AVG MS",
+            "P95 MS",
+            "MAX MS",
+        )
+        rows = [header] + [self._format_row(key, stats) for key, stats in self]
+        rows.append(self._format_row(("TOTAL", "", ""), self.total))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if i < 3 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add the stats of another process.
+
+        Args:
+            data: Output of :meth:`to_dict`.
+
+        """
+        with self._lock:
+            for entry in data["operations"]:
+                key = (entry["service"], entry["operation"], entry["region"])
+                self.operations.setdefault(key, OperationStats()).merge(entry)
+
+    def record(
+        self,
+        service: str,
+        operation: str,
+        region: str,
+        latency_ms: float,
+        *,
+        error: bool = False,
+        retries: int = 0,
+        throttles: int = 0,
+    ) -> None:
+        """Record a call.
+
+        Args:
+            service: Name of the service.
+            operation: Name of the operation.
+            region: Region the call was made to.
+            latency_ms: Duration of the call, including retries.
+            error: Whether the call failed.
+            retries: Number of times the request was retried.
+            throttles: Number of throttled responses received.
+
+        """
+        with self._lock:
+            stats = self.operations.get((service, operation, region))
+            if stats is None:
+                stats = self.operations[(service, operation, region)] = OperationStats()
+            stats.record(latency_ms, error=error, retries=retries, throttles=throttles)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict that can be serialized as JSON."""
+        return {
+            "latency_buckets_ms": list(LATENCY_BUCKETS),
+            "operations": [
+                {
+                    "operation": operation,
+                    "region": region,
+                    "service": service,
+                    **stats.to_dict(),
+                }
+                for (service, operation, region), stats in self
+            ],
+            "total": self.total.to_dict(),
+        }
+
+    def write_json(self, path: Union[Path, str]) -> None:
+        """Write the stats to a JSON file.
+
+        Args:
+            path: Path to the file.
+
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    @staticmethod
+    def _format_row(key: OperationKey, stats: OperationStats) -> Tuple[str, ...]:
+        """Format the values of a row of the table."""
+        p95 = stats.percentile(95)
+        return (
+            *key,
+            str(stats.calls),
+            str(stats.errors),
+            str(stats.retries),
+            str(stats.throttles),
+            f"{stats.avg_ms:.0f}",
+            f"<={p95}" if p95 is not None else f">{LATENCY_BUCKETS[-1]}",
+            f"{stats.max_ms:.0f}",
+        )
+
+
+class _CallEntry:
+    """State of a call that is in progress."""
+
+    __slots__ = ("model", "start", "throttles")
+
+    def __init__(self, model: Any) -> None:
+        """Instantiate class."""
+        self.model = model
+        self.start = time.perf_counter()
+        self.throttles = 0
+
+
+_STATS: Optional[ApiStats] = None
+_SPOOL_DIR: Optional[Path] = None
+
+
+def _after_fork(stats: ApiStats) -> None:
+    """Start over in a forked process and write its stats when it exits."""
+    stats._lock = threading.Lock()  # pylint: disable=protected-access
+    stats.clear()
+    multiprocessing.util.Finalize(None, _write_spool, exitpriority=10)
+
+
+def _write_spool() -> None:
+    """Write the stats of a forked process to the spool directory."""
+    if _STATS is None or _SPOOL_DIR is None or not _STATS.operations:
+        return
+    try:
+        (_SPOOL_DIR / f"{os.getpid()}.json").write_text(json.dumps(_STATS.to_dict()))
+    except OSError as exc:
+        LOGGER.debug("unable to write AWS API call stats: %s", exc)
+
+
+def _get_error_code(parsed: Any) -> Optional[str]:
+    """Get the error code of a parsed response."""
+    if isinstance(parsed, dict):
+        return parsed.get("Error", {}).get("Code")  # type: ignore
+    return None
+
+
+def _before_call(context: Dict[str, Any], model: Any, **_: Any) -> None:
+    """Handle ``before-call`` events."""
+    if _STATS is not None:
+        context[_CONTEXT_KEY] = _CallEntry(model)
+
+
+def _needs_retry(
+    request_dict: Dict[str, Any], response: Optional[Tuple[Any, Any]], **_: Any
+) -> None:
+    """Handle ``needs-retry`` events, counting throttled responses."""
+    entry = request_dict.get("context", {}).get(_CONTEXT_KEY)
+    if entry and response and _get_error_code(response[1]) in THROTTLING_ERROR_CODES:
+        entry.throttles += 1
+
+
+def _after_call(
+    context: Dict[str, Any], http_response: Any, parsed: Any, **_: Any
+) -> None:
+    """Handle ``after-call`` events."""
+    retries = 0
+    if isinstance(parsed, dict):
+        retries = parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+    _record(context, error=http_response.status_code >= 300, retries=retries)
+
+
+def _after_call_error(context: Dict[str, Any], **_: Any) -> None:
+    """Handle ``after-call-error`` events (e.g. connection errors)."""
+    _record(context, error=True)
+
+
+def _record(context: Dict[str, Any], *, error: bool, retries: int = 0) -> None:
+    """Record a call that has completed."""
+    entry: Optional[_CallEntry] = context.pop(_CONTEXT_KEY, None)
+    if _STATS is None or entry is None:
+        return
+    _STATS.record(
+        entry.model.service_model.service_name,
+        entry.model.name,
+        context.get("client_region") or "",
+        (time.perf_counter() - entry.start) * 1000,
+        error=error,
+        retries=retries,
+        throttles=entry.throttles,
+    )
+
+
+def enabled() -> bool:
+    """Whether AWS API calls are being counted."""
+    return _STATS is not None
+
+
+def register(session: boto3.Session) -> None:
+    """Register event handlers to count the calls made by clients of a session.
+
+    The handlers do nothing while accounting is disabled.
+
+    Args:
+        session: boto3 session. Only clients created after this is called
+            are counted.
+
+    """
+    events = session.events
+    events.register_first(
+        "before-call", _before_call, unique_id=f"{_CONTEXT_KEY}-before"
+    )
+    events.register("needs-retry", _needs_retry, unique_id=f"{_CONTEXT_KEY}-retry")
+    events.register("after-call", _after_call, unique_id=f"{_CONTEXT_KEY}-after")
+    events.register(
+        "after-call-error", _after_call_error, unique_id=f"{_CONTEXT_KEY}-error"
+    )
+
+
+def start() -> ApiStats:
+    """Start counting AWS API calls."""
+    global _SPOOL_DIR, _STATS  # pylint: disable=global-statement
+    stop()
+    _STATS = ApiStats()
+    _SPOOL_DIR = Path(tempfile.mkdtemp(prefix="runway-api-stats-"))
+    multiprocessing.util.register_after_fork(_STATS, _after_fork)
+    return _STATS
+
+
+def stop() -> Optional[ApiStats]:
+    """Stop counting AWS API calls.
+
+    Returns:
+        Stats of the calls made by this process and the processes it forked
+        or ``None`` if accounting was not enabled.
+
+    """
+    global _SPOOL_DIR, _STATS  # pylint: disable=global-statement
+    stats, spool_dir = _STATS, _SPOOL_DIR
+    _STATS = _SPOOL_DIR = None
+    if stats is None or spool_dir is None:
+        return stats
+    for path in sorted(spool_dir.glob("*.json")):
+        try:
+            stats.merge(json.loads(path.read_text()))
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("unable to read AWS API call stats from %s: %s", path, exc)
+    shutil.rmtree(spool_dir, ignore_errors=True)
+    return stats
@@ -1,4 +1,5 @@
 """Runway command import aggregation."""
+from ._cache import cache
 from ._deploy import deploy
 from ._destroy import destroy
 from ._dismantle import dismantle
@@ -19,6 +20,7 @@ from ._tfenv import tfenv
 from ._whichenv import whichenv
 
 __all__ = [
+    "cache",
     "deploy",
     "destroy",
     "dismantle",
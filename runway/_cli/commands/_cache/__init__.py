@@ -0,0 +1,30 @@
+"""``runway cache`` command group."""
+# docs: file://./../../../../docs/source/commands.rst
+from typing import Any
+
+import click
+
+from ... import options
+from ._list import list_
+from ._prune import prune
+
+__all__ = ["list_", "prune"]
+
+COMMANDS = [list_, prune]
+
+
+@click.group("cache", short_help="local caches (list|prune)")
+@options.debug
+@options.no_color
+@options.verbose
+def cache(**_: Any) -> None:
+    """Inspect and prune local caches used by Runway.
+
+    Dependencies installed for AWS Lambda payloads and templates rendered by
+    CFNgin blueprints are cached in ".runway/cache" of the current directory.
+
+    """
+
+
+for cmd in COMMANDS:  # register commands
+    cache.add_command(cmd)
@@ -0,0 +1,62 @@
+"""List the contents of local caches."""
+# docs: file://./../../../../docs/source/commands.rst
+import logging
+from datetime import datetime
+from typing import Any
+
+import click
+
+from ....cfngin.blueprints.render_cache import RenderCache
+from ....cfngin.hooks.aws_lambda_cache import DependencyCache
+from ... import options
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+
+def _format_time(timestamp: float) -> str:
+    """Format the time an entry was last used."""
+    return datetime.fromtimestamp(timestamp).isoformat(" ", "seconds")
+
+
+@click.command("list", short_help="list cache entries")
+@options.debug
+@options.no_color
+@options.verbose
+def list_(**_: Any) -> None:
+    """List the entries of the AWS Lambda dependency and rendered template caches.
+
+    Entries are listed from least to most recently used. The hit rate of the
+    rendered template cache is the number of times its entries were used
+    compared to the number of times they were rendered.
+
+    """
+    dependency_cache = DependencyCache()
+    entries = dependency_cache.entries
+    for entry in entries:
+        click.echo(
+            f"{entry.key[:12]}  {entry.size / 1024 ** 2:>10.1f} MiB  "
+            f"{entry.files:>7} files  last used {_format_time(entry.last_used)}"
+        )
+    click.echo(
+        f"{len(entries)} entries using "
+        f"{sum(entry.size for entry in entries) / 1024 ** 2:.1f} MiB of "
+        f"{dependency_cache.max_size / 1024 ** 2:.1f} MiB "
+        f"({dependency_cache.cache_dir})"
+    )
+
+    render_cache = RenderCache()
+    render_entries = render_cache.entries
+    for entry in render_entries:
+        click.echo(
+            f"{entry.key[:12]}  {entry.size / 1024:>10.1f} KiB  "
+            f"{entry.hits:>7} hits   last used {_format_time(entry.last_used)}  "
+            f"{entry.blueprint}"
+        )
+    hits = sum(entry.hits for entry in render_entries)
+    click.echo(
+        f"{len(render_entries)} entries using "
+        f"{sum(entry.size for entry in render_entries) / 1024 ** 2:.1f} MiB of "
+        f"{render_cache.max_size / 1024 ** 2:.1f} MiB "
+        f"({render_cache.cache_dir}); "
+        f"hit rate {hits / (hits + len(render_entries)) if render_entries else 0:.0%}"
+    )
@@ -0,0 +1,65 @@
+"""Prune local caches."""
+# docs: file://./../../../../docs/source/commands.rst
+import logging
+from typing import Any, List, Optional, Tuple, Union
+
+import click
+
+from ....cfngin.blueprints.render_cache import RenderCache, RenderCacheEntry
+from ....cfngin.hooks.aws_lambda_cache import CacheEntry, DependencyCache
+from ... import options
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+CACHES = {"lambda-dependencies": DependencyCache, "rendered-templates": RenderCache}
+
+
+@click.command("prune", short_help="remove cache entries")
+@click.option(
+    "--all",
+    "all_",
+    default=False,
+    help="Remove all entries.",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--cache",
+    "caches",
+    metavar="<name>",
+    multiple=True,
+    type=click.Choice(list(CACHES)),
+    help="Only prune this cache. Can be provided more than once. "
+    "[default: all caches]",
+)
+@click.option(
+    "--max-size",
+    metavar="<mib>",
+    type=click.IntRange(min=0),
+    help="Remove the least recently used entries until each cache is smaller "
+    "than this many MiB. [default: 2048 for lambda-dependencies, "
+    "256 for rendered-templates]",
+)
+@options.debug
+@options.no_color
+@options.verbose
+def prune(
+    all_: bool, caches: Tuple[str, ...], max_size: Optional[int], **_: Any
+) -> None:
+    """Remove entries from the AWS Lambda dependency and rendered template caches.
+
+    The least recently used entries are removed first.
+
+    """
+    if all_:
+        max_size = 0
+    removed: List[Union[CacheEntry, RenderCacheEntry]] = []
+    for name in caches or CACHES:
+        removed.extend(
+            CACHES[name]().prune(None if max_size is None else max_size * 1024**2)
+        )
+    LOGGER.info(
+        "removed %s entries (%.1f MiB)",
+        len(removed),
+        sum(entry.size for entry in removed) / 1024**2,
+    )
@@ -15,11 +15,14 @@ LOGGER = logging.getLogger(__name__.replace("._", "."))
 
 
 @click.command("destroy", short_help="destroy things")
+@options.api_stats
+@options.api_stats_file
 @options.ci
 @options.debug
 @options.deploy_environment
 @options.no_color
 @options.tags
+@options.trace_file
 @options.verbose
 @click.pass_context
 def destroy(ctx: click.Context, debug: bool, tags: Tuple[str, ...], **_: Any) -> None:
@@ -15,11 +15,14 @@ LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
 
 
 @click.command("dismantle", short_help="alias of destroy")
+@options.api_stats
+@options.api_stats_file
 @options.ci
 @options.debug
 @options.deploy_environment
 @options.no_color
 @options.tags
+@options.trace_file
 @options.verbose
 @click.pass_context
 def dismantle(ctx: click.Context, **kwargs: Any) -> None:
@@ -15,11 +15,14 @@ LOGGER = logging.getLogger(__name__.replace("._", "."))
 
 
 @click.command("init", short_help="initialize/bootstrap things")
+@options.api_stats
+@options.api_stats_file
 @options.ci
 @options.debug
 @options.deploy_environment
 @options.no_color
 @options.tags
+@options.trace_file
 @options.verbose
 @click.pass_context
 def init(ctx: click.Context, debug: bool, tags: Tuple[str, ...], **_: Any) -> None:
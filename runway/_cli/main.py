@@ -2,12 +2,14 @@
 import argparse
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import click
 
 from runway import __version__
 
+from .. import _api_stats, _tracing
+from ..cfngin.session_cache import SESSION_POOL
 from . import commands, options
 from .logs import setup_logging
 from .utils import CliContext
@@ -30,7 +32,23 @@ class _CliGroup(click.Group):
     def invoke(self, ctx: click.Context) -> Any:
         """Replace invoke command to pass along args."""
         ctx.meta["global.options"] = self.__parse_global_options(ctx)
-        return super().invoke(ctx)
+        try:
+            return super().invoke(ctx)
+        finally:
+            LOGGER.debug("boto3 session pool statistics: %s", SESSION_POOL.stats)
+            _tracing.stop()
+            self.__report_api_stats(ctx.meta["global.options"].get("api_stats_file"))
+
+    @staticmethod
+    def __report_api_stats(path: Optional[str]) -> None:
+        """Display and write the stats of AWS API calls if they were counted."""
+        stats = _api_stats.stop()
+        if stats is None:
+            return
+        click.echo(f"\nAWS API calls:\n{stats.format_table()}", err=True)
+        if path:
+            stats.write_json(path)
+            LOGGER.info("AWS API call stats written to %s", path)
 
     @staticmethod
     def __parse_global_options(ctx: click.Context) -> Dict[str, Any]:
@@ -42,6 +60,14 @@ class _CliGroup(click.Group):
 
         """
         parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument(
+            "--api-stats",
+            action="store_true",
+            default=bool(os.getenv("RUNWAY_API_STATS")),
+        )
+        parser.add_argument(
+            "--api-stats-file", default=os.getenv("RUNWAY_API_STATS_FILE") or None
+        )
         parser.add_argument("--ci", action="store_true", default=bool(os.getenv("CI")))
         parser.add_argument(
             "--debug", default=int(os.getenv("DEBUG", "0")), action="count"
@@ -54,6 +80,9 @@ class _CliGroup(click.Group):
             action="store_true",
             default=bool(os.getenv("RUNWAY_NO_COLOR")),
         )
+        parser.add_argument(
+            "--trace-file", default=os.getenv("RUNWAY_TRACE_FILE") or None
+        )
         parser.add_argument(
             "--verbose", action="store_true", default=bool(os.getenv("VERBOSE"))
         )
@@ -63,8 +92,11 @@ class _CliGroup(click.Group):
 
 @click.group(context_settings=CLICK_CONTEXT_SETTINGS, cls=_CliGroup)
 @click.version_option(__version__, message="%(version)s")
+@options.api_stats
+@options.api_stats_file
 @options.debug
 @options.no_color
+@options.trace_file
 @options.verbose
 @click.pass_context
 def cli(ctx: click.Context, **_: Any) -> None:
@@ -77,6 +109,10 @@ def cli(ctx: click.Context, **_: Any) -> None:
     setup_logging(
         debug=opts["debug"], no_color=opts["no_color"], verbose=opts["verbose"]
     )
+    if opts["trace_file"]:
+        _tracing.start(opts["trace_file"])
+    if opts["api_stats"] or opts["api_stats_file"]:
+        _api_stats.start()
     ctx.obj = CliContext(**opts)
 
 
@@ -2,6 +2,23 @@
 # pylint: disable=invalid-name
 import click
 
+api_stats = click.option(
+    "--api-stats",
+    default=False,
+    envvar="RUNWAY_API_STATS",
+    is_flag=True,
+    help="Display a summary of the AWS API calls made at the end of the run.",
+)
+
+api_stats_file = click.option(
+    "--api-stats-file",
+    envvar="RUNWAY_API_STATS_FILE",
+    metavar="<path>",
+    type=click.Path(dir_okay=False),
+    help="Write stats of the AWS API calls made to a JSON file. "
+    "Also displays a summary at the end of the run.",
+)
+
 ci = click.option(
     "--ci",
     default=False,
@@ -46,6 +63,15 @@ tags = click.option(
     " with BOTH tags).",
 )
 
+trace_file = click.option(
+    "--trace-file",
+    envvar="RUNWAY_TRACE_FILE",
+    metavar="<path>",
+    type=click.Path(dir_okay=False),
+    help="Write a timeline of the run to a file that can be viewed with "
+    "Perfetto (https://ui.perfetto.dev) or chrome://tracing.",
+)
+
 verbose = click.option(
     "--verbose",
     default=False,
@@ -1,7 +1,9 @@
 """Runway logging."""
 import logging
 from enum import IntEnum
-from typing import Any, MutableMapping, Text, Tuple, Union
+from typing import Any, Callable, MutableMapping, Text, Tuple, TypeVar, Union
+
+_T = TypeVar("_T")
 
 
 class LogLevels(IntEnum):
@@ -100,6 +102,100 @@ class PrefixAdaptor(logging.LoggerAdapter):
         self.log(LogLevels.VERBOSE, msg, *args, **kwargs)
 
 
+class PrefixFilter(logging.Filter):
+    """Filter that adds a prefix to the message of every record.
+
+    Added to handlers so messages from all loggers are prefixed.
+
+    Example:
+        >>> handler.addFilter(PrefixFilter('something'))
+
+    """
+
+    installed: str = ""
+    """Prefix most recently installed in the current process."""
+
+    def __init__(self, prefix: str, prefix_template: str = "[{prefix}] {msg}") -> None:
+        """Instantiate class.
+
+        Args:
+            prefix: Message prefix.
+            prefix_template: String that can be used with
+                ".format(prefix=<prefix>, msg=<msg>)" to produce a dynamic
+                message prefix.
+
+        """
+        super().__init__()
+        self.prefix = prefix
+        self.prefix_template = prefix_template
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add the prefix to a record.
+
+        Records handled by more than one handler are only prefixed once.
+
+        """
+        if getattr(record, "runway_prefix", None) != self.prefix:
+            record.msg = self.prefix_template.format(prefix=self.prefix, msg=record.msg)
+            record.runway_prefix = self.prefix
+        return True
+
+    @classmethod
+    def install(cls, prefix: str) -> None:
+        """Add a prefix to the messages of every existing log handler.
+
+        Intended for use in a child process so its output can be told apart
+        from other processes writing to the same stream.
+
+        Args:
+            prefix: Message prefix.
+
+        """
+        loggers = [logging.getLogger()] + [
+            logger
+            for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ]
+        prefix_filter = cls(prefix)
+        for logger in loggers:
+            for handler in logger.handlers:
+                for existing in list(handler.filters):
+                    if isinstance(existing, cls):  # nested child process
+                        handler.removeFilter(existing)
+                handler.addFilter(prefix_filter)
+        cls.installed = prefix
+
+    @classmethod
+    def nested(cls, prefix: str) -> str:
+        """Prefix for a child of the current process.
+
+        Args:
+            prefix: Message prefix of the child.
+
+        Returns:
+            The prefix appended to the prefix installed in the current
+            process, if any.
+
+        """
+        return f"{cls.installed}.{prefix}" if cls.installed else prefix
+
+    @classmethod
+    def call(cls, prefix: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Install a prefix then call a function.
+
+        Intended for use as the task of a worker process. Replaces the
+        prefix of any task previously run by the worker.
+
+        Args:
+            prefix: Message prefix.
+            func: Function to call.
+            *args: Positional arguments passed to the function.
+
+        """
+        cls.install(prefix)
+        return func(*args)
+
+
 class RunwayLogger(logging.Logger):
     """Extend built-in logger with additional levels."""
 
@@ -0,0 +1,251 @@
+"""Process-wide adaptive rate limiting of AWS API calls.
+
+Calls made by clients of sessions from
+:func:`runway.cfngin.session_cache.get_session` share a token bucket per
+access key, region, and API family (e.g. read operations of CloudFormation).
+Buckets do not limit calls until a call is throttled. The rate of a bucket
+is then reduced and increased again over time while calls succeed, so
+threads (e.g. CFNgin steps or stack event tails) wait for a token instead of
+adding to the throttling and exhausting their retries.
+
+"""
+from __future__ import annotations
+
+import collections
+import logging
+import os
+import threading
+import time
+from distutils.util import strtobool
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+from ._api_stats import THROTTLING_ERROR_CODES
+
+if TYPE_CHECKING:
+    import boto3
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+#: Fraction of the rate that is kept when a call is throttled.
+DECREASE_FACTOR = 0.7
+#: Requests per second added to the rate of a bucket each second it is not throttled.
+INCREASE_PER_SECOND = 0.5
+#: Requests per second above which a bucket stops limiting calls.
+MAX_RATE = 100.0
+#: Lowest rate of a bucket in requests per second.
+MIN_RATE = 0.5
+#: Operations with these prefixes are part of the read family of a service.
+READ_PREFIXES = ("Describe", "Get", "List")
+#: Seconds after a throttled call during which other throttled calls do not
+#: reduce the rate again (they were likely sent at the same time).
+THROTTLE_COOLDOWN = 1.0
+
+_CONTEXT_KEY = "runway_rate_limiter"
+
+BucketKey = Tuple[str, str, str]
+
+
+class TokenBucket:
+    """Thread-safe token bucket with a rate adjusted from throttled calls.
+
+    Attributes:
+        key: Access key, region, and API family of the bucket.
+        rate: Requests per second when :attr:`limiting`.
+        limiting: Whether calls are being limited.
+
+    """
+
+    def __init__(self, key: BucketKey) -> None:
+        """Instantiate class.
+
+        Args:
+            key: Access key, region, and API family of the bucket.
+
+        """
+        self._last_refill = 0.0
+        self._last_throttle = 0.0
+        self._lock = threading.Lock()
+        self._recent: Deque[float] = collections.deque()
+        self._throttled_rate = 0.0
+        self._tokens = 0.0
+        self.key = key
+        self.limiting = False
+        self.rate = MAX_RATE
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one to be available if needed.
+
+        Returns:
+            Number of seconds waited.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not self.limiting:
+                self._recent.append(now)
+                while self._recent[0] < now - 1:
+                    self._recent.popleft()
+                return 0.0
+            self._tokens = min(
+                max(self.rate, 1.0),
+                self._tokens + (now - self._last_refill) * self.rate,
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Increase the rate after a call that was not throttled."""
+        if not self.limiting:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.rate = (
+                self._throttled_rate + (now - self._last_throttle) * INCREASE_PER_SECOND
+            )
+            if self.rate >= MAX_RATE:
+                LOGGER.debug("%s: no longer limiting calls", self._name)
+                self.limiting = False
+                self._recent.clear()
+
+    def on_throttle(self) -> None:
+        """Reduce the rate after a call was throttled."""
+        with self._lock:
+            now = time.monotonic()
+            if self.limiting:
+                if now - self._last_throttle < THROTTLE_COOLDOWN:
+                    return
+                current = self.rate
+            else:
+                # start from the rate calls were sent at before being throttled
+                current = max(float(len(self._recent)), MIN_RATE / DECREASE_FACTOR)
+                self._last_refill = now
+                self._tokens = 0.0
+                self.limiting = True
+            self.rate = self._throttled_rate = max(current * DECREASE_FACTOR, MIN_RATE)
+            self._last_throttle = now
+        LOGGER.debug(
+            "%s: throttled; limiting calls to %.2f/s", self._name, self._throttled_rate
+        )
+
+    @property
+    def _name(self) -> str:
+        """Name of the bucket used in log messages."""
+        return f"{self.key[2]} ({self.key[1] or 'default region'})"
+
+
+class RateLimiter:
+    """Token buckets of the current process."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self._buckets: Dict[BucketKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Remove all buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+    def get_bucket(self, access_key: str, region: str, family: str) -> TokenBucket:
+        """Get the bucket of an access key, region, and API family.
+
+        Args:
+            access_key: AWS access key ID used to sign calls. Account IDs are
+                not used since resolving them requires an additional call.
+            region: Region calls are sent to.
+            family: API family of the calls (see :func:`get_api_family`).
+
+        """
+        key = (access_key, region, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(key))
+        return bucket
+
+    def _after_fork_in_child(self) -> None:
+        """Replace locks that could have been held by another thread."""
+        self._lock = threading.Lock()
+        for bucket in self._buckets.values():
+            bucket._lock = threading.Lock()  # pylint: disable=protected-access
+
+
+RATE_LIMITER = RateLimiter()
+os.register_at_fork(
+    after_in_child=RATE_LIMITER._after_fork_in_child  # pylint: disable=protected-access
+)
+
+
+def get_api_family(service: str, operation: str) -> str:
+    """Get the API family of an operation.
+
+    Read operations (e.g. ``DescribeStacks``) and write operations of a
+    service are limited separately since AWS throttles them separately.
+
+    Args:
+        service: Name of the service.
+        operation: Name of the operation.
+
+    """
+    return f"{service}:{'read' if operation.startswith(READ_PREFIXES) else 'write'}"
+
+
+def _before_call(
+    context: Dict[str, Any], model: Any, request_signer: Any = None, **_: Any
+) -> None:
+    """Handle ``before-call`` events, waiting for a token."""
+    credentials = getattr(request_signer, "_credentials", None)
+    bucket = RATE_LIMITER.get_bucket(
+        getattr(credentials, "access_key", None) or "",
+        context.get("client_region") or "",
+        get_api_family(model.service_model.service_name, model.name),
+    )
+    context[_CONTEXT_KEY] = bucket
+    bucket.acquire()
+
+
+def _needs_retry(
+    request_dict: Dict[str, Any], response: Optional[Tuple[Any, Any]], **_: Any
+) -> None:
+    """Handle ``needs-retry`` events, adjusting the rate of the bucket."""
+    bucket: Optional[TokenBucket] = request_dict.get("context", {}).get(_CONTEXT_KEY)
+    if not bucket or not response:
+        return
+    parsed = response[1]
+    code = parsed.get("Error", {}).get("Code") if isinstance(parsed, dict) else None
+    if code in THROTTLING_ERROR_CODES:
+        bucket.on_throttle()
+        bucket.acquire()  # for the retry
+    elif response[0].status_code < 300:
+        bucket.on_success()
+
+
+def enabled() -> bool:
+    """Whether rate limiting is enabled.
+
+    Can be disabled by setting ``RUNWAY_ADAPTIVE_RATE_LIMIT`` to ``false``.
+
+    """
+    return bool(strtobool(os.getenv("RUNWAY_ADAPTIVE_RATE_LIMIT", "true")))
+
+
+def register(session: boto3.Session) -> None:
+    """Register event handlers to limit the calls made by clients of a session.
+
+    Args:
+        session: boto3 session. Only clients created after this is called
+            are limited.
+
+    """
+    if not enabled():
+        return
+    session.events.register(
+        "before-call", _before_call, unique_id=f"{_CONTEXT_KEY}-before"
+    )
+    session.events.register(
+        "needs-retry", _needs_retry, unique_id=f"{_CONTEXT_KEY}-retry"
+    )
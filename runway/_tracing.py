@@ -0,0 +1,313 @@
+"""Execution timeline tracing.
+
+When enabled (e.g. with the ``--trace-file`` option), spans are written to a
+file using the JSON array format of the Chrome trace event format so the
+timeline of a run can be viewed with `Perfetto <https://ui.perfetto.dev>`__
+or ``chrome://tracing``.
+
+Events are appended to the file as they are recorded, including by forked
+processes, so a trace is still readable if the run is interrupted. Tracing is
+disabled by default and each function of this module returns immediately
+when it is.
+
+"""
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+_CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+
+
+def _now() -> int:
+    """Current time in microseconds since the epoch."""
+    return time.time_ns() // 1000
+
+
+class Tracer:
+    """Write trace events to a file.
+
+    Attributes:
+        path: Path to the trace file.
+
+    """
+
+    path: Path
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        """Instantiate class.
+
+        The file is created (or truncated) immediately.
+
+        Args:
+            path: Path to the trace file.
+
+        """
+        self.path = Path(path)
+        self._fd: Optional[int] = os.open(
+            self.path, os.O_APPEND | os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o644
+        )
+        self._lock = threading.Lock()
+        self._named_threads: Set[Tuple[int, int]] = set()
+        self._pid = os.getpid()
+        os.write(self._fd, b"[\n")
+        self.write({"args": {"name": "runway"}, "name": "process_name", "ph": "M"})
+
+    def close(self) -> None:
+        """Complete the trace file.
+
+        Only the process that created the tracer completes the file.
+
+        """
+        with self._lock:
+            if self._fd is None or os.getpid() != self._pid:
+                return
+            os.write(
+                self._fd,
+                json.dumps(
+                    {
+                        "args": {"sort_index": 0},
+                        "name": "process_sort_index",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": 0,
+                    }
+                ).encode()
+                + b"\n]\n",
+            )
+            os.close(self._fd)
+            self._fd = None
+
+    def write(self, event: Dict[str, Any]) -> None:
+        """Write an event to the file.
+
+        The ID of the current process and thread are added to the event.
+
+        Args:
+            event: Trace event.
+
+        """
+        pid = os.getpid()
+        tid = threading.get_native_id()
+        event.setdefault("pid", pid)
+        event.setdefault("tid", tid)
+        data = json.dumps(event, default=str).encode() + b",\n"
+        with self._lock:
+            if self._fd is None:
+                return
+            if (pid, tid) not in self._named_threads:
+                self._named_threads.add((pid, tid))
+                data = (
+                    json.dumps(
+                        {
+                            "args": {"name": threading.current_thread().name},
+                            "name": "thread_name",
+                            "ph": "M",
+                            "pid": pid,
+                            "tid": tid,
+                        }
+                    ).encode()
+                    + b",\n"
+                    + data
+                )
+            # each event is written with a single call so events written by
+            # forked processes are not interleaved
+            os.write(self._fd, data)
+
+
+class _Span:
+    """Record the duration of a block of code as a complete event."""
+
+    __slots__ = ("args", "category", "name", "start", "tracer")
+
+    def __init__(
+        self, tracer: Tracer, name: str, category: str, args: Dict[str, Any]
+    ) -> None:
+        """Instantiate class."""
+        self.args = args
+        self.category = category
+        self.name = name
+        self.start = 0
+        self.tracer = tracer
+
+    def __enter__(self) -> _Span:
+        """Start the span."""
+        self.start = _now()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """End the span, recording the type of the exception raised if any."""
+        if exc_type:
+            self.args["error"] = exc_type.__name__
+        self.tracer.write(
+            {
+                "args": self.args,
+                "cat": self.category,
+                "dur": _now() - self.start,
+                "name": self.name,
+                "ph": "X",
+                "ts": self.start,
+            }
+        )
+
+
+class _NullSpan:
+    """Span used when tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        """Do nothing."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Do nothing."""
+
+
+_NULL_SPAN = _NullSpan()
+_TRACER: Optional[Tracer] = None
+
+
+def _after_fork_in_child() -> None:
+    """Replace the lock of the tracer in case it was held by another thread."""
+    if _TRACER is not None:
+        _TRACER._lock = threading.Lock()  # pylint: disable=protected-access
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def complete(name: str, category: str, start: float, end: float, **args: Any) -> None:
+    """Record a span that has already ended.
+
+    Args:
+        name: Name of the span.
+        category: Category of the span (e.g. ``step``).
+        start: When the span started in seconds since the epoch.
+        end: When the span ended in seconds since the epoch.
+        **args: Additional data to display with the span.
+
+    """
+    if _TRACER is None:
+        return
+    _TRACER.write(
+        {
+            "args": args,
+            "cat": category,
+            "dur": int((end - start) * 1_000_000),
+            "name": name,
+            "ph": "X",
+            "ts": int(start * 1_000_000),
+        }
+    )
+
+
+def enabled() -> bool:
+    """Whether tracing is enabled."""
+    return _TRACER is not None
+
+
+def instant(name: str, category: str, **args: Any) -> None:
+    """Record an event that has no duration.
+
+    Args:
+        name: Name of the event.
+        category: Category of the event.
+        **args: Additional data to display with the event.
+
+    """
+    if _TRACER is None:
+        return
+    _TRACER.write(
+        {"args": args, "cat": category, "name": name, "ph": "i", "s": "t", "ts": _now()}
+    )
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[Any]:
+    """Record the duration of a block of code.
+
+    Args:
+        name: Name of the span.
+        category: Category of the span (e.g. ``hook``).
+        **args: Additional data to display with the span.
+
+    """
+    if _TRACER is None:
+        return _NULL_SPAN
+    return _Span(_TRACER, name, category, args)
+
+
+def start(path: Union[Path, str]) -> Tracer:
+    """Start writing trace events to a file.
+
+    Args:
+        path: Path to the trace file.
+
+    """
+    global _TRACER  # pylint: disable=global-statement
+    stop()
+    _TRACER = Tracer(path)
+    LOGGER.debug("writing trace events to %s", _TRACER.path)
+    return _TRACER
+
+
+def stop() -> None:
+    """Stop tracing and complete the trace file."""
+    global _TRACER  # pylint: disable=global-statement
+    if _TRACER is not None:
+        _TRACER.close()
+        _TRACER = None
+
+
+def traced(
+    category: str, name: Callable[..., str]
+) -> Callable[[_CallableT], _CallableT]:
+    """Decorate a function to record the duration of each call.
+
+    Args:
+        category: Category of the spans.
+        name: Called with the arguments of the decorated function to get the
+            name of each span.
+
+    """
+
+    def decorator(func: _CallableT) -> _CallableT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _TRACER is None:
+                return func(*args, **kwargs)
+            with _Span(_TRACER, name(*args, **kwargs), category, {}):
+                return func(*args, **kwargs)
+
+        return cast(_CallableT, wrapper)
+
+    return decorator
@@ -5,29 +5,33 @@ import logging
 import os
 import sys
 import threading
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set, Union, cast
 
 import botocore.exceptions
 
-from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
-from ..exceptions import PlanFailed
+from ... import _tracing
+from ..dag import ThreadPoolWalker, walk
+from ..exceptions import PlanFailed, StackDoesNotExist
 from ..plan import Graph, Plan, Step, merge_graphs
+from ..status import PENDING
 from ..utils import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
 
 if TYPE_CHECKING:
+    from mypy_boto3_cloudformation.type_defs import StackTypeDef
     from mypy_boto3_s3.client import S3Client
 
     from ...context import CfnginContext
     from ..blueprints.base import Blueprint
     from ..providers.aws.default import Provider, ProviderBuilder
     from ..stack import Stack
+    from ..status import Status
 
 LOGGER = logging.getLogger(__name__)
 
-# After submitting a stack update/create, this controls how long we'll wait
-# between calls to DescribeStacks to check on it's status. Most stack updates
-# take at least a couple minutes, so 30 seconds is pretty reasonable and inline
-# with the suggested value in
+# After submitting a stack update/create, this controls the maximum amount of
+# time we'll wait between calls to DescribeStacks to check on it's status.
+# Most stack updates take at least a couple minutes, so 30 seconds is pretty
+# reasonable and inline with the suggested value in
 # https://github.com/boto/botocore/blob/1.6.1/botocore/data/cloudformation/2010-05-15/waiters-2.json#L22
 #
 # This can be controlled via an environment variable, mostly for testing.
@@ -48,6 +52,9 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     If concurrency is greater than 1, it will return a walker that will only
     execute a maximum of concurrency steps at any given time.
 
+    Parallel walkers dispatch each step to a pool of worker threads as soon
+    as the last of its dependencies has finished.
+
     Args:
         concurrency: Number of threads to use while walking.
 
@@ -58,11 +65,7 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     if concurrency == 1:
         return walk
 
-    semaphore = UnlimitedSemaphore()
-    if concurrency > 1:
-        semaphore = threading.Semaphore(concurrency)
-
-    return ThreadedWalker(semaphore).walk
+    return ThreadPoolWalker(concurrency if concurrency > 1 else None).walk
 
 
 def stack_template_url(bucket_name: str, blueprint: Blueprint, endpoint: str):
@@ -129,6 +132,9 @@ class BaseAction:
         if not self.bucket_region and provider_builder:
             self.bucket_region = provider_builder.region
         self.s3_conn = self.context.s3_client
+        self._template_index: Optional[Set[str]] = None
+        self._template_index_lock = threading.Lock()
+        self._template_index_unavailable = False
 
     @property
     def _stack_action(self) -> Callable[..., Any]:
@@ -194,7 +200,9 @@ class BaseAction:
         """Push the rendered blueprint's template to S3.
 
         Verifies that the template doesn't already exist in S3 before
-        pushing.
+        pushing. Since the key of a template contains its version, existing
+        templates are looked up in an index of the templates stored under
+        the namespace that is built the first time a template is pushed.
 
         Returns:
             URL to the template in S3.
@@ -204,27 +212,20 @@ class BaseAction:
             raise ValueError("bucket_name required")
         key_name = stack_template_key_name(blueprint)
         template_url = self.stack_template_url(blueprint)
-        try:
-            template_exists = (
-                self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name)
-                is not None
-            )
-        except botocore.exceptions.ClientError as err:
-            if err.response["Error"]["Code"] == "404":
-                template_exists = False
-            else:
-                raise
-
-        if template_exists and not force:
+        if not force and self._template_exists(key_name):
             LOGGER.debug("CloudFormation template already exists: %s", template_url)
             return template_url
-        self.s3_conn.put_object(
-            Bucket=self.bucket_name,
-            Key=key_name,
-            Body=blueprint.rendered.encode(),
-            ServerSideEncryption="AES256",
-            ACL="bucket-owner-full-control",
-        )
+        with _tracing.span(key_name, "s3", bucket=self.bucket_name):
+            self.s3_conn.put_object(
+                Bucket=self.bucket_name,
+                Key=key_name,
+                Body=blueprint.rendered.encode(),
+                ServerSideEncryption="AES256",
+                ACL="bucket-owner-full-control",
+            )
+        with self._template_index_lock:
+            if self._template_index is not None:
+                self._template_index.add(key_name)
         LOGGER.debug("blueprint %s pushed to %s", blueprint.name, template_url)
         return template_url
 
@@ -236,6 +237,55 @@ class BaseAction:
             self.bucket_name, blueprint, get_s3_endpoint(self.s3_conn)
         )
 
+    def _get_template_index(self) -> Optional[Set[str]]:
+        """Get the keys of templates stored in S3 under the namespace.
+
+        The index is built once using ``list_objects_v2``.
+
+        Returns:
+            Keys of existing templates or ``None`` if the bucket can't be listed.
+
+        """
+        with self._template_index_lock:
+            if self._template_index is None and not self._template_index_unavailable:
+                keys: Set[str] = set()
+                try:
+                    for page in self.s3_conn.get_paginator("list_objects_v2").paginate(
+                        Bucket=cast(str, self.bucket_name),
+                        Prefix=f"stack_templates/{self.context.get_fqn()}",
+                    ):
+                        keys.update(obj["Key"] for obj in page.get("Contents", []))
+                except botocore.exceptions.ClientError as err:
+                    LOGGER.debug("unable to list existing templates: %s", err)
+                    self._template_index_unavailable = True
+                else:
+                    LOGGER.debug("found %s existing template(s) in S3", len(keys))
+                    self._template_index = keys
+            return self._template_index
+
+    def _template_exists(self, key_name: str) -> bool:
+        """Check if a template exists in S3.
+
+        Uses the index of existing templates when available, falling back to
+        ``head_object``.
+
+        """
+        index = self._get_template_index()
+        if index is not None:
+            with self._template_index_lock:
+                return key_name in index
+        try:
+            return (
+                self.s3_conn.head_object(
+                    Bucket=cast(str, self.bucket_name), Key=key_name
+                )
+                is not None
+            )
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "404":
+                return False
+            raise
+
     def _generate_plan(
         self,
         tail: bool = False,
@@ -282,6 +332,50 @@ class BaseAction:
             require_unlocked=require_unlocked,
         )
 
+    def _prefetch_stacks(self, plan: Plan) -> None:
+        """Prefetch the descriptions of the stacks of a plan before walking it.
+
+        Each step uses the prefetched description of its stack the first time
+        it checks the stack so only stacks that were changed are described
+        again. Prefetched descriptions that were not used are discarded by
+        :meth:`_clear_prefetched_stacks` once the plan has been walked.
+
+        """
+        stack_names = [step.stack.fqn for step in plan.steps]
+        if stack_names and self.provider_builder:
+            self.build_provider().prefetch_stacks(stack_names)
+
+    def _clear_prefetched_stacks(self) -> None:
+        """Discard the descriptions of stacks prefetched for a plan."""
+        if self.provider_builder:
+            self.build_provider().clear_prefetched_stacks()
+
+    def _get_provider_stack(
+        self, provider: Provider, stack: Stack, status: Optional[Status]
+    ) -> Optional[StackTypeDef]:
+        """Get the description of a stack from the provider for a step.
+
+        If the step is pending, the stack is described immediately (or its
+        prefetched description is used). Otherwise, the step is waiting on a
+        change so this waits for the status of the stack to change.
+
+        Args:
+            provider: Provider of the stack.
+            stack: The stack to describe.
+            status: The current status of the step.
+
+        Returns:
+            The description of the stack or ``None`` if it does not exist.
+
+        """
+        try:
+            if status is PENDING:
+                return provider.get_stack(stack.fqn)
+            return provider.poll_stack(stack.fqn, self.cancel)
+        except StackDoesNotExist:
+            LOGGER.debug("%s:stack does not exist", stack.fqn)
+            return None
+
     def _tail_stack(
         self, stack: Stack, cancel: threading.Event, retries: int = 0, **kwargs: Any
     ) -> None:
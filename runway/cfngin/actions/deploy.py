@@ -1,18 +1,21 @@
 """CFNgin deploy action."""
 from __future__ import annotations
 
+import concurrent.futures
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from typing_extensions import Literal
 
-from ..exceptions import (
-    CancelExecution,
-    MissingParameterException,
-    StackDidNotChange,
-    StackDoesNotExist,
-)
+from ...lookups.handlers.cfn import TYPE_NAME as CFN_TYPE_NAME
+from ...lookups.handlers.cfn import CfnLookup
+from ...lookups.handlers.ssm import SsmLookup
+from ..exceptions import CancelExecution, MissingParameterException, StackDidNotChange
 from ..hooks import utils
+from ..lookups.handlers.output import TYPE_NAME as OUTPUT_TYPE_NAME
+from ..lookups.handlers.output import deconstruct
+from ..lookups.handlers.rxref import TYPE_NAME as RXREF_TYPE_NAME
+from ..lookups.handlers.xref import TYPE_NAME as XREF_TYPE_NAME
 from ..plan import Graph, Plan, Step
 from ..providers.base import Template
 from ..status import (
@@ -29,7 +32,7 @@ from ..status import (
     SkippedStatus,
     SubmittedStatus,
 )
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudformation.type_defs import ParameterTypeDef, StackTypeDef
@@ -47,6 +50,9 @@ LOGGER = logging.getLogger(__name__)
 DESTROYED_STATUS = CompleteStatus("stack destroyed")
 DESTROYING_STATUS = SubmittedStatus("submitted for destruction")
 
+#: Lookups that read the state of a stack, which can change during a deploy.
+STACK_LOOKUPS = (CFN_TYPE_NAME, OUTPUT_TYPE_NAME, RXREF_TYPE_NAME, XREF_TYPE_NAME)
+
 
 def build_stack_tags(stack: Stack) -> List[TagTypeDef]:
     """Build a common set of tags to attach to a stack."""
@@ -273,16 +279,15 @@ class Action(BaseAction):
             status: The Stack's status represented by a CFNgin status object.
 
         """
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         provider = self.build_provider()
+        stack_data = self._get_provider_stack(provider, stack, status)
+        if status is not PENDING and self.cancel.wait(0):
+            return INTERRUPTED
 
-        try:
-            stack_data = provider.get_stack(stack.fqn)
-        except StackDoesNotExist:
-            LOGGER.debug("%s:stack does not exist", stack.fqn)
+        if stack_data is None:
             if status == SUBMITTED:
                 return DESTROYED_STATUS
             return DoesNotExistInCloudFormation()
@@ -296,6 +301,7 @@ class Action(BaseAction):
             if provider.is_stack_being_destroyed(stack_data):
                 return DESTROYING_STATUS
             if provider.is_stack_destroyed(stack_data):
+                SsmLookup.clear_cache()  # parameters of the stack were deleted
                 return DESTROYED_STATUS
             wait = stack.in_progress_behavior == "wait"
             if wait and provider.is_stack_in_progress(stack_data):
@@ -325,22 +331,19 @@ class Action(BaseAction):
             status: The Stack's status represented by a CFNgin status object.
 
         """
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         if not should_submit(stack):
             return NotSubmittedStatus()
 
         provider = self.build_provider()
-
-        try:
-            provider_stack = provider.get_stack(stack.fqn)
-        except StackDoesNotExist:
-            provider_stack = None
+        provider_stack = self._get_provider_stack(provider, stack, status)
+        if status is not PENDING and self.cancel.wait(0):
+            return INTERRUPTED
 
         if provider_stack and not should_update(stack):
-            stack.set_outputs(self.provider.get_output_dict(provider_stack))
+            stack.set_outputs(provider.get_output_dict(provider_stack))
             return NotUpdatedStatus()
 
         recreate = False
@@ -383,6 +386,8 @@ class Action(BaseAction):
                 return FailedStatus(reason)
 
             elif provider.is_stack_completed(provider_stack):
+                # the stack may have created or changed SSM parameters
+                SsmLookup.clear_cache()
                 stack.set_outputs(provider.get_output_dict(provider_stack))
                 return CompleteStatus(status.reason)
             else:
@@ -527,10 +532,23 @@ class Action(BaseAction):
         return Plan(context=self.context, description=self.DESCRIPTION, graph=graph)
 
     def pre_run(  # pylint: disable=arguments-differ
-        self, *, dump: Union[bool, str] = False, outline: bool = False, **_: Any
+        self,
+        *,
+        cfn_bucket_ensured: bool = False,
+        dump: Union[bool, str] = False,
+        outline: bool = False,
+        **_: Any,
     ) -> None:
-        """Any steps that need to be taken prior to running the action."""
-        if should_ensure_cfn_bucket(outline, bool(dump)):
+        """Any steps that need to be taken prior to running the action.
+
+        Args:
+            cfn_bucket_ensured: The CloudFormation template bucket was already
+                ensured to exist (e.g. while processing another config file).
+            dump: Dump rendered templates instead of deploying them.
+            outline: Outline the plan instead of executing it.
+
+        """
+        if not cfn_bucket_ensured and should_ensure_cfn_bucket(outline, bool(dump)):
             self.ensure_cfn_bucket()
         handle_hooks(
             "pre_deploy",
@@ -563,17 +581,108 @@ class Action(BaseAction):
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
             LOGGER.debug("launching stacks: %s", ", ".join(plan.keys()))
+            self._prefetch_stacks(plan)
+            self._prefetch_lookups(plan)
+            if self.bucket_name:
+                self._push_templates(plan, concurrency)
             walker = build_walker(concurrency)
             try:
                 plan.execute(walker)
             finally:
                 # always unlock the graph at the end
                 self.context.unlock_persistent_graph(plan.lock_code)
+                self._clear_prefetched_stacks()
         if outline:
             plan.outline()
         if isinstance(dump, str):
             plan.dump(directory=dump, context=self.context, provider=self.provider)
 
+    def _prefetch_lookups(self, plan: Plan) -> None:
+        """Prefetch the values of lookups used by the stacks of a plan.
+
+        Stack outputs are only prefetched for stacks that are not part of the
+        plan since the outputs of those are cached as they are deployed.
+
+        """
+        lookups = [
+            lookup
+            for step in plan.steps
+            for variable in step.stack.variables
+            for lookup in variable.lookups
+        ]
+        SsmLookup.prefetch(lookups, self.context)
+        CfnLookup.prefetch(lookups, self.context)
+        stack_names: Set[str] = set()
+        for lookup in lookups:
+            if (
+                lookup.lookup_name.value not in (RXREF_TYPE_NAME, XREF_TYPE_NAME)
+                or lookup.lookup_query.lookups
+            ):
+                continue
+            try:
+                stack_name = deconstruct(lookup.lookup_query.value).stack_name
+            except ValueError:
+                continue  # raised again when the lookup is resolved
+            if lookup.lookup_name.value == RXREF_TYPE_NAME:
+                stack_name = self.context.get_fqn(stack_name)
+            stack_names.add(stack_name)
+        stack_names.difference_update(step.stack.fqn for step in plan.steps)
+        if stack_names:
+            self.provider.output_cache.prefetch(
+                self.provider.cloudformation, stack_names
+            )
+
+    def _push_templates(self, plan: Plan, concurrency: int = 0) -> None:
+        """Push the templates of independent stacks to S3 before walking the plan.
+
+        Only stacks that do not depend on another stack and do not use a
+        lookup that reads the state of a stack are rendered ahead of time
+        since the templates of other stacks can change while the plan is
+        being walked. Templates are pushed concurrently. Errors are left to
+        be raised again when the stack is launched.
+
+        The templates are rendered again when the stacks are launched. They
+        are only pushed again if the values of their variables changed.
+
+        Args:
+            plan: Plan being executed.
+            concurrency: Max number of templates to push at the same time.
+                ``0`` will use the default of
+                :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        """
+        local_stacks = {stack.fqn for stack in self.context.stacks}
+        stacks = [
+            step.stack
+            for step in plan.steps
+            if step.stack.fqn in local_stacks
+            and should_submit(step.stack)
+            and not step.stack.locked
+            and not step.stack.requires
+            and not any(
+                lookup.lookup_name.value in STACK_LOOKUPS or lookup.lookup_query.lookups
+                for variable in step.stack.variables
+                for lookup in variable.lookups
+            )
+        ]
+        if not stacks:
+            return
+
+        def push(stack: Stack) -> None:
+            try:
+                stack.resolve(self.context, self.provider)
+                self.s3_stack_push(stack.blueprint)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("%s:unable to push template early: %s", stack.fqn, err)
+            finally:
+                # rendered again when the stack is launched so the template
+                # matches the values its variables resolve to then
+                stack.blueprint.reset_template()
+
+        LOGGER.debug("pushing templates of %s independent stack(s)", len(stacks))
+        with concurrent.futures.ThreadPoolExecutor(concurrency or None) as executor:
+            list(executor.map(push, stacks))
+
     def post_run(  # pylint: disable=arguments-differ
         self, *, dump: Union[bool, str] = False, outline: bool = False, **_: Any
     ) -> None:
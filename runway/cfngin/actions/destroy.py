@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
-from ..exceptions import StackDoesNotExist
+from ...lookups.handlers.ssm import SsmLookup
 from ..hooks.utils import handle_hooks
 from ..status import (
     INTERRUPTED,
@@ -15,7 +15,7 @@ from ..status import (
     FailedStatus,
     SubmittedStatus,
 )
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 if TYPE_CHECKING:
     from ..stack import Stack
@@ -51,20 +51,20 @@ class Action(BaseAction):
     def _destroy_stack(
         self, stack: Stack, *, status: Optional[Status], **_: Any
     ) -> Status:
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         provider = self.build_provider()
+        stack_data = self._get_provider_stack(provider, stack, status)
+        if status is not PENDING and self.cancel.wait(0):
+            return INTERRUPTED
 
-        try:
-            stack_data = provider.get_stack(stack.fqn)
-        except StackDoesNotExist:
-            LOGGER.debug("%s:stack does not exist", stack.fqn)
+        if stack_data is None:
             # Once the stack has been destroyed, it doesn't exist. If the
             # status of the step was SUBMITTED, we know we just deleted it,
             # otherwise it should be skipped
             if status == SUBMITTED:
+                SsmLookup.clear_cache()  # parameters of the stack were deleted
                 return DESTROYED_STATUS
             return DoesNotExistInCloudFormation()
 
@@ -74,6 +74,7 @@ class Action(BaseAction):
             provider.get_stack_status(stack_data),
         )
         if provider.is_stack_destroyed(stack_data):
+            SsmLookup.clear_cache()
             return DESTROYED_STATUS
         if provider.is_stack_in_progress(stack_data):
             return DESTROYING_STATUS
@@ -124,11 +125,13 @@ class Action(BaseAction):
             # steps to COMPLETE in order to log them
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
+            self._prefetch_stacks(plan)
             walker = build_walker(concurrency)
             try:
                 plan.execute(walker)
             finally:
                 self.context.unlock_persistent_graph(plan.lock_code)
+                self._clear_prefetched_stacks()
         else:
             plan.outline(message='To execute this plan, run with --force" flag.')
 
@@ -1,6 +1,7 @@
 """CFNgin diff action."""
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import sys
 from operator import attrgetter
@@ -11,6 +12,7 @@ from typing import (
     Dict,
     Generic,
     List,
+    Optional,
     Tuple,
     TypeVar,
     Union,
@@ -33,7 +35,12 @@ from . import deploy
 from .base import build_walker
 
 if TYPE_CHECKING:
+    import threading
+
     from ..._logging import RunwayLogger
+    from ...context import CfnginContext
+    from ..plan import Plan
+    from ..providers.aws.default import Provider, ProviderBuilder
     from ..stack import Stack
     from ..status import Status
 
@@ -42,6 +49,10 @@ _OV = TypeVar("_OV")
 
 LOGGER = cast("RunwayLogger", logging.getLogger(__name__))
 
+#: Sections of a template listed first when diffing templates locally.
+#: Every other top-level section is compared after them, in sorted order.
+TEMPLATE_SECTIONS = ("Parameters", "Resources", "Outputs")
+
 
 class DictValue(Generic[_OV, _NV]):
     """Used to create a diff of two dictionaries."""
@@ -175,6 +186,111 @@ def diff_parameters(
     return diff
 
 
+def diff_templates(
+    old_template: Dict[str, Any], new_template: Dict[str, Any]
+) -> Dict[str, List[DictValue[Any, Any]]]:
+    """Compare every top-level section of two templates.
+
+    Sections that are mappings (e.g. ``Resources``, ``Conditions``,
+    ``Mappings``) are compared key by key. Any other section (e.g.
+    ``Transform``) is compared as a single value keyed by its name.
+
+    Args:
+        old_template: Template of the deployed stack.
+        new_template: Rendered template.
+
+    Returns:
+        Changed items of each section that has changes, keyed by section.
+
+    """
+    result: Dict[str, List[DictValue[Any, Any]]] = {}
+    sections = set(old_template) | set(new_template)
+    for section in [
+        *(i for i in TEMPLATE_SECTIONS if i in sections),
+        *sorted(sections.difference(TEMPLATE_SECTIONS)),
+    ]:
+        old_items = old_template.get(section)
+        new_items = new_template.get(section)
+        if not isinstance(old_items or {}, dict) or not isinstance(
+            new_items or {}, dict
+        ):
+            if old_items != new_items:
+                result[section] = [DictValue(section, old_items, new_items)]
+            continue
+        old_items = old_items or {}
+        new_items = new_items or {}
+        changes = [
+            DictValue(key, old_items.get(key), new_items.get(key))
+            for key in sorted(set(old_items) | set(new_items))
+            if old_items.get(key) != new_items.get(key)
+        ]
+        if changes:
+            result[section] = changes
+    return result
+
+
+def get_changed_paths(old_value: Any, new_value: Any, path: str = "") -> List[str]:
+    """Get the paths of the nested values that differ between two values.
+
+    Args:
+        old_value: Old value.
+        new_value: New value.
+        path: Path of the values.
+
+    Returns:
+        Dot separated paths of each difference.
+
+    """
+    if old_value == new_value:
+        return []
+    if not (isinstance(old_value, dict) and isinstance(new_value, dict)):
+        return [path]
+    result: List[str] = []
+    for key in sorted(set(old_value) | set(new_value), key=str):
+        result.extend(
+            get_changed_paths(
+                old_value.get(key), new_value.get(key), f"{path}.{key}" if path else key
+            )
+        )
+    return result
+
+
+def format_template_diff(template_diff: Dict[str, List[DictValue[Any, Any]]]) -> str:
+    """Handle the formatting of differences in templates.
+
+    Args:
+        template_diff: Differences between two templates returned by
+            :func:`diff_templates`.
+
+    Returns:
+        A formatted string that represents a template diff.
+
+    """
+    lines: List[str] = []
+    for section, changes in template_diff.items():
+        lines.append(f"{section}:")
+        for change in changes:
+            value: Optional[Dict[str, Any]] = change.new_value or change.old_value
+            resource_type = (
+                f" ({value.get('Type')})"
+                if section == "Resources" and isinstance(value, dict)
+                else ""
+            )
+            if change.status() is DictValue.ADDED:
+                lines.append(f"+ {change.key}{resource_type}")
+            elif change.status() is DictValue.REMOVED:
+                lines.append(f"- {change.key}{resource_type}")
+            else:
+                paths = get_changed_paths(change.old_value, change.new_value)
+                lines.append(
+                    f"~ {change.key}{resource_type}"
+                    + (f": {', '.join(paths)}" if any(paths) else "")
+                )
+    return "--- Old Template\n+++ New Template\n******************\n%s\n" % (
+        "\n".join(lines)
+    )
+
+
 class Action(deploy.Action):
     """Responsible for diffing CloudFormation stacks in AWS and locally.
 
@@ -185,11 +301,40 @@ class Action(deploy.Action):
     The plan is then used to create a changeset for a stack using a
     generated template based on the current config.
 
+    When :attr:`~runway.core.components.DeployEnvironment.cfngin_fast_diff`
+    is enabled, the rendered templates are compared locally to the deployed
+    templates, which are retrieved concurrently before the plan is walked.
+    Change sets are only created for stacks listed in
+    :attr:`~runway.core.components.DeployEnvironment.cfngin_diff_change_set_stacks`.
+
     """
 
     DESCRIPTION = "Diff stacks"
     NAME = "diff"
 
+    def __init__(
+        self,
+        context: CfnginContext,
+        provider_builder: Optional[ProviderBuilder] = None,
+        cancel: Optional[threading.Event] = None,
+    ):
+        """Instantiate class.
+
+        Args:
+            context: The context for the current run.
+            provider_builder: An object that will build a provider that will be
+                interacted with in order to perform the necessary actions.
+            cancel: Cancel handler.
+
+        """
+        super().__init__(context, provider_builder, cancel)
+        self._stack_info: Dict[
+            str,
+            concurrent.futures.Future[
+                Optional[Tuple[str, Dict[str, Union[List[str], str]]]]
+            ],
+        ] = {}
+
     @property
     def _stack_action(self) -> Callable[..., Status]:
         """Run against a step."""
@@ -216,9 +361,14 @@ class Action(deploy.Action):
         try:
             stack.resolve(self.context, provider)
             parameters = self.build_parameters(stack)
-            outputs = provider.get_stack_changes(
-                stack, self._template(stack.blueprint), parameters, tags
-            )
+            if self._use_change_set(stack):
+                outputs = provider.get_stack_changes(
+                    stack, self._template(stack.blueprint), parameters, tags
+                )
+            else:
+                outputs = provider.get_stack_diff(
+                    stack, parameters, self._get_stack_info(provider, stack)
+                )
             stack.set_outputs(outputs)
         except exceptions.StackDidNotChange:
             LOGGER.info("%s:no changes", stack.fqn)
@@ -270,7 +420,54 @@ class Action(deploy.Action):
         else:
             LOGGER.warning("no stacks detected (error in config?)")
         walker = build_walker(concurrency)
-        plan.execute(walker)
+        self._prefetch_stacks(plan)
+        try:
+            if not self.context.env.cfngin_fast_diff:
+                plan.execute(walker)
+                return
+            with concurrent.futures.ThreadPoolExecutor(concurrency or None) as executor:
+                self._prefetch_stack_info(executor, plan)
+                try:
+                    plan.execute(walker)
+                finally:
+                    self._stack_info = {}
+        finally:
+            self._clear_prefetched_stacks()
+
+    def _get_stack_info(
+        self, provider: Provider, stack: Stack
+    ) -> Optional[Tuple[str, Dict[str, Union[List[str], str]]]]:
+        """Get the template and parameters of a deployed stack.
+
+        Uses the value retrieved by :meth:`_prefetch_stack_info` if available.
+
+        """
+        if stack.fqn in self._stack_info:
+            return self._stack_info[stack.fqn].result()
+        return provider.get_deployed_stack_info(stack.fqn)
+
+    def _prefetch_stack_info(
+        self, executor: concurrent.futures.Executor, plan: Plan
+    ) -> None:
+        """Start retrieving the deployed templates of stacks diffed locally."""
+        provider = self.build_provider()
+        self._stack_info = {
+            step.stack.fqn: executor.submit(
+                provider.get_deployed_stack_info, step.stack.fqn
+            )
+            for step in plan.steps
+            if not self._use_change_set(step.stack)
+        }
+        LOGGER.debug(
+            "retrieving the deployed templates of %s stack(s)", len(self._stack_info)
+        )
+
+    def _use_change_set(self, stack: Stack) -> bool:
+        """Whether to diff a stack using a change set."""
+        env = self.context.env
+        return not env.cfngin_fast_diff or bool(
+            {stack.name, stack.fqn}.intersection(env.cfngin_diff_change_set_stacks)
+        )
 
     def pre_run(
         self,
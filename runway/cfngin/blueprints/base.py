@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 import hashlib
+import json
 import logging
 import string
 from typing import (
@@ -20,6 +21,7 @@ from typing import (
 
 from troposphere import Output, Parameter, Ref, Template
 
+from ... import _tracing
 from ...compat import cached_property
 from ...variables import Variable
 from ..exceptions import (
@@ -31,6 +33,7 @@ from ..exceptions import (
     VariableTypeRequired,
 )
 from ..utils import read_value_from_path
+from .render_cache import get_render_cache
 from .variables.types import CFNType, TroposphereType
 
 if TYPE_CHECKING:
@@ -345,6 +348,7 @@ class Blueprint:
 
         """
         self._rendered = None
+        self._rendered_from_cache = False
         self._resolved_variables: Optional[Dict[str, Any]] = None
         self._version = None
         self.context = context
@@ -404,6 +408,8 @@ class Blueprint:
             containing key/values for various output properties.
 
         """
+        if self._rendered_from_cache:
+            return json.loads(self.rendered).get("Outputs", {})
         return {k: output.to_dict() for k, output in self.template.outputs.items()}
 
     @cached_property
@@ -476,6 +482,8 @@ class Blueprint:
     @property
     def requires_change_set(self) -> bool:
         """Return true if the underlying template has transforms."""
+        if self._rendered_from_cache:
+            return "Transform" in json.loads(self.rendered)
         return self.template.transform is not None
 
     @property
@@ -667,8 +675,24 @@ class Blueprint:
         raw_user_data = read_value_from_path(user_data_path)
         return parse_user_data(self.variables, raw_user_data, self.name)
 
+    @_tracing.traced("blueprint", lambda self: self.name)
     def render_template(self) -> Tuple[str, str]:
-        """Render the Blueprint to a CloudFormation template."""
+        """Render the Blueprint to a CloudFormation template.
+
+        When :data:`RUNWAY_CFNGIN_RENDER_CACHE` is enabled, a template
+        previously rendered with the same blueprint source and resolved
+        variables is returned without calling :meth:`create_template`.
+
+        """
+        cache = (
+            get_render_cache() if self.context.env.cfngin_render_cache is True else None
+        )
+        key = cache.compute_key(self) if cache else None
+        if cache and key:
+            cached = cache.get(key)
+            if cached:
+                self._rendered_from_cache = True
+                return cached
         self.import_mappings()
         self.create_template()
         if self.description:
@@ -676,12 +700,15 @@ class Blueprint:
         self.setup_parameters()
         rendered = self.template.to_json(indent=self.context.template_indent)
         version = hashlib.md5(rendered.encode()).hexdigest()[:8]
+        if cache and key:
+            cache.put(key, version, rendered, blueprint=self.name)
         return version, rendered
 
     def reset_template(self) -> None:
         """Reset template."""
         self.template = Template()
         self._rendered = None
+        self._rendered_from_cache = False
         self._version = None
 
     def resolve_variables(self, provided_variables: List[Variable]) -> None:
@@ -226,6 +226,11 @@ class RawTemplateBlueprint(Blueprint):  # pylint: disable=abstract-method
         """Load template and generate its md5 hash."""
         return (self.version, self.rendered)
 
+    def reset_template(self) -> None:
+        """Reset template."""
+        self._rendered = None
+        self._version = None
+
     def resolve_variables(self, provided_variables: List[Variable]) -> None:
         """Resolve the values of the blueprint variables.
 
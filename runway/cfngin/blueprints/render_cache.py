@@ -0,0 +1,315 @@
+"""Cache of templates rendered by CFNgin blueprints."""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import awacs
+import troposphere
+
+from ... import __version__
+from ...constants import DEFAULT_CACHE_DIR
+
+if TYPE_CHECKING:
+    from .base import Blueprint
+
+LOGGER = logging.getLogger(__name__)
+
+RENDER_CACHE_DIR = DEFAULT_CACHE_DIR / "rendered_templates"
+RENDER_CACHE_MAX_SIZE = 256 * 1024**2
+
+_SOURCE_HASHES: Dict[Tuple[str, int, int], str] = {}
+
+
+class RenderCacheEntry(NamedTuple):
+    """Template cached for one key."""
+
+    blueprint: str
+    hits: int
+    key: str
+    last_used: float
+    size: int
+
+
+def _serialize(value: Any) -> Any:
+    """Serialize values that are not supported by :func:`json.dumps`.
+
+    Raises:
+        TypeError: The value can't be reliably serialized.
+
+    """
+    if hasattr(value, "to_parameter_value"):  # CFNParameter
+        return {"CFNParameter": [value.name, value.to_parameter_value()]}
+    if hasattr(value, "to_dict"):  # troposphere objects
+        return value.to_dict()
+    raise TypeError(f"{type(value)} can't be used in a cache key")
+
+
+def get_source_hash(klass: type) -> str:
+    """Hash the source files of a class and each of its base classes.
+
+    The hash of each file is kept until the file is modified.
+
+    Args:
+        klass: Class to hash.
+
+    """
+    result = hashlib.sha256()
+    for base in klass.__mro__:
+        try:
+            source_file = inspect.getsourcefile(base)
+        except TypeError:  # builtin
+            continue
+        if not source_file:
+            continue
+        stat = os.stat(source_file)
+        signature = (source_file, stat.st_mtime_ns, stat.st_size)
+        if signature not in _SOURCE_HASHES:
+            _SOURCE_HASHES[signature] = hashlib.sha256(
+                Path(source_file).read_bytes()
+            ).hexdigest()
+        result.update(f"{base.__module__}.{base.__qualname__}\0".encode())
+        result.update(_SOURCE_HASHES[signature].encode())
+    return result.hexdigest()
+
+
+class RenderCache:
+    """Persistent cache of templates rendered by blueprints.
+
+    Each entry is a template file named after a hash of everything that can
+    change the result of rendering a blueprint (e.g. the source of the
+    blueprint class, resolved variables, mappings, versions of Runway and
+    troposphere). A metadata file next to the template records its size,
+    the number of times it was used, and (as its modified time) when it was
+    last used so the least recently used entries can be evicted once the
+    total size of the cache exceeds ``max_size``.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[Path, str]] = None,
+        *,
+        max_size: Optional[int] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            cache_dir: Directory where entries are stored.
+                Defaults to :data:`RENDER_CACHE_DIR`.
+            max_size: Maximum total size of the cache in bytes.
+                Defaults to :data:`RENDER_CACHE_MAX_SIZE`.
+
+        """
+        self.cache_dir = Path(cache_dir or RENDER_CACHE_DIR)
+        self.max_size = RENDER_CACHE_MAX_SIZE if max_size is None else max_size
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> List[RenderCacheEntry]:
+        """Entries of the cache, least recently used first."""
+        if not self.cache_dir.is_dir():
+            return []
+        entries: List[RenderCacheEntry] = []
+        for metadata_file in self.cache_dir.glob("*.json"):
+            if metadata_file.name.startswith("."):
+                continue  # metadata being written
+            try:
+                metadata = json.loads(metadata_file.read_text())
+                last_used = metadata_file.stat().st_mtime
+            except (OSError, ValueError):
+                continue  # being written or removed by another process
+            entries.append(
+                RenderCacheEntry(
+                    blueprint=metadata.get("blueprint", ""),
+                    hits=metadata.get("hits", 0),
+                    key=metadata_file.stem,
+                    last_used=last_used,
+                    size=metadata.get("size", 0),
+                )
+            )
+        return sorted(entries, key=lambda entry: entry.last_used)
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups that were hits in the current process."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache in bytes."""
+        return sum(entry.size for entry in self.entries)
+
+    @staticmethod
+    def compute_key(blueprint: Blueprint) -> Optional[str]:
+        """Compute the key of the template rendered by a blueprint.
+
+        Args:
+            blueprint: Blueprint with resolved variables.
+
+        Returns:
+            The key or ``None`` if the blueprint can't be cached (e.g. a
+            variable value can't be serialized).
+
+        """
+        klass = type(blueprint)
+        try:
+            data = json.dumps(
+                {
+                    "blueprint": f"{klass.__module__}.{klass.__qualname__}",
+                    "description": blueprint.description,
+                    "environment": blueprint.context.env.name,
+                    "mappings": blueprint.mappings,
+                    "name": blueprint.name,
+                    "namespace": blueprint.context.namespace,
+                    "region": blueprint.context.env.aws_region,
+                    "source": get_source_hash(klass),
+                    "template": blueprint.template.to_dict(),
+                    "template_indent": blueprint.context.template_indent,
+                    "variables": blueprint.variables,
+                    "versions": [
+                        __version__,
+                        troposphere.__version__,
+                        awacs.__version__,
+                    ],
+                },
+                default=_serialize,
+                sort_keys=True,
+            )
+        except (TypeError, ValueError) as exc:
+            LOGGER.debug(
+                "%s: unable to cache rendered template: %s", blueprint.name, exc
+            )
+            return None
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """Get the template rendered for a key.
+
+        Args:
+            key: Key computed by :meth:`compute_key`.
+
+        Returns:
+            Version and rendered template if cached.
+
+        """
+        metadata_file = self.cache_dir / f"{key}.json"
+        try:
+            metadata = json.loads(metadata_file.read_text())
+            rendered = (self.cache_dir / f"{key}.template").read_text()
+        except (OSError, ValueError):
+            self._record(key, hit=False)
+            return None
+        metadata["hits"] = metadata.get("hits", 0) + 1
+        try:
+            self._write_metadata(key, metadata)  # also records use for LRU eviction
+        except OSError:
+            pass
+        self._record(key, hit=True)
+        return metadata["version"], rendered
+
+    def put(self, key: str, version: str, rendered: str, blueprint: str = "") -> None:
+        """Add a rendered template to the cache, then evict entries as needed.
+
+        Args:
+            key: Key computed by :meth:`compute_key`.
+            version: Version of the template.
+            rendered: Rendered template.
+            blueprint: Name of the blueprint that rendered the template.
+
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            template_file = self.cache_dir / f".tmp-{os.getpid()}-{key}.template"
+            template_file.write_text(rendered)
+            template_file.replace(self.cache_dir / f"{key}.template")
+            self._write_metadata(
+                key,
+                {
+                    "blueprint": blueprint,
+                    "created": time.time(),
+                    "hits": 0,
+                    "size": len(rendered.encode()),
+                    "version": version,
+                },
+            )
+        except OSError as exc:  # caching is best effort
+            LOGGER.debug("unable to cache rendered template %s: %s", key, exc)
+            return
+        self.prune()
+
+    def prune(self, max_size: Optional[int] = None) -> List[RenderCacheEntry]:
+        """Remove the least recently used entries until the cache fits in a size.
+
+        Args:
+            max_size: Maximum total size of the cache in bytes.
+                If not provided, the max size of the cache is used.
+
+        Returns:
+            Entries that were removed.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+        removed: List[RenderCacheEntry] = []
+        with self._lock:
+            entries = self.entries
+            total = sum(entry.size for entry in entries)
+            for entry in entries:
+                if total <= max_size:
+                    break
+                self.remove(entry)
+                removed.append(entry)
+                total -= entry.size
+        return removed
+
+    def remove(self, entry: RenderCacheEntry) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            entry: Entry to remove.
+
+        """
+        LOGGER.debug("removing cached template: %s", entry.key)
+        # remove the metadata first so the entry is no longer used
+        for suffix in [".json", ".template"]:
+            try:
+                (self.cache_dir / f"{entry.key}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+
+    def _record(self, key: str, *, hit: bool) -> None:
+        """Record a hit or miss."""
+        self.stats["hits" if hit else "misses"] += 1
+        LOGGER.debug(
+            "rendered template cache %s for %s (hit rate %.0f%% of %s lookups)",
+            "hit" if hit else "miss",
+            key[:12],
+            self.hit_rate * 100,
+            self.stats["hits"] + self.stats["misses"],
+        )
+
+    def _write_metadata(self, key: str, metadata: Dict[str, Any]) -> None:
+        """Write the metadata of an entry."""
+        metadata_file = self.cache_dir / f".tmp-{os.getpid()}-{key}.json"
+        metadata_file.write_text(json.dumps(metadata))
+        metadata_file.replace(self.cache_dir / f"{key}.json")
+
+
+_RENDER_CACHE: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """Get the render cache shared by the blueprints of the current process."""
+    global _RENDER_CACHE  # pylint: disable=global-statement
+    if _RENDER_CACHE is None:
+        _RENDER_CACHE = RenderCache()
+    return _RENDER_CACHE
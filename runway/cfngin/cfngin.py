@@ -5,15 +5,20 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, cast
 
+from typing_extensions import Literal
 from yaml.constructor import ConstructorError
 
+from .. import _tracing
 from .._logging import PrefixAdaptor
 from ..compat import cached_property
 from ..config import CfnginConfig
 from ..context import CfnginContext
+from ..core.components._dependency_graph import DependencyGraph
+from ..exceptions import InvalidLookupConcatenation, UnknownLookupType
 from ..utils import MutableMap, SafeHaven
+from ..variables import VariableValue
 from .actions import deploy, destroy, diff
 from .environment import parse_environment
 from .providers.aws.default import ProviderBuilder
@@ -33,6 +38,8 @@ class CFNgin:
         concurrency: Max number of CFNgin stacks that can be deployed concurrently.
             If the value is ``0``, will be constrained based on the underlying graph.
         interactive: Whether or not to prompt the user before taking action.
+        max_concurrent_configs: Max number of config files that can be
+            processed concurrently.
         parameters: Combination of the parameters provided when initalizing the
             class and any environment files that are found.
         recreate_failed: Destroy and re-create stacks that are stuck in
@@ -45,6 +52,7 @@ class CFNgin:
 
     concurrency: int
     interactive: bool
+    max_concurrent_configs: int
     parameters: MutableMap
     recreate_failed: bool
     region: str
@@ -67,8 +75,11 @@ class CFNgin:
         """
         self.__ctx = ctx
         self._env_file_name = None
+        self._ensured_buckets: Set[str] = set()
+        self._provider_builders: Dict[Optional[str], ProviderBuilder] = {}
         self.concurrency = ctx.env.max_concurrent_cfngin_stacks
         self.interactive = ctx.is_interactive
+        self.max_concurrent_configs = ctx.env.max_concurrent_cfngin_configs
         self.parameters = MutableMap()
         self.recreate_failed = ctx.is_noninteractive
         self.region = ctx.env.aws_region
@@ -119,19 +130,7 @@ class CFNgin:
         with SafeHaven(
             environ=self.__ctx.env.vars, sys_modules_exclude=["awacs", "troposphere"]
         ):
-            for config_path in config_file_paths:
-                logger = PrefixAdaptor(os.path.basename(config_path), LOGGER)
-                logger.notice("deploy (in progress)")
-                with SafeHaven(sys_modules_exclude=["awacs", "troposphere"]):
-                    ctx = self.load(config_path)
-                    action = deploy.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        ),
-                    )
-                    action.execute(concurrency=self.concurrency, tail=self.tail)
-                logger.success("deploy (complete)")
+            self._run_configs("deploy", config_file_paths)
 
     def destroy(self, force: bool = False, sys_path: Optional[Path] = None) -> None:
         """Run the CFNgin destroy action.
@@ -152,21 +151,7 @@ class CFNgin:
         config_file_paths.reverse()
 
         with SafeHaven(environ=self.__ctx.env.vars):
-            for config_path in config_file_paths:
-                logger = PrefixAdaptor(config_path.name, LOGGER)
-                logger.notice("destroy (in progress)")
-                with SafeHaven():
-                    ctx = self.load(config_path)
-                    action = destroy.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        ),
-                    )
-                    action.execute(
-                        concurrency=self.concurrency, force=True, tail=self.tail
-                    )
-                logger.success("destroy (complete)")
+            self._run_configs("destroy", config_file_paths)
 
     def load(self, config_path: Path) -> CfnginContext:
         """Load a CFNgin config into a context object.
@@ -209,19 +194,7 @@ class CFNgin:
             sys_path = self.sys_path
         config_file_paths = self.find_config_files(sys_path=sys_path)
         with SafeHaven(environ=self.__ctx.env.vars):
-            for config_path in config_file_paths:
-                logger = PrefixAdaptor(config_path.name, LOGGER)
-                logger.notice("plan (in progress)")
-                with SafeHaven():
-                    ctx = self.load(config_path)
-                    action = diff.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        ),
-                    )
-                    action.execute()
-                logger.success("plan (complete)")
+            self._run_configs("plan", config_file_paths)
 
     def should_skip(self, force: bool = False) -> bool:
         """Determine if action should be taken or not.
@@ -236,6 +209,111 @@ class CFNgin:
         LOGGER.info("skipped; no parameters and environment file not found")
         return True
 
+    def _ensure_cfn_bucket(self, action: deploy.Action) -> bool:
+        """Ensure the CloudFormation template bucket of an action exists.
+
+        Each bucket is only checked once so config files that use the same
+        bucket share the result.
+
+        Returns:
+            Whether the bucket was checked.
+
+        """
+        if not action.bucket_name:
+            return False
+        if action.bucket_name not in self._ensured_buckets:
+            action.ensure_cfn_bucket()
+            self._ensured_buckets.add(action.bucket_name)
+        return True
+
+    @classmethod
+    def _get_config_dependencies(
+        cls, contexts: List[CfnginContext]
+    ) -> Dict[str, List[str]]:
+        """Determine which config files depend on the config files before them.
+
+        A config file depends on an earlier config file if they use the same
+        namespace or it references one of the stacks of the earlier config
+        file with a ``cfn``, ``output``, ``rxref``, or ``xref`` lookup.
+
+        Any other kind of dependency (e.g. SSM parameters, hooks, or blueprint
+        code) is not detected. Config files with such a dependency must use
+        the same namespace, be placed in separate modules ordered with
+        ``depends_on``, or be processed sequentially.
+
+        Args:
+            contexts: Context object of each config file, in the order they
+                would be processed.
+
+        Returns:
+            Names of the config files each config file depends on.
+
+        """
+        result: Dict[str, List[str]] = {}
+        for index, ctx in enumerate(contexts):
+            referenced = cls._get_referenced_stacks(ctx)
+            result[ctx.config_path.name] = [
+                other.config_path.name
+                for other in contexts[:index]
+                if other.namespace == ctx.namespace
+                or any(
+                    other.get_fqn(stack.stack_name or stack.name) in referenced
+                    for stack in other.config.stacks
+                )
+            ]
+        return result
+
+    @staticmethod
+    def _get_referenced_stacks(ctx: CfnginContext) -> Set[str]:
+        """Get the fully qualified names of the stacks referenced by a config file.
+
+        Stacks are referenced by ``cfn``, ``output``, ``rxref``, and ``xref``
+        lookups. Lookups with a query that contains another lookup, and values
+        that cannot be parsed, are ignored.
+
+        Args:
+            ctx: Context object of the config file.
+
+        """
+        result: Set[str] = set()
+        config = ctx.config
+        values: List[Any] = [
+            model.dict()
+            for model in [
+                *config.pre_deploy,
+                *config.post_deploy,
+                *config.pre_destroy,
+                *config.post_destroy,
+                *config.stacks,
+            ]
+        ]
+        while values:
+            value = values.pop()
+            if isinstance(value, dict):
+                values.extend(cast(Dict[Any, Any], value).values())
+            elif isinstance(value, list):
+                values.extend(cast(List[Any], value))
+            elif isinstance(value, str) and "${" in value:
+                try:
+                    lookups = VariableValue.parse_obj(
+                        value, variable_type="cfngin"
+                    ).lookups
+                except (InvalidLookupConcatenation, UnknownLookupType):
+                    continue
+                for lookup in lookups:
+                    if lookup.lookup_query.lookups:
+                        continue
+                    name = lookup.lookup_name.value
+                    query = str(lookup.lookup_query.value)
+                    if name == "cfn":
+                        result.add(query.split("::", 1)[0].split(".", 1)[0])
+                    elif name in ("output", "rxref", "xref") and "::" in query:
+                        stack_name = query.split("::", 1)[0]
+                        result.add(
+                            stack_name if name == "xref" else ctx.get_fqn(stack_name)
+                        )
+        return result
+
     def _get_config(self, file_path: Path) -> CfnginConfig:
         """Initialize a CFNgin config object from a file.
 
@@ -272,16 +350,120 @@ class CFNgin:
             service_role: CloudFormation service role.
 
         """
+        if service_role in self._provider_builders:
+            return self._provider_builders[service_role]
         if self.interactive:
             LOGGER.verbose("using interactive AWS provider mode")
         else:
             LOGGER.verbose("using default AWS provider mode")
-        return ProviderBuilder(
+        self._provider_builders[service_role] = ProviderBuilder(
             interactive=self.interactive,
             recreate_failed=self.recreate_failed,
             region=self.region,
             service_role=service_role,
         )
+        return self._provider_builders[service_role]
+
+    def _run_config(
+        self, action: Literal["deploy", "destroy", "plan"], config_path: Path
+    ) -> None:
+        """Run an action for a single config file.
+
+        Args:
+            action: Name of the action to run.
+            config_path: Path to the config file.
+
+        """
+        logger = PrefixAdaptor(config_path.name, LOGGER)
+        logger.notice("%s (in progress)", action)
+        with _tracing.span(config_path.name, "cfngin", action=action), (
+            SafeHaven(sys_modules_exclude=["awacs", "troposphere"])
+            if action == "deploy"
+            else SafeHaven()
+        ):
+            ctx = self.load(config_path)
+            provider_builder = self._get_provider_builder(ctx.config.service_role)
+            if action == "deploy":
+                deploy_action = deploy.Action(
+                    context=ctx, provider_builder=provider_builder
+                )
+                deploy_action.execute(
+                    cfn_bucket_ensured=self._ensure_cfn_bucket(deploy_action),
+                    concurrency=self.concurrency,
+                    tail=self.tail,
+                )
+            elif action == "destroy":
+                destroy.Action(context=ctx, provider_builder=provider_builder).execute(
+                    concurrency=self.concurrency, force=True, tail=self.tail
+                )
+            else:
+                diff.Action(context=ctx, provider_builder=provider_builder).execute()
+        logger.success("%s (complete)", action)
+
+    def _run_configs(
+        self,
+        action: Literal["deploy", "destroy", "plan"],
+        config_file_paths: List[Path],
+    ) -> None:
+        """Run an action for each config file.
+
+        Config files are processed concurrently when
+        :attr:`max_concurrent_configs` is greater than ``1`` and they do not
+        depend on each other. Otherwise, they are processed in order.
+        Dependencies are reversed for destroy so a config file is destroyed
+        after the config files that depend on it.
+
+        Args:
+            action: Name of the action to run.
+            config_file_paths: Paths to the config files, in the order they
+                should be processed (reversed for destroy).
+
+        """
+        if (
+            self.max_concurrent_configs < 2
+            or len(config_file_paths) < 2
+            or not self.__ctx.use_concurrent
+        ):
+            for config_path in config_file_paths:
+                self._run_config(action, config_path)
+            return
+        contexts: List[CfnginContext] = []
+        for config_path in config_file_paths:
+            with SafeHaven():
+                contexts.append(self.load(config_path))
+            if action == "deploy":  # check buckets once before forking
+                self._ensure_cfn_bucket(
+                    deploy.Action(
+                        context=contexts[-1],
+                        provider_builder=self._get_provider_builder(
+                            contexts[-1].config.service_role
+                        ),
+                    )
+                )
+        # dependencies are determined in the order config files are deployed
+        dependencies = self._get_config_dependencies(
+            contexts[::-1] if action == "destroy" else contexts
+        )
+        graph = DependencyGraph(
+            [
+                (ctx.config_path.name, dependencies[ctx.config_path.name])
+                for ctx in contexts
+            ],
+            kind="config file",
+            reverse=action == "destroy",
+        )
+        paths = {config_path.name: config_path for config_path in config_file_paths}
+        LOGGER.info("processing config files in parallel...")
+        failed, skipped = graph.run(
+            lambda name: self._run_config(action, paths[name]),
+            continue_on_error=self.__ctx.env.continue_on_error,
+            max_workers=self.max_concurrent_configs,
+        )
+        if skipped:
+            LOGGER.error("skipped config file(s): %s", ", ".join(skipped))
+        if failed:
+            LOGGER.error("failed config file(s): %s", ", ".join(failed))
+            sys.exit(1)
 
     def _inject_common_parameters(self) -> None:
         """Add common parameters if they don't already exist.
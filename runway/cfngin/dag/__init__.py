@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import collections
+import collections.abc
 import logging
-from copy import copy, deepcopy
-from threading import Thread
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
     List,
+    Optional,
     OrderedDict,
     Set,
     Tuple,
@@ -19,9 +22,6 @@ from typing import (
     cast,
 )
 
-if TYPE_CHECKING:
-    import threading
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -29,14 +29,95 @@ class DAGValidationError(Exception):
     """Raised when DAG validation fails."""
 
 
+class _DAGIndex:
+    """Integer-indexed view of a DAG, derived from its topological order.
+
+    Nodes are numbered by their position in the topological order so every
+    edge points from a lower to a higher number and the nodes reachable from
+    a node can be stored as the bits of an integer.
+
+    """
+
+    __slots__ = ("_reachable", "index", "nodes", "successors")
+
+    def __init__(self, graph: OrderedDict[str, Set[str]], nodes: List[str]) -> None:
+        """Instantiate class.
+
+        Args:
+            graph: Graph of a DAG.
+            nodes: Nodes of the graph in topological order.
+
+        """
+        self._reachable: Optional[List[int]] = None
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.nodes = nodes
+        self.successors = [[self.index[edge] for edge in graph[node]] for node in nodes]
+
+    @property
+    def reachable(self) -> List[int]:
+        """Bitset of the nodes reachable from each node."""
+        if self._reachable is None:
+            reachable = [0] * len(self.nodes)
+            for i in reversed(range(len(self.nodes))):
+                bits = 0
+                for successor in self.successors[i]:
+                    bits |= reachable[successor] | (1 << successor)
+                reachable[i] = bits
+            self._reachable = reachable
+        return self._reachable
+
+    def members(self, bits: int) -> List[str]:
+        """Return the nodes in a bitset, in topological order."""
+        flags = bin(bits)[:1:-1]  # least significant bit first
+        result: List[str] = []
+        i = flags.find("1")
+        while i != -1:
+            result.append(self.nodes[i])
+            i = flags.find("1", i + 1)
+        return result
+
+
 class DAG:
-    """Directed acyclic graph implementation."""
+    """Directed acyclic graph implementation.
 
-    graph: OrderedDict[str, Set[str]]
+    The topological order of the graph, and the nodes reachable from each
+    node, are calculated when first needed and cached until the graph is
+    changed using the methods of this class. The cache must be cleared with
+    :meth:`invalidate` after changing :attr:`graph` directly.
+
+    """
 
     def __init__(self) -> None:
         """Instantiate a new DAG with no nodes or edges."""
-        self.graph = collections.OrderedDict()
+        self._graph: OrderedDict[str, Set[str]] = collections.OrderedDict()
+        self._index: Optional[_DAGIndex] = None
+
+    @property
+    def graph(self) -> OrderedDict[str, Set[str]]:
+        """Mapping of each node to the nodes it has edges towards."""
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: OrderedDict[str, Set[str]]) -> None:
+        """Replace the graph."""
+        self._graph = value
+        self.invalidate()
+
+    @property
+    def _indexed(self) -> _DAGIndex:
+        """Integer-indexed view of the graph.
+
+        Raises:
+            ValueError: Raised if the graph is not acyclic.
+
+        """
+        if self._index is None:
+            self._index = _DAGIndex(self.graph, self._topological_sort())
+        return self._index
+
+    def invalidate(self) -> None:
+        """Clear cached information about the graph."""
+        self._index = None
 
     def add_node(self, node_name: str) -> None:
         """Add a node if it does not exist yet, or error out.
@@ -53,6 +134,7 @@ class DAG:
         if node_name in graph:
             raise KeyError("node %s already exists" % node_name)
         graph[node_name] = cast(Set[str], set())
+        self.invalidate()
 
     def add_node_if_not_exists(self, node_name: str) -> None:
         """Add a node if it does not exist yet, ignoring duplicates.
@@ -84,6 +166,7 @@ class DAG:
         for _node, edges in graph.items():
             if node_name in edges:
                 edges.remove(node_name)
+        self.invalidate()
 
     def delete_node_if_exists(self, node_name: str) -> None:
         """Delete this node and all edges referencing it.
@@ -117,15 +200,41 @@ class DAG:
             raise KeyError("independent node %s does not exist" % ind_node)
         if dep_node not in graph:
             raise KeyError("dependent node %s does not exist" % dep_node)
-        test_graph = deepcopy(graph)
-        test_graph[ind_node].add(dep_node)
-        test_dag = DAG()
-        test_dag.graph = test_graph
-        is_valid, message = test_dag.validate()
-        if is_valid:
-            graph[ind_node].add(dep_node)
-        else:
-            raise DAGValidationError(message)
+        if dep_node in graph[ind_node]:
+            return
+        if self._is_reachable(dep_node, ind_node):
+            raise DAGValidationError(self._cycle_message(ind_node, dep_node))
+        graph[ind_node].add(dep_node)
+        self.invalidate()
+
+    def _cycle_message(self, ind_node: str, dep_node: str) -> str:
+        """Message describing why an edge that creates a cycle is invalid."""
+        dependent_nodes = {
+            node for dependents in self.graph.values() for node in dependents
+        }
+        dependent_nodes.add(dep_node)
+        if all(node in dependent_nodes for node in self.graph):
+            return "no independent nodes detected"
+        return "graph is not acyclic"
+
+    def _is_reachable(self, start: str, target: str) -> bool:
+        """Whether a node can be reached by following edges from another node."""
+        if start == target:
+            return True
+        if self._index is not None:  # cached; no need to search the graph
+            index = self._index.index
+            return bool(self._index.reachable[index[start]] >> index[target] & 1)
+        graph = self.graph
+        stack = [start]
+        seen = {start}
+        while stack:
+            for edge in graph[stack.pop()]:
+                if edge == target:
+                    return True
+                if edge not in seen:
+                    seen.add(edge)
+                    stack.append(edge)
+        return False
 
     def delete_edge(self, ind_node: str, dep_node: str) -> None:
         """Delete an edge from the graph.
@@ -143,17 +252,21 @@ class DAG:
         if dep_node not in graph.get(ind_node, []):
             raise KeyError("No edge exists between %s and %s." % (ind_node, dep_node))
         graph[ind_node].remove(dep_node)
+        self.invalidate()
 
     def transpose(self) -> DAG:
         """Build a new graph with the edges reversed."""
         graph = self.graph
         transposed = DAG()
-        for node, edges in graph.items():
-            transposed.add_node(node)
+        # reversing the edges of a DAG can't create a cycle so they are
+        # added directly rather than validating each one
+        transposed_graph = transposed.graph
+        for node in graph:
+            transposed_graph[node] = set()
         for node, edges in graph.items():
             # for each edge A -> B, transpose it so that B -> A
             for edge in edges:
-                transposed.add_edge(edge, node)
+                transposed_graph[edge].add(node)
         return transposed
 
     def walk(self, walk_func: Callable[[str], Any]) -> None:
@@ -178,32 +291,28 @@ class DAG:
         """Perform a transitive reduction on the DAG.
 
         The transitive reduction of a graph is a graph with as few edges as
-        possible with the same reachability as the original graph.
+        possible with the same reachability as the original graph. An edge
+        is redundant if its target can be reached through another edge of the
+        same node.
 
         See https://en.wikipedia.org/wiki/Transitive_reduction
 
         """
-        combinations: List[List[str]] = []
-        for node, edges in self.graph.items():
-            combinations += [[node, edge] for edge in edges]
-
-        while True:
-            new_combinations: List[List[str]] = []
-            for comb1 in combinations:
-                for comb2 in combinations:
-                    if comb1[-1] != comb2[0]:
-                        continue
-                    new_entry = comb1 + comb2[1:]
-                    if new_entry not in combinations:
-                        new_combinations.append(new_entry)
-            if not new_combinations:
-                break
-            combinations += new_combinations
-
-        constructed = {(c[0], c[-1]) for c in combinations if len(c) != 2}
-        for node, edges in self.graph.items():
-            bad_nodes = {e for n, e in constructed if node == n}
-            self.graph[node] = edges - bad_nodes
+        indexed = self._indexed
+        reachable = indexed.reachable
+        for i, node in enumerate(indexed.nodes):
+            successors = indexed.successors[i]
+            if len(successors) < 2:
+                continue
+            indirect = 0
+            for successor in successors:
+                indirect |= reachable[successor]
+            self.graph[node] = {
+                indexed.nodes[successor]
+                for successor in successors
+                if not indirect >> successor & 1
+            }
+        self.invalidate()
 
     def rename_edges(self, old_node_name: str, new_node_name: str) -> None:
         """Change references to a node in existing edges.
@@ -214,7 +323,7 @@ class DAG:
 
         """
         graph = self.graph
-        for node, edges in graph.items():
+        for node, edges in list(graph.items()):
             if node == old_node_name:
                 graph[new_node_name] = copy(edges)
                 del graph[old_node_name]
@@ -223,6 +332,7 @@ class DAG:
                 if old_node_name in edges:
                     edges.remove(old_node_name)
                     edges.add(new_node_name)
+        self.invalidate()
 
     def predecessors(self, node: str) -> List[str]:
         """Return a list of all immediate predecessors of the given node.
@@ -262,15 +372,10 @@ class DAG:
             A list of nodes that are downstream from the node.
 
         """
-        nodes = [node]
-        nodes_seen: Set[str] = set()
-        for node__ in nodes:
-            downstreams = self.downstream(node__)
-            for downstream_node in downstreams:
-                if downstream_node not in nodes_seen:
-                    nodes_seen.add(downstream_node)
-                    nodes.append(downstream_node)
-        return [node_ for node_ in self.topological_sort() if node_ in nodes_seen]
+        if node not in self.graph:
+            raise KeyError("node %s is not in graph" % node)
+        indexed = self._indexed
+        return indexed.members(indexed.reachable[indexed.index[node]])
 
     def filter(self, nodes: List[str]) -> DAG:
         """Return a new DAG with only the given nodes and their dependencies.
@@ -291,6 +396,7 @@ class DAG:
         for node, edges in self.graph.items():
             if node in filtered_dag.graph:
                 filtered_dag.graph[node] = edges
+        filtered_dag.invalidate()
 
         return filtered_dag
 
@@ -308,17 +414,27 @@ class DAG:
             graph_dict: The dictionary used to create the graph.
 
         Raises:
+            DAGValidationError: Raised if the resulting graph is invalid.
+            KeyError: Raised if an edge references a node that does not exist.
             TypeError: Raised if the value of items in the dict are not lists.
 
         """
         self.reset_graph()
+        graph = self.graph
         for new_node in graph_dict:
             self.add_node(new_node)
+        # edges are validated once the graph is complete rather than one at a time
         for ind_node, dep_nodes in graph_dict.items():
-            if not isinstance(dep_nodes, collections.Iterable):
+            if not isinstance(dep_nodes, collections.abc.Iterable):
                 raise TypeError("%s: dict values must be lists" % ind_node)
             for dep_node in dep_nodes:
-                self.add_edge(ind_node, dep_node)
+                if dep_node not in graph:
+                    raise KeyError("dependent node %s does not exist" % dep_node)
+                graph[ind_node].add(dep_node)
+        self.invalidate()
+        is_valid, message = self.validate()
+        if not is_valid:
+            raise DAGValidationError(message)
 
     def reset_graph(self) -> None:
         """Restore the graph to an empty state."""
@@ -345,6 +461,15 @@ class DAG:
     def topological_sort(self) -> List[str]:
         """Return a topological ordering of the DAG.
 
+        Raises:
+            ValueError: Raised if the graph is not acyclic.
+
+        """
+        return list(self._indexed.nodes)
+
+    def _topological_sort(self) -> List[str]:
+        """Calculate a topological ordering of the DAG.
+
         Raises:
             ValueError: Raised if the graph is not acyclic.
 
@@ -356,19 +481,19 @@ class DAG:
             for val in graph[node]:
                 in_degree[val] += 1
 
-        queue: "collections.deque[str]" = collections.deque()
+        ready: "collections.deque[str]" = collections.deque()
         for node, value in in_degree.items():
             if value == 0:
-                queue.appendleft(node)
+                ready.appendleft(node)
 
         sorted_graph: List[str] = []
-        while queue:
-            node = queue.pop()
+        while ready:
+            node = ready.pop()
             sorted_graph.append(node)
             for val in sorted(graph[node]):
                 in_degree[val] -= 1
                 if in_degree[val] == 0:
-                    queue.appendleft(val)
+                    ready.appendleft(val)
 
         if len(sorted_graph) == len(graph):
             return sorted_graph
@@ -461,8 +586,10 @@ class ThreadedWalker:
                 finally:
                     self.semaphore.release()
 
-            deps = dag.all_downstreams(node)
-            threads[node] = Thread(target=_fn, args=(node, deps), name=node)
+            # dependencies only finish after their own dependencies so there is
+            # no need to wait on anything further downstream
+            deps = dag.downstream(node)
+            threads[node] = threading.Thread(target=_fn, args=(node, deps), name=node)
 
         # Start up all of the threads.
         for node in nodes:
@@ -470,3 +597,77 @@ class ThreadedWalker:
 
         # Wait for all threads to complete executing.
         wait_for(nodes)
+
+
+class ThreadPoolWalker:
+    """Walk a DAG as quickly as the graph topology allows, using a thread pool.
+
+    Rather than starting a thread for every node up front, the number of
+    unfinished dependencies of each node is tracked. A node is dispatched to
+    a bounded pool of worker threads the moment its last dependency finishes.
+
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Instantiate class.
+
+        Args:
+            max_workers: Maximum number of nodes that can be executed in
+                parallel. If not provided, the number of nodes in the graph
+                being walked is used (e.g. as fast as the topology allows).
+
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+
+    def walk(self, dag: DAG, walk_func: Callable[[str], Any]) -> None:
+        """Walk each node of the graph, in parallel if it can.
+
+        The walk_func is only called when the nodes dependencies have been
+        satisfied.
+
+        """
+        # nodes with no dependencies first
+        nodes = dag.topological_sort()
+        nodes.reverse()
+        if not nodes:
+            return
+
+        # number of unfinished dependencies for each node
+        pending = {node: len(dag.graph[node]) for node in nodes}
+        # maps a node to the nodes that depend on it
+        dependents: Dict[str, List[str]] = {node: [] for node in nodes}
+        for node in nodes:
+            for dep in dag.graph[node]:
+                dependents[dep].append(node)
+
+        finished: "queue.Queue[str]" = queue.Queue()
+
+        def _fn(node: str) -> None:
+            """Execute the walk_func on a node, reporting when it finishes."""
+            thread = threading.current_thread()
+            thread_name = thread.name
+            thread.name = node  # keeps log records attributable to the node
+            LOGGER.debug("%s starting", node)
+            try:
+                walk_func(node)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("unhandled exception while walking %s", node)
+            finally:
+                thread.name = thread_name
+                finished.put(node)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers or len(nodes), len(nodes)),
+            thread_name_prefix="dag-walker",
+        ) as executor:
+            for node in nodes:
+                if not pending[node]:
+                    executor.submit(_fn, node)
+            for _ in range(len(nodes)):
+                node = finished.get()
+                for dependent in dependents[node]:
+                    pending[dependent] -= 1
+                    if not pending[dependent]:
+                        executor.submit(_fn, dependent)
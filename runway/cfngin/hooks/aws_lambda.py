@@ -6,16 +6,22 @@ import hashlib
 import json
 import logging
 import os
+import platform
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from distutils.util import strtobool
-from io import BytesIO as StringIO
+from io import BytesIO
 from pathlib import Path
 from shutil import copyfile
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Dict,
@@ -23,15 +29,17 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
 )
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZipFile, ZipInfo
 
 import botocore
 import botocore.exceptions
 import docker
+import docker.errors
 import docker.types
 import formic
 from docker.models.containers import Container
@@ -39,11 +47,15 @@ from docker.models.images import Image
 from troposphere.awslambda import Code
 from typing_extensions import Literal, TypedDict
 
+from ... import _tracing
 from ...constants import DOT_RUNWAY_DIR
 from ..exceptions import InvalidDockerizePipConfiguration, PipenvError, PipError
 from ..utils import ensure_s3_bucket
+from .aws_lambda_cache import DependencyCache, is_pinned
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from mypy_boto3_s3.client import S3Client
     from mypy_boto3_s3.type_defs import HeadObjectOutputTypeDef
 
@@ -56,6 +68,11 @@ ZIP_PERMS_MASK = (stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO) << 16
 
 LOGGER = logging.getLogger(__name__)
 
+# size of the chunks used to read files being added to a ZIP file
+ZIP_CHUNK_SIZE = 1024 * 1024
+# ZIP files larger than this are written to disk instead of kept in memory
+ZIP_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
 # list from python tags of https://hub.docker.com/r/lambci/lambda/tags
 SUPPORTED_RUNTIMES = [
     # Python 2.7 reached end-of-life on January 1st, 2020.
@@ -172,46 +189,60 @@ def should_use_docker(dockerize_pip: DockerizePipArgTypeDef = None) -> bool:
     return False
 
 
-def _zip_files(files: Iterable[str], root: str) -> Tuple[bytes, str]:
-    """Generate a ZIP file in-memory from a list of files.
+def _zip_files(files: Iterable[str], root: str) -> Tuple[IO[bytes], str]:
+    """Generate a ZIP file from a list of files in a single pass.
 
     Files will be stored in the archive with relative names, and have their
     UNIX permissions forced to 755 or 644 (depending on whether they are
     user-executable in the source filesystem).
 
+    Each file is read once, in chunks, to both compress it and update the hash
+    of the payload. The archive is kept in memory until it grows larger than
+    :data:`ZIP_SPOOL_MAX_SIZE` after which it is written to a temporary file.
+
     Args:
         files: file names to add to the archive, relative to ``root``.
         root: base directory to retrieve files from.
 
     Returns:
-        Content of the ZIP file as a byte string and calculated hash of all the files.
+        ZIP file, positioned at its start, and calculated hash of all the files.
+        The caller is responsible for closing the file.
 
     """
-    zip_data = StringIO()
-    files = list(files)  # create copy of list also converts generator to list
-    with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
-        for file_name in files:
-            zip_file.write(os.path.join(root, file_name), file_name)
-
-        # Fix file permissions to avoid any issues - only care whether a file
-        # is executable or not, choosing between modes 755 and 644 accordingly.
-        for zip_entry in zip_file.filelist:
-            perms = (zip_entry.external_attr & ZIP_PERMS_MASK) >> 16
-            new_perms = 0o755 if perms & stat.S_IXUSR != 0 else 0o644
-            if new_perms != perms:
-                LOGGER.debug(
-                    "fixing perms: %s: %o => %o", zip_entry.filename, perms, new_perms
-                )
-                new_attr = (zip_entry.external_attr & ~ZIP_PERMS_MASK) | (
-                    new_perms << 16
-                )
-                zip_entry.external_attr = new_attr
-
-    contents = zip_data.getvalue()
-    zip_data.close()
-    content_hash = _calculate_hash(files, root)
-
-    return contents, content_hash
+    # pylint: disable=consider-using-with
+    zip_data = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+    file_hash = hashlib.md5()
+    try:
+        with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
+            # sorted to produce the same hash as _calculate_hash
+            for file_name in sorted(files):
+                zip_info = ZipInfo.from_file(os.path.join(root, file_name), file_name)
+                zip_info.compress_type = ZIP_DEFLATED
+                # Fix file permissions to avoid any issues - only care whether a
+                # file is executable or not, choosing between modes 755 and 644.
+                perms = (zip_info.external_attr & ZIP_PERMS_MASK) >> 16
+                new_perms = 0o755 if perms & stat.S_IXUSR != 0 else 0o644
+                if new_perms != perms:
+                    LOGGER.debug(
+                        "fixing perms: %s: %o => %o", file_name, perms, new_perms
+                    )
+                    zip_info.external_attr = (
+                        zip_info.external_attr & ~ZIP_PERMS_MASK
+                    ) | (new_perms << 16)
+                file_hash.update((file_name + "\0").encode())
+                with open(os.path.join(root, file_name), "rb") as src, zip_file.open(
+                    zip_info, "w", force_zip64=zip_info.file_size > ZIP64_LIMIT
+                ) as dest:
+                    # pylint: disable=cell-var-from-loop
+                    for chunk in iter(lambda: src.read(ZIP_CHUNK_SIZE), b""):
+                        file_hash.update(chunk)
+                        dest.write(chunk)
+                file_hash.update("\0".encode())
+    except BaseException:
+        zip_data.close()
+        raise
+    zip_data.seek(0)
+    return zip_data, file_hash.hexdigest()
 
 
 def _calculate_hash(files: Iterable[str], root: str) -> str:
@@ -273,8 +304,8 @@ def _find_files(
 
 def _zip_from_file_patterns(
     root: str, includes: List[str], excludes: List[str], follow_symlinks: bool
-) -> Tuple[bytes, str]:
-    """Generate a ZIP file in-memory from file search patterns.
+) -> Tuple[IO[bytes], str]:
+    """Generate a ZIP file from file search patterns.
 
     Args:
         root: Base directory to list files from.
@@ -511,6 +542,66 @@ def dockerized_pip(
         LOGGER.info(log.decode().strip())
 
 
+def _dependency_cache_key(
+    requirements_file: str,
+    *,
+    client: Optional[docker.DockerClient] = None,
+    dockerize_pip: DockerizePipArgTypeDef = False,
+    docker_file: Optional[str] = None,
+    docker_image: Optional[str] = None,
+    python_dontwritebytecode: bool = False,
+    python_path: Optional[str] = None,
+    runtime: Optional[str] = None,
+    **_: Any,
+) -> Optional[str]:
+    """Compute the key of the dependencies installed from a requirements file.
+
+    Includes everything that changes what ``pip`` installs: the content of the
+    requirements file, the ID of the Docker image or python interpreter used,
+    and the platform of the build.
+
+    Returns:
+        The key or ``None`` if the dependencies should not be cached because
+        they could change without the key changing (e.g. requirements are not
+        pinned or the Docker image must be built or pulled first).
+
+    """
+    if not is_pinned(requirements_file):
+        LOGGER.debug("not caching dependencies; requirements are not all pinned")
+        return None
+    if should_use_docker(dockerize_pip):
+        if docker_file or not (docker_image or runtime):
+            LOGGER.debug("not caching dependencies; docker image is built by pip")
+            return None
+        image = docker_image or f"lambci/lambda:build-{runtime}"
+        try:
+            image_id = (client or docker.from_env()).images.get(image).id
+        except docker.errors.DockerException as err:
+            LOGGER.debug("not caching dependencies; image not available: %s", err)
+            return None
+        environment = ["docker", image_id]
+    else:
+        environment = [
+            "pip",
+            python_path or sys.executable,
+            None if python_path else sys.version,
+            sys.platform,
+            platform.machine(),
+        ]
+    return DependencyCache.compute_key(
+        requirements_file, *environment, python_dontwritebytecode
+    )
+
+
+def _list_files(root: str) -> Set[str]:
+    """List all files in a directory, relative to the directory."""
+    return {
+        os.path.relpath(os.path.join(dir_path, file_name), root)
+        for dir_path, _, file_names in os.walk(root)
+        for file_name in file_names
+    }
+
+
 def _pip_has_no_color_option(python_path: str) -> bool:
     """Return boolean on whether pip is new enough to have --no-color option.
 
@@ -563,12 +654,19 @@ def _zip_package(  # pylint: disable=too-many-locals,too-many-statements
     python_path: Optional[str] = None,
     requirements_files: Dict[str, bool],
     use_pipenv: bool = False,
+    cache_dependencies: bool = False,
+    docker_semaphore: Optional[threading.Semaphore] = None,
     **kwargs: Any,
-) -> Tuple[bytes, str]:
-    """Create zip file in memory with package dependencies.
+) -> Tuple[IO[bytes], str]:
+    """Create zip file with package dependencies.
 
     Args:
         package_root: Base directory to copy files from.
+        cache_dependencies: Whether to reuse dependencies installed by a
+            previous build with the same requirements and build environment.
+            Only used when all requirements are pinned.
+        docker_semaphore: Semaphore acquired while ``pip`` runs in docker to
+            limit the number of concurrent containers.
         dockerize_pip: Whether to use docker or under what conditions docker will
             be used to run ``pip``.
         excludes: Exclusion patterns. Files matching those patterns will be
@@ -586,14 +684,13 @@ def _zip_package(  # pylint: disable=too-many-locals,too-many-statements
         use_pipenv: Whether to use pipenv to export a Pipfile as requirements.txt.
 
     Returns:
-        Content of the ZIP file as a byte string and calculated hash of all the files
+        ZIP file, positioned at its start, and calculated hash of all the files.
 
     """
     kwargs.setdefault("pipenv_timeout", 300)
 
     temp_root = DOT_RUNWAY_DIR
-    if not temp_root.is_dir():
-        temp_root.mkdir(parents=True)
+    temp_root.mkdir(parents=True, exist_ok=True)
 
     # exclude potential virtual environments in the package
     excludes = excludes or []
@@ -612,57 +709,90 @@ def _zip_package(  # pylint: disable=too-many-locals,too-many-statements
         pipenv_timeout=pipenv_timeout,
     )
 
-    if should_use_docker(dockerize_pip):
-        dockerized_pip(tmpdir.name, **kwargs)
-    else:
-        tmp_script = Path(tmpdir.name) / "__runway_run_pip_install.py"
-        pip_cmd = [
-            python_path or sys.executable,
-            "-m",
-            "pip",
-            "install",
-            "--target",
-            tmpdir.name,
-            "--requirement",
-            tmp_req,
-            "--no-color",
-        ]
-
-        subprocess_args: Dict[str, Any] = {}
-        if python_dontwritebytecode:
-            subprocess_args["env"] = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
-
-        # Pyinstaller build or explicit python path
-        if getattr(sys, "frozen", False) and not python_path:
-            script_contents = os.linesep.join(
-                [
-                    "import runpy",
-                    "from runway.utils imports argv",
-                    "with argv(*{}):".format(json.dumps(pip_cmd[2:])),
-                    '   runpy.run_module("pip", run_name="__main__")\n',
-                ]
+    cache = DependencyCache() if cache_dependencies else None
+    cache_key: Optional[str] = None
+    if cache:
+        try:
+            cache_key = _dependency_cache_key(
+                tmp_req,
+                dockerize_pip=dockerize_pip,
+                python_dontwritebytecode=python_dontwritebytecode,
+                python_path=python_path,
+                **kwargs,
             )
-            tmp_script.write_text(script_contents)
-            cmd = [sys.executable, "run-python", str(tmp_script)]
+        except OSError as err:
+            LOGGER.debug("not caching dependencies: %s", err)
+        if not cache_key:
+            cache = None
+    cached_dependencies = cache.get(cache_key) if cache and cache_key else None
+    if cached_dependencies:
+        LOGGER.info("using cached dependencies; not running pip")
+        DependencyCache.restore(cached_dependencies, tmpdir.name)
+    else:
+        existing_files = _list_files(tmpdir.name)
+        if should_use_docker(dockerize_pip):
+            with docker_semaphore or nullcontext():
+                dockerized_pip(tmpdir.name, **kwargs)
         else:
-            if not _pip_has_no_color_option(pip_cmd[0]):
-                pip_cmd.remove("--no-color")
-            cmd = pip_cmd
+            tmp_script = Path(tmpdir.name) / "__runway_run_pip_install.py"
+            pip_cmd = [
+                python_path or sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--target",
+                tmpdir.name,
+                "--requirement",
+                tmp_req,
+                "--no-color",
+            ]
 
-        LOGGER.info(
-            "The following output from pip may include incompatibility errors. "
-            "These can generally be ignored (pip will erroneously warn "
-            "about conflicts between the packages in your Lambda zip and "
-            "your host system)."
-        )
+            subprocess_args: Dict[str, Any] = {}
+            if python_dontwritebytecode:
+                subprocess_args["env"] = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+
+            # Pyinstaller build or explicit python path
+            if getattr(sys, "frozen", False) and not python_path:
+                script_contents = os.linesep.join(
+                    [
+                        "import runpy",
+                        "from runway.utils imports argv",
+                        "with argv(*{}):".format(json.dumps(pip_cmd[2:])),
+                        '   runpy.run_module("pip", run_name="__main__")\n',
+                    ]
+                )
+                tmp_script.write_text(script_contents)
+                cmd = [sys.executable, "run-python", str(tmp_script)]
+            else:
+                if not _pip_has_no_color_option(pip_cmd[0]):
+                    pip_cmd.remove("--no-color")
+                cmd = pip_cmd
+
+            LOGGER.info(
+                "The following output from pip may include incompatibility errors. "
+                "These can generally be ignored (pip will erroneously warn "
+                "about conflicts between the packages in your Lambda zip and "
+                "your host system)."
+            )
 
-        try:
-            subprocess.check_call(cmd, **subprocess_args)
-        except subprocess.CalledProcessError:
-            raise PipError from None
-        finally:
-            if tmp_script.is_file():
-                tmp_script.unlink()
+            try:
+                with _tracing.span("pip install", "subprocess"):
+                    subprocess.check_call(cmd, **subprocess_args)
+            except subprocess.CalledProcessError:
+                raise PipError from None
+            finally:
+                if tmp_script.is_file():
+                    tmp_script.unlink()
+
+        if cache and cache_key:
+            try:
+                cache.put(
+                    cache_key,
+                    tmpdir.name,
+                    sorted(_list_files(tmpdir.name) - existing_files),
+                )
+            except OSError as err:
+                LOGGER.warning("unable to cache dependencies: %s", err)
 
     if python_exclude_bin_dir and os.path.isdir(os.path.join(tmpdir.name, "bin")):
         LOGGER.debug("Removing python /bin directory from Lambda files")
@@ -723,7 +853,7 @@ def _upload_code(
     bucket: str,
     prefix: str,
     name: str,
-    contents: Union[bytes, str],
+    contents: Union[IO[bytes], bytes, str],
     content_hash: str,
     payload_acl: PayloadAclTypeDef,
 ) -> Code:
@@ -740,7 +870,8 @@ def _upload_code(
             the uploaded file
         name: desired name of the Lambda function. Will be used to construct a
             key name for the uploaded file.
-        contents: byte string with the content of the file upload.
+        contents: File object or byte string with the content of the file upload.
+            Large files are uploaded in multiple parts.
         content_hash: md5 hash of the contents to be uploaded.
         payload_acl: The canned S3 object ACL to be applied to the uploaded payload.
 
@@ -759,12 +890,58 @@ def _upload_code(
         LOGGER.info("object already exists; not uploading: %s", key)
     else:
         LOGGER.info("uploading object: %s", key)
-        s3_conn.put_object(
+        if isinstance(contents, str):
+            contents = contents.encode()
+        s3_conn.upload_fileobj(
+            BytesIO(contents) if isinstance(contents, bytes) else contents,
+            bucket,
+            key,
+            ExtraArgs={"ACL": payload_acl, "ContentType": "application/zip"},
+        )
+
+    return Code(S3Bucket=bucket, S3Key=key)
+
+
+def _copy_code(
+    s3_conn: S3Client,
+    source: Code,
+    prefix: str,
+    name: str,
+    content_hash: str,
+    payload_acl: PayloadAclTypeDef,
+) -> Code:
+    """Copy a payload already uploaded to S3 for use by another Lambda.
+
+    Used in place of :func:`_upload_code` when functions have identical
+    payloads so the payload is only uploaded once.
+
+    Args:
+        s3_conn: S3 connection to use for operations.
+        source: Payload uploaded for another function.
+        prefix: S3 prefix to prepend to the constructed key name for
+            the copied file
+        name: desired name of the Lambda function. Will be used to construct a
+            key name for the copied file.
+        content_hash: md5 hash of the contents of the payload.
+        payload_acl: The canned S3 object ACL to be applied to the copied payload.
+
+    Returns:
+        CloudFormation Lambda Code object, pointing to the copied payload in S3.
+
+    """
+    bucket = cast(str, source.S3Bucket)
+    key = "{}lambda-{}-{}.zip".format(prefix, name, content_hash)
+
+    if _head_object(s3_conn, bucket, key):
+        LOGGER.info("object already exists; not copying: %s", key)
+    else:
+        LOGGER.info("copying identical payload %s to object: %s", source.S3Key, key)
+        s3_conn.copy_object(
+            ACL=payload_acl,
             Bucket=bucket,
-            Key=key,
-            Body=contents.encode() if isinstance(contents, str) else contents,
             ContentType="application/zip",
-            ACL=payload_acl,
+            CopySource={"Bucket": bucket, "Key": cast(str, source.S3Key)},
+            Key=key,
         )
 
     return Code(S3Bucket=bucket, S3Key=key)
@@ -810,7 +987,7 @@ def _check_pattern_list(
 
 
 class _UploadFunctionOptionsTypeDef(TypedDict):
-    """Type definition for the "options" argument of _upload_function.
+    """Type definition for the "options" argument of _build_function.
 
     Attributes:
         include: File patterns to include in the payload.
@@ -826,39 +1003,28 @@ class _UploadFunctionOptionsTypeDef(TypedDict):
     path: str
 
 
-def _upload_function(
-    s3_conn: S3Client,
-    bucket: str,
-    prefix: str,
+def _build_function(
     name: str,
     options: _UploadFunctionOptionsTypeDef,
     follow_symlinks: bool,
-    payload_acl: PayloadAclTypeDef,
     sys_path: str,
-) -> Code:
-    """Build a Lambda payload from user configuration and uploads it to S3.
+    docker_semaphore: Optional[threading.Semaphore] = None,
+) -> Tuple[IO[bytes], str]:
+    """Build a Lambda payload from user configuration.
 
     Args:
-        s3_conn: S3 connection to use for operations.
-        bucket: name of the bucket to upload to.
-        prefix: S3 prefix to prepend to the constructed key name for
-            the uploaded file
-        name: Desired name of the Lambda function. Will be used to
-            construct a key name for the uploaded file.
+        name: Name of the Lambda function.
         options: Configuration for how to build the payload.
         follow_symlinks: If true, symlinks will be included in the
             resulting zip file
-        payload_acl: The canned S3 object ACL to be applied to the
-            uploaded payload
         sys_path: Path that all actions are relative to.
+        docker_semaphore: Semaphore acquired while ``pip`` runs in docker.
 
     Returns:
-        CloudFormation AWS Lambda Code object, pointing to the uploaded object in S3.
+        ZIP file, positioned at its start, and calculated hash of all the files.
 
     Raises:
         ValueError: If any configuration is invalid.
-        botocore.exceptions.ClientError: Any error from boto3 is passed
-            through.
 
     """
     try:
@@ -879,24 +1045,48 @@ def _upload_function(
         root = os.path.abspath(os.path.join(sys_path, root))
     requirements_files = find_requirements(root)
     if requirements_files:
-        zip_contents, content_hash = _zip_package(
+        return _zip_package(
             root,
             includes=cast(List[str], includes),
             excludes=excludes,
             follow_symlinks=follow_symlinks,
             requirements_files=requirements_files,
+            docker_semaphore=docker_semaphore,
             **options,
         )
-    else:
-        zip_contents, content_hash = _zip_from_file_patterns(
-            root, cast(List[str], includes), cast(List[str], excludes), follow_symlinks
-        )
-
-    return _upload_code(
-        s3_conn, bucket, prefix, name, zip_contents, content_hash, payload_acl
+    return _zip_from_file_patterns(
+        root, cast(List[str], includes), cast(List[str], excludes), follow_symlinks
     )
 
 
+def _check_worker_count(value: Any, key: str) -> int:
+    """Validate a number of workers from user configuration.
+
+    Args:
+        value: Input from user configuration (YAML).
+        key: Name of the configuration key the input came from,
+            used for error display purposes.
+
+    Returns:
+        Validated number of workers.
+
+    Raises:
+        ValueError: If the input is unacceptable.
+
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError("{} option must be an integer greater than 0".format(key))
+    return value
+
+
+def _wait_for_results(futures: List[Future[None]]) -> None:
+    """Wait for all futures to finish then raise the first error, if any."""
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error:
+            raise error
+
+
 def select_bucket_region(
     custom_bucket: Optional[str],
     hook_region: Optional[str],
@@ -939,7 +1129,8 @@ def upload_lambda_functions(context: CfnginContext, provider: Provider, **kwargs
 
     Payloads are uploaded to either a custom bucket or the CFNgin default
     bucket, with the key containing it's checksum, to allow repeated uploads
-    to be skipped in subsequent runs.
+    to be skipped in subsequent runs. Functions with identical payloads are
+    only uploaded once; the payload is copied within S3 for the others.
 
     The configuration settings are documented as keyword arguments below.
 
@@ -961,11 +1152,22 @@ def upload_lambda_functions(context: CfnginContext, provider: Provider, **kwargs
             ``False``)
         payload_acl (Optional[str]): The canned S3 object ACL to be applied
             to the uploaded payload. (*default: private*)
+        max_docker_workers (Optional[int]): Maximum number of functions that
+            can run ``pip`` in Docker at the same time. (*default:* ``1``)
+        max_workers (Optional[int]): Maximum number of functions that can be
+            built and uploaded at the same time. (*default:* ``1``)
         functions (Dict[str, Any]): Configurations of desired payloads to
             build. Keys correspond to function names, used to derive key
             names for the payload. Each value should itself be a dictionary,
             with the following data:
 
+            **cache_dependencies (bool)**
+                Whether to reuse dependencies installed for an identical
+                requirements file, interpreter, and Docker image.
+                Only used when every requirement is pinned to a version
+                (e.g. ``requests==2.25.1``) and, when using Docker, the image
+                is not built from ``docker_file``. (*default:* ``False``)
+
             **docker_file (Optional[str])**
                 Path to a local DockerFile that will be built and used for
                 ``dockerize_pip``. Must provide exactly one of ``docker_file``,
@@ -1051,6 +1253,7 @@ def upload_lambda_functions(context: CfnginContext, provider: Provider, **kwargs
                   follow_symlinks: true
                   prefix: cloudformation-custom-resources/
                   payload_acl: authenticated-read
+                  max_workers: 4
                   functions:
                     MyFunction:
                       path: ./lambda_functions
@@ -1125,22 +1328,104 @@ def upload_lambda_functions(context: CfnginContext, provider: Provider, **kwargs
 
     prefix = kwargs.get("prefix", "")
 
+    functions = cast(Dict[str, _UploadFunctionOptionsTypeDef], kwargs["functions"])
+    max_workers = _check_worker_count(kwargs.get("max_workers", 1), "max_workers")
+    docker_semaphore = threading.BoundedSemaphore(
+        _check_worker_count(kwargs.get("max_docker_workers", 1), "max_docker_workers")
+    )
+    sys_path = (
+        os.path.dirname(context.config_path)
+        if os.path.isfile(context.config_path)
+        else context.config_path
+    )
+
+    build_times: Dict[str, float] = {}
+    upload_times: Dict[str, float] = {}
+    failed = threading.Event()
+
+    def build(name: str) -> Optional[Tuple[IO[bytes], str]]:
+        if failed.is_set():  # don't start new builds once one has failed
+            return None
+        start = time.perf_counter()
+        try:
+            payload = _build_function(
+                name, functions[name], follow_symlinks, str(sys_path), docker_semaphore
+            )
+        except BaseException:
+            failed.set()
+            raise
+        build_times[name] = time.perf_counter() - start
+        return payload
+
+    def upload(names: List[str], zip_contents: IO[bytes], content_hash: str) -> None:
+        start = time.perf_counter()
+        try:
+            code = _upload_code(
+                s3_client,
+                bucket_name,
+                prefix,
+                names[0],
+                zip_contents,
+                content_hash,
+                payload_acl,
+            )
+        finally:
+            zip_contents.close()
+        results[names[0]] = code
+        upload_times[names[0]] = time.perf_counter() - start
+        for name in names[1:]:
+            start = time.perf_counter()
+            results[name] = _copy_code(
+                s3_client, code, prefix, name, content_hash, payload_acl
+            )
+            upload_times[name] = time.perf_counter() - start
+
     results: Dict[str, Any] = {}
-    for name, options in kwargs["functions"].items():
-        sys_path = (
-            os.path.dirname(context.config_path)
-            if os.path.isfile(context.config_path)
-            else context.config_path
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="aws-lambda"
+    ) as executor:
+        builds = {name: executor.submit(build, name) for name in functions}
+        # functions with identical payloads are only uploaded once
+        payloads: Dict[str, Tuple[List[str], IO[bytes]]] = {}
+        error: Optional[BaseException] = None
+        for name, future in builds.items():
+            try:
+                payload = future.result()
+            except BaseException as exc:  # pylint: disable=broad-except
+                error = error or exc
+                continue
+            if payload:
+                zip_contents, content_hash = payload
+                if content_hash in payloads:
+                    zip_contents.close()
+                    payloads[content_hash][0].append(name)
+                else:
+                    payloads[content_hash] = ([name], zip_contents)
+        if error:
+            for _, zip_contents in payloads.values():
+                zip_contents.close()
+            raise error
+        _wait_for_results(
+            [
+                executor.submit(upload, names, zip_contents, content_hash)
+                for content_hash, (names, zip_contents) in payloads.items()
+            ]
         )
-        results[name] = _upload_function(
-            s3_client,
-            bucket_name,
-            prefix,
+
+    for name in functions:
+        LOGGER.info(
+            "%s: built in %.2fs; uploaded in %.2fs",
             name,
-            options,
-            follow_symlinks,
-            payload_acl,
-            str(sys_path),
+            build_times[name],
+            upload_times[name],
         )
-
-    return results
+    if functions:
+        LOGGER.info(
+            "processed %s function(s) (%s unique payload(s)) in %.2fs",
+            len(functions),
+            len(payloads),
+            time.perf_counter() - start,
+        )
+    # return results in the order the functions were defined
+    return {name: results[name] for name in functions}
@@ -0,0 +1,286 @@
+"""Cache of python dependencies installed for AWS Lambda payloads."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from ...constants import DEFAULT_CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+DEPENDENCY_CACHE_DIR = DEFAULT_CACHE_DIR / "lambda_dependencies"
+DEPENDENCY_CACHE_MAX_SIZE = 2 * 1024**3
+# options of a requirements file that do not change which versions are installed
+PINNED_REQUIREMENT_OPTIONS = (
+    "--extra-index-url",
+    "--find-links",
+    "--hash",
+    "--index-url",
+    "--trusted-host",
+    "-f",
+    "-i",
+)
+PINNED_REQUIREMENT_REGEX = re.compile(
+    r"^[A-Za-z0-9][A-Za-z0-9._-]*(\[[^\]]*\])?\s*===?\s*[^\s,;*]+\s*(;.*)?$"
+)
+
+
+class CacheEntry(NamedTuple):
+    """Dependencies cached for one key."""
+
+    key: str
+    files: int
+    last_used: float
+    path: Path
+    size: int
+
+
+class DependencyCache:
+    """Content-addressed cache of dependency trees installed by ``pip``.
+
+    Each entry is a directory containing the files ``pip`` added to a build
+    directory, named after a hash of everything that can change the result of
+    the install (e.g. requirements, interpreter, Docker image, platform). A
+    metadata file next to the directory records its size and the time it was
+    last used so the least recently used entries can be evicted once the
+    total size of the cache exceeds ``max_size``.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[Path, str]] = None,
+        *,
+        max_size: Optional[int] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            cache_dir: Directory where entries are stored.
+                Defaults to :data:`DEPENDENCY_CACHE_DIR`.
+            max_size: Maximum total size of the cache in bytes.
+                Defaults to :data:`DEPENDENCY_CACHE_MAX_SIZE`.
+
+        """
+        self.cache_dir = Path(cache_dir or DEPENDENCY_CACHE_DIR)
+        self.max_size = DEPENDENCY_CACHE_MAX_SIZE if max_size is None else max_size
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> List[CacheEntry]:
+        """Entries of the cache, least recently used first."""
+        if not self.cache_dir.is_dir():
+            return []
+        entries: List[CacheEntry] = []
+        for metadata_file in self.cache_dir.glob("*.json"):
+            if metadata_file.name.startswith("."):
+                continue  # metadata being written
+            try:
+                metadata = json.loads(metadata_file.read_text())
+                last_used = metadata_file.stat().st_mtime
+            except (OSError, ValueError):
+                continue  # being written or removed by another build
+            entries.append(
+                CacheEntry(
+                    key=metadata_file.stem,
+                    files=metadata.get("files", 0),
+                    last_used=last_used,
+                    path=self.cache_dir / metadata_file.stem,
+                    size=metadata.get("size", 0),
+                )
+            )
+        return sorted(entries, key=lambda entry: entry.last_used)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache in bytes."""
+        return sum(entry.size for entry in self.entries)
+
+    @staticmethod
+    def compute_key(requirements_file: Union[Path, str], *values: object) -> str:
+        """Compute the key of the dependencies installed from a requirements file.
+
+        Args:
+            requirements_file: Requirements file passed to ``pip``.
+            *values: Anything else that changes what is installed.
+
+        """
+        key = hashlib.sha256(Path(requirements_file).read_bytes())
+        for value in values:
+            key.update(b"\0" + str(value).encode())
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[Path]:
+        """Get the directory containing the dependencies of a key.
+
+        Args:
+            key: Key computed by :meth:`compute_key`.
+
+        Returns:
+            Path to the cached dependencies if they exist.
+
+        """
+        metadata_file = self.cache_dir / f"{key}.json"
+        if not (metadata_file.is_file() and (self.cache_dir / key).is_dir()):
+            return None
+        try:
+            os.utime(metadata_file)  # record use for LRU eviction
+        except OSError:
+            return None
+        return self.cache_dir / key
+
+    def put(self, key: str, root: Union[Path, str], files: Iterable[str]) -> Path:
+        """Add dependencies to the cache, then evict entries as needed.
+
+        Args:
+            key: Key computed by :meth:`compute_key`.
+            root: Directory containing the files.
+            files: Paths of the files to cache, relative to ``root``.
+
+        Returns:
+            Path to the cached dependencies.
+
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-"))
+        file_count = size = 0
+        try:
+            for file_name in files:
+                dest = staging / file_name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(Path(root) / file_name, dest, follow_symlinks=False)
+                file_count += 1
+                size += dest.lstat().st_size
+            try:
+                staging.rename(self.cache_dir / key)
+            except OSError:
+                if (self.cache_dir / f"{key}.json").is_file():
+                    # added by another build while this one was installing
+                    shutil.rmtree(staging)
+                    return self.cache_dir / key
+                # left behind by a build that was interrupted
+                shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+                staging.rename(self.cache_dir / key)
+            metadata_file = self.cache_dir / f".tmp-{key}.json"
+            metadata_file.write_text(
+                json.dumps({"created": time.time(), "files": file_count, "size": size})
+            )
+            metadata_file.replace(self.cache_dir / f"{key}.json")
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        LOGGER.debug(
+            "cached %s dependency file(s) (%s bytes) as %s", file_count, size, key
+        )
+        self.prune()
+        return self.cache_dir / key
+
+    def prune(self, max_size: Optional[int] = None) -> List[CacheEntry]:
+        """Remove the least recently used entries until the cache fits in a size.
+
+        Args:
+            max_size: Maximum total size of the cache in bytes.
+                If not provided, the max size of the cache is used.
+
+        Returns:
+            Entries that were removed.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+        removed: List[CacheEntry] = []
+        with self._lock:
+            entries = self.entries
+            total = sum(entry.size for entry in entries)
+            for entry in entries:
+                if total <= max_size:
+                    break
+                self.remove(entry)
+                removed.append(entry)
+                total -= entry.size
+        return removed
+
+    def remove(self, entry: CacheEntry) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            entry: Entry to remove.
+
+        """
+        LOGGER.debug("removing cached dependencies: %s", entry.key)
+        # remove the metadata first so the entry is no longer used
+        try:
+            (self.cache_dir / f"{entry.key}.json").unlink()
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    @staticmethod
+    def restore(path: Union[Path, str], dest: Union[Path, str]) -> int:
+        """Overlay cached dependencies onto a directory.
+
+        Files that already exist in ``dest`` are not replaced, matching how
+        ``pip install --target`` treats existing files. Files are hard linked
+        when possible.
+
+        Args:
+            path: Path to cached dependencies returned by :meth:`get`.
+            dest: Directory to restore the dependencies to.
+
+        Returns:
+            Number of files restored.
+
+        """
+        count = 0
+        for dir_path, _, file_names in os.walk(path):
+            dest_dir = Path(dest) / os.path.relpath(dir_path, path)
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            for file_name in file_names:
+                src_file = os.path.join(dir_path, file_name)
+                dest_file = dest_dir / file_name
+                if dest_file.exists() or dest_file.is_symlink():
+                    continue
+                if not os.path.islink(src_file):
+                    try:
+                        os.link(src_file, dest_file)
+                        count += 1
+                        continue
+                    except OSError:
+                        pass
+                shutil.copy2(src_file, dest_file, follow_symlinks=False)
+                count += 1
+        return count
+
+
+def is_pinned(requirements_file: Union[Path, str]) -> bool:
+    """Whether every requirement of a requirements file is pinned to a version.
+
+    Only requirements pinned with ``==`` or ``===`` are considered pinned.
+    Files that include other files, editable installs, and URLs are not
+    considered pinned since what they install can change.
+
+    Args:
+        requirements_file: Requirements file passed to ``pip``.
+
+    """
+    content = Path(requirements_file).read_text().replace("\\\n", " ")
+    for line in content.splitlines():
+        line = re.sub(r"(^|\s)#.*", "", line)  # comments
+        line = re.sub(r"\s--hash[=\s]\S+", "", f" {line}").strip()
+        if not line:
+            continue
+        if line.startswith("-"):
+            if not line.startswith(PINNED_REQUIREMENT_OPTIONS):
+                return False
+            continue
+        if not PINNED_REQUIREMENT_REGEX.match(line):
+            return False
+    return True
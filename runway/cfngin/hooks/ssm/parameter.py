@@ -9,6 +9,7 @@ from pydantic import Extra, Field, validator
 from typing_extensions import Literal
 
 from ....compat import cached_property
+from ....lookups.handlers.ssm import SsmLookup
 from ....utils import BaseModel, JsonEncoder
 from ..utils import TagDataModel
 
@@ -139,6 +140,7 @@ class _Parameter:
         """Delete parameter."""
         try:
             self.client.delete_parameter(Name=self.args.name)
+            SsmLookup.clear_cache(self.args.name)
             LOGGER.info("deleted SSM Parameter %s", self.args.name)
         except self.client.exceptions.ParameterNotFound:
             LOGGER.info("delete parameter skipped; %s not found", self.args.name)
@@ -204,6 +206,7 @@ class _Parameter:
                         by_alias=True, exclude_none=True, exclude={"force", "tags"}
                     )
                 )
+                SsmLookup.clear_cache(self.args.name)
             except self.client.exceptions.ParameterAlreadyExists:
                 LOGGER.warning(
                     "parameter %s already exists; to overwrite it's value, "
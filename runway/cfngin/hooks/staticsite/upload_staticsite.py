@@ -103,6 +103,7 @@ def sync(
         bucket = Bucket(context, bucket_name)
         bucket.sync_from_local(
             build_context["app_directory"],
+            checksum=True,
             delete=True,
             exclude=[f["name"] for f in extra_files if "name" in f],
         )
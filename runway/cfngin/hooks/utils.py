@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import collections.abc
+import concurrent.futures
+import json
 import logging
 import os
+import re
 import sys
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, cast
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Tuple, cast
 
 from pydantic import Extra, Field
 
+from ... import _tracing
+from ...core.components._dependency_graph import DependencyGraph
 from ...exceptions import FailedVariableLookup
 from ...utils import BaseModel, load_object_from_string
 from ...variables import Variable, resolve_variables
@@ -21,6 +27,8 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+_LOAD_LOCK = threading.Lock()  # importing/reloading modules is not thread safe
+
 
 class BlankBlueprint(Blueprint):
     """Blueprint that can be built programatically."""
@@ -47,8 +55,61 @@ def full_path(path: str) -> str:
     return os.path.abspath(os.path.expanduser(path))
 
 
-# TODO split up to reduce number of statements
-def handle_hooks(  # pylint: disable=too-many-statements
+#: Matches the ``data_key`` used in a ``hook_data`` lookup.
+HOOK_DATA_LOOKUP_REGEX = re.compile(r"\$\{hook_data\s+([^.:}\s]+)")
+
+
+def get_hook_dependencies(
+    hooks: List[CfnginHookDefinitionModel],
+) -> List[Tuple[str, List[str]]]:
+    """Determine which hooks each hook depends on.
+
+    A hook depends on the hooks listed in its ``requires`` (by ``data_key`` or
+    ``path``) and on the hooks defined before it whose ``data_key`` it uses in
+    a ``hook_data`` lookup. Only ``requires`` can make a hook run after a hook
+    defined after it.
+
+    Args:
+        hooks: Hooks to execute.
+
+    Returns:
+        Name of each hook in the dependency graph (its index in the list of
+        hooks) and the names of the hooks it depends on.
+
+    """
+    names: Dict[str, List[int]] = {}
+    for index, hook in enumerate(hooks):
+        for key in {hook.data_key, hook.path}:
+            if key:
+                names.setdefault(key, []).append(index)
+    result: List[Tuple[str, List[str]]] = []
+    for index, hook in enumerate(hooks):
+        for key in hook.requires:
+            if key not in names:
+                LOGGER.warning(
+                    "hook %s requires %s which is not a hook of this stage",
+                    hook.path,
+                    key,
+                )
+        dependencies = {
+            dependency
+            for key in hook.requires
+            for dependency in names.get(key, [])
+            if dependency != index
+        }
+        dependencies.update(
+            dependency
+            for key in HOOK_DATA_LOOKUP_REGEX.findall(
+                json.dumps(hook.args, default=str)
+            )
+            for dependency in names.get(key, [])
+            if dependency < index
+        )
+        result.append((str(index), [str(i) for i in sorted(dependencies)]))
+    return result
+
+
+def handle_hooks(
     stage: str,
     hooks: List[CfnginHookDefinitionModel],
     provider: Provider,
@@ -59,6 +120,11 @@ def handle_hooks(  # pylint: disable=too-many-statements
     These are pieces of code that we want to run before/after deploying
     stacks.
 
+    Hooks run in the order they are defined unless they require a hook
+    defined after them (see :func:`get_hook_dependencies`). When
+    ``RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS`` is greater than ``1``, hooks
+    that do not depend on each other run concurrently in threads.
+
     Args:
         stage: The current stage (pre_run, post_run, etc).
         hooks: Hooks to execute.
@@ -78,72 +144,127 @@ def handle_hooks(  # pylint: disable=too-many-statements
             raise ValueError("%s hook #%d missing path." % (stage, i)) from exc
 
     LOGGER.info("executing %s hooks: %s", stage, ", ".join(hook_paths))
-    for hook in hooks:
-        if not hook.enabled:
-            LOGGER.debug("hook with method %s is disabled; skipping", hook.path)
-            continue
+    graph = DependencyGraph(get_hook_dependencies(hooks), kind="hook")
+    max_workers = context.env.max_concurrent_cfngin_hooks
+    if max_workers < 2:
+        for name in graph.order:
+            _run_hook(stage, hooks[int(name)], provider, context)
+        return
 
-        try:
-            method = load_object_from_string(hook.path, try_reload=True)
-        except (AttributeError, ImportError):
-            LOGGER.exception("unable to load method at %s", hook.path)
-            if hook.required:
-                raise
-            continue
-
-        if hook.args:
-            args = [Variable(k, v) for k, v in hook.args.items()]
-            try:  # handling for output or similar being used in pre_deploy
-                resolve_variables(args, context, provider)
-            except FailedVariableLookup:
-                if "pre" in stage:
-                    LOGGER.error(
-                        "lookups that change the order of execution, like "
-                        '"output", can only be used in "post_*" hooks; '
-                        "please ensure that the hook being used does "
-                        "not rely on a stack, hook_data, or context that "
-                        "does not exist yet"
-                    )
-                raise
-            kwargs: Dict[str, Any] = {v.name: v.value for v in args}
-        else:
-            kwargs = {}
+    pending = graph.order
+    completed: Set[str] = set()
+    running: Dict[concurrent.futures.Future[None], str] = {}
+    error: Optional[BaseException] = None
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="hook"
+    ) as executor:
+        while pending or running:
+            for name in list(pending):
+                if error or len(running) >= max_workers:
+                    break
+                if all(dep in completed for dep in graph.dag.downstream(name)):
+                    pending.remove(name)
+                    running[
+                        executor.submit(
+                            _run_hook, stage, hooks[int(name)], provider, context
+                        )
+                    ] = name
+            if not running:
+                break  # nothing left can be started after an error
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except BaseException as exc:  # pylint: disable=broad-except
+                    error = error or exc
+                completed.add(name)
+    if error:
+        raise error
 
-        try:
-            if isinstance(method, type):
-                result = getattr(
-                    method(context=context, provider=provider, **kwargs), stage
-                )()
-            else:
-                result = method(context=context, provider=provider, **kwargs)
-        except Exception:  # pylint: disable=broad-except
-            LOGGER.exception("hook %s threw an exception", hook.path)
-            if hook.required:
-                raise
-            continue
-
-        if not result:
-            if hook.required:
+
+@_tracing.traced("hook", lambda stage, hook, *_: f"{stage}: {hook.path}")
+def _run_hook(  # pylint: disable=too-many-branches
+    stage: str,
+    hook: CfnginHookDefinitionModel,
+    provider: Provider,
+    context: CfnginContext,
+) -> None:
+    """Run a single hook.
+
+    Args:
+        stage: The current stage (pre_run, post_run, etc).
+        hook: Hook to execute.
+        provider: Provider instance.
+        context: Context instance.
+
+    """
+    if not hook.enabled:
+        LOGGER.debug("hook with method %s is disabled; skipping", hook.path)
+        return
+
+    try:
+        with _LOAD_LOCK:
+            method = load_object_from_string(
+                hook.path, try_reload=True, if_modified=True
+            )
+    except (AttributeError, ImportError):
+        LOGGER.exception("unable to load method at %s", hook.path)
+        if hook.required:
+            raise
+        return
+
+    if hook.args:
+        args = [Variable(k, v) for k, v in hook.args.items()]
+        try:  # handling for output or similar being used in pre_deploy
+            resolve_variables(args, context, provider)
+        except FailedVariableLookup:
+            if "pre" in stage:
                 LOGGER.error(
-                    "required hook %s failed; return value: %s", hook.path, result
+                    "lookups that change the order of execution, like "
+                    '"output", can only be used in "post_*" hooks; '
+                    "please ensure that the hook being used does "
+                    "not rely on a stack, hook_data, or context that "
+                    "does not exist yet"
                 )
-                sys.exit(1)
-            LOGGER.warning(
-                "non-required hook %s failed; return value: %s", hook.path, result
-            )
+            raise
+        kwargs: Dict[str, Any] = {v.name: v.value for v in args}
+    else:
+        kwargs = {}
+
+    try:
+        if isinstance(method, type):
+            result = getattr(
+                method(context=context, provider=provider, **kwargs), stage
+            )()
         else:
-            if isinstance(result, collections.abc.Mapping):
-                if hook.data_key:
-                    LOGGER.debug(
-                        "adding result for hook %s to context in data_key %s",
-                        hook.path,
-                        hook.data_key,
-                    )
-                    context.set_hook_data(
-                        hook.data_key, cast(Mapping[str, Any], result)
-                    )
-                else:
-                    LOGGER.debug(
-                        "hook %s returned result data but no data key set; ignoring",
-                        hook.path,
-                    )
+            result = method(context=context, provider=provider, **kwargs)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception("hook %s threw an exception", hook.path)
+        if hook.required:
+            raise
+        return
+
+    if not result:
+        if hook.required:
+            LOGGER.error("required hook %s failed; return value: %s", hook.path, result)
+            sys.exit(1)
+        LOGGER.warning(
+            "non-required hook %s failed; return value: %s", hook.path, result
+        )
+    else:
+        if isinstance(result, collections.abc.Mapping):
+            if hook.data_key:
+                LOGGER.debug(
+                    "adding result for hook %s to context in data_key %s",
+                    hook.path,
+                    hook.data_key,
+                )
+                context.set_hook_data(hook.data_key, cast(Mapping[str, Any], result))
+            else:
+                LOGGER.debug(
+                    "hook %s returned result data but no data key set; ignoring",
+                    hook.path,
+                )
@@ -32,6 +32,8 @@ class ImageNotFound(Exception):
 class AmiLookup(LookupHandler):
     """AMI lookup."""
 
+    concurrent = True
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls, value: str, context: CfnginContext, *__args: Any, **__kwargs: Any
@@ -20,6 +20,8 @@ TYPE_NAME = "dynamodb"
 class DynamodbLookup(LookupHandler):
     """DynamoDB lookup."""
 
+    concurrent = True
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls, value: str, context: CfnginContext, *__args: Any, **__kwargs: Any
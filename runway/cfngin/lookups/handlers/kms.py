@@ -17,6 +17,8 @@ TYPE_NAME = "kms"
 class KmsLookup(LookupHandler):
     """AWS KMS lookup."""
 
+    concurrent = True
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls, value: str, context: CfnginContext, **_: Any
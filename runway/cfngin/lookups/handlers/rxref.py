@@ -17,6 +17,8 @@ TYPE_NAME = "rxref"
 class RxrefLookup(LookupHandler):
     """Rxref lookup."""
 
+    concurrent = True
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls, value: str, context: CfnginContext, provider: Provider, **_: Any
@@ -20,6 +20,8 @@ XREF_PRESISTENT_STATE = {"has_warned": False}
 class XrefLookup(LookupHandler):
     """Xref lookup."""
 
+    concurrent = True
+
     DEPRECATION_MSG = "xref Lookup has been deprecated; use the cfn lookup instead"
 
     @classmethod
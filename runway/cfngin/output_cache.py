@@ -0,0 +1,224 @@
+"""CloudFormation stack output caching."""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import boto3
+    from mypy_boto3_cloudformation.client import CloudFormationClient
+    from mypy_boto3_cloudformation.type_defs import StackTypeDef
+
+LOGGER = logging.getLogger(__name__)
+
+# number of uncached stacks that makes sweeping all stacks in the region
+# cheaper than describing them one at a time
+OUTPUT_CACHE_SWEEP_THRESHOLD = 5
+
+
+class StackOutputCache:
+    """Thread-safe cache of the outputs of CloudFormation stacks in a region.
+
+    Outputs are cached until :func:`clear_output_caches` is called (e.g. when
+    a module finishes since it could have changed any stack). Stacks that are
+    deployed or destroyed by CFNgin must be updated or discarded by the caller.
+
+    """
+
+    lock: threading.Lock
+    stats: Dict[str, int]
+    swept: bool
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self._outputs: Dict[str, Dict[str, str]] = {}
+        self.lock = threading.Lock()
+        self.stats = dict.fromkeys(["hits", "misses", "sweeps"], 0)
+        self.swept = False
+
+    def __contains__(self, stack_name: str) -> bool:
+        """Whether the outputs of a stack are cached."""
+        return stack_name in self._outputs
+
+    def clear(self) -> None:
+        """Remove the outputs of all stacks from the cache."""
+        with self.lock:
+            self._outputs.clear()
+            self.swept = False
+
+    def discard(self, stack_name: str) -> None:
+        """Remove the outputs of a stack from the cache.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+
+        """
+        with self.lock:
+            self._outputs.pop(stack_name, None)
+
+    def get(self, stack_name: str) -> Optional[Dict[str, str]]:
+        """Get the cached outputs of a stack.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+
+        """
+        with self.lock:
+            outputs = self._outputs.get(stack_name)
+            self.stats["hits" if outputs is not None else "misses"] += 1
+            return outputs
+
+    def get_outputs(
+        self, cloudformation: CloudFormationClient, stack_name: str
+    ) -> Dict[str, str]:
+        """Get the outputs of a stack, describing it if it is not cached.
+
+        Args:
+            cloudformation: CloudFormation client for the region of the cache.
+            stack_name: Name of a CloudFormation stack.
+
+        """
+        outputs = self.get(stack_name)
+        if outputs is None:
+            LOGGER.debug("describing stack: %s", stack_name)
+            outputs = self.set_stack(
+                cloudformation.describe_stacks(StackName=stack_name)["Stacks"][0]
+            )
+        return outputs
+
+    def prefetch(
+        self,
+        cloudformation: CloudFormationClient,
+        stack_names: Iterable[str],
+        *,
+        threshold: int = OUTPUT_CACHE_SWEEP_THRESHOLD,
+    ) -> None:
+        """Sweep all stacks if enough of the stacks provided are not cached.
+
+        Errors are logged and ignored; stacks that could not be cached are
+        described when their outputs are needed.
+
+        Args:
+            cloudformation: CloudFormation client for the region of the cache.
+            stack_names: Names of stacks whose outputs will be needed.
+            threshold: Number of uncached stacks required to sweep.
+
+        """
+        with self.lock:
+            if self.swept:
+                return
+            missing = {name for name in stack_names if name not in self._outputs}
+        if len(missing) < threshold:
+            return
+        try:
+            self.sweep(cloudformation)
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.debug("failed to cache the outputs of all stacks: %s", err)
+
+    def set(self, stack_name: str, outputs: Dict[str, str]) -> None:
+        """Cache the outputs of a stack.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+            outputs: Outputs of the stack.
+
+        """
+        with self.lock:
+            self._outputs[stack_name] = outputs
+
+    def set_stack(self, stack: StackTypeDef) -> Dict[str, str]:
+        """Cache the outputs of a stack returned by ``describe_stacks``.
+
+        Args:
+            stack: A stack returned by ``describe_stacks``.
+
+        Returns:
+            Outputs of the stack.
+
+        """
+        outputs = {
+            output["OutputKey"]: output["OutputValue"]
+            for output in stack.get("Outputs", [])
+        }
+        LOGGER.debug("%s stack outputs: %s", stack["StackName"], json.dumps(outputs))
+        self.set(stack["StackName"], outputs)
+        return outputs
+
+    def sweep(self, cloudformation: CloudFormationClient) -> int:
+        """Cache the outputs of every stack in the region.
+
+        Args:
+            cloudformation: CloudFormation client for the region of the cache.
+
+        Returns:
+            Number of stacks cached.
+
+        """
+        return self.set_swept(
+            stack
+            for page in cloudformation.get_paginator("describe_stacks").paginate()
+            for stack in page.get("Stacks", [])
+        )
+
+    def set_swept(self, stacks: Iterable[StackTypeDef]) -> int:
+        """Cache the outputs of all stacks returned by ``describe_stacks``.
+
+        Args:
+            stacks: All stacks in the region of the cache.
+
+        Returns:
+            Number of stacks cached.
+
+        """
+        outputs: Dict[str, Dict[str, str]] = {}
+        for stack in stacks:
+            if stack["StackStatus"] == "DELETE_COMPLETE":
+                continue
+            outputs[stack["StackName"]] = {
+                output["OutputKey"]: output["OutputValue"]
+                for output in stack.get("Outputs", [])
+            }
+        with self.lock:
+            # don't replace outputs cached while sweeping; they are newer
+            for stack_name, stack_outputs in outputs.items():
+                self._outputs.setdefault(stack_name, stack_outputs)
+            self.stats["sweeps"] += 1
+            self.swept = True
+        LOGGER.debug("cached the outputs of %s stack(s)", len(outputs))
+        return len(outputs)
+
+
+_OUTPUT_CACHES: Dict[Tuple[Optional[str], Optional[str]], StackOutputCache] = {}
+_OUTPUT_CACHES_LOCK = threading.Lock()
+
+
+def clear_output_caches() -> None:
+    """Remove all output caches.
+
+    Caches are also cleared since they can still be used by providers.
+
+    """
+    with _OUTPUT_CACHES_LOCK:
+        for cache in _OUTPUT_CACHES.values():
+            cache.clear()
+        _OUTPUT_CACHES.clear()
+
+
+def get_output_cache(session: boto3.Session) -> StackOutputCache:
+    """Get the output cache shared by all users of an account and region.
+
+    Caches are keyed by the access key of the session's credentials and its
+    region so outputs are never shared between accounts or roles.
+
+    Args:
+        session: boto3 session used to describe stacks.
+
+    """
+    credentials = session.get_credentials()
+    key = (credentials.access_key if credentials else None, session.region_name)
+    with _OUTPUT_CACHES_LOCK:
+        if key not in _OUTPUT_CACHES:
+            _OUTPUT_CACHES[key] = StackOutputCache()
+        return _OUTPUT_CACHES[key]
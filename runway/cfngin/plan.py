@@ -22,6 +22,7 @@ from typing import (
     overload,
 )
 
+from .. import _tracing
 from .._logging import LogLevels, PrefixAdaptor
 from ..utils import merge_dicts
 from .dag import DAG, DAGValidationError, walk
@@ -146,8 +147,9 @@ class Step:
             watcher.start()
 
         try:
-            while not self.done:
-                self._run_once()
+            with _tracing.span(self.name, "step", fqn=self.stack.fqn):
+                while not self.done:
+                    self._run_once()
         finally:
             if watcher:
                 stop_watcher.set()
@@ -230,8 +232,18 @@ class Step:
         """
         if status is not self.status:
             LOGGER.debug("setting %s state to %s...", self.stack.name, status.name)
+            now = time.time()
+            if _tracing.enabled():  # record how long the step had its last status
+                _tracing.complete(
+                    f"{self.name}: {self.status.name}",
+                    "step_status",
+                    self.last_updated,
+                    now,
+                    next_status=status.name,
+                    reason=self.status.reason,
+                )
             self.status = status
-            self.last_updated = time.time()
+            self.last_updated = now
             if self.stack.logging:
                 self.log_step()
 
@@ -715,7 +727,8 @@ class Plan:
         """
         if self.locked and self.require_unlocked:
             raise PersistentGraphLocked
-        self.walk(*args, **kwargs)
+        with _tracing.span(self.description, "plan", steps=len(self.steps)):
+            self.walk(*args, **kwargs)
 
         failed_steps = [step for step in self.steps if step.status == FAILED]
         if failed_steps:
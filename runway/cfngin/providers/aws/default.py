@@ -7,10 +7,12 @@ import logging
 import sys
 import threading
 import time
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -28,8 +30,15 @@ from botocore.config import Config
 
 from ....utils import DOC_SITE, JsonEncoder
 from ... import exceptions
-from ...actions.diff import DictValue, diff_parameters
+from ...actions.base import STACK_POLL_TIME
+from ...actions.diff import DictValue, diff_parameters, diff_templates
 from ...actions.diff import format_params_diff as format_diff
+from ...actions.diff import format_template_diff
+from ...output_cache import (
+    OUTPUT_CACHE_SWEEP_THRESHOLD,
+    StackOutputCache,
+    get_output_cache,
+)
 from ...session_cache import get_session
 from ...ui import ui
 from ...utils import parse_cloudformation_template
@@ -78,6 +87,17 @@ MAX_ATTEMPTS = 10
 MAX_TAIL_RETRIES = 15
 TAIL_RETRY_SLEEP = 1
 GET_EVENTS_SLEEP = 1
+# number of the most recent event IDs remembered per tailed stack
+TAIL_SEEN_EVENTS = 500
+# When waiting on a submitted stack, the status of the stack is first checked
+# after STACK_POLL_MIN_TIME seconds. Each check that does not find a change in
+# status increases the time until the next check by STACK_POLL_BACKOFF, up to
+# STACK_POLL_TIME. Checks for multiple stacks that are due at the same time are
+# batched into a single paginated DescribeStacks sweep when there are more
+# than STACK_POLL_SWEEP_THRESHOLD of them.
+STACK_POLL_MIN_TIME = min(2, STACK_POLL_TIME)
+STACK_POLL_BACKOFF = 1.5
+STACK_POLL_SWEEP_THRESHOLD = 5
 DEFAULT_CAPABILITIES = ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"]
 
 
@@ -539,6 +559,423 @@ def generate_stack_policy_args(
     return args
 
 
+class _PolledStack:
+    """Polling state of a single stack tracked by :class:`StackStatusPoller`."""
+
+    __slots__ = (
+        "interval",
+        "next_poll",
+        "refreshed_at",
+        "returned_status",
+        "stack",
+        "status",
+        "waiters",
+    )
+
+    def __init__(self, interval: float, now: float) -> None:
+        """Instantiate class."""
+        self.interval = interval
+        self.next_poll = now + interval
+        self.refreshed_at = float("-inf")
+        self.returned_status: Optional[str] = None
+        self.stack: Optional[StackTypeDef] = None
+        self.status: Optional[str] = None
+        self.waiters = 0
+
+
+class StackStatusPoller:
+    """Shared, batched poller of CloudFormation stack statuses.
+
+    Threads waiting on a stack take turns refreshing the status of every stack
+    that is being waited on and is due to be checked. When many stacks are due
+    at once, they are refreshed with a single paginated ``DescribeStacks``
+    sweep rather than a call per stack. Waiting threads are notified as soon
+    as the status of their stack changes.
+
+    The interval between checks of a stack starts short and grows each time
+    its status is found unchanged so long running stacks are checked less
+    often.
+
+    """
+
+    DOES_NOT_EXIST = "DOES_NOT_EXIST"
+
+    def __init__(
+        self,
+        cloudformation: CloudFormationClient,
+        *,
+        backoff: float = STACK_POLL_BACKOFF,
+        max_interval: float = STACK_POLL_TIME,
+        min_interval: float = STACK_POLL_MIN_TIME,
+        sweep_threshold: int = STACK_POLL_SWEEP_THRESHOLD,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            cloudformation: CloudFormation client used to check stack status.
+            backoff: Multiplier applied to the interval of a stack each time its
+                status is found unchanged.
+            max_interval: Maximum number of seconds between checks of a stack.
+            min_interval: Number of seconds before the first check of a stack.
+            sweep_threshold: When more than this many stacks are due to be
+                checked, all stacks are described with a paginated sweep.
+
+        """
+        self._condition = threading.Condition()
+        self._polling = False
+        self._stacks: Dict[str, _PolledStack] = {}
+        self.backoff = backoff
+        self.cloudformation = cloudformation
+        self.max_interval = max(max_interval, min_interval)
+        self.min_interval = min_interval
+        self.sweep_threshold = sweep_threshold
+
+    def wait(self, stack_name: str, cancel: threading.Event) -> Optional[StackTypeDef]:
+        """Wait for the status of a stack to change.
+
+        The first wait on a stack returns the first status retrieved after it
+        was called. Subsequent waits only return once the status differs from
+        the status that was last returned.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+            cancel: Stop waiting when this event is set.
+
+        Returns:
+            The latest description of the stack or ``None`` if it does not
+            exist.
+
+        """
+        with self._condition:
+            started = time.monotonic()
+            record = self._stacks.get(stack_name)
+            if not record:
+                record = self._stacks[stack_name] = _PolledStack(
+                    self.min_interval, started
+                )
+            record.waiters += 1
+            try:
+                while not (
+                    record.refreshed_at >= started
+                    and record.status != record.returned_status
+                ):
+                    if cancel.is_set():
+                        return record.stack
+                    if not self._poll():
+                        self._condition.wait(self._time_until_next_poll())
+                record.returned_status = record.status
+                return record.stack
+            finally:
+                record.waiters -= 1
+
+    def reset(self, stack_name: str) -> None:
+        """Forget the status last returned for a stack.
+
+        Must be called when a change to the stack is submitted so the next
+        wait returns the status of the new operation, even if it is the same
+        as the status returned for a previous operation.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+
+        """
+        with self._condition:
+            record = self._stacks.get(stack_name)
+            if not record:
+                return
+            if record.waiters:
+                record.returned_status = None
+            else:
+                del self._stacks[stack_name]
+
+    def _describe_stacks(
+        self, stack_names: List[str]
+    ) -> Dict[str, Optional[StackTypeDef]]:
+        """Describe stacks, using a sweep of all stacks if there are many."""
+        if len(stack_names) <= self.sweep_threshold:
+            result: Dict[str, Optional[StackTypeDef]] = {}
+            for stack_name in stack_names:
+                try:
+                    result[stack_name] = self.cloudformation.describe_stacks(
+                        StackName=stack_name
+                    )["Stacks"][0]
+                except botocore.exceptions.ClientError as err:
+                    if "does not exist" not in str(err):
+                        raise
+                    result[stack_name] = None
+            return result
+        LOGGER.debug("describing all stacks to check %s stacks", len(stack_names))
+        found: Dict[str, StackTypeDef] = {}
+        for page in self.cloudformation.get_paginator("describe_stacks").paginate():
+            for stack in page.get("Stacks", []):
+                found[stack["StackName"]] = stack
+        return {stack_name: found.get(stack_name) for stack_name in stack_names}
+
+    def _poll(self) -> bool:
+        """Refresh the stacks that are due, if another thread is not already.
+
+        Must be called while holding the lock of the condition. The lock is
+        released while making API calls.
+
+        Returns:
+            Whether stacks were refreshed.
+
+        """
+        if self._polling:
+            return False
+        started = time.monotonic()
+        waiting = {
+            name: record for name, record in self._stacks.items() if record.waiters
+        }
+        if not any(record.next_poll <= started for record in waiting.values()):
+            return False
+        # include stacks that will be due shortly to reduce the number of polls
+        due = [
+            name
+            for name, record in waiting.items()
+            if record.next_poll <= started + self.min_interval / 2
+        ]
+        stacks: Optional[Dict[str, Optional[StackTypeDef]]] = None
+        self._polling = True
+        self._condition.release()
+        try:
+            stacks = self._describe_stacks(due)
+        finally:
+            self._condition.acquire()
+            self._polling = False
+            for name in due:
+                self._update_record(self._stacks[name], name, stacks, started)
+            self._condition.notify_all()
+        return True
+
+    def _update_record(
+        self,
+        record: _PolledStack,
+        stack_name: str,
+        stacks: Optional[Dict[str, Optional[StackTypeDef]]],
+        refreshed_at: float,
+    ) -> None:
+        """Update the polling state of a stack after it was refreshed.
+
+        Args:
+            record: Polling state of the stack.
+            stack_name: Name of the stack.
+            stacks: Result of describing the stacks. If ``None``, describing the
+                stacks failed and only the time of the next check is updated.
+            refreshed_at: Time when the refresh was started.
+
+        """
+        if stacks is None:
+            record.next_poll = refreshed_at + record.interval
+            return
+        stack = stacks[stack_name]
+        status = stack["StackStatus"] if stack else self.DOES_NOT_EXIST
+        if status == record.status:
+            record.interval = min(record.interval * self.backoff, self.max_interval)
+        else:
+            LOGGER.debug("%s:status changed to %s", stack_name, status)
+            record.interval = self.min_interval
+        record.next_poll = refreshed_at + record.interval
+        record.refreshed_at = refreshed_at
+        record.stack = stack
+        record.status = status
+
+    def _time_until_next_poll(self) -> float:
+        """Seconds until a stack that is being waited on is due to be checked.
+
+        Capped at one second so that cancellation is noticed promptly.
+
+        """
+        next_poll = min(
+            (record.next_poll for record in self._stacks.values() if record.waiters),
+            default=float("inf"),
+        )
+        return max(0.0, min(next_poll - time.monotonic(), 1.0))
+
+
+class _TailedStack:
+    """State of a single stack tailed by :class:`StackEventTailer`."""
+
+    __slots__ = (
+        "error",
+        "failed",
+        "include_initial",
+        "interval",
+        "log_func",
+        "next_poll",
+        "seen",
+        "seen_order",
+        "stack_name",
+    )
+
+    def __init__(
+        self,
+        stack_name: str,
+        log_func: Callable[[StackEventTypeDef], None],
+        include_initial: bool,
+        interval: float,
+        max_seen: int,
+    ) -> None:
+        """Instantiate class."""
+        self.error: Optional[Exception] = None
+        self.failed = threading.Event()
+        self.include_initial = include_initial
+        self.interval = interval
+        self.log_func = log_func
+        self.next_poll = time.monotonic()
+        self.seen: Optional[Set[str]] = None  # None until events are first read
+        self.seen_order: Deque[str] = deque(maxlen=max_seen)
+        self.stack_name = stack_name
+
+    def add_seen(self, event_id: str) -> None:
+        """Remember an event, forgetting the oldest one if at capacity."""
+        if self.seen is None:
+            self.seen = set()
+        if len(self.seen_order) == self.seen_order.maxlen:
+            self.seen.discard(self.seen_order[0])
+        self.seen_order.append(event_id)
+        self.seen.add(event_id)
+
+
+class StackEventTailer:
+    """Tail the events of many stacks from a single thread.
+
+    Events are read newest first and only until an event that has already been
+    seen is found so each check of a stack usually costs a single
+    ``DescribeStackEvents`` call, regardless of the length of its history.
+    Only the most recent event IDs of each stack are remembered.
+
+    """
+
+    def __init__(
+        self, cloudformation: CloudFormationClient, *, max_seen: int = TAIL_SEEN_EVENTS
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            cloudformation: CloudFormation client used to read stack events.
+            max_seen: Number of the most recent event IDs to remember per stack.
+
+        """
+        self._condition = threading.Condition()
+        self._stacks: List[_TailedStack] = []
+        self._thread: Optional[threading.Thread] = None
+        self.cloudformation = cloudformation
+        self.max_seen = max_seen
+
+    def tail(
+        self,
+        stack_name: str,
+        cancel: threading.Event,
+        log_func: Callable[[StackEventTypeDef], None],
+        *,
+        include_initial: bool = True,
+        interval: float = 5,
+    ) -> None:
+        """Log the events of a stack until cancelled.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+            cancel: Stop tailing when this event is set.
+            log_func: Called with each new event, in chronological order.
+            include_initial: Whether to log the events that occurred before
+                tailing started.
+            interval: Number of seconds between checks for new events.
+
+        Raises:
+            Exception: Any error raised while reading or logging the events of
+                the stack.
+
+        """
+        record = _TailedStack(
+            stack_name, log_func, include_initial, interval, self.max_seen
+        )
+        with self._condition:
+            self._stacks.append(record)
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="cfngin-tail", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        try:
+            while not record.failed.wait(0.1):
+                if cancel.is_set():
+                    return
+            raise cast(Exception, record.error)
+        finally:
+            with self._condition:
+                self._stacks.remove(record)
+                self._condition.notify_all()
+
+    def _read(self, record: _TailedStack) -> List[StackEventTypeDef]:
+        """Read the events of a stack that have not been seen.
+
+        Returns:
+            New events in chronological order.
+
+        """
+        initial = record.seen is None
+        new_events: List[StackEventTypeDef] = []
+        kwargs: Dict[str, Any] = {"StackName": record.stack_name}
+        while True:
+            response = self.cloudformation.describe_stack_events(**kwargs)
+            found_seen = False
+            for event in response["StackEvents"]:
+                if record.seen and event["EventId"] in record.seen:
+                    # finish the page in case events arrived out of order
+                    found_seen = True
+                    continue
+                new_events.append(event)
+            next_token = response.get("NextToken")
+            # older events are only needed when logging the full history
+            if found_seen or not next_token or (initial and not record.include_initial):
+                break
+            kwargs["NextToken"] = next_token
+            time.sleep(GET_EVENTS_SLEEP)
+        new_events.reverse()
+        if record.seen is None:
+            record.seen = set()
+        for event in new_events[-self.max_seen :]:
+            record.add_seen(event["EventId"])
+        if initial and not record.include_initial:
+            return []
+        return new_events
+
+    def _run(self) -> None:
+        """Check stacks for new events as they are due until none are tailed."""
+        with self._condition:
+            while self._stacks:
+                now = time.monotonic()
+                due = [
+                    record
+                    for record in self._stacks
+                    if not record.error and record.next_poll <= now
+                ]
+                self._condition.release()
+                try:
+                    for record in due:
+                        record.next_poll = now + record.interval
+                        try:
+                            for event in self._read(record):
+                                record.log_func(event)
+                        except Exception as err:  # pylint: disable=broad-except
+                            record.error = err
+                            record.failed.set()
+                finally:
+                    self._condition.acquire()
+                next_poll = min(
+                    (record.next_poll for record in self._stacks if not record.error),
+                    default=None,
+                )
+                self._condition.wait(
+                    None
+                    if next_poll is None
+                    else max(0.0, next_poll - time.monotonic())
+                )
+            self._thread = None
+
+
 class ProviderBuilder:
     """Implements a Memorized ProviderBuilder for the AWS provider."""
 
@@ -624,10 +1061,13 @@ class Provider(BaseProvider):
 
     cloudformation: CloudFormationClient
     interactive: bool
+    output_cache: StackOutputCache
+    poller: StackStatusPoller
     recreate_failed: bool
     region: Optional[str]
     replacements_only: bool
     service_role: Optional[str]
+    tailer: StackEventTailer
 
     def __init__(
         self,
@@ -641,8 +1081,13 @@ class Provider(BaseProvider):
     ):
         """Instantiate class."""
         self._outputs: Dict[str, Dict[str, str]] = {}
+        self._stack_snapshot: Dict[str, Optional[StackTypeDef]] = {}
+        self._stack_snapshot_lock = threading.Lock()
         self.cloudformation = get_cloudformation_client(session)
         self.interactive = interactive
+        self.output_cache = get_output_cache(session)
+        self.poller = StackStatusPoller(self.cloudformation)
+        self.tailer = StackEventTailer(self.cloudformation)
         self.recreate_failed = interactive or recreate_failed
         self.region = region
         # replacements only is only used in interactive mode
@@ -650,7 +1095,20 @@ class Provider(BaseProvider):
         self.service_role = service_role
 
     def get_stack(self, stack_name: str, *_args: Any, **_kwargs: Any) -> StackTypeDef:
-        """Get stack."""
+        """Get stack.
+
+        The first time a stack prefetched by :meth:`prefetch_stacks` is
+        retrieved, its prefetched description is used. After that, the stack
+        is described again.
+
+        """
+        with self._stack_snapshot_lock:
+            prefetched = stack_name in self._stack_snapshot
+            snapshot = self._stack_snapshot.pop(stack_name, None)
+        if prefetched:
+            if snapshot is None:
+                raise exceptions.StackDoesNotExist(stack_name)
+            return snapshot
         try:
             return self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][
                 0
@@ -660,6 +1118,80 @@ class Provider(BaseProvider):
                 raise
             raise exceptions.StackDoesNotExist(stack_name)
 
+    def clear_prefetched_stacks(self) -> None:
+        """Discard the descriptions of stacks prefetched by :meth:`prefetch_stacks`."""
+        with self._stack_snapshot_lock:
+            self._stack_snapshot.clear()
+
+    def prefetch_stacks(
+        self,
+        stack_names: Iterable[str],
+        *,
+        threshold: int = OUTPUT_CACHE_SWEEP_THRESHOLD,
+    ) -> int:
+        """Describe all stacks in the region with one paginated sweep.
+
+        The description of each stack provided (or the fact that it does not
+        exist) is kept until it is first retrieved with :meth:`get_stack`.
+        The outputs of every stack in the region are added to the output
+        cache. Errors are logged and ignored; stacks are described one at a
+        time when they are needed instead.
+
+        Args:
+            stack_names: Names of stacks that will be retrieved.
+            threshold: Number of stacks required to sweep. Fewer stacks are
+                cheaper to describe one at a time.
+
+        Returns:
+            Number of stacks prefetched.
+
+        """
+        stack_names = set(stack_names)
+        if len(stack_names) < threshold:
+            return 0
+        stacks: List[StackTypeDef] = []
+        try:
+            for page in self.cloudformation.get_paginator("describe_stacks").paginate():
+                stacks.extend(page.get("Stacks", []))
+        except botocore.exceptions.ClientError as err:
+            LOGGER.debug("failed to prefetch stacks: %s", err)
+            return 0
+        snapshot: Dict[str, Optional[StackTypeDef]] = dict.fromkeys(stack_names)
+        for stack in stacks:
+            if (
+                stack["StackName"] in stack_names
+                and stack["StackStatus"] != self.DELETED_STATUS
+            ):
+                snapshot[stack["StackName"]] = stack
+        with self._stack_snapshot_lock:
+            self._stack_snapshot.update(snapshot)
+        self.output_cache.set_swept(stacks)
+        LOGGER.debug(
+            "prefetched %s stack(s); %s exist",
+            len(snapshot),
+            sum(stack is not None for stack in snapshot.values()),
+        )
+        return len(snapshot)
+
+    def poll_stack(self, stack_name: str, cancel: threading.Event) -> StackTypeDef:
+        """Wait for the status of a stack to change, then return the stack.
+
+        Uses the :class:`StackStatusPoller` shared by all steps using this
+        provider.
+
+        Args:
+            stack_name: Name of a CloudFormation stack.
+            cancel: Stop waiting when this event is set.
+
+        Raises:
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        stack = self.poller.wait(stack_name, cancel)
+        if not stack:
+            raise exceptions.StackDoesNotExist(stack_name)
+        return stack
+
     @staticmethod
     def get_stack_status(stack: StackTypeDef, *_args: Any, **_kwargs: Any) -> str:
         """Get stack status."""
@@ -818,7 +1350,7 @@ class Provider(BaseProvider):
     ) -> Iterable[StackEventTypeDef]:
         """Get the events in batches and return in chronological order."""
         next_token = None
-        event_list: List[List[StackEventTypeDef]] = []
+        event_list: List[StackEventTypeDef] = []
         while True:
             if next_token is not None:
                 events = self.cloudformation.describe_stack_events(
@@ -826,19 +1358,14 @@ class Provider(BaseProvider):
                 )
             else:
                 events = self.cloudformation.describe_stack_events(StackName=stack_name)
-            event_list.append(events["StackEvents"])
+            event_list.extend(events["StackEvents"])
             next_token = events.get("NextToken", None)
             if next_token is None:
                 break
             time.sleep(GET_EVENTS_SLEEP)
         if chronological:
-            return cast(
-                Iterable["StackEventTypeDef"],
-                reversed(
-                    cast(List["StackEventTypeDef"], sum(event_list, []))  # type: ignore
-                ),
-            )
-        return cast(Iterable["StackEventTypeDef"], sum(event_list, []))  # type: ignore
+            return reversed(event_list)
+        return event_list
 
     def get_rollback_status_reason(self, stack_name: str) -> Optional[str]:
         """Process events and returns latest roll back reason.
@@ -869,25 +1396,19 @@ class Provider(BaseProvider):
         sleep_time: int = 5,
         include_initial: bool = True,
     ) -> None:
-        """Show and then tail the event log."""
-        # First dump the full list of events in chronological order and keep
-        # track of the events we've seen already
-        seen: Set[str] = set()
-        initial_events = self.get_events(stack_name)
-        for event in initial_events:
-            if include_initial:
-                log_func(event)
-            seen.add(event["EventId"])
-
-        # Now keep looping through and dump the new events
-        while True:
-            events = self.get_events(stack_name)
-            for event in events:
-                if event["EventId"] not in seen:
-                    log_func(event)
-                    seen.add(event["EventId"])
-            if cancel.wait(sleep_time):
-                return
+        """Show and then tail the event log.
+
+        Stacks are tailed by the :class:`StackEventTailer` shared by all steps
+        using this provider.
+
+        """
+        self.tailer.tail(
+            stack_name,
+            cancel,
+            log_func,
+            include_initial=include_initial,
+            interval=sleep_time,
+        )
 
     def destroy_stack(
         self,
@@ -909,6 +1430,8 @@ class Provider(BaseProvider):
         """
         fqn = self.get_stack_name(stack)
         LOGGER.debug("%s:attempting to delete stack", fqn)
+        self.output_cache.discard(fqn)
+        self.poller.reset(fqn)
 
         if action == "deploy":
             LOGGER.info(
@@ -955,6 +1478,8 @@ class Provider(BaseProvider):
                 {"parameters": parameters, "tags": tags, "template_url": template.url}
             ),
         )
+        self.output_cache.discard(fqn)
+        self.poller.reset(fqn)
         if not template.url:
             LOGGER.debug("no template url; uploading template directly")
         if force_change_set:
@@ -1140,6 +1665,8 @@ class Provider(BaseProvider):
                 {"parameters": parameters, "tags": tags, "template_url": template.url}
             ),
         )
+        self.output_cache.discard(fqn)
+        self.poller.reset(fqn)
         if not template.url:
             LOGGER.debug("no template url; uploading template directly")
         update_method = self.select_update_method(force_interactive, force_change_set)
@@ -1452,16 +1979,22 @@ class Provider(BaseProvider):
     def get_outputs(
         self, stack_name: str, *_args: Any, **_kwargs: Any
     ) -> Dict[str, str]:
-        """Get stack outputs."""
-        if not self._outputs.get(stack_name):
-            stack = self.get_stack(stack_name)
-            self._outputs[stack_name] = get_output_dict(stack)
-        return self._outputs[stack_name]
+        """Get stack outputs.
 
-    @staticmethod
-    def get_output_dict(stack: StackTypeDef) -> Dict[str, str]:
-        """Get stack outputs dict."""
-        return get_output_dict(stack)
+        Outputs are retrieved from the output cache shared by all providers
+        for the account and region unless changes were inferred for the stack.
+
+        """
+        if stack_name in self._outputs:
+            return self._outputs[stack_name]
+        outputs = self.output_cache.get(stack_name)
+        if outputs is None:
+            outputs = self.output_cache.set_stack(self.get_stack(stack_name))
+        return outputs
+
+    def get_output_dict(self, stack: StackTypeDef) -> Dict[str, str]:
+        """Get stack outputs dict and update the output cache with them."""
+        return self.output_cache.set_stack(stack)
 
     def get_stack_info(
         self, stack: StackTypeDef
@@ -1529,18 +2062,9 @@ class Provider(BaseProvider):
             change_type,
             service_role=self.service_role,
         )
-        new_parameters_as_dict = self.params_as_dict(
-            [
-                x
-                if "ParameterValue" in x
-                else {
-                    "ParameterKey": x["ParameterKey"],  # type: ignore
-                    "ParameterValue": old_params[x["ParameterKey"]],  # type: ignore
-                }
-                for x in parameters
-            ]
+        params_diff = diff_parameters(
+            old_params, self._new_params_as_dict(parameters, old_params)
         )
-        params_diff = diff_parameters(old_params, new_parameters_as_dict)
 
         if changes or params_diff:
             with ui:
@@ -1565,9 +2089,6 @@ class Provider(BaseProvider):
 
         self.cloudformation.delete_change_set(ChangeSetName=change_set_id)
 
-        # ensure current stack outputs are loaded
-        self.get_outputs(stack.fqn)
-
         # infer which outputs may have changed
         refs_to_invalidate: List[str] = []
         for change in changes:
@@ -1589,25 +2110,7 @@ class Provider(BaseProvider):
                     resc_change["LogicalResourceId"],
                 )
                 refs_to_invalidate.append(resc_change["LogicalResourceId"])
-
-        # invalidate cached outputs with inferred changes
-        if "Outputs" in old_template:
-            for output, props in old_template["Outputs"].items():
-                if any(r in str(props["Value"]) for r in refs_to_invalidate):
-                    self._outputs[stack.fqn].pop(output)
-                    LOGGER.debug("%s:removed from the outputs: %s", output, stack.fqn)
-
-        # push values for new + invalidated outputs to outputs
-        for (
-            output_name,
-            output_params,
-        ) in stack.blueprint.get_output_definitions().items():
-            if output_name not in self._outputs[stack.fqn]:
-                self._outputs[stack.fqn][
-                    output_name
-                ] = "<inferred-change: {}.{}={}>".format(
-                    stack.fqn, output_name, str(output_params["Value"])
-                )
+        self._infer_outputs(stack, old_template, refs_to_invalidate)
 
         # when creating a changeset for a new stack, CFN creates a temporary
         # stack with a status of REVIEW_IN_PROGRESS. this is only removed if
@@ -1629,6 +2132,141 @@ class Provider(BaseProvider):
 
         return self.get_outputs(stack.fqn)
 
+    def get_deployed_stack_info(
+        self, stack_name: str
+    ) -> Optional[Tuple[str, Dict[str, Union[List[str], str]]]]:
+        """Get the template and parameters of a deployed stack.
+
+        Args:
+            stack_name: Name of the stack.
+
+        Returns:
+            The result of :meth:`get_stack_info` or ``None`` if the stack has
+            not been deployed.
+
+        """
+        try:
+            stack_details = self.get_stack(stack_name)
+            # handling for orphaned changeset temp stacks
+            if self.get_stack_status(stack_details) == self.REVIEW_STATUS:
+                return None
+            return self.get_stack_info(stack_details)
+        except exceptions.StackDoesNotExist:
+            return None
+
+    def get_stack_diff(
+        self,
+        stack: Stack,
+        parameters: List[ParameterTypeDef],
+        stack_info: Optional[Tuple[str, Dict[str, Union[List[str], str]]]],
+    ) -> Dict[str, str]:
+        """Get the changes of a stack by comparing templates locally.
+
+        Unlike :meth:`get_stack_changes`, a change set is not created. The
+        parameters and every top-level section of the rendered template are
+        compared to those of the deployed stack instead so changes that can
+        only be determined by CloudFormation (e.g. replacements) are not
+        shown.
+
+        Args:
+            stack: The stack to get changes.
+            parameters: A list of dictionaries that defines the parameter list
+                to be applied to the Cloudformation stack.
+            stack_info: Template and parameters of the deployed stack returned
+                by :meth:`get_deployed_stack_info`.
+
+        Returns:
+            Stack outputs with inferred changes.
+
+        Raises:
+            StackDidNotChange: Nothing changed.
+
+        """
+        old_params: Dict[str, Union[List[str], str]] = {}
+        old_template: Dict[str, Any] = {}
+        if stack_info:
+            old_template = parse_cloudformation_template(stack_info[0])
+            old_params = stack_info[1]
+        else:
+            self._outputs[stack.fqn] = {}  # all outputs will be inferred
+        template_diff = diff_templates(
+            old_template, parse_cloudformation_template(stack.blueprint.rendered)
+        )
+        params_diff = diff_parameters(
+            old_params, self._new_params_as_dict(parameters, old_params)
+        )
+        if not (template_diff or params_diff):
+            raise exceptions.StackDidNotChange
+        LOGGER.info(
+            "%s changes:\n\n%s",
+            stack.fqn,
+            "\n".join(
+                ([format_params_diff(params_diff)] if params_diff else [])
+                + ([format_template_diff(template_diff)] if template_diff else [])
+            ),
+        )
+        self._infer_outputs(
+            stack,
+            old_template,
+            [
+                change.key
+                for change in template_diff.get("Resources", [])
+                if change.status() is DictValue.MODIFIED
+            ],
+        )
+        return self.get_outputs(stack.fqn)
+
+    def _infer_outputs(
+        self, stack: Stack, old_template: Dict[str, Any], refs_to_invalidate: List[str]
+    ) -> None:
+        """Infer which outputs of a stack will change.
+
+        Args:
+            stack: The stack being diffed.
+            old_template: Template of the deployed stack.
+            refs_to_invalidate: Logical IDs of resources that will change.
+
+        """
+        # copy the current stack outputs so inferred changes are not shared
+        self._outputs[stack.fqn] = dict(self.get_outputs(stack.fqn))
+
+        # invalidate cached outputs with inferred changes
+        if "Outputs" in old_template:
+            for output, props in old_template["Outputs"].items():
+                if any(r in str(props["Value"]) for r in refs_to_invalidate):
+                    self._outputs[stack.fqn].pop(output, None)
+                    LOGGER.debug("%s:removed from the outputs: %s", output, stack.fqn)
+
+        # push values for new + invalidated outputs to outputs
+        for (
+            output_name,
+            output_params,
+        ) in stack.blueprint.get_output_definitions().items():
+            if output_name not in self._outputs[stack.fqn]:
+                self._outputs[stack.fqn][
+                    output_name
+                ] = "<inferred-change: {}.{}={}>".format(
+                    stack.fqn, output_name, str(output_params["Value"])
+                )
+
+    def _new_params_as_dict(
+        self,
+        parameters: List[ParameterTypeDef],
+        old_params: Dict[str, Union[List[str], str]],
+    ) -> Dict[str, Union[List[str], str]]:
+        """Parameters as dict, replacing previous values with the old values."""
+        return self.params_as_dict(
+            [
+                x
+                if "ParameterValue" in x
+                else {
+                    "ParameterKey": x["ParameterKey"],  # type: ignore
+                    "ParameterValue": old_params[x["ParameterKey"]],  # type: ignore
+                }
+                for x in parameters
+            ]
+        )
+
     @staticmethod
     def params_as_dict(
         parameters_list: List[ParameterTypeDef],
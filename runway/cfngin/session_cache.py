@@ -1,16 +1,230 @@
 """CFNgin session caching."""
+from __future__ import annotations
+
+import hashlib
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import boto3
 
+from .. import _api_stats, _rate_limiter
 from ..aws_sso_botocore.session import Session
 from ..constants import BOTO3_CREDENTIAL_CACHE
 from .ui import ui
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PROFILE = None
+# environment variables that change how a session without explicit credentials
+# or profile resolves its credentials
+CREDENTIAL_ENV_VARS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_CONFIG_FILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_PROFILE",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_SHARED_CREDENTIALS_FILE",
+)
+# environment variables used to determine the region of a session without one
+REGION_ENV_VARS = ("AWS_DEFAULT_REGION", "AWS_REGION")
+# keyword arguments of boto3.Session.client that can be part of a cache key
+CACHEABLE_CLIENT_ARGS = frozenset(
+    ["api_version", "endpoint_url", "region_name", "use_ssl", "verify"]
+)
+SESSION_POOL_TTL = 3600
+
+
+class PooledSession(boto3.Session):
+    """boto3 session that reuses clients from a :class:`SessionPool`."""
+
+    def __init__(self, *args: Any, pool: SessionPool, **kwargs: Any) -> None:
+        """Instantiate class.
+
+        Args:
+            pool: Pool that the session belongs to.
+
+        """
+        super().__init__(*args, **kwargs)
+        self._clients: Dict[Tuple[Any, ...], BaseClient] = {}
+        self._pool = pool
+
+    def client(self, service_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Create a low-level service client or reuse an existing one.
+
+        Clients are only reused when they are created with keyword arguments
+        that can be compared (e.g. not a ``config``). Creating clients from
+        the same session is not thread-safe so it is done while holding the
+        lock of the pool.
+
+        """
+        with self._pool.lock:
+            if args or not CACHEABLE_CLIENT_ARGS.issuperset(kwargs):
+                return super().client(service_name, *args, **kwargs)
+            key = (service_name, *sorted(kwargs.items()))
+            if key in self._clients:
+                self._pool.stats["client_hits"] += 1
+                return self._clients[key]
+            self._pool.stats["client_misses"] += 1
+            client = self._clients[key] = super().client(service_name, **kwargs)
+        return client
+
+    def resource(self, service_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Create a resource service client while holding the lock of the pool."""
+        with self._pool.lock:
+            return super().resource(service_name, *args, **kwargs)
+
+
+class SessionPool:
+    """Thread-safe pool of boto3 sessions and their clients.
+
+    Sessions are keyed by profile, region, and a fingerprint of the credentials
+    used to create them, including credentials from the environment. Entries
+    are discarded once they are older than ``ttl`` or the credentials of the
+    session have expired.
+
+    """
+
+    lock: threading.RLock
+    stats: Dict[str, int]
+    ttl: float
+
+    def __init__(self, ttl: float = SESSION_POOL_TTL) -> None:
+        """Instantiate class.
+
+        Args:
+            ttl: Number of seconds a session can be reused.
+
+        """
+        self._sessions: Dict[
+            Tuple[Optional[str], ...], Tuple[float, PooledSession]
+        ] = {}
+        self.lock = threading.RLock()
+        self.stats = dict.fromkeys(
+            ["client_hits", "client_misses", "expired", "hits", "misses"], 0
+        )
+        self.ttl = ttl
+
+    def clear(self) -> None:
+        """Remove all sessions from the pool and reset statistics."""
+        with self.lock:
+            self._sessions.clear()
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def get_session(
+        self,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        session_token: Optional[str] = None,
+    ) -> boto3.Session:
+        """Get a session from the pool, creating it if needed.
+
+        Args:
+            region: The region for the session.
+            profile: The profile for the session.
+            access_key: AWS Access Key ID.
+            secret_key: AWS secret Access Key.
+            session_token: AWS session token.
+
+        Returns:
+            A thread-safe boto3 session.
+
+        """
+        key = (
+            profile,
+            region or tuple(os.getenv(var) for var in REGION_ENV_VARS),
+            self._fingerprint(
+                access_key,
+                secret_key,
+                session_token,
+                *(os.getenv(var) for var in CREDENTIAL_ENV_VARS),
+            ),
+        )
+        with self.lock:
+            entry = self._sessions.get(key)
+            if entry:
+                if not self._is_expired(*entry):
+                    self.stats["hits"] += 1
+                    return entry[1]
+                self.stats["expired"] += 1
+                del self._sessions[key]
+            self.stats["misses"] += 1
+            session = self._create_session(
+                region=region,
+                profile=profile,
+                access_key=access_key,
+                secret_key=secret_key,
+                session_token=session_token,
+            )
+            self._sessions[key] = (time.monotonic(), session)
+            return session
+
+    def _create_session(
+        self,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        session_token: Optional[str] = None,
+    ) -> PooledSession:
+        """Create a new session."""
+        if profile:
+            LOGGER.debug(
+                'building session using profile "%s" in region "%s"',
+                profile,
+                region or "default",
+            )
+        elif access_key:
+            LOGGER.debug(
+                'building session with Access Key "%s" in region "%s"',
+                access_key,
+                region or "default",
+            )
+
+        session = PooledSession(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            aws_session_token=session_token,
+            botocore_session=Session(),  # type: ignore
+            region_name=region,
+            profile_name=profile,
+            pool=self,
+        )
+        cred_provider = session._session.get_component("credential_provider")  # type: ignore
+        provider = cred_provider.get_provider("assume-role")  # type: ignore
+        provider.cache = BOTO3_CREDENTIAL_CACHE
+        provider._prompter = ui.getpass
+        _api_stats.register(session)
+        _rate_limiter.register(session)
+        return session
+
+    @staticmethod
+    def _fingerprint(*values: Optional[str]) -> str:
+        """Hash values so credentials are not used as part of a key."""
+        return hashlib.sha256(
+            "\0".join(value or "" for value in values).encode()
+        ).hexdigest()
+
+    def _is_expired(self, created_at: float, session: PooledSession) -> bool:
+        """Whether a session should no longer be reused."""
+        if time.monotonic() - created_at > self.ttl:
+            return True
+        # only check credentials that have already been resolved
+        credentials = getattr(session._session, "_credentials", None)  # type: ignore
+        seconds_remaining = getattr(credentials, "_seconds_remaining", None)
+        return bool(seconds_remaining and seconds_remaining() <= 0)
+
+
+SESSION_POOL = SessionPool()
 
 
 def get_session(
@@ -20,7 +234,7 @@ def get_session(
     secret_key: Optional[str] = None,
     session_token: Optional[str] = None,
 ) -> boto3.Session:
-    """Create a thread-safe boto3 session.
+    """Get a thread-safe boto3 session from the process-wide pool.
 
     Args:
         region: The region for the session.
@@ -33,29 +247,10 @@ def get_session(
         A thread-safe boto3 session.
 
     """
-    if profile:
-        LOGGER.debug(
-            'building session using profile "%s" in region "%s"',
-            profile,
-            region or "default",
-        )
-    elif access_key:
-        LOGGER.debug(
-            'building session with Access Key "%s" in region "%s"',
-            access_key,
-            region or "default",
-        )
-
-    session = boto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        aws_session_token=session_token,
-        botocore_session=Session(),  # type: ignore
-        region_name=region,
-        profile_name=profile,
+    return SESSION_POOL.get_session(
+        region=region,
+        profile=profile,
+        access_key=access_key,
+        secret_key=secret_key,
+        session_token=session_token,
     )
-    cred_provider = session._session.get_component("credential_provider")  # type: ignore
-    provider = cred_provider.get_provider("assume-role")  # type: ignore
-    provider.cache = BOTO3_CREDENTIAL_CACHE
-    provider._prompter = ui.getpass
-    return session
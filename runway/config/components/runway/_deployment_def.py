@@ -14,6 +14,7 @@ from ._module_def import RunwayModuleDefinition
 from .base import ConfigComponentDefinition
 
 if TYPE_CHECKING:
+    from ....variables import VariableValueLookup
     from ...models.base import ConfigProperty
     from ...models.runway import (
         RunwayAssumeRoleDefinitionModel,
@@ -30,6 +31,7 @@ class RunwayDeploymentDefinition(ConfigComponentDefinition):
     account_alias: Optional[str]
     account_id: Optional[str]
     assume_role: RunwayAssumeRoleDefinitionModel
+    depends_on: List[str]
     environments: RunwayEnvironmentsType
     env_vars: RunwayEnvVarsType
     module_options: Dict[str, Any]
@@ -80,6 +82,13 @@ class RunwayDeploymentDefinition(ConfigComponentDefinition):
             regions=", ".join(regions if isinstance(regions, list) else [regions]),
         )
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in this deployment and its modules."""
+        return super().lookups + [
+            lookup for module in self.modules for lookup in module.lookups
+        ]
+
     @property
     def modules(self) -> List[RunwayModuleDefinition]:
         """List of Runway modules."""
@@ -9,6 +9,7 @@ from ...models.runway import RunwayModuleDefinitionModel
 from .base import ConfigComponentDefinition
 
 if TYPE_CHECKING:
+    from ....variables import VariableValueLookup
     from ...models.runway import (
         RunwayEnvironmentsType,
         RunwayEnvVarsType,
@@ -20,6 +21,7 @@ class RunwayModuleDefinition(ConfigComponentDefinition):
     """Runway module definition."""
 
     class_path: Optional[str]
+    depends_on: List[str]
     environments: RunwayEnvironmentsType
     env_vars: RunwayEnvVarsType
     name: str
@@ -84,6 +86,13 @@ class RunwayModuleDefinition(ConfigComponentDefinition):
         """Assess if the modules contains child modules (e.g. run in parallel)."""
         return bool(self._data.parallel)
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in this module and its child modules."""
+        return super().lookups + [
+            lookup for child in self.child_modules for lookup in child.lookups
+        ]
+
     @property
     def menu_entry(self) -> str:
         """Return menu entry representation of this module."""
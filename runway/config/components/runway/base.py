@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from abc import abstractclassmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 from ...._logging import PrefixAdaptor
 from ....exceptions import UnresolvedVariable
@@ -12,6 +12,7 @@ from ....variables import Variable
 if TYPE_CHECKING:
     from ...._logging import RunwayLogger
     from ....context import RunwayContext
+    from ....variables import VariableValueLookup
     from ...models.base import ConfigProperty
     from ._variables_def import RunwayVariablesDefinition
 
@@ -40,6 +41,11 @@ class ConfigComponentDefinition:
         """Return the underlying data as a dict."""
         return self._data.dict()
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in fields that support variables."""
+        return [lookup for var in self._vars.values() for lookup in var.lookups]
+
     def get(self, name: str, default: Any = None) -> None:
         """Get a value or return default if it is not found.
 
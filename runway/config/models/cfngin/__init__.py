@@ -52,6 +52,11 @@ class CfnginHookDefinitionModel(ConfigProperty):
         True,
         description="Whether to continue execution if the hook results in an error.",
     )
+    requires: List[str] = Field(
+        [],
+        description="Array of hooks (by data_key or path) of the same stage "
+        "that must run before this hook.",
+    )
 
     class Config(ConfigProperty.Config):
         """Model configuration."""
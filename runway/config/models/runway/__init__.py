@@ -195,6 +195,12 @@ class RunwayDeploymentDefinitionModel(ConfigProperty):
             List[Any], RunwayAssumeRoleDefinitionModel.Config.schema_extra["examples"]
         ),
     )
+    depends_on: List[str] = Field(
+        [],
+        description="Names of deployments that must be processed before this "
+        "deployment. Only used when future.dependency_graph is enabled.",
+        examples=[["network", "database"]],
+    )
     env_vars: RunwayEnvVarsUnresolvedType = Field(
         {},
         title="Environment Variables",
@@ -334,6 +340,17 @@ class RunwayDeploymentDefinitionModel(ConfigProperty):
             values["parallel_regions"] = regions.parallel
         return values
 
+    @root_validator(skip_on_failure=True)
+    def _validate_module_depends_on(
+        cls, values: Dict[str, Any]  # noqa: N805
+    ) -> Dict[str, Any]:
+        """Validate that modules only depend on modules of this deployment."""
+        utils.validate_depends_on(
+            "module",
+            [(module.name, module.depends_on) for module in values["modules"]],
+        )
+        return values
+
     _validate_string_is_lookup = validator(
         "env_vars",
         "environments",
@@ -349,6 +366,14 @@ class RunwayDeploymentDefinitionModel(ConfigProperty):
 class RunwayFutureDefinitionModel(ConfigProperty):
     """Model for the Runway future definition."""
 
+    dependency_graph: bool = Field(
+        False,
+        description="Process deployments and modules as soon as the deployments "
+        "and modules they depend on are complete rather than in the order they "
+        "are defined. Independent deployments and modules are processed "
+        "concurrently during deploy/destroy.",
+    )
+
     class Config(ConfigProperty.Config):
         """Model configuration."""
 
@@ -367,6 +392,13 @@ class RunwayModuleDefinitionModel(ConfigProperty):
         None,
         description="Import path to a custom Runway module class. (supports lookups)",
     )
+    depends_on: List[str] = Field(
+        [],
+        description="Names of modules in the same deployment that must be "
+        "processed before this module. Only used when future.dependency_graph "
+        "is enabled.",
+        examples=[["vpc", "database"]],
+    )
     env_vars: RunwayEnvVarsUnresolvedType = Field(
         {},
         title="Environment Variables",
@@ -601,6 +633,20 @@ class RunwayConfigDefinitionModel(ConfigProperty):
         validate_all = True
         validate_assignment = True
 
+    @root_validator(skip_on_failure=True)
+    def _validate_deployment_depends_on(
+        cls, values: Dict[str, Any]  # noqa: N805
+    ) -> Dict[str, Any]:
+        """Validate that deployments only depend on defined deployments."""
+        utils.validate_depends_on(
+            "deployment",
+            [
+                (deployment.name, deployment.depends_on)
+                for deployment in values["deployments"]
+            ],
+        )
+        return values
+
     @root_validator(pre=True)
     def _add_deployment_names(
         cls, values: Dict[str, Any]  # noqa: N805
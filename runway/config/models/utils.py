@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
 CFNGIN_LOOKUP_STRING_REGEX = r"^\${.*}$"
 RUNWAY_LOOKUP_STRING_ERROR = ValueError("field can only be a string if it's a lookup")
@@ -16,6 +16,37 @@ def convert_null_values(v: Any) -> Any:
     return None if isinstance(v, str) and v.lower() in null_strings else v
 
 
+def validate_depends_on(
+    kind: str, definitions: Iterable[Tuple[str, List[str]]]
+) -> None:
+    """Validate the names listed in ``depends_on`` of a list of definitions.
+
+    Args:
+        kind: Kind of definition used in error messages (e.g. ``deployment``).
+        definitions: Name and ``depends_on`` of each definition.
+
+    Raises:
+        ValueError: A definition depends on itself or on a name that is not
+            defined exactly once.
+
+    """
+    definitions = list(definitions)
+    names = [name for name, _ in definitions]
+    for name, depends_on in definitions:
+        for dependency in depends_on:
+            if dependency == name:
+                raise ValueError(f"{kind} {name} can't depend on itself")
+            if dependency not in names:
+                raise ValueError(
+                    f"{kind} {name} depends on {dependency} which is not defined"
+                )
+            if names.count(dependency) > 1:
+                raise ValueError(
+                    f"{kind} {name} depends on {dependency} which is defined "
+                    "more than once"
+                )
+
+
 def resolve_path_field(v: Optional[Path]) -> Optional[Path]:
     """Resolve sys_path."""
     return v.resolve() if v else v
@@ -6,9 +6,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import boto3
 
-from ..aws_sso_botocore.session import Session
-from ..cfngin.ui import ui
-from ..constants import BOTO3_CREDENTIAL_CACHE
+from ..cfngin.session_cache import SESSION_POOL
 from ..type_defs import Boto3CredentialsTypeDef
 from .sys_info import SystemInfo
 
@@ -85,7 +83,10 @@ class BaseContext:
         profile: Optional[str] = None,
         region: Optional[str] = None,
     ) -> boto3.Session:
-        """Create a thread-safe boto3 session.
+        """Get a thread-safe boto3 session.
+
+        Sessions are shared process-wide and reused for the same credentials,
+        profile, and region (see :class:`runway.cfngin.session_cache.SessionPool`).
 
         Args:
             aws_access_key_id: AWS Access Key ID.
@@ -98,31 +99,13 @@ class BaseContext:
             A thread-safe boto3 session.
 
         """
-        if profile:
-            self.logger.debug(
-                'building session using profile "%s" in region "%s"',
-                profile,
-                region or "default",
-            )
-        elif aws_access_key_id:
-            self.logger.debug(
-                'building session with Access Key "%s" in region "%s"',
-                aws_access_key_id,
-                region or "default",
-            )
-        session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-            botocore_session=Session(),  # type: ignore
-            region_name=region,
-            profile_name=profile,
+        return SESSION_POOL.get_session(
+            region=region,
+            profile=profile,
+            access_key=aws_access_key_id,
+            secret_key=aws_secret_access_key,
+            session_token=aws_session_token,
         )
-        cred_provider = session._session.get_component("credential_provider")  # type: ignore
-        provider = cred_provider.get_provider("assume-role")  # type: ignore
-        provider.cache = BOTO3_CREDENTIAL_CACHE
-        provider._prompter = ui.getpass
-        return session
 
     # TODO remove after IaC tools support AWS SSO
     def _inject_profile_credentials(self) -> None:  # cov: ignore
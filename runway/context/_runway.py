@@ -12,6 +12,7 @@ from ._base import BaseContext
 
 if TYPE_CHECKING:
     from .._logging import PrefixAdaptor, RunwayLogger
+    from ..core.components import WorkerPool
     from ..core.type_defs import RunwayActionTypeDef
 
 LOGGER = cast("RunwayLogger", logging.getLogger(__name__))
@@ -23,6 +24,7 @@ class RunwayContext(BaseContext):
     command: Optional[RunwayActionTypeDef]
     env: DeployEnvironment
     logger: Union[PrefixAdaptor, RunwayLogger]
+    worker_pool: Optional[WorkerPool]
 
     def __init__(
         self,
@@ -30,6 +32,7 @@ class RunwayContext(BaseContext):
         command: Optional[RunwayActionTypeDef] = None,
         deploy_environment: Optional[DeployEnvironment] = None,
         logger: Union[PrefixAdaptor, RunwayLogger] = LOGGER,
+        worker_pool: Optional[WorkerPool] = None,
         **_: Any,
     ) -> None:
         """Instantiate class.
@@ -38,12 +41,15 @@ class RunwayContext(BaseContext):
             command: Runway command/action being run.
             deploy_environment: The current deploy environment.
             logger: Custom logger.
+            worker_pool: Pool of worker processes used to process regions and
+                modules concurrently.
 
         """
         super().__init__(
             deploy_environment=deploy_environment or DeployEnvironment(), logger=logger
         )
         self.command = command
+        self.worker_pool = worker_pool
         self._inject_profile_credentials()
 
     @cached_property
@@ -88,7 +94,10 @@ class RunwayContext(BaseContext):
     def copy(self) -> RunwayContext:
         """Copy the contents of this object into a new instance."""
         return self.__class__(
-            command=self.command, deploy_environment=self.env.copy(), logger=self.logger
+            command=self.command,
+            deploy_environment=self.env.copy(),
+            logger=self.logger,
+            worker_pool=self.worker_pool,
         )
 
     def echo_detected_environment(self) -> None:
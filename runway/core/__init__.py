@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import yaml as _yaml
 
-from .. import __version__
+from .. import __version__, _tracing
 from .._logging import PrefixAdaptor as _PrefixAdaptor
 from .._logging import RunwayLogger as _RunwayLogger
 from ..tests.registry import TEST_HANDLERS as _TEST_HANDLERS
@@ -44,6 +44,13 @@ class Runway:
         self.tests = config.tests
         self.ignore_git_branch = config.ignore_git_branch
         self.variables = config.variables
+        self.worker_pool = components.WorkerPool(
+            max(
+                self.ctx.env.max_concurrent_modules,
+                self.ctx.env.max_concurrent_regions,
+            )
+        )
+        self.ctx.worker_pool = self.worker_pool
         self.__assert_config_version()
         self.ctx.env.log_name()
 
@@ -252,10 +259,14 @@ class Runway:
 
         """
         self.ctx.command = action
-        components.Deployment.run_list(
-            action=action,
-            context=self.ctx,
-            deployments=deployments or [],
-            future=self.future,
-            variables=self.variables,
-        )
+        try:
+            with _tracing.span(action, "runway"):
+                components.Deployment.run_list(
+                    action=action,
+                    context=self.ctx,
+                    deployments=deployments or [],
+                    future=self.future,
+                    variables=self.variables,
+                )
+        finally:
+            self.worker_pool.shutdown()
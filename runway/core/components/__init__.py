@@ -4,6 +4,7 @@ from ._deployment import Deployment
 from ._module import Module
 from ._module_path import ModulePath
 from ._module_type import RunwayModuleType, RunwayModuleTypeExtensionsTypeDef
+from ._worker_pool import WorkerPool
 
 __all__ = [
     "DeployEnvironment",
@@ -12,4 +13,5 @@ __all__ = [
     "ModulePath",
     "RunwayModuleType",
     "RunwayModuleTypeExtensionsTypeDef",
+    "WorkerPool",
 ]
@@ -0,0 +1,182 @@
+"""Process Runway deployments and modules using a dependency graph."""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple, cast
+
+from ..._logging import PrefixAdaptor, PrefixFilter
+from ...cfngin.dag import DAG
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from ..._logging import RunwayLogger
+
+LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
+
+
+class DependencyGraph:
+    """Dependency graph of Runway deployments or modules.
+
+    Dependencies that are not part of the graph (e.g. a deployment that was
+    not selected) are treated as complete.
+
+    """
+
+    def __init__(
+        self,
+        definitions: Iterable[Tuple[str, Iterable[str]]],
+        *,
+        kind: str = "deployment",
+        log_prefix: str = "",
+        reverse: bool = False,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            definitions: Name and ``depends_on`` of each definition, in the
+                order they are defined.
+            kind: Kind of definition used in log messages.
+            log_prefix: Added before the name when prefixing the messages
+                logged by each process (e.g. the name of a deployment).
+            reverse: Reverse the dependencies (e.g. for destroy) so a
+                definition is processed before the definitions it depends on.
+
+        Raises:
+            DAGValidationError: The dependencies contain a cycle.
+            ValueError: More than one definition has the same name.
+
+        """
+        definitions = [(name, list(depends_on)) for name, depends_on in definitions]
+        self.kind = kind
+        self.log_prefix = log_prefix
+        self.names = [name for name, _ in definitions]
+        dag = DAG()
+        for name in self.names:
+            try:
+                dag.add_node(name)
+            except KeyError:
+                raise ValueError(
+                    f"{kind} {name} is defined more than once; names must be "
+                    "unique when using a dependency graph"
+                ) from None
+        for name, depends_on in definitions:
+            for dependency in depends_on:
+                if dependency in dag.graph:
+                    dag.add_edge(name, dependency)
+                else:
+                    LOGGER.debug(
+                        "%s %s depends on %s which is not being processed",
+                        kind,
+                        name,
+                        dependency,
+                    )
+        self.dag = dag.transpose() if reverse else dag
+
+    @property
+    def order(self) -> List[str]:
+        """Names in an order that satisfies the dependencies.
+
+        The order definitions are defined in is kept where possible.
+
+        """
+        result: List[str] = []
+        pending = list(self.names)
+        while pending:
+            for name in pending:
+                if all(dep in result for dep in self.dag.downstream(name)):
+                    result.append(name)
+                    pending.remove(name)
+                    break
+        return result
+
+    def run(
+        self,
+        func: Callable[[str], Any],
+        *,
+        continue_on_error: bool = False,
+        max_workers: int = 1,
+    ) -> Tuple[List[str], List[str]]:
+        """Run a function for each name in its own process.
+
+        Each process is started as soon as the processes of its dependencies
+        have completed successfully. Messages logged by each process are
+        prefixed with its name.
+
+        When a process fails, no new processes are started unless
+        ``continue_on_error`` is set, in which case only the dependents of
+        the failed process are skipped. Running processes are always allowed
+        to finish.
+
+        Args:
+            func: Function to run. Called with a name from the graph.
+            continue_on_error: Keep starting processes that do not depend on
+                a process that failed.
+            max_workers: Max number of processes to run concurrently.
+
+        Returns:
+            Names that failed and names that were skipped.
+
+        Raises:
+            ValueError: max_workers is less than 1.
+
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        completed: List[str] = []
+        failed: List[str] = []
+        skipped: List[str] = []
+        pending = self.order
+        running: Dict[Any, Tuple[str, BaseProcess]] = {}
+        mp_context = multiprocessing.get_context("fork")
+
+        while pending or running:
+            for name in list(pending):
+                dependencies = self.dag.downstream(name)
+                if (failed and not continue_on_error) or any(
+                    dep in failed or dep in skipped for dep in dependencies
+                ):
+                    PrefixAdaptor(self._prefix(name), LOGGER).warning(
+                        "skipped; %s",
+                        "a dependency failed"
+                        if continue_on_error
+                        else f"another {self.kind} failed",
+                    )
+                    pending.remove(name)
+                    skipped.append(name)
+                elif len(running) < max_workers and all(
+                    dep in completed for dep in dependencies
+                ):
+                    process = mp_context.Process(
+                        target=self._run_process,
+                        args=(func, name, self._prefix(name)),
+                        name=name,
+                    )
+                    process.start()
+                    pending.remove(name)
+                    running[process.sentinel] = (name, process)
+            if not running:
+                continue  # everything left was skipped
+            for sentinel in wait(list(running)):
+                name, process = running.pop(sentinel)
+                process.join()
+                if process.exitcode:
+                    LOGGER.debug(
+                        "%s %s exited with code %s", self.kind, name, process.exitcode
+                    )
+                    failed.append(name)
+                else:
+                    completed.append(name)
+        return failed, skipped
+
+    def _prefix(self, name: str) -> str:
+        """Log prefix of a name."""
+        return f"{self.log_prefix}.{name}" if self.log_prefix else name
+
+    @staticmethod
+    def _run_process(func: Callable[[str], Any], name: str, prefix: str) -> None:
+        """Target of each process."""
+        PrefixFilter.install(prefix)
+        func(name)
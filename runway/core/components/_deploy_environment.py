@@ -5,8 +5,9 @@ import json
 import logging
 import os
 import sys
+from distutils.util import strtobool
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import click
 
@@ -195,6 +196,170 @@ class DeployEnvironment:
         """Set RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS."""
         self._update_vars({"RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS": str(value)})
 
+    @property
+    def max_concurrent_cfngin_hooks(self) -> int:
+        """Max number of CFNgin hooks of a stage that can run concurrently.
+
+        Hooks only run concurrently when they do not depend on each other.
+        This property can be set by exporting
+        ``RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS``.
+
+        Returns:
+            Value from environment variable or ``1``.
+
+        """
+        return int(self.vars.get("RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS", "1"))
+
+    @max_concurrent_cfngin_hooks.setter
+    def max_concurrent_cfngin_hooks(self, value: int) -> None:
+        """Set RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS."""
+        self._update_vars({"RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS": str(value)})
+
+    @property
+    def max_concurrent_cfngin_configs(self) -> int:
+        """Max number of CFNgin config files that can be processed concurrently.
+
+        Config files are only processed concurrently when they do not share
+        a namespace or reference the stacks of another config file.
+        This property can be set by exporting
+        ``RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS``.
+
+        Returns:
+            Value from environment variable or ``1``.
+
+        """
+        return int(self.vars.get("RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS", "1"))
+
+    @max_concurrent_cfngin_configs.setter
+    def max_concurrent_cfngin_configs(self, value: int) -> None:
+        """Set RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS."""
+        self._update_vars({"RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS": str(value)})
+
+    @property
+    def cfngin_diff_change_set_stacks(self) -> List[str]:
+        """Stacks diffed using a change set when using a fast diff.
+
+        This property can be set by exporting
+        ``RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS`` as a comma separated list of
+        stack names.
+
+        Returns:
+            Value from environment variable or an empty list.
+
+        """
+        return [
+            name.strip()
+            for name in self.vars.get("RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS", "").split(
+                ","
+            )
+            if name.strip()
+        ]
+
+    @cfngin_diff_change_set_stacks.setter
+    def cfngin_diff_change_set_stacks(self, value: List[str]) -> None:
+        """Set RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS."""
+        self._update_vars({"RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS": ",".join(value)})
+
+    @property
+    def cfngin_fast_diff(self) -> bool:
+        """Whether to diff CFNgin stacks without creating change sets.
+
+        This property can be set by exporting ``RUNWAY_CFNGIN_FAST_DIFF``.
+
+        Returns:
+            Value from environment variable or ``False``.
+
+        """
+        return bool(strtobool(self.vars.get("RUNWAY_CFNGIN_FAST_DIFF", "false")))
+
+    @cfngin_fast_diff.setter
+    def cfngin_fast_diff(self, value: bool) -> None:
+        """Set RUNWAY_CFNGIN_FAST_DIFF."""
+        self._update_vars({"RUNWAY_CFNGIN_FAST_DIFF": str(value).lower()})
+
+    @property
+    def cfngin_render_cache(self) -> bool:
+        """Whether to cache the templates rendered by CFNgin blueprints.
+
+        This property can be set by exporting ``RUNWAY_CFNGIN_RENDER_CACHE``.
+
+        Returns:
+            Value from environment variable or ``False``.
+
+        """
+        return bool(strtobool(self.vars.get("RUNWAY_CFNGIN_RENDER_CACHE", "false")))
+
+    @cfngin_render_cache.setter
+    def cfngin_render_cache(self, value: bool) -> None:
+        """Set RUNWAY_CFNGIN_RENDER_CACHE."""
+        self._update_vars({"RUNWAY_CFNGIN_RENDER_CACHE": str(value).lower()})
+
+    @property
+    def continue_on_error(self) -> bool:
+        """Whether to keep processing independent deployments after a failure.
+
+        Only used when processing deployments and modules using a dependency
+        graph. This property can be set by exporting
+        ``RUNWAY_CONTINUE_ON_ERROR``.
+
+        Returns:
+            Value from environment variable or ``False``.
+
+        """
+        return bool(strtobool(self.vars.get("RUNWAY_CONTINUE_ON_ERROR", "false")))
+
+    @continue_on_error.setter
+    def continue_on_error(self, value: bool) -> None:
+        """Set RUNWAY_CONTINUE_ON_ERROR."""
+        self._update_vars({"RUNWAY_CONTINUE_ON_ERROR": str(value).lower()})
+
+    @property
+    def max_concurrent_deployments(self) -> int:
+        """Max number of deployments that can be processed concurrently.
+
+        Only used when processing deployments using a dependency graph.
+        This property can be set by exporting
+        ``RUNWAY_MAX_CONCURRENT_DEPLOYMENTS``.
+        If no value is specified, ``min(61, os.cpu_count())`` is used.
+
+        **IMPORTANT:** Each deployment can also process regions and modules
+        concurrently. Please consider the nature of their relationship when
+        manually setting this value.
+
+        Returns:
+            Value from environment variable or ``min(61, os.cpu_count())``
+
+        """
+        value = self.vars.get("RUNWAY_MAX_CONCURRENT_DEPLOYMENTS")
+
+        if value:
+            return int(value)
+        return min(61, os.cpu_count() or 61)
+
+    @max_concurrent_deployments.setter
+    def max_concurrent_deployments(self, value: int) -> None:
+        """Set RUNWAY_MAX_CONCURRENT_DEPLOYMENTS."""
+        self._update_vars({"RUNWAY_MAX_CONCURRENT_DEPLOYMENTS": str(value)})
+
+    @property
+    def max_concurrent_lookups(self) -> int:
+        """Max number of lookups of a stack that can be resolved concurrently.
+
+        Only lookups that retrieve data (e.g. ``ssm``) are resolved
+        concurrently. This property can be set by exporting
+        ``RUNWAY_MAX_CONCURRENT_LOOKUPS``.
+
+        Returns:
+            Value from environment variable or ``10``.
+
+        """
+        return int(self.vars.get("RUNWAY_MAX_CONCURRENT_LOOKUPS", "10"))
+
+    @max_concurrent_lookups.setter
+    def max_concurrent_lookups(self, value: int) -> None:
+        """Set RUNWAY_MAX_CONCURRENT_LOOKUPS."""
+        self._update_vars({"RUNWAY_MAX_CONCURRENT_LOOKUPS": str(value)})
+
     @property
     def max_concurrent_modules(self) -> int:
         """Max number of modules that can be deployed to concurrently.
@@ -7,7 +7,10 @@ import multiprocessing
 import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from ..._logging import PrefixAdaptor
+from ... import _tracing
+from ..._logging import PrefixAdaptor, PrefixFilter
+from ...cfngin.dag import DAGValidationError
+from ...cfngin.output_cache import clear_output_caches
 from ...compat import cached_property
 from ...config.components.runway import RunwayVariablesDefinition
 from ...config.models.runway import (
@@ -15,8 +18,11 @@ from ...config.models.runway import (
     RunwayFutureDefinitionModel,
 )
 from ...exceptions import UnresolvedVariable
+from ...lookups.handlers.cfn import CfnLookup
+from ...lookups.handlers.ssm import SsmLookup
 from ...utils import flatten_path_lists, merge_dicts
 from ..providers import aws
+from ._dependency_graph import DependencyGraph
 from ._module import Module
 
 if TYPE_CHECKING:
@@ -172,7 +178,9 @@ class Deployment:
         context.command = action
         context.env.aws_region = region
 
-        with aws.AssumeRole(context, **self.assume_role_config):
+        with _tracing.span(
+            self.name, "deployment", action=action, region=region
+        ), aws.AssumeRole(context, **self.assume_role_config):
             self.definition.resolve(context, variables=self._variables)
             self.validate_account_credentials(context)
             Module.run_list(
@@ -243,15 +251,31 @@ class Deployment:
             action: Name of action to run.
 
         """
+        pool = self.ctx.worker_pool
+        if pool and pool.available:
+            self.logger.info("processing regions in parallel...")
+            pool.map(
+                self.run,
+                [(action, region) for region in self.regions],
+                max_concurrent=self.ctx.env.max_concurrent_regions,
+            )
+            return
         self.logger.info(
-            "processing regions in parallel... (output will be interwoven)"
+            "processing regions in parallel... (output will be prefixed with the region)"
         )
         with concurrent.futures.ProcessPoolExecutor(
             max_workers=self.ctx.env.max_concurrent_regions,
             mp_context=multiprocessing.get_context("fork"),
         ) as executor:
             futures = [
-                executor.submit(self.run, *[action, region]) for region in self.regions
+                executor.submit(
+                    PrefixFilter.call,
+                    PrefixFilter.nested(region),
+                    self.run,
+                    action,
+                    region,
+                )
+                for region in self.regions
             ]
         for job in futures:
             job.result()  # raise exceptions / exit as needed
@@ -287,27 +311,132 @@ class Deployment:
             variables: Runway variables for lookup resolution.
 
         """
+        if future and future.dependency_graph:
+            return cls.__run_graph(
+                action=action,
+                context=context,
+                deployments=deployments,
+                future=future,
+                variables=variables,
+            )
         for definition in deployments:
-            definition.resolve(context, variables=variables, pre_process=True)
-            deployment = cls(
+            cls.__process(
+                action=action,
                 context=context,
                 definition=definition,
                 future=future,
                 variables=variables,
             )
-            LOGGER.info("")
-            LOGGER.info("")
-            deployment.logger.notice("processing deployment (in progress)")
-            if not definition.modules:
-                deployment.logger.warning("skipped; no modules found in definition")
-                continue
-            cls(
+
+    @classmethod
+    def __process(
+        cls,
+        action: RunwayActionTypeDef,
+        context: RunwayContext,
+        definition: RunwayDeploymentDefinition,
+        future: RunwayFutureDefinitionModel,
+        variables: RunwayVariablesDefinition,
+    ) -> None:
+        """Process a single deployment definition.
+
+        Args:
+            action: Name of action to run.
+            context: Runway context.
+            definition: Deployment to run.
+            future: Future definition.
+            variables: Runway variables for lookup resolution.
+
+        """
+        # parameters and stacks may have been changed by the modules of other
+        # deployments
+        SsmLookup.clear_cache()
+        clear_output_caches()
+        SsmLookup.prefetch(definition.lookups, context)
+        CfnLookup.prefetch(definition.lookups, context)
+        definition.resolve(context, variables=variables, pre_process=True)
+        deployment = cls(
+            context=context,
+            definition=definition,
+            future=future,
+            variables=variables,
+        )
+        LOGGER.info("")
+        LOGGER.info("")
+        deployment.logger.notice("processing deployment (in progress)")
+        if not definition.modules:
+            deployment.logger.warning("skipped; no modules found in definition")
+            return
+        cls(
+            context=context,
+            definition=definition,
+            future=future,
+            variables=variables,
+        )[action]()
+        deployment.logger.success("processing deployment (complete)")
+
+    @classmethod
+    def __run_graph(
+        cls,
+        action: RunwayActionTypeDef,
+        context: RunwayContext,
+        deployments: List[RunwayDeploymentDefinition],
+        future: RunwayFutureDefinitionModel,
+        variables: RunwayVariablesDefinition,
+    ) -> None:
+        """Run a list of deployments in the order of their dependencies.
+
+        Deployments that do not depend on each other are processed
+        concurrently during deploy/destroy. The dependencies are reversed
+        for destroy.
+
+        Args:
+            action: Name of action to run.
+            context: Runway context.
+            deployments: List of deployments to run.
+            future: Future definition.
+            variables: Runway variables for lookup resolution.
+
+        """
+        try:
+            graph = DependencyGraph(
+                [
+                    (definition.name, definition.depends_on)
+                    for definition in deployments
+                ],
+                reverse=action == "destroy",
+            )
+        except (DAGValidationError, ValueError) as err:
+            LOGGER.error("unable to determine the order of deployments: %s", err)
+            sys.exit(1)
+        definitions = {definition.name: definition for definition in deployments}
+
+        def _process(name: str) -> None:
+            cls.__process(
+                action=action,
                 context=context,
-                definition=definition,
+                definition=definitions[name],
                 future=future,
                 variables=variables,
-            )[action]()
-            deployment.logger.success("processing deployment (complete)")
+            )
+
+        if action not in ("deploy", "destroy") or not context.use_concurrent:
+            for name in graph.order:
+                _process(name)
+            return
+        LOGGER.info(
+            "processing deployments in parallel... "
+            "(output will be prefixed with the deployment name)"
+        )
+        failed, skipped = graph.run(
+            _process,
+            continue_on_error=context.env.continue_on_error,
+            max_workers=context.env.max_concurrent_deployments,
+        )
+        if skipped:
+            LOGGER.error("skipped deployment(s): %s", ", ".join(skipped))
+        if failed:
+            LOGGER.error("failed deployment(s): %s", ", ".join(failed))
+            sys.exit(1)
 
     def __getitem__(self, name: str) -> Any:
         """Make the object subscriptable.
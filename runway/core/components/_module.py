@@ -10,7 +10,10 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 import yaml
 
-from ..._logging import PrefixAdaptor
+from ... import _tracing
+from ..._logging import PrefixAdaptor, PrefixFilter
+from ...cfngin.dag import DAGValidationError
+from ...cfngin.output_cache import clear_output_caches
 from ...compat import cached_property
 from ...config.components.runway import RunwayVariablesDefinition
 from ...config.models.runway import (
@@ -18,8 +21,10 @@ from ...config.models.runway import (
     RunwayFutureDefinitionModel,
     RunwayVariablesDefinitionModel,
 )
+from ...lookups.handlers.ssm import SsmLookup
 from ...utils import change_dir, flatten_path_lists, merge_dicts
 from ..providers import aws
+from ._dependency_graph import DependencyGraph
 from ._module_path import ModulePath
 from ._module_type import RunwayModuleType
 
@@ -232,17 +237,24 @@ class Module:
         self.logger.verbose("module payload: %s", json.dumps(self.payload))
         if self.should_skip:
             return
-        with change_dir(self.path.module_root):
-            # dynamically load the particular module's class, 'get' the method
-            # associated with the command, and call the method.
-            inst = self.type.module_class(
-                self.ctx, module_root=self.path.module_root, **self.payload
-            )
-            if hasattr(inst, action):
-                inst[action]()
-            else:
-                self.logger.error('"%s" is missing method "%s"', inst, action)
-                sys.exit(1)
+        try:
+            with _tracing.span(
+                self.fqn, "module", action=action, region=self.ctx.env.aws_region
+            ), change_dir(self.path.module_root):
+                # dynamically load the particular module's class, 'get' the method
+                # associated with the command, and call the method.
+                inst = self.type.module_class(
+                    self.ctx, module_root=self.path.module_root, **self.payload
+                )
+                if hasattr(inst, action):
+                    inst[action]()
+                else:
+                    self.logger.error('"%s" is missing method "%s"', inst, action)
+                    sys.exit(1)
+        finally:
+            # the module may have changed parameters or stacks used by lookups
+            SsmLookup.clear_cache()
+            clear_output_caches()
         self.logger.success(
             "processing module in %s (complete)", self.ctx.env.aws_region
         )
@@ -254,8 +266,17 @@ class Module:
             action: Name of action to run.
 
         """
+        pool = self.ctx.worker_pool
+        if pool and pool.available:
+            self.logger.info("processing modules in parallel...")
+            pool.map(
+                Module.run,
+                [(child, action) for child in self.child_modules],
+                max_concurrent=self.ctx.env.max_concurrent_modules,
+            )
+            return
         self.logger.info(
-            "processing modules in parallel... (output will be interwoven)"
+            "processing modules in parallel... (output will be prefixed with the module name)"
         )
         # Can't use threading or ThreadPoolExecutor here because
         # we need to be able to do things like `cd` which is not
@@ -265,7 +286,13 @@ class Module:
             mp_context=multiprocessing.get_context("fork"),
         ) as executor:
             futures = [
-                executor.submit(child.run, *[action]) for child in self.child_modules
+                executor.submit(
+                    PrefixFilter.call,
+                    PrefixFilter.nested(child.name),
+                    child.run,
+                    action,
+                )
+                for child in self.child_modules
             ]
         for job in futures:
             job.result()  # raise exceptions / exit as needed
@@ -315,6 +342,15 @@ class Module:
             future: Future functionality configuration.
 
         """
+        if future and future.dependency_graph:
+            return cls.__run_graph(
+                action=action,
+                context=context,
+                modules=modules,
+                variables=variables,
+                deployment=deployment,
+                future=future,
+            )
         for module in modules:
             cls(
                 context=context,
@@ -324,6 +360,70 @@ class Module:
                 variables=variables,
             )[action]()
 
+    @classmethod
+    def __run_graph(
+        cls,
+        action: RunwayActionTypeDef,
+        context: RunwayContext,
+        modules: List[RunwayModuleDefinition],
+        variables: RunwayVariablesDefinition,
+        deployment: RunwayDeploymentDefinition = None,
+        future: Optional[RunwayFutureDefinitionModel] = None,
+    ) -> None:
+        """Run a list of modules in the order of their dependencies.
+
+        Modules that do not depend on each other are processed concurrently
+        during deploy/destroy. The dependencies are reversed for destroy.
+
+        Args:
+            action: Name of action to run.
+            context: Runway context.
+            modules: List of modules to run.
+            variables: Variable definition for resolving lookups in the module.
+            deployment: Deployment the modules are a part of.
+            future: Future functionality configuration.
+
+        """
+        try:
+            graph = DependencyGraph(
+                [(module.name, module.depends_on) for module in modules],
+                kind="module",
+                log_prefix=deployment.name if deployment else "",
+                reverse=action == "destroy",
+            )
+        except (DAGValidationError, ValueError) as err:
+            LOGGER.error("unable to determine the order of modules: %s", err)
+            sys.exit(1)
+        definitions = {module.name: module for module in modules}
+
+        def _run(name: str) -> None:
+            cls(
+                context=context,
+                definition=definitions[name],
+                deployment=deployment,
+                future=future,
+                variables=variables,
+            )[action]()
+
+        if action not in ("deploy", "destroy") or not context.use_concurrent:
+            for name in graph.order:
+                _run(name)
+            return
+        LOGGER.info(
+            "processing modules in parallel... "
+            "(output will be prefixed with the module name)"
+        )
+        failed, skipped = graph.run(
+            _run,
+            continue_on_error=context.env.continue_on_error,
+            max_workers=context.env.max_concurrent_modules,
+        )
+        if skipped:
+            LOGGER.error("skipped module(s): %s", ", ".join(skipped))
+        if failed:
+            LOGGER.error("failed module(s): %s", ", ".join(failed))
+            sys.exit(1)
+
     def __getitem__(self, key: str) -> Any:
         """Make the object subscriptable.
 
@@ -0,0 +1,393 @@
+"""Pool of worker processes shared by everything run by a Runway action."""
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+from ..._logging import PrefixFilter
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+    from ..._logging import RunwayLogger
+
+LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
+
+#: Seconds to wait for the log records of a task after it completes.
+LOG_FLUSH_TIMEOUT = 10.0
+
+_TASK_ID: Optional[int] = None  # task being run by a worker process
+_WORKER_STATE: Optional[_WorkerState] = None  # state restored after each task
+
+
+class _TaskFilter(logging.Filter):
+    """Tag records logged by a worker process with the task being run."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add the task ID to a record."""
+        record.runway_task = _TASK_ID
+        return True
+
+
+class _TaskLogHandler(logging.Handler):
+    """Handle records sent by worker processes without interleaving tasks.
+
+    Records of the first task to log something are passed to the loggers of
+    this process as they are received. Records of other tasks are held until
+    the tasks before them complete.
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        super().__init__()
+        self._active: Optional[int] = None
+        self._buffers: OrderedDict[int, List[logging.LogRecord]] = OrderedDict()
+        self._condition = threading.Condition()
+        self._done: Set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Route a record."""
+        task = getattr(record, "runway_task", None)
+        with self._condition:
+            if task is None:
+                self._dispatch(record)
+            elif getattr(record, "runway_task_done", False):
+                self._done.add(task)
+                self._advance()
+                self._condition.notify_all()
+            else:
+                if self._active is None:
+                    self._active = task
+                if task == self._active:
+                    self._dispatch(record)
+                else:
+                    self._buffers.setdefault(task, []).append(record)
+
+    def flush_all(self) -> None:
+        """Pass on all held records."""
+        with self._condition:
+            self._done.update(self._buffers)
+            if self._active is not None:
+                self._done.add(self._active)
+            self._advance()
+
+    def wait(self, tasks: Iterable[int], timeout: float = LOG_FLUSH_TIMEOUT) -> bool:
+        """Wait for the records of tasks to be received.
+
+        Returns:
+            Whether all records were received before the timeout.
+
+        """
+        tasks = set(tasks)
+        with self._condition:
+            received = self._condition.wait_for(
+                lambda: tasks.issubset(self._done), timeout
+            )
+            self._done.difference_update(tasks)
+        return received
+
+    def _advance(self) -> None:
+        """Pass on the held records of the next task once the active one is done."""
+        while self._active is None or self._active in self._done:
+            self._active = None
+            if not self._buffers:
+                return
+            self._active, records = self._buffers.popitem(last=False)
+            for record in records:
+                self._dispatch(record)
+
+    @staticmethod
+    def _dispatch(record: logging.LogRecord) -> None:
+        """Pass a record to the logger it was logged with in this process."""
+        logging.getLogger(record.name).handle(record)
+
+
+class _WorkerState:
+    """State of a worker process that is restored after each task.
+
+    Modules imported by a task are removed unless they are part of Runway or
+    installed in the Python environment (e.g. ``boto3``), so code loaded from
+    a module or ``sys_path`` (e.g. blueprints, hooks) is imported again by
+    the next task.
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.argv = list(sys.argv)
+        self.modules = set(sys.modules)
+        self.path = list(sys.path)
+        self.prefix = PrefixFilter.installed
+        self.loggers = {
+            logger: (
+                list(logger.handlers),
+                list(logger.filters),
+                logger.level,
+                logger.propagate,
+                logger.disabled,
+            )
+            for logger in self._loggers()
+        }
+        self.handler_filters = {
+            handler: list(handler.filters)
+            for handlers, *_ in self.loggers.values()
+            for handler in handlers
+        }
+
+    def restore(self) -> None:
+        """Restore the state."""
+        sys.argv = list(self.argv)
+        sys.path = list(self.path)
+        prefixes = tuple(
+            {os.path.realpath(sys.prefix), os.path.realpath(sys.base_prefix)}
+        )
+        for name in set(sys.modules).difference(self.modules):
+            module_file = getattr(sys.modules[name], "__file__", None)
+            if (
+                module_file
+                and name.split(".")[0] != "runway"
+                and not os.path.realpath(module_file).startswith(prefixes)
+            ):
+                del sys.modules[name]
+        for logger in self._loggers():
+            handlers, filters, level, propagate, disabled = self.loggers.get(
+                logger, ([], [], logging.NOTSET, True, False)
+            )
+            logger.handlers = list(handlers)
+            logger.filters = list(filters)
+            logger.setLevel(level)
+            logger.propagate = propagate
+            logger.disabled = disabled
+        for handler, handler_filters in self.handler_filters.items():
+            handler.filters = list(handler_filters)
+        PrefixFilter.installed = self.prefix
+
+    @staticmethod
+    def _loggers() -> List[logging.Logger]:
+        """Get every logger of the process."""
+        return [logging.getLogger()] + [
+            logger
+            for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ]
+
+
+def _initialize_worker(queue: Queue[Any]) -> None:
+    """Send the records logged by a worker process to the main process."""
+    global _WORKER_STATE  # pylint: disable=global-statement
+    handler = logging.handlers.QueueHandler(queue)
+    handler.addFilter(_TaskFilter())
+    root = logging.getLogger()
+    for logger in [root] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]:
+        had_handlers = bool(logger.handlers)
+        for existing in list(logger.handlers):
+            logger.removeHandler(existing)
+        if had_handlers and not logger.propagate:
+            logger.addHandler(handler)
+    root.addHandler(handler)
+    _WORKER_STATE = _WorkerState()
+
+
+def _run_task(
+    task_id: int,
+    func: Callable[..., Any],
+    args: Sequence[Any],
+    environ: Dict[str, str],
+    cwd: str,
+) -> Any:
+    """Run a function in a worker process.
+
+    The task starts with the environment variables and working directory of
+    the process that submitted it. Other state changed by the task is
+    restored once it completes.
+
+    """
+    global _TASK_ID  # pylint: disable=global-statement
+    _TASK_ID = task_id
+    os.environ.clear()
+    os.environ.update(environ)
+    try:
+        os.chdir(cwd)
+        return func(*args)
+    finally:
+        logging.getLogger().handle(
+            logging.makeLogRecord(
+                {
+                    "name": LOGGER.name,
+                    "levelno": logging.DEBUG,
+                    "runway_task_done": True,
+                }
+            )
+        )
+        _TASK_ID = None
+        if _WORKER_STATE:
+            _WORKER_STATE.restore()
+
+
+class WorkerPool:
+    """Pool of worker processes shared by everything run by a Runway action.
+
+    Worker processes are forked the first time they are needed and reused
+    until the pool is shut down, so pooled boto3 sessions and installed
+    packages imported by a worker stay available to the tasks it runs after.
+    Each task starts with the environment variables and working directory of
+    the main process, and ``sys.argv``, ``sys.path``, modules imported from
+    outside of the Python environment, and logging configuration are
+    restored after each task. Records logged by workers are sent to the main
+    process so the output of each task is kept together.
+
+    A worker that exits unexpectedly breaks the pool. The call raises
+    :class:`RuntimeError` and new workers are started by the next call.
+
+    The pool can only be used by the process that created it. Copies of the
+    pool (e.g. in a worker process) are not :attr:`available`.
+
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Instantiate class.
+
+        Args:
+            max_workers: Max number of worker processes.
+                Defaults to ``min(61, os.cpu_count())``.
+
+        """
+        self.max_workers = max_workers or min(61, os.cpu_count() or 61)
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._handler: Optional[_TaskLogHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._task_ids = itertools.count()
+
+    @property
+    def available(self) -> bool:
+        """Whether the pool can be used by the current process."""
+        return os.getpid() == self._pid
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        args_list: Iterable[Sequence[Any]],
+        *,
+        max_concurrent: Optional[int] = None,
+    ) -> List[Any]:
+        """Call a function in worker processes once for each set of arguments.
+
+        Args:
+            func: Function to call. It and its arguments must be picklable.
+            args_list: Arguments of each call.
+            max_concurrent: Max number of calls to run at the same time.
+                Defaults to the size of the pool.
+
+        Returns:
+            The return value of each call, in order.
+
+        Raises:
+            Exception: The first exception raised by a call once all calls
+                have completed.
+
+        """
+        executor, handler = self._start()
+        futures: List[concurrent.futures.Future[Any]] = []
+        running: Set[concurrent.futures.Future[Any]] = set()
+        task_ids: List[int] = []
+        for args in args_list:
+            if max_concurrent and len(running) >= max_concurrent:
+                _, running = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            task_ids.append(next(self._task_ids))
+            future = executor.submit(
+                _run_task, task_ids[-1], func, args, dict(os.environ), os.getcwd()
+            )
+            futures.append(future)
+            running.add(future)
+        concurrent.futures.wait(futures)
+        if any(isinstance(future.exception(), BrokenProcessPool) for future in futures):
+            self.shutdown()  # new workers are started by the next call
+            raise RuntimeError("a worker process exited unexpectedly")
+        if not handler.wait(task_ids):
+            LOGGER.debug("timed out waiting for log records from worker processes")
+            handler.flush_all()
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._listener:
+                self._listener.stop()
+                self._listener = None
+            if self._handler:
+                self._handler.flush_all()
+                self._handler = None
+
+    def _start(self) -> Tuple[concurrent.futures.ProcessPoolExecutor, _TaskLogHandler]:
+        """Start the worker processes if needed."""
+        if not self.available:
+            raise RuntimeError(
+                "worker pool can only be used by the process that created it"
+            )
+        with self._lock:
+            if not (self._executor and self._handler):
+                mp_context = multiprocessing.get_context("fork")
+                queue: Queue[Any] = mp_context.Queue()
+                self._handler = _TaskLogHandler()
+                self._listener = logging.handlers.QueueListener(queue, self._handler)
+                self._listener.start()
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    initargs=(queue,),
+                    initializer=_initialize_worker,
+                    max_workers=self.max_workers,
+                    mp_context=mp_context,
+                )
+                LOGGER.debug(
+                    "started worker pool with up to %s process(es)", self.max_workers
+                )
+            return self._executor, self._handler
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Only copy the settings of the pool when pickled."""
+        return {"max_workers": self.max_workers, "pid": self._pid}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pool that is not available to the current process."""
+        self.__init__(state["max_workers"])
+        self._pid = state["pid"]
+
+    def __enter__(self) -> WorkerPool:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Shut down the pool when exiting the context manager."""
+        self.shutdown()
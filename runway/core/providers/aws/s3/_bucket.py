@@ -179,6 +179,7 @@ class Bucket:
         self,
         src_directory: str,
         *,
+        checksum: bool = False,
         delete: bool = False,
         exclude: Optional[List[str]] = None,
         follow_symlinks: bool = False,
@@ -189,6 +190,8 @@ class Bucket:
 
         Args:
             src_directory: Local directory to sync to S3.
+            checksum: If true, files are compared using their checksum instead
+                of their modification time.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             exclude: List of patterns for files/objects to exclude.
@@ -198,6 +201,7 @@ class Bucket:
 
         """
         S3SyncHandler(
+            checksum=checksum,
             context=self.__ctx,
             delete=delete,
             dest=self.format_bucket_path_uri(prefix=prefix),
@@ -212,6 +216,7 @@ class Bucket:
         self,
         dest_directory: str,
         *,
+        checksum: bool = False,
         delete: bool = False,
         exclude: Optional[List[str]] = None,
         follow_symlinks: bool = False,
@@ -222,6 +227,8 @@ class Bucket:
 
         Args:
             dest_directory: Local directory to sync S3 objects to.
+            checksum: If true, files are compared using their checksum instead
+                of their modification time.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             exclude: List of patterns for files/objects to exclude.
@@ -231,6 +238,7 @@ class Bucket:
 
         """
         S3SyncHandler(
+            checksum=checksum,
             context=self.__ctx,
             delete=delete,
             dest=dest_directory,
@@ -19,6 +19,7 @@ class ParametersDataModel(BaseModel):
     Attributes:
         dest: File/object destination.
         src: File/object source.
+        checksum: Compare the checksum of files/objects during sync.
         content_type: Explicitly provided content type.
         delete: Whether or not to delete files at the destination that are
             missing from the source location.
@@ -48,6 +49,7 @@ class ParametersDataModel(BaseModel):
     dest: str
     src: str
     # these need to be set after dest & src so their validators can access the value if needed
+    checksum: bool = False
     content_type: Optional[str] = None
     delete: bool = False
     dir_op: bool = False
@@ -62,6 +62,9 @@ class BaseSync:
                 f"Unknown sync_type: {sync_type}.\nValid options are {VALID_SYNC_TYPES}."
             )
 
+    def close(self) -> None:
+        """Release anything held by the sync strategy once the sync is complete."""
+
     def register_strategy(self, session: Session) -> None:
         """Register the sync strategy class to the given session."""
         session.register("choosing-s3-sync-strategy", self.use_sync_strategy)
@@ -0,0 +1,241 @@
+"""Checksum sync strategy."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Union
+
+from s3transfer.utils import ChunksizeAdjuster
+from typing_extensions import Literal
+
+from .......constants import DEFAULT_CACHE_DIR
+from ..transfer_config import DEFAULTS
+from .base import BaseSync, ValidSyncType
+
+if TYPE_CHECKING:
+    from ..file_generator import FileStats
+
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+CHECKSUM_INDEX_FILE = DEFAULT_CACHE_DIR / "s3_sync_checksums.json"
+#: Size of the blocks read from a file while it is being hashed.
+READ_SIZE = 1024 * 1024
+
+
+def calculate_etag(path: Union[Path, str], chunksize: Optional[int] = None) -> str:
+    """Calculate the ETag S3 assigns to an object uploaded from a local file.
+
+    Args:
+        path: Path to a local file.
+        chunksize: Size of the parts if the object was uploaded in multiple
+            parts. The chunksize is adjusted the same way ``s3transfer``
+            adjusts it so it stays within the limits of S3.
+
+    Returns:
+        The MD5 of the file if it was uploaded in a single part, otherwise the
+        MD5 of the MD5 of each part followed by the number of parts.
+
+    """
+    if not chunksize:
+        md5 = hashlib.md5()
+        with open(path, "rb") as file_obj:
+            for block in iter(lambda: file_obj.read(READ_SIZE), b""):
+                md5.update(block)
+        return md5.hexdigest()
+    chunksize = ChunksizeAdjuster().adjust_chunksize(chunksize, os.path.getsize(path))
+    digests = []
+    with open(path, "rb") as file_obj:
+        while True:
+            md5 = hashlib.md5()
+            remaining = chunksize
+            while remaining:
+                block = file_obj.read(min(READ_SIZE, remaining))
+                if not block:
+                    break
+                md5.update(block)
+                remaining -= len(block)
+            if remaining == chunksize:
+                break
+            digests.append(md5.digest())
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+class ChecksumIndex:
+    """Sidecar index of the checksums of local files.
+
+    Checksums are reused as long as the size, modification time, and inode of
+    a file are unchanged so files only need to be hashed once.
+
+    """
+
+    def __init__(self, path: Optional[Union[Path, str]] = None) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the file where the index is stored.
+                Defaults to :data:`CHECKSUM_INDEX_FILE`.
+
+        """
+        self.path = Path(path or CHECKSUM_INDEX_FILE)
+        self.stats = dict.fromkeys(["hits", "misses"], 0)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self._modified = False
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Entries of the index, loaded from the file the first time it is used."""
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get_etag(self, path: Union[Path, str], chunksize: Optional[int] = None) -> str:
+        """Get the ETag of a local file, calculating it if needed.
+
+        Args:
+            path: Path to a local file.
+            chunksize: Size of the parts if the object was uploaded in
+                multiple parts.
+
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        digest_key = str(chunksize or 0)
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry and entry.get("signature") == signature:
+                etag = entry["etags"].get(digest_key)
+                if etag:
+                    self.stats["hits"] += 1
+                    return etag
+            else:
+                entry = {"etags": {}, "signature": signature}
+        etag = calculate_etag(path, chunksize)
+        with self._lock:
+            self.stats["misses"] += 1
+            entry["etags"][digest_key] = etag
+            self.entries[path] = entry
+            self._modified = True
+        return etag
+
+    def save(self) -> None:
+        """Write the index to its file if it changed.
+
+        Entries of files that no longer exist are dropped.
+
+        """
+        with self._lock:
+            if not self._modified:
+                return
+            entries = {
+                path: entry
+                for path, entry in self.entries.items()
+                if os.path.isfile(path)
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.path.parent / f".tmp-{os.getpid()}-{self.path.name}"
+                tmp_file.write_text(json.dumps(entries))
+                tmp_file.replace(self.path)
+            except OSError as err:
+                LOGGER.warning("unable to save checksum index: %s", err)
+                return
+            self._modified = False
+        LOGGER.debug(
+            "checksum index: %s hit(s), %s miss(es)",
+            self.stats["hits"],
+            self.stats["misses"],
+        )
+
+
+class ChecksumSync(BaseSync):
+    """Sync files with a different size or checksum.
+
+    The MD5 of local files is compared to the ETag of S3 objects, including
+    the composite ETag of objects uploaded in multiple parts. Objects that
+    are encrypted with SSE-KMS or SSE-C do not have an MD5 ETag so they are
+    always synced.
+
+    """
+
+    NAME: ClassVar[Literal["checksum"]] = "checksum"
+
+    def __init__(
+        self,
+        sync_type: ValidSyncType = "file_at_src_and_dest",
+        *,
+        index: Optional[ChecksumIndex] = None,
+        multipart_chunksize: Optional[Union[int, str]] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            sync_type: This determines where the sync strategy will be
+                used. There are three strings to choose from.
+            index: Index used to store the checksums of local files.
+            multipart_chunksize: Size of the parts of multipart uploads.
+
+        """
+        super().__init__(sync_type)
+        self.index = index or ChecksumIndex()
+        self.multipart_chunksize = int(
+            multipart_chunksize or DEFAULTS["multipart_chunksize"]
+        )
+
+    def close(self) -> None:
+        """Save the checksums of local files."""
+        self.index.save()
+
+    def compare_checksum(
+        self, src_file: Optional[FileStats], dest_file: Optional[FileStats]
+    ) -> bool:
+        """Compare the checksum of a local file with the ETag of an S3 object.
+
+        Returns:
+            True if the file and object have the same content.
+
+        """
+        if not (src_file and dest_file):
+            raise ValueError("src_file and dest_file must not be None")
+        local_file, s3_object = (
+            (src_file, dest_file)
+            if src_file.src_type == "local"
+            else (dest_file, src_file)
+        )
+        if local_file.src_type != "local" or s3_object.src_type != "s3":
+            return False  # only local files can be compared with S3 objects
+        etag = str((s3_object.response_data or {}).get("ETag", "")).strip('"')
+        if not etag:
+            return False
+        try:
+            return etag == self.index.get_etag(
+                local_file.src, self.multipart_chunksize if "-" in etag else None
+            )
+        except OSError as err:
+            LOGGER.debug("unable to calculate checksum of %s: %s", local_file.src, err)
+            return False
+
+    def determine_should_sync(
+        self, src_file: Optional[FileStats], dest_file: Optional[FileStats]
+    ) -> bool:
+        """Determine if file should sync."""
+        same_size = self.compare_size(src_file, dest_file)
+        should_sync = not (same_size and self.compare_checksum(src_file, dest_file))
+        if should_sync:
+            LOGGER.debug(
+                "syncing: %s -> %s, size_changed: %s, checksum_changed: %s",
+                src_file.src if src_file else None,
+                src_file.dest if src_file else None,
+                not same_size,
+                same_size,
+            )
+        return should_sync
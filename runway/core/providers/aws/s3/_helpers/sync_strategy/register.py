@@ -6,8 +6,9 @@
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Type
+from typing import TYPE_CHECKING, Any, List, Optional, Type
 
+from .checksum import ChecksumSync
 from .delete import DeleteSync
 from .exact_timestamps import ExactTimestampsSync
 from .size_only import SizeOnlySync
@@ -15,6 +16,7 @@ from .size_only import SizeOnlySync
 if TYPE_CHECKING:
     from botocore.session import Session
 
+    from ..transfer_config import TransferConfigDict
     from .base import BaseSync, ValidSyncType
 
 
@@ -22,7 +24,8 @@ def register_sync_strategy(
     session: Session,
     strategy_cls: Type[BaseSync],
     sync_type: ValidSyncType = "file_at_src_and_dest",
-):
+    **kwargs: Any,
+) -> BaseSync:
     """Register a single sync strategy.
 
     Args:
@@ -30,19 +33,45 @@ def register_sync_strategy(
         strategy_cls: The class of the sync strategy to be registered.
         sync_type: A string representing when to perform the sync strategy.
             See ``__init__`` method of ``BaseSyncStrategy`` for possible options.
+        **kwargs: Additional arguments passed to the sync strategy class.
+
+    Returns:
+        The sync strategy that was registered.
 
     """
-    strategy = strategy_cls(sync_type)
+    strategy = strategy_cls(sync_type, **kwargs)
     strategy.register_strategy(session)
+    return strategy
 
 
-def register_sync_strategies(session: Session, **_: Any) -> None:
-    """Register the different sync strategies."""
-    # Register the size only sync strategy.
-    register_sync_strategy(session, SizeOnlySync)
+def register_sync_strategies(
+    session: Session,
+    *,
+    runtime_config: Optional[TransferConfigDict] = None,
+    **_: Any,
+) -> List[BaseSync]:
+    """Register the different sync strategies.
 
-    # Register the exact timestamps sync strategy.
-    register_sync_strategy(session, ExactTimestampsSync)
+    Args:
+        session: The session that the sync strategies are being registered to.
+        runtime_config: Runtime transfer config used by the sync.
 
-    # Register the delete sync strategy.
-    register_sync_strategy(session, DeleteSync, "file_not_at_src")
+    Returns:
+        The sync strategies that were registered. They should be closed once
+        the sync is complete.
+
+    """
+    return [
+        # Register the size only sync strategy.
+        register_sync_strategy(session, SizeOnlySync),
+        # Register the exact timestamps sync strategy.
+        register_sync_strategy(session, ExactTimestampsSync),
+        # Register the checksum sync strategy.
+        register_sync_strategy(
+            session,
+            ChecksumSync,
+            multipart_chunksize=(runtime_config or {}).get("multipart_chunksize"),
+        ),
+        # Register the delete sync strategy.
+        register_sync_strategy(session, DeleteSync, "file_not_at_src"),
+    ]
@@ -24,6 +24,7 @@ class S3SyncHandler:
         self,
         context: Union[CfnginContext, RunwayContext],
         *,
+        checksum: bool = False,
         delete: bool = False,
         dest: str,
         exclude: Optional[List[str]] = None,
@@ -37,6 +38,8 @@ class S3SyncHandler:
 
         Args:
             context: Runway or CFNgin context object.
+            checksum: If true, files are compared using their checksum instead
+                of their modification time.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             dest: Destination path.
@@ -60,6 +63,7 @@ class S3SyncHandler:
         self.parameters = Parameters(
             "sync",
             ParametersDataModel(
+                checksum=checksum,
                 delete=delete,
                 dest=dest,
                 exclude=exclude or [],
@@ -84,11 +88,17 @@ class S3SyncHandler:
 
     def run(self) -> None:
         """Run sync."""
-        register_sync_strategies(self._botocore_session)
-        ActionArchitecture(
-            session=self._session,
-            botocore_session=self._botocore_session,
-            action="sync",
-            parameters=self.parameters.data,
-            runtime_config=self.transfer_config,
-        ).run()
+        strategies = register_sync_strategies(
+            self._botocore_session, runtime_config=self.transfer_config
+        )
+        try:
+            ActionArchitecture(
+                session=self._session,
+                botocore_session=self._botocore_session,
+                action="sync",
+                parameters=self.parameters.data,
+                runtime_config=self.transfer_config,
+            ).run()
+        finally:
+            for strategy in strategies:
+                strategy.close()
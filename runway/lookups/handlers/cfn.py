@@ -9,19 +9,32 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 from botocore.exceptions import ClientError
 
 from ...cfngin.exceptions import StackDoesNotExist
+from ...cfngin.output_cache import get_output_cache
 from ...exceptions import OutputDoesNotExist
 from .base import LookupHandler
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudformation.client import CloudFormationClient
 
+    from ...cfngin.output_cache import StackOutputCache
     from ...cfngin.providers.aws.default import Provider
     from ...context import CfnginContext, RunwayContext
+    from ...variables import VariableValueLookup
 
 LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "cfn"
@@ -37,6 +50,8 @@ class OutputQuery(NamedTuple):
 class CfnLookup(LookupHandler):
     """CloudFormation Stack Output lookup."""
 
+    concurrent = True
+
     @staticmethod
     def should_use_provider(args: Dict[str, str], provider: Optional[Provider]) -> bool:
         """Determine if the provider should be used for the lookup.
@@ -57,14 +72,21 @@ class CfnLookup(LookupHandler):
         return False
 
     @staticmethod
-    def get_stack_output(client: CloudFormationClient, query: OutputQuery) -> str:
+    def get_stack_output(
+        client: CloudFormationClient,
+        query: OutputQuery,
+        cache: Optional[StackOutputCache] = None,
+    ) -> str:
         """Get CloudFormation Stack output.
 
         Args:
             client: Boto3 CloudFormation client.
             query: What to get.
+            cache: Output cache for the region of the client.
 
         """
+        if cache is not None:
+            return cache.get_outputs(client, query.stack_name)[query.output_name]
         LOGGER.debug("describing stack: %s", query.stack_name)
         stack = client.describe_stacks(StackName=query.stack_name)["Stacks"][0]
         outputs = {
@@ -115,10 +137,12 @@ class CfnLookup(LookupHandler):
                     query.stack_name, query.output_name
                 )
             else:
-                cfn_client = context.get_session(region=args.get("region")).client(
-                    "cloudformation"
+                session = context.get_session(region=args.get("region"))
+                result = cls.get_stack_output(
+                    session.client("cloudformation"),
+                    query,
+                    get_output_cache(session),
                 )
-                result = cls.get_stack_output(cfn_client, query)
         except (ClientError, KeyError, StackDoesNotExist) as exc:
             # StackDoesNotExist is only raised by provider
             if "default" in args:
@@ -135,3 +159,36 @@ class CfnLookup(LookupHandler):
             else:
                 raise OutputDoesNotExist(query.stack_name, query.output_name) from exc
         return cls.format_results(result, **args)
+
+    @classmethod
+    def prefetch(
+        cls,
+        lookups: Iterable[VariableValueLookup],
+        context: Union[CfnginContext, RunwayContext],
+    ) -> None:
+        """Warm the output caches used by many lookups.
+
+        When enough distinct stacks of a region are referenced, the outputs of
+        every stack in the region are cached with a single paginated
+        ``describe_stacks`` sweep. Lookups that are not CloudFormation lookups
+        or contain nested lookups are ignored.
+
+        Args:
+            lookups: Lookups that will be resolved later.
+            context: The current context object.
+
+        """
+        queries: Dict[Optional[str], Set[str]] = {}
+        for lookup in lookups:
+            if lookup.lookup_name.value != TYPE_NAME or lookup.lookup_query.lookups:
+                continue
+            raw_query, args = cls.parse(lookup.lookup_query.value)
+            queries.setdefault(args.get("region"), set()).add(raw_query.split(".")[0])
+        for region, stack_names in queries.items():
+            try:
+                session = context.get_session(region=region)
+                get_output_cache(session).prefetch(
+                    session.client("cloudformation"), stack_names
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("failed to prefetch stack outputs: %s", err)
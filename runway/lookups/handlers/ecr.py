@@ -20,6 +20,8 @@ TYPE_NAME = "ecr"
 class EcrLookup(LookupHandler):
     """ECR Lookup."""
 
+    concurrent = True
+
     @staticmethod
     def get_login_password(client: ECRClient) -> str:
         """Get a password to login to ECR registry."""
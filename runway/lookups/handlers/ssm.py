@@ -2,19 +2,80 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ...lookups.handlers.base import LookupHandler
 
 if TYPE_CHECKING:
+    import boto3
+    from mypy_boto3_ssm.type_defs import ParameterTypeDef
+
     from ...context import CfnginContext, RunwayContext
+    from ...variables import VariableValueLookup
 
 LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "ssm"
+# maximum number of names accepted by ssm:GetParameters
+GET_PARAMETERS_MAX_NAMES = 10
 
 
 class SsmLookup(LookupHandler):
-    """SSM Parameter Store Lookup."""
+    """SSM Parameter Store Lookup.
+
+    Parameters that are found are cached, keyed by the access key of the
+    credentials used, region, name, and whether the value was decrypted.
+    Including the access key prevents a parameter from being shared between
+    accounts or roles. The cache is cleared whenever parameters could have
+    been changed: when a CFNgin stack finishes being deployed or destroyed,
+    when a module finishes, and before a deployment is processed.
+
+    """
+
+    concurrent = True
+    cache: ClassVar[
+        Dict[Tuple[Optional[str], Optional[str], str, bool], ParameterTypeDef]
+    ] = {}
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls, name: Optional[str] = None) -> None:
+        """Clear cached parameters.
+
+        Args:
+            name: Only clear parameters with this name.
+
+        """
+        with cls._cache_lock:
+            if name is None:
+                cls.cache.clear()
+                return
+            for key in [key for key in cls.cache if key[2] == name]:
+                del cls.cache[key]
+
+    @staticmethod
+    def _cache_key(
+        session: boto3.Session, name: str
+    ) -> Tuple[Optional[str], Optional[str], str, bool]:
+        """Key used to cache a parameter retrieved with a session."""
+        credentials = session.get_credentials()
+        return (
+            credentials.access_key if credentials else None,
+            session.region_name,
+            name,
+            True,
+        )
 
     @classmethod
     def handle(  # pylint: disable=arguments-differ
@@ -39,11 +100,16 @@ class SsmLookup(LookupHandler):
 
         session = context.get_session(region=args.get("region"))
         client = session.client("ssm")
+        key = cls._cache_key(session, query)
 
         try:
-            response = client.get_parameter(Name=query, WithDecryption=True)[
-                "Parameter"
-            ]
+            response = cls.cache.get(key)
+            if not response:
+                response = client.get_parameter(Name=query, WithDecryption=True)[
+                    "Parameter"
+                ]
+                with cls._cache_lock:
+                    cls.cache[key] = response
             return cls.format_results(
                 response["Value"].split(",")
                 if response["Type"] == "StringList"
@@ -55,3 +121,68 @@ class SsmLookup(LookupHandler):
                 args.pop("load", None)  # don't load a default value
                 return cls.format_results(args.pop("default"), **args)
             raise
+
+    @classmethod
+    def prefetch(
+        cls,
+        lookups: Iterable[VariableValueLookup],
+        context: Union[CfnginContext, RunwayContext],
+    ) -> None:
+        """Fetch the parameters of many lookups with as few API calls as possible.
+
+        Parameters are fetched with ``ssm:GetParameters`` in batches of 10,
+        concurrently for each region, and added to the cache. Lookups that are
+        not SSM lookups or contain nested lookups are ignored. Parameters that
+        do not exist or can't be retrieved are left for :meth:`handle`.
+
+        Args:
+            lookups: Lookups that will be resolved later.
+            context: The current context object.
+
+        """
+        queries: Dict[Optional[str], Set[str]] = {}
+        for lookup in lookups:
+            if lookup.lookup_name.value != TYPE_NAME or lookup.lookup_query.lookups:
+                continue
+            query, args = cls.parse(lookup.lookup_query.value)
+            queries.setdefault(args.get("region"), set()).add(query)
+        if not queries:
+            return
+
+        def fetch(region: Optional[str], names: Set[str]) -> None:
+            session = context.get_session(region=region)
+            with cls._cache_lock:
+                sorted_names = sorted(
+                    name
+                    for name in names
+                    if cls._cache_key(session, name) not in cls.cache
+                )
+            for i in range(0, len(sorted_names), GET_PARAMETERS_MAX_NAMES):
+                batch = sorted_names[i : i + GET_PARAMETERS_MAX_NAMES]
+                response = session.client("ssm").get_parameters(
+                    Names=batch, WithDecryption=True
+                )
+                with cls._cache_lock:
+                    for param in response.get("Parameters", []):
+                        # selectors (e.g. name:version) are returned separately
+                        name = param["Name"] + param.get("Selector", "")
+                        if name in batch:
+                            cls.cache[cls._cache_key(session, name)] = param
+            LOGGER.debug(
+                "prefetched %s SSM parameter(s) from region %s",
+                len(sorted_names),
+                session.region_name or "default",
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=len(queries), thread_name_prefix="ssm-prefetch"
+        ) as executor:
+            futures = [
+                executor.submit(fetch, region, names)
+                for region, names in queries.items()
+            ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("failed to prefetch SSM parameters: %s", err)
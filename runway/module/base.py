@@ -6,9 +6,15 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
+from .. import _tracing
 from ..exceptions import NpmNotFound
 from ..utils import which
-from .utils import NPM_BIN, format_npm_command_for_logging, use_npm_ci
+from .utils import (
+    NPM_BIN,
+    format_command_for_tracing,
+    format_npm_command_for_logging,
+    use_npm_ci,
+)
 
 if TYPE_CHECKING:
     from .._logging import PrefixAdaptor, RunwayLogger
@@ -158,7 +164,8 @@ class RunwayModuleNpm(RunwayModule):  # pylint: disable=abstract-method
         else:
             self.logger.info("running npm install...")
             cmd[1] = "install"
-        subprocess.check_call(cmd)
+        with _tracing.span(format_command_for_tracing(cmd), "subprocess"):
+            subprocess.check_call(cmd)
 
     def package_json_missing(self) -> bool:
         """Check for the existence for a package.json file in the module.
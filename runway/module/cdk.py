@@ -9,12 +9,13 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 from typing_extensions import Literal
 
+from .. import _tracing
 from .._logging import PrefixAdaptor
 from ..compat import cached_property
 from ..config.models.runway.options.cdk import RunwayCdkModuleOptionsDataModel
 from ..utils import fix_windows_command_list
 from .base import ModuleOptions, RunwayModuleNpm
-from .utils import generate_node_command, run_module_command
+from .utils import format_command_for_tracing, generate_node_command, run_module_command
 
 if TYPE_CHECKING:
     from .._logging import RunwayLogger
@@ -252,7 +253,10 @@ class CloudDevelopmentKit(RunwayModuleNpm):
             if platform.system() == "Windows":
                 cmd_list = fix_windows_command_list(cmd_list)
             try:
-                subprocess.check_call(cmd_list, env=self.ctx.env.vars, cwd=self.path)
+                with _tracing.span(format_command_for_tracing(cmd_list), "subprocess"):
+                    subprocess.check_call(
+                        cmd_list, env=self.ctx.env.vars, cwd=self.path
+                    )
             except FileNotFoundError:
                 self.logger.error(
                     'attempted to run "%s" but failed to find it (are you sure it '
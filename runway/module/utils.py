@@ -4,11 +4,13 @@ from __future__ import annotations
 import logging
 import os
 import platform
+import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
 
+from .. import _tracing
 from ..utils import which
 
 if TYPE_CHECKING:
@@ -28,6 +30,35 @@ def format_npm_command_for_logging(command: List[str]) -> str:
     return " ".join(command)
 
 
+def format_command_for_tracing(command: List[str], max_words: int = 2) -> str:
+    """Convert a command list to the name of its span in a trace.
+
+    The name only includes the program and the first few plain words that
+    follow it (e.g. ``terraform apply``). Options, the argument following an
+    option (its value), and arguments such as ``key=value`` pairs or paths
+    are left out since they can contain secrets.
+
+    Args:
+        command: List that will be passed into a subprocess.
+        max_words: Max number of words to include after the program.
+
+    """
+    words: List[str] = []
+    skip_next = False
+    for arg in command[1:]:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg.startswith("-"):
+            skip_next = "=" not in arg  # value is the next argument
+            continue
+        for word in arg.split():
+            if len(words) >= max_words or not re.match(r"^[\w.:-]+$", word):
+                break
+            words.append(word)
+    return " ".join([os.path.basename(command[0]), *words]) if command else ""
+
+
 def generate_node_command(
     command: str,
     command_opts: List[str],
@@ -79,13 +110,14 @@ def run_module_command(
 ) -> None:
     """Shell out to provisioner command."""
     logger.debug("running command: %s", " ".join(cmd_list))
-    if exit_on_error:
-        try:
+    with _tracing.span(format_command_for_tracing(cmd_list), "subprocess"):
+        if exit_on_error:
+            try:
+                subprocess.check_call(cmd_list, env=env_vars)
+            except subprocess.CalledProcessError as shelloutexc:
+                sys.exit(shelloutexc.returncode)
+        else:
             subprocess.check_call(cmd_list, env=env_vars)
-        except subprocess.CalledProcessError as shelloutexc:
-            sys.exit(shelloutexc.returncode)
-    else:
-        subprocess.check_call(cmd_list, env=env_vars)
 
 
 def use_npm_ci(path: Path) -> bool:
@@ -30,6 +30,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -50,6 +51,10 @@ AWS_ENV_VARS = ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN
 DOC_SITE = "https://docs.onica.com/projects/runway"
 EMBEDDED_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "embedded")
 
+# signature of the file of each module when it was last loaded by
+# load_object_from_string
+_MODULE_FILE_SIGNATURES: Dict[str, Optional[Tuple[int, int]]] = {}
+
 
 class BaseModel(_BaseModel):
     """Base class for Runway models."""
@@ -550,8 +555,18 @@ def json_serial(obj: Any) -> Any:
     raise TypeError("Type %s not serializable" % type(obj))
 
 
+def _get_module_file_signature(module_path: str) -> Optional[Tuple[int, int]]:
+    """Get the modification time and size of the file of an imported module."""
+    file_path = getattr(sys.modules.get(module_path), "__file__", None)
+    try:
+        stats = os.stat(file_path) if file_path else None
+    except OSError:
+        return None
+    return (stats.st_mtime_ns, stats.st_size) if stats else None
+
+
 def load_object_from_string(
-    fqcn: str, try_reload: bool = False
+    fqcn: str, try_reload: bool = False, *, if_modified: bool = False
 ) -> Union[type, Callable[..., Any]]:
     """Convert "." delimited strings to a python object.
 
@@ -561,6 +576,8 @@ def load_object_from_string(
         try_reload: Try to reload the module so any global variables
             set within the file during import are reloaded. This only applies
             to modules that are already imported and are not builtin.
+        if_modified: Only reload the module if its file changed since it was
+            last loaded by this function.
 
     Returns:
         Object being imported from the provided path.
@@ -582,9 +599,16 @@ def load_object_from_string(
             and module_path.split(".")[0]
             not in sys.builtin_module_names  # skip builtins
         ):
-            importlib.reload(sys.modules[module_path])
+            if not (
+                if_modified
+                and module_path in _MODULE_FILE_SIGNATURES
+                and _MODULE_FILE_SIGNATURES[module_path]
+                == _get_module_file_signature(module_path)
+            ):
+                importlib.reload(sys.modules[module_path])
         else:
             importlib.import_module(module_path)
+        _MODULE_FILE_SIGNATURES[module_path] = _get_module_file_signature(module_path)
     return getattr(sys.modules[module_path], object_name)
 
 
@@ -1,8 +1,10 @@
 """Runway variables."""
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,6 +17,7 @@ from typing import (
     MutableSequence,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -24,6 +27,7 @@ from typing import (
 
 from typing_extensions import Literal
 
+from . import _tracing
 from .cfngin.lookups.registry import CFNGIN_LOOKUP_HANDLERS
 from .exceptions import (
     FailedLookup,
@@ -46,6 +50,9 @@ LOGGER = logging.getLogger(__name__)
 _LiteralValue = TypeVar("_LiteralValue", int, str)
 VariableTypeLiteralTypeDef = Literal["cfngin", "runway"]
 
+#: Max number of distinct strings containing lookups kept by the parse cache.
+PARSE_CACHE_SIZE = 8192
+
 
 class Variable:
     """Represents a variable provided to a Runway directive."""
@@ -69,6 +76,8 @@ class Variable:
         self.name = name
         self._raw_value = value
         self._value = VariableValue.parse_obj(value, variable_type)
+        # lookups not nested in another lookup are all that needs resolving
+        self._root_lookups = _find_root_lookups(self._value)
         self.variable_type = variable_type
 
     @property
@@ -81,6 +90,11 @@ class Variable:
         """
         return self._value.dependencies
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in the variable, including nested lookups."""
+        return self._value.lookups
+
     @property
     def resolved(self) -> bool:
         """Boolean for whether the Variable has been resolved.
@@ -121,12 +135,13 @@ class Variable:
             FailedVariableLookup
 
         """
-        try:
-            self._value.resolve(
-                context, provider=provider, variables=variables, **kwargs
-            )
-        except FailedLookup as err:
-            raise FailedVariableLookup(self, err) from err.cause
+        _resolve_lookups(
+            [(self, lookup) for lookup in self._root_lookups],
+            context,
+            provider=provider,
+            variables=variables,
+            **kwargs,
+        )
 
     def get(self, key: str, default: Any = None) -> Any:
         """Implement evaluation of self.get.
@@ -150,14 +165,27 @@ def resolve_variables(
 ) -> None:
     """Given a list of variables, resolve all of them.
 
+    Lookups that only retrieve data (e.g. ``ssm``) are resolved concurrently.
+    Other lookups (e.g. ``output``) are resolved in order.
+
     Args:
         variables: List of variables.
         context: CFNgin context.
         provider: Subclass of the base provider.
 
+    Raises:
+        FailedVariableLookup
+
     """
-    for variable in variables:
-        variable.resolve(context=context, provider=provider)
+    _resolve_lookups(
+        [
+            (variable, lookup)
+            for variable in variables
+            for lookup in variable._root_lookups  # pylint: disable=protected-access
+        ],
+        context,
+        provider=provider,
+    )
 
 
 _VariableValue = TypeVar("_VariableValue", bound="VariableValue")
@@ -166,6 +194,8 @@ _VariableValue = TypeVar("_VariableValue", bound="VariableValue")
 class VariableValue:
     """Syntax tree base class to parse variable values."""
 
+    __slots__ = ("_data", "variable_type")
+
     _resolved: bool = False
     _data: Any
     variable_type: VariableTypeLiteralTypeDef
@@ -175,6 +205,11 @@ class VariableValue:
         """Stack names that this variable depends on."""
         return set()
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in the value, including nested lookups."""
+        return []
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved.
@@ -281,6 +316,23 @@ class VariableValue:
         if not isinstance(obj, str):
             return VariableValueLiteral(obj, variable_type=variable_type)  # type: ignore
 
+        if "${" not in obj:
+            return VariableValueLiteral(obj, variable_type=variable_type)  # type: ignore
+        return _build_node(_parse_str_cached(obj, variable_type))
+
+    @staticmethod
+    def _parse_str(
+        obj: str, variable_type: VariableTypeLiteralTypeDef
+    ) -> VariableValue:
+        """Parse a string that can contain lookups.
+
+        Use :meth:`parse_obj` which caches the result of parsing each string.
+
+        Args:
+            obj: The string to parse.
+            variable_type: Type of variable (cfngin|runway).
+
+        """
         tokens: VariableValueConcatenation[
             Union[VariableValueLiteral[str], VariableValueLookup]
         ] = VariableValueConcatenation(
@@ -344,6 +396,8 @@ class VariableValue:
 class VariableValueDict(VariableValue, MutableMapping[str, VariableValue]):
     """A dict variable value."""
 
+    __slots__ = ()
+
     def __init__(
         self, data: Dict[str, Any], variable_type: VariableTypeLiteralTypeDef = "cfngin"
     ) -> None:
@@ -367,6 +421,14 @@ class VariableValueDict(VariableValue, MutableMapping[str, VariableValue]):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in the value, including nested lookups."""
+        lookups: List[VariableValueLookup] = []
+        for item in self.values():  # pylint: disable=no-member
+            lookups.extend(item.lookups)
+        return lookups
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -437,6 +499,8 @@ class VariableValueDict(VariableValue, MutableMapping[str, VariableValue]):
 class VariableValueList(VariableValue, MutableSequence[VariableValue]):
     """List variable value."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         iterable: Iterable[Any],
@@ -462,6 +526,14 @@ class VariableValueList(VariableValue, MutableSequence[VariableValue]):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in the value, including nested lookups."""
+        lookups: List[VariableValueLookup] = []
+        for item in self:
+            lookups.extend(item.lookups)
+        return lookups
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -557,6 +629,8 @@ class VariableValueList(VariableValue, MutableSequence[VariableValue]):
 class VariableValueLiteral(Generic[_LiteralValue], VariableValue):
     """The literal value of a variable as provided."""
 
+    __slots__ = ()
+
     def __init__(
         self, value: _LiteralValue, variable_type: VariableTypeLiteralTypeDef = "cfngin"
     ) -> None:
@@ -597,6 +671,8 @@ class VariableValueLiteral(Generic[_LiteralValue], VariableValue):
 class VariableValueConcatenation(Generic[_VariableValue], VariableValue):
     """A concatinated variable values."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         iterable: Iterable[_VariableValue],
@@ -620,6 +696,14 @@ class VariableValueConcatenation(Generic[_VariableValue], VariableValue):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """Lookups contained in the value, including nested lookups."""
+        lookups: List[VariableValueLookup] = []
+        for item in self:
+            lookups.extend(item.lookups)
+        return lookups
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -748,6 +832,8 @@ class VariableValueConcatenation(Generic[_VariableValue], VariableValue):
 class VariableValueLookup(VariableValue):
     """A lookup variable value."""
 
+    __slots__ = ("_resolved", "handler", "lookup_name", "lookup_query")
+
     handler: Type[LookupHandler]
     lookup_name: VariableValueLiteral[str]
     lookup_query: VariableValue
@@ -806,6 +892,11 @@ class VariableValueLookup(VariableValue):
             return self.handler.dependencies(self.lookup_query)
         return set()
 
+    @property
+    def lookups(self) -> List[VariableValueLookup]:
+        """This lookup, preceded by any lookups nested in its query."""
+        return [*self.lookup_query.lookups, self]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -855,13 +946,15 @@ class VariableValueLookup(VariableValue):
             context=context, provider=provider, variables=variables, **kwargs
         )
         try:
-            result = self.handler.handle(
-                self.lookup_query.value,
-                context=context,
-                provider=provider,
-                variables=variables,
-                **kwargs,
-            )
+            # the query is not recorded since it can contain secrets
+            with _tracing.span(str(self.lookup_name.value), "lookup"):
+                result = self.handler.handle(
+                    self.lookup_query.value,
+                    context=context,
+                    provider=provider,
+                    variables=variables,
+                    **kwargs,
+                )
             return self._resolve(result)
         except Exception as err:
             raise FailedLookup(self, err) from err
@@ -881,3 +974,141 @@ class VariableValueLookup(VariableValue):
     def __str__(self) -> str:
         """Object displayed as a string."""
         return f"${{{self.lookup_name.value} {self.lookup_query.value}}}"
+
+
+# immutable form of a parsed string: literals (which are never modified) or
+# tuples describing a concatenation or a lookup
+_Node = Union[
+    VariableValueLiteral[Any],
+    Tuple[Literal["concat"], Tuple[Any, ...], VariableTypeLiteralTypeDef],
+    Tuple[Literal["lookup"], Any, Any, VariableTypeLiteralTypeDef],
+]
+
+
+def _build_node(node: _Node) -> VariableValue:
+    """Create the value of a variable from a node of a parsed string."""
+    if not isinstance(node, tuple):
+        return node
+    if node[0] == "concat":
+        return VariableValueConcatenation(
+            [_build_node(item) for item in node[1]], variable_type=node[2]
+        )
+    return VariableValueLookup(
+        lookup_name=cast("VariableValueLiteral[str]", _build_node(node[1])),
+        lookup_query=_build_node(node[2]),
+        variable_type=node[3],
+    )
+
+
+def _find_root_lookups(value: Any) -> List[VariableValueLookup]:
+    """Find the lookups of a value that are not nested in another lookup."""
+    if isinstance(value, VariableValueLookup):
+        return [value]
+    if isinstance(value, VariableValueDict):
+        value = value.values()
+    elif not isinstance(value, (VariableValueConcatenation, VariableValueList)):
+        return []
+    return [lookup for item in value for lookup in _find_root_lookups(item)]
+
+
+def _is_concurrent(lookup: VariableValueLookup) -> bool:
+    """Whether a lookup and the lookups nested in it can be resolved in a thread."""
+    return all(
+        getattr(nested.handler, "concurrent", False) for nested in lookup.lookups
+    )
+
+
+def _resolve_lookups(
+    lookups: List[Tuple[Variable, VariableValueLookup]],
+    context: Union[CfnginContext, RunwayContext],
+    **kwargs: Any,
+) -> None:
+    """Resolve the root lookups of variables.
+
+    Lookups that can be resolved concurrently are submitted to a thread pool
+    before the others are resolved in order. Identical lookups are only
+    resolved once.
+
+    Args:
+        lookups: Variables and their root lookups, in order.
+        context: The current context object.
+        **kwargs: Passed to :meth:`VariableValueLookup.resolve`.
+
+    Raises:
+        FailedVariableLookup: A lookup of a variable failed. When more than one
+            lookup failed, it is raised for the first variable.
+
+    """
+    futures: List[Optional[Future[None]]] = [None] * len(lookups)
+    # lookup resolved by each future; others with the same key copy its value
+    owners: Dict[Future[None], VariableValueLookup] = {}
+    executor: Optional[ThreadPoolExecutor] = None
+    concurrent = [
+        index for index, (_, lookup) in enumerate(lookups) if _is_concurrent(lookup)
+    ]
+    if len(concurrent) > 1 and context.env.max_concurrent_lookups > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(concurrent), context.env.max_concurrent_lookups),
+            thread_name_prefix="lookup",
+        )
+        submitted: Dict[Tuple[Any, ...], Future[None]] = {}
+        for index in concurrent:
+            lookup = lookups[index][1]
+            key: Tuple[Any, ...] = (
+                (lookup.handler, str(lookup))
+                if not lookup.lookup_query.lookups
+                else (id(lookup),)
+            )
+            if key not in submitted:
+                submitted[key] = executor.submit(lookup.resolve, context, **kwargs)
+                owners[submitted[key]] = lookup
+            futures[index] = submitted[key]
+    try:
+        for (variable, lookup), future in zip(lookups, futures):
+            try:
+                if future is None:
+                    lookup.resolve(context, **kwargs)
+                    continue
+                future.result()
+                if owners[future] is not lookup:
+                    lookup._resolve(  # pylint: disable=protected-access
+                        owners[future].value
+                    )
+            except FailedLookup as err:
+                raise FailedVariableLookup(variable, err) from err.cause
+    finally:
+        if executor:
+            for future in owners:
+                future.cancel()
+            executor.shutdown()
+
+
+def _freeze_node(value: VariableValue) -> _Node:
+    """Convert the value of a variable parsed from a string to a node."""
+    if isinstance(value, VariableValueLookup):
+        return (
+            "lookup",
+            _freeze_node(value.lookup_name),
+            _freeze_node(value.lookup_query),
+            value.variable_type,
+        )
+    if isinstance(value, VariableValueConcatenation):
+        return (
+            "concat",
+            tuple(_freeze_node(item) for item in value),  # type: ignore
+            value.variable_type,
+        )
+    return cast("VariableValueLiteral[Any]", value)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_str_cached(obj: str, variable_type: VariableTypeLiteralTypeDef) -> _Node:
+    """Parse a string that contains lookups into an immutable node.
+
+    Strings are often repeated throughout a config (e.g. the same lookup used
+    by many stacks) so each is only parsed once.
+
+    """
+    return _freeze_node(
+        VariableValue._parse_str(obj, variable_type)  # pylint: disable=protected-access
+    )
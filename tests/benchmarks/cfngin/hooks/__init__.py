@@ -0,0 +1 @@
+"""Benchmark tests for runway.cfngin.hooks."""
@@ -0,0 +1,49 @@
+"""Benchmarks for runway.cfngin.hooks.staticsite.utils."""
+# pyright: basic
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Union
+
+import pytest
+
+from runway.cfngin.hooks.staticsite.utils import get_hash_of_files
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ....conftest import BenchmarkFixture
+
+
+@pytest.fixture(scope="module")
+def source_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the source of a static site with 2,000 files and ignored files."""
+    root = tmp_path_factory.mktemp("source_tree")
+    (root / ".gitignore").write_text("node_modules/\n*.log\n")
+    for i in range(2000):
+        path = root / "src" / f"dir{i // 100:02}" / f"file{i:04}.js"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"export const value = {i};\n" * 32)
+    for i in range(500):
+        path = root / "node_modules" / f"package{i // 50}" / f"index{i}.js"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(str(i))
+        (root / "src" / f"debug{i}.log").write_text(str(i))
+    return root
+
+
+@pytest.mark.parametrize(
+    "directories",
+    [
+        [{"path": "./"}],
+        [{"path": "./", "exclusions": ["src/dir0*"]}],
+    ],
+    ids=["gitignore", "exclusions"],
+)
+def test_get_hash_of_files(
+    benchmark: BenchmarkFixture,
+    directories: List[Dict[str, Union[List[str], str]]],
+    source_tree: Path,
+) -> None:
+    """Benchmark hashing the source of a static site."""
+    result = benchmark(get_hash_of_files, source_tree, directories)
+    assert result == get_hash_of_files(source_tree, directories)
@@ -0,0 +1,82 @@
+"""Benchmarks for runway.cfngin.hooks.aws_lambda."""
+# pyright: basic
+from __future__ import annotations
+
+import os
+import stat
+import tracemalloc
+from io import BytesIO
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from runway.cfngin.hooks.aws_lambda import ZIP_PERMS_MASK, _calculate_hash, _zip_files
+
+if TYPE_CHECKING:
+    from ...conftest import BenchmarkFixture
+
+
+def zip_files_in_memory(files: List[str], root: str) -> Tuple[bytes, str]:
+    """Previous implementation of _zip_files, kept for comparison.
+
+    The archive is built in memory then every file is read again to hash it.
+
+    """
+    zip_data = BytesIO()
+    with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
+        for file_name in files:
+            zip_file.write(os.path.join(root, file_name), file_name)
+        for zip_entry in zip_file.filelist:
+            perms = (zip_entry.external_attr & ZIP_PERMS_MASK) >> 16
+            new_perms = 0o755 if perms & stat.S_IXUSR != 0 else 0o644
+            zip_entry.external_attr = (zip_entry.external_attr & ~ZIP_PERMS_MASK) | (
+                new_perms << 16
+            )
+    return zip_data.getvalue(), _calculate_hash(files, root)
+
+
+def zip_files_streaming(files: List[str], root: str) -> Tuple[bytes, str]:
+    """Call _zip_files, closing the file it returns."""
+    zip_data, content_hash = _zip_files(files, root)
+    zip_data.close()
+    return b"", content_hash
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[List[str], str], Tuple[bytes, str]]] = {
+    "in_memory": zip_files_in_memory,
+    "streaming": zip_files_streaming,
+}
+
+
+@pytest.fixture(scope="module")
+def payload(tmp_path_factory: pytest.TempPathFactory) -> Tuple[List[str], str]:
+    """Create a payload of partially compressible files totaling ~64 MiB."""
+    root = tmp_path_factory.mktemp("payload")
+    files: List[str] = []
+    for i in range(64):
+        path = root / f"pkg{i % 8}" / f"module{i}.so"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes((os.urandom(256 * 1024) + bytes(256 * 1024)) * 2)
+        files.append(str(path.relative_to(root)))
+    return files, str(root)
+
+
+@pytest.mark.parametrize("implementation", list(IMPLEMENTATIONS))
+def test_zip_files(
+    benchmark: BenchmarkFixture,
+    implementation: str,
+    payload: Tuple[List[str], str],
+) -> None:
+    """Benchmark time and peak memory used to zip and hash a payload."""
+    files, root = payload
+    tracemalloc.start()
+    try:
+        _, content_hash = benchmark.pedantic(
+            IMPLEMENTATIONS[implementation], args=(files, root), rounds=3
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_mib"] = round(peak / 1024 / 1024, 1)
+    assert content_hash == _calculate_hash(files, root)
@@ -0,0 +1,167 @@
+"""Benchmarks for runway.cfngin.dag."""
+# pyright: basic
+from __future__ import annotations
+
+import collections
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, List, Set
+
+import pytest
+
+from runway.cfngin.dag import DAG, ThreadedWalker, ThreadPoolWalker, UnlimitedSemaphore
+
+if TYPE_CHECKING:
+    from ..conftest import BenchmarkFixture
+
+WALKERS = {
+    "threaded": lambda: ThreadedWalker(UnlimitedSemaphore()).walk,
+    "thread_pool": lambda: ThreadPoolWalker().walk,
+}
+
+
+def generate_dag(size: int, max_deps: int = 3, seed: int = 0) -> DAG:
+    """Generate a DAG where each node depends on up to ``max_deps`` earlier nodes.
+
+    The graph is assigned directly rather than with ``DAG.add_edge`` to avoid
+    validating the graph for each edge.
+
+    """
+    rng = random.Random(seed)
+    dag = DAG()
+    for i in range(size):
+        dag.graph[f"node{i}"] = (
+            {f"node{dep}" for dep in rng.sample(range(i), min(i, max_deps))}
+            if i
+            else set()
+        )
+    return dag
+
+
+@pytest.mark.parametrize("walker_name", list(WALKERS))
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_walk(benchmark: BenchmarkFixture, size: int, walker_name: str) -> None:
+    """Benchmark walking a graph, simulating steps that wait on I/O."""
+    dag = generate_dag(size)
+    walker: Callable[[DAG, Callable[[str], Any]], Any] = WALKERS[walker_name]()
+    lock = threading.Lock()
+    max_threads: List[int] = [threading.active_count()]
+    visited: Set[str] = set()
+
+    def walk_func(node: str) -> bool:
+        time.sleep(0.001)
+        with lock:
+            visited.add(node)
+            max_threads[0] = max(max_threads[0], threading.active_count())
+        return True
+
+    benchmark.pedantic(walker, args=(dag, walk_func), rounds=3)
+    benchmark.extra_info["max_threads"] = max_threads[0]
+    assert len(visited) == size
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_walk_order(size: int) -> None:
+    """Verify that ThreadPoolWalker satisfies dependencies on generated graphs."""
+    dag = generate_dag(size)
+    finished: Set[str] = set()
+    violations: List[str] = []
+    lock = threading.Lock()
+
+    def walk_func(node: str) -> bool:
+        with lock:
+            if not dag.graph[node].issubset(finished):
+                violations.append(node)
+        time.sleep(0.0001)
+        with lock:
+            finished.add(node)
+        return True
+
+    ThreadPoolWalker().walk(dag, walk_func)
+    assert not violations
+    assert finished == set(dag.graph)
+
+
+def uncached(dag: DAG, method: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap a method of a DAG so each call starts with a cold cache."""
+
+    def _wrapper() -> Any:
+        dag.invalidate()
+        return method()
+
+    return _wrapper
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_topological_sort(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark calculating the topological order of a graph."""
+    dag = generate_dag(size)
+    result = benchmark(uncached(dag, dag.topological_sort))
+    assert len(result) == size
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_all_downstreams(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark finding the downstream nodes of every node in a graph."""
+    dag = generate_dag(size)
+
+    def all_downstreams() -> int:
+        return sum(len(dag.all_downstreams(node)) for node in dag.graph)
+
+    benchmark.extra_info["edges"] = benchmark(uncached(dag, all_downstreams))
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_transitive_reduction(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark the transitive reduction of a graph."""
+    graph = generate_dag(size, max_deps=10).graph
+
+    def transitive_reduction() -> DAG:
+        dag = DAG()
+        dag.graph = collections.OrderedDict(
+            (node, set(edges)) for node, edges in graph.items()
+        )
+        dag.transitive_reduction()
+        return dag
+
+    dag = benchmark(transitive_reduction)
+    benchmark.extra_info["edges"] = sum(len(edges) for edges in graph.values())
+    benchmark.extra_info["reduced_edges"] = sum(
+        len(edges) for edges in dag.graph.values()
+    )
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_from_dict(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark building and validating a graph from a dict."""
+    graph_dict = {node: list(edges) for node, edges in generate_dag(size).graph.items()}
+    dag = DAG()
+    benchmark(dag.from_dict, graph_dict)
+    assert len(dag) == size
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_add_edge(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark building a graph one validated edge at a time."""
+    graph = generate_dag(size).graph
+
+    def add_edges() -> DAG:
+        dag = DAG()
+        for node in graph:
+            dag.add_node(node)
+        for node, edges in graph.items():
+            for edge in edges:
+                dag.add_edge(node, edge)
+        return dag
+
+    assert len(benchmark.pedantic(add_edges, rounds=3)) == size
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000, 5000])
+def test_filter(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark filtering a graph to a tenth of its nodes."""
+    dag = generate_dag(size)
+    nodes = list(dag.graph)[:: max(size // 10, 1)]
+    filtered = benchmark(uncached(dag, lambda: dag.filter(nodes)))
+    benchmark.extra_info["nodes"] = len(filtered)
@@ -0,0 +1,86 @@
+"""Benchmarks for runway.config."""
+# pyright: basic
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import pytest
+import yaml
+
+from runway.config import CfnginConfig, RunwayConfig
+
+if TYPE_CHECKING:
+    from ..conftest import BenchmarkFixture
+
+
+def generate_cfngin_config(size: int) -> str:
+    """Generate a raw CFNgin config with ``size`` stacks."""
+    return yaml.safe_dump(
+        {
+            "namespace": "${namespace}",
+            "cfngin_bucket": "",
+            "sys_path": "./",
+            "stacks": [
+                {
+                    "name": f"stack{i}",
+                    "class_path": "blueprints.Example",
+                    "requires": [f"stack{i - 1}"] if i else [],
+                    "tags": {"Environment": "${environment}"},
+                    "variables": {
+                        "BucketName": f"${{namespace}}-bucket{i}",
+                        "Subnets": [f"subnet-{i}{j}" for j in range(3)],
+                        "VpcId": "${output stack0::VpcId}",
+                    },
+                }
+                for i in range(size)
+            ],
+        }
+    )
+
+
+def generate_runway_config(size: int) -> Dict[str, Any]:
+    """Generate a Runway config with ``size`` deployments of two modules each."""
+    return {
+        "deployments": [
+            {
+                "name": f"deployment{i}",
+                "modules": [
+                    {"path": f"module{i}.cfn", "parameters": {"key": f"value{i}"}},
+                    {
+                        "name": f"parallel{i}",
+                        "parallel": [
+                            {"path": f"parallel{i}a.cfn"},
+                            {"path": f"parallel{i}b.cfn"},
+                        ],
+                    },
+                ],
+                "parameters": {
+                    "namespace": "${var namespace.${env DEPLOY_ENVIRONMENT}}"
+                },
+                "regions": ["us-east-1", "us-west-2"],
+            }
+            for i in range(size)
+        ],
+        "variables": {"namespace": {"test": "test-namespace"}},
+    }
+
+
+@pytest.mark.parametrize("size", [10, 100, 500])
+def test_cfngin_config_parse_raw(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark parsing a raw CFNgin config."""
+    data = generate_cfngin_config(size)
+    config = benchmark(
+        CfnginConfig.parse_raw,
+        data,
+        parameters={"environment": "test", "namespace": "test"},
+        skip_package_sources=True,
+    )
+    assert len(config.stacks) == size
+
+
+@pytest.mark.parametrize("size", [10, 100, 500])
+def test_runway_config_parse_obj(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark parsing a Runway config."""
+    data = generate_runway_config(size)
+    config = benchmark(RunwayConfig.parse_obj, data)
+    assert len(config.deployments) == size
@@ -0,0 +1,246 @@
+"""Pytest configuration, fixtures, and plugins.
+
+Benchmarks are only collected when pytest is invoked with ``--benchmark``.
+The ``benchmark`` fixture loosely follows the interface of ``pytest-benchmark``
+so the suite does not require any additional dependencies.
+
+When pytest is invoked with ``--benchmark-json PATH``, the results are also
+written to a JSON file so they can be compared between commits and releases.
+
+"""
+# pylint: disable=redefined-outer-name
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import pytest
+
+from runway import __version__
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+    from _pytest.fixtures import SubRequest
+    from _pytest.main import Session
+    from _pytest.terminal import TerminalReporter
+
+_T = TypeVar("_T")
+
+RESULTS: List[BenchmarkFixture] = []
+
+
+class BenchmarkFixture:
+    """Time the execution of a callable and record the results.
+
+    Attributes:
+        extra_info: Additional data to include with the results
+            (e.g. number of threads used).
+        fullname: Node ID of the test that ran the benchmark.
+        name: Name of the benchmark.
+        params: Parameters of the test that ran the benchmark.
+        timings: Duration, in seconds, of each round.
+
+    """
+
+    extra_info: Dict[str, Any]
+    fullname: str
+    name: str
+    params: Dict[str, Any]
+    timings: List[float]
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        fullname: str = "",
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            name: Name of the benchmark.
+            fullname: Node ID of the test that ran the benchmark.
+            params: Parameters of the test that ran the benchmark.
+
+        """
+        self.extra_info = {}
+        self.fullname = fullname or name
+        self.name = name
+        self.params = dict(params or {})
+        self.timings = []
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Statistics calculated from the recorded timings."""
+        if not self.timings:
+            return {}
+        return {
+            "max": max(self.timings),
+            "mean": statistics.mean(self.timings),
+            "median": statistics.median(self.timings),
+            "min": min(self.timings),
+            "rounds": len(self.timings),
+            "stddev": statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dump the results to a dict that can be serialized as JSON."""
+        return {
+            "extra_info": self.extra_info,
+            "fullname": self.fullname,
+            "name": self.name,
+            "params": {key: str(value) for key, value in self.params.items()},
+            "stats": self.stats,
+            "timings": self.timings,
+        }
+
+    def pedantic(
+        self,
+        target: Callable[..., _T],
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+        rounds: int = 1,
+    ) -> _T:
+        """Run a callable a specific number of rounds, recording each.
+
+        Args:
+            target: Callable to benchmark.
+            args: Positional arguments passed to the callable.
+            kwargs: Keyword arguments passed to the callable.
+            rounds: Number of times to call the callable.
+
+        Returns:
+            The return value of the last call.
+
+        """
+        if self not in RESULTS:
+            RESULTS.append(self)
+        result: Any = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = target(*args, **(kwargs or {}))
+            self.timings.append(time.perf_counter() - start)
+        return result
+
+    def __call__(self, target: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a callable five times, recording each."""
+        return self.pedantic(target, args=args, kwargs=kwargs, rounds=5)
+
+
+def get_commit_info() -> Dict[str, Any]:
+    """Get the commit of the repo the benchmarks were run against."""
+    root = Path(__file__).parent
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=root, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+        dirty = bool(
+            subprocess.check_output(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=root,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ).strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"dirty": None, "id": None}
+    return {"dirty": dirty, "id": commit}
+
+
+def get_machine_info() -> Dict[str, Any]:
+    """Get information about the machine the benchmarks were run on."""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "release": platform.release(),
+        "system": platform.system(),
+    }
+
+
+def write_results(path: Path) -> None:
+    """Write the recorded results to a JSON file.
+
+    Args:
+        path: Path of the file to write.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "benchmarks": [result.to_dict() for result in RESULTS if result.stats],
+                "commit_info": get_commit_info(),
+                "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "machine_info": get_machine_info(),
+                "runway_version": __version__,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n"
+    )
+
+
+# pylint: disable=unused-argument
+def pytest_ignore_collect(path: Any, config: Config) -> bool:
+    """Determine if this directory should have its tests collected."""
+    return not config.option.benchmark
+
+
+def pytest_sessionfinish(session: Session, exitstatus: int) -> None:
+    """Write the results to a JSON file if requested."""
+    if RESULTS and session.config.option.benchmark_json:
+        write_results(Path(session.config.option.benchmark_json))
+
+
+def pytest_terminal_summary(
+    terminalreporter: TerminalReporter, exitstatus: int, config: Config
+) -> None:
+    """Output a table of benchmark results."""
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    name_width = max(len(result.name) for result in RESULTS)
+    terminalreporter.write_line(
+        f"{'name':<{name_width}} {'min (s)':>10} {'mean (s)':>10} "
+        f"{'max (s)':>10} {'rounds':>6}  extra_info"
+    )
+    for result in RESULTS:
+        stats = result.stats
+        if not stats:
+            continue
+        terminalreporter.write_line(
+            f"{result.name:<{name_width}} {stats['min']:>10.4f} "
+            f"{stats['mean']:>10.4f} {stats['max']:>10.4f} "
+            f"{stats['rounds']:>6}  "
+            + ", ".join(f"{k}={v}" for k, v in sorted(result.extra_info.items()))
+        )
+
+
+@pytest.fixture
+def benchmark(request: SubRequest) -> BenchmarkFixture:
+    """Benchmark a callable."""
+    callspec = getattr(request.node, "callspec", None)
+    return BenchmarkFixture(
+        request.node.name,
+        fullname=request.node.nodeid,
+        params=callspec.params if callspec else None,
+    )
@@ -0,0 +1,96 @@
+"""Benchmarks for runway.core.providers.aws.s3._helpers."""
+# pyright: basic
+from __future__ import annotations
+
+import datetime
+import os
+from typing import TYPE_CHECKING, List
+
+import pytest
+from mock import Mock
+
+from runway.core.providers.aws.s3._helpers.comparator import Comparator
+from runway.core.providers.aws.s3._helpers.file_generator import (
+    FileGenerator,
+    FileStats,
+)
+from runway.core.providers.aws.s3._helpers.filters import Filter, FilterPattern
+from runway.core.providers.aws.s3._helpers.format_path import FormatPath
+from runway.core.providers.aws.s3._helpers.sync_strategy import (
+    MissingFileSync,
+    NeverSync,
+    SizeAndLastModifiedSync,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .....conftest import BenchmarkFixture
+
+NOW = datetime.datetime.now(datetime.timezone.utc)
+
+
+def generate_file_stats(
+    size: int, src_type: str, dest_type: str, step: int = 1
+) -> List[FileStats]:
+    """Generate sorted FileStats for every ``step`` file of ``size`` files."""
+    return [
+        FileStats(
+            src=f"src/dir{i // 100:04}/file{i:06}.txt",
+            compare_key=f"dir{i // 100:04}/file{i:06}.txt",
+            dest=f"dest/dir{i // 100:04}/file{i:06}.txt",
+            dest_type=dest_type,  # type: ignore
+            last_update=NOW,
+            operation_name="upload",
+            size=i % 7,
+            src_type=src_type,  # type: ignore
+        )
+        for i in range(0, size, step)
+    ]
+
+
+@pytest.fixture(scope="module")
+def local_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a directory tree of 2,000 small files."""
+    root = tmp_path_factory.mktemp("local_tree")
+    for i in range(2000):
+        path = root / f"dir{i // 100:02}" / f"sub{i % 5}" / f"file{i:04}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(str(i))
+    return root
+
+
+@pytest.mark.parametrize("size", [1000, 10000, 100000])
+def test_comparator(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark comparing source and destination files where half differ."""
+    src_files = generate_file_stats(size, "local", "s3")
+    dest_files = generate_file_stats(size, "s3", "local", step=2)
+    comparator = Comparator(
+        SizeAndLastModifiedSync(),
+        MissingFileSync("file_not_at_dest"),
+        NeverSync("file_not_at_src"),
+    )
+    result = benchmark(lambda: list(comparator.call(iter(src_files), iter(dest_files))))
+    assert len(result) == size // 2
+
+
+def test_file_generator(benchmark: BenchmarkFixture, local_tree: Path) -> None:
+    """Benchmark listing a local directory tree."""
+    files = FormatPath.format(str(local_tree) + os.sep, "s3://bucket/prefix/")
+    generator = FileGenerator(Mock(), "upload")
+    result = benchmark(lambda: list(generator.call(files)))
+    assert len(result) == 2000
+
+
+@pytest.mark.parametrize("patterns", [2, 20])
+def test_filter(benchmark: BenchmarkFixture, patterns: int) -> None:
+    """Benchmark filtering files with exclude and include patterns."""
+    files = generate_file_stats(10000, "local", "s3")
+    filter_patterns = [
+        FilterPattern(type="exclude" if i % 2 else "include", pattern=f"dir{i:04}/*")
+        for i in range(patterns - 1)
+    ]
+    filter_patterns.insert(0, FilterPattern(type="exclude", pattern="*.txt"))
+    file_filter = Filter(filter_patterns, "src", "dest")
+    result = benchmark(lambda: list(file_filter.call(iter(files))))
+    benchmark.extra_info["included"] = len(result)
@@ -0,0 +1,173 @@
+"""Benchmarks for runway.variables."""
+# pyright: basic
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+import pytest
+
+from runway.context import RunwayContext
+from runway.core.components import DeployEnvironment
+from runway.lookups.handlers.base import LookupHandler
+from runway.lookups.registry import RUNWAY_LOOKUP_HANDLERS
+from runway.utils import MutableMap
+from runway.variables import Variable, resolve_variables
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
+    from .conftest import BenchmarkFixture
+
+ROUNDS = 5
+#: Seconds taken by each lookup of :class:`SlowLookup`.
+SLOW_LOOKUP_LATENCY = 0.02
+
+
+class SlowLookup(LookupHandler):
+    """Lookup that takes as long as a call to AWS and can run concurrently."""
+
+    concurrent = True
+
+    @classmethod
+    def handle(cls, value: str, *__args: Any, **__kwargs: Any) -> Any:
+        """Perform the lookup."""
+        time.sleep(SLOW_LOOKUP_LATENCY)
+        return value
+
+
+def generate_value(size: int) -> Dict[str, Any]:
+    """Generate a nested value containing ``size`` entries that use lookups.
+
+    Entries use a mix of literals, lookups, concatenations, and nested lookups.
+
+    """
+    value: Dict[str, Any] = {}
+    for i in range(size):
+        value[f"key{i}"] = [
+            f"literal{i}",
+            f"${{env ENV_VAR{i % 10}}}",
+            f"prefix-${{var values.key{i % 10}}}-suffix",
+            {"nested": f"${{env ${{var names.key{i % 10}}}}}"},
+        ]
+    return value
+
+
+def generate_variables(size: int) -> Dict[str, Any]:
+    """Generate the raw values of ``size`` variables, like those of a large config.
+
+    Most values are literals or lookups that are repeated across variables.
+
+    """
+    return {
+        f"Variable{i}": [
+            "t3.micro",
+            f"literal value {i}",
+            "${var values.key1}",
+            "${var names.key2}-${env ENV_VAR3}-bucket",
+            ["subnet-a", "subnet-b", "${var values.key4}"],
+            {"Environment": "${env ENV_VAR5}", "Team": "platform"},
+        ][i % 6]
+        for i in range(size)
+    }
+
+
+@pytest.fixture(scope="module")
+def context() -> RunwayContext:
+    """Runway context with environment variables used by lookups."""
+    return RunwayContext(
+        deploy_environment=DeployEnvironment(
+            environ={f"ENV_VAR{i}": f"env{i}" for i in range(10)},
+            explicit_name="test",
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def variables() -> MutableMap:
+    """Variables used by lookups."""
+    return MutableMap(
+        names={f"key{i}": f"ENV_VAR{i}" for i in range(10)},
+        values={f"key{i}": f"value{i}" for i in range(10)},
+    )
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_parse(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark parsing a value that contains lookups."""
+    value = generate_value(size)
+    variable = benchmark(Variable, "Param", value, "runway")
+    benchmark.extra_info["lookups"] = len(variable.lookups)
+    assert not variable.resolved
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_resolve(
+    benchmark: BenchmarkFixture,
+    context: RunwayContext,
+    size: int,
+    variables: MutableMap,
+) -> None:
+    """Benchmark resolving the lookups of a parsed value."""
+    value = generate_value(size)
+    parsed: List[Variable] = [Variable("Param", value, "runway") for _ in range(ROUNDS)]
+    unresolved: Iterator[Variable] = iter(parsed)
+
+    def resolve() -> Variable:
+        variable = next(unresolved)
+        variable.resolve(context, variables=variables)
+        return variable
+
+    variable = benchmark.pedantic(resolve, rounds=ROUNDS)
+    assert variable.value["key1"] == [
+        "literal1",
+        "env1",
+        "prefix-value1-suffix",
+        {"nested": "env1"},
+    ]
+
+
+def test_parse_variables(benchmark: BenchmarkFixture) -> None:
+    """Benchmark parsing the variables of a config with 5,000 variables."""
+    raw = generate_variables(5000)
+    result = benchmark(
+        lambda: [Variable(name, value, "runway") for name, value in raw.items()]
+    )
+    assert len(result) == 5000
+
+
+def test_resolve_literal_variables(
+    benchmark: BenchmarkFixture, context: RunwayContext, variables: MutableMap
+) -> None:
+    """Benchmark resolving 5,000 variables that do not contain lookups."""
+    parsed = [
+        Variable(f"Variable{i}", {"key": [f"literal{i}", i]}, "runway")
+        for i in range(5000)
+    ]
+
+    def resolve() -> None:
+        for variable in parsed:
+            variable.resolve(context, variables=variables)
+
+    benchmark(resolve)
+    assert parsed[1].value == {"key": ["literal1", 1]}
+
+
+@pytest.mark.parametrize("max_concurrent_lookups", [1, 10])
+def test_resolve_variables_slow_lookups(
+    benchmark: BenchmarkFixture,
+    context: RunwayContext,
+    max_concurrent_lookups: int,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Benchmark resolving 30 variables that each use a lookup calling AWS."""
+    monkeypatch.setitem(RUNWAY_LOOKUP_HANDLERS, "slow", SlowLookup)
+    monkeypatch.setitem(
+        context.env.vars, "RUNWAY_MAX_CONCURRENT_LOOKUPS", str(max_concurrent_lookups)
+    )
+    parsed = [
+        Variable(f"Variable{i}", f"${{slow /parameter/{i}}}", "runway")
+        for i in range(30)
+    ]
+    benchmark.pedantic(resolve_variables, args=(parsed, context), rounds=ROUNDS)
+    assert parsed[1].value == "/parameter/1"
@@ -29,6 +29,18 @@ def pytest_configure(config: Config) -> None:
 
 def pytest_addoption(parser: Parser) -> None:
     """Add pytest CLI options."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run only benchmark tests",
+    )
+    parser.addoption(
+        "--benchmark-json",
+        default=None,
+        metavar="PATH",
+        help="write the results of benchmark tests to a JSON file",
+    )
     parser.addoption(
         "--functional",
         action="store_true",
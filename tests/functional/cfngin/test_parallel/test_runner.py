@@ -47,8 +47,7 @@ def test_deploy_exit_code(deploy_result: Result) -> None:
 def test_deploy_log_messages(deploy_result: Result) -> None:
     """Test deploy log messages."""
     assert (
-        "deployment_1:processing regions in parallel... (output will be interwoven)"
-        in deploy_result.stdout
+        "deployment_1:processing regions in parallel..." in deploy_result.stdout
     ), f"expected not in stdout:\n{deploy_result.stdout}"
 
 
@@ -0,0 +1,117 @@
+"""Test ``runway cache`` command."""
+# pylint: disable=unused-argument
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from runway._cli import cli
+from runway.cfngin.blueprints.render_cache import RenderCache
+from runway.cfngin.hooks.aws_lambda_cache import DependencyCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import LogCaptureFixture, MonkeyPatch
+
+MODULE = "runway.cfngin.hooks.aws_lambda_cache"
+RENDER_CACHE_MODULE = "runway.cfngin.blueprints.render_cache"
+
+
+def create_cache(tmp_path: Path, *keys: str) -> DependencyCache:
+    """Create a dependency cache with an entry for each key."""
+    cache = DependencyCache(tmp_path / "cache")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "foo.py").write_text("foo")
+    for key in keys:
+        cache.put(key, tmp_path / "src", ["foo.py"])
+    return cache
+
+
+def create_render_cache(tmp_path: Path, *keys: str) -> RenderCache:
+    """Create a render cache with an entry for each key."""
+    cache = RenderCache(tmp_path / "templates")
+    for key in keys:
+        cache.put(key, "version", "{}", blueprint=f"blueprint-{key}")
+    return cache
+
+
+def test_cache_list(cd_tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ``runway cache list``."""
+    monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", cd_tmp_path / "cache")
+    monkeypatch.setattr(
+        f"{RENDER_CACHE_MODULE}.RENDER_CACHE_DIR", cd_tmp_path / "templates"
+    )
+    create_cache(cd_tmp_path, "key0", "key1")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["cache", "list"])
+    assert result.exit_code == 0
+    assert "key0" in result.stdout
+    assert "key1" in result.stdout
+    assert "2 entries using" in result.stdout
+
+
+def test_cache_prune_all(
+    caplog: LogCaptureFixture, cd_tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test ``runway cache prune --all``."""
+    caplog.set_level(logging.INFO, logger="runway.cli.commands.cache")
+    monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", cd_tmp_path / "cache")
+    monkeypatch.setattr(
+        f"{RENDER_CACHE_MODULE}.RENDER_CACHE_DIR", cd_tmp_path / "templates"
+    )
+    cache = create_cache(cd_tmp_path, "key0", "key1")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["cache", "prune", "--all"])
+    assert result.exit_code == 0
+    assert not cache.entries
+    assert "removed 2 entries" in caplog.messages[-1]
+
+
+def test_cache_prune_max_size(cd_tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ``runway cache prune --max-size``."""
+    monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", cd_tmp_path / "cache")
+    monkeypatch.setattr(
+        f"{RENDER_CACHE_MODULE}.RENDER_CACHE_DIR", cd_tmp_path / "templates"
+    )
+    cache = create_cache(cd_tmp_path, "key0")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["cache", "prune", "--max-size", "1"])
+    assert result.exit_code == 0
+    assert [entry.key for entry in cache.entries] == ["key0"]
+
+
+def test_cache_list_rendered_templates(
+    cd_tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test ``runway cache list`` with rendered templates."""
+    monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", cd_tmp_path / "cache")
+    monkeypatch.setattr(
+        f"{RENDER_CACHE_MODULE}.RENDER_CACHE_DIR", cd_tmp_path / "templates"
+    )
+    cache = create_render_cache(cd_tmp_path, "key0")
+    cache.get("key0")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["cache", "list"])
+    assert result.exit_code == 0
+    assert "blueprint-key0" in result.stdout
+    assert "hit rate 50%" in result.stdout
+
+
+def test_cache_prune_cache(cd_tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ``runway cache prune --cache``."""
+    monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", cd_tmp_path / "cache")
+    monkeypatch.setattr(
+        f"{RENDER_CACHE_MODULE}.RENDER_CACHE_DIR", cd_tmp_path / "templates"
+    )
+    cache = create_cache(cd_tmp_path, "key0")
+    render_cache = create_render_cache(cd_tmp_path, "key0")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["cache", "prune", "--all", "--cache", "rendered-templates"]
+    )
+    assert result.exit_code == 0
+    assert not render_cache.entries
+    assert [entry.key for entry in cache.entries] == ["key0"]
@@ -19,7 +19,7 @@ CpConfigTypeDef = Callable[[str, Path], Path]
 # pylint: disable=unused-argument
 def pytest_ignore_collect(path: Any, config: Config) -> bool:
     """Determine if this directory should have its tests collected."""
-    if config.option.functional:
+    if config.option.benchmark or config.option.functional:
         return True
     return not (config.option.integration or config.option.integration_only)
 
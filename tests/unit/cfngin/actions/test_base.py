@@ -7,8 +7,9 @@ import botocore.exceptions
 from botocore.stub import ANY, Stubber
 from mock import MagicMock, PropertyMock, patch
 
-from runway.cfngin.actions.base import BaseAction
+from runway.cfngin.actions.base import BaseAction, build_walker
 from runway.cfngin.blueprints.base import Blueprint
+from runway.cfngin.dag import ThreadPoolWalker, walk
 from runway.cfngin.plan import Graph, Plan, Step
 from runway.cfngin.providers.aws.default import Provider
 from runway.cfngin.session_cache import get_session
@@ -34,6 +35,16 @@ class MockBlueprint(Blueprint):
         """Create template."""
 
 
+def test_build_walker() -> None:
+    """Test build_walker."""
+    assert build_walker(1) is walk
+    unlimited = build_walker(0)
+    assert isinstance(unlimited.__self__, ThreadPoolWalker)  # type: ignore
+    assert unlimited.__self__.max_workers is None  # type: ignore
+    limited = build_walker(3)
+    assert limited.__self__.max_workers == 3  # type: ignore
+
+
 class TestBaseAction(unittest.TestCase):
     """Tests for runway.cfngin.actions.base.BaseAction."""
 
@@ -322,6 +333,89 @@ class TestBaseAction(unittest.TestCase):
         self.assertEqual(BaseAction.DESCRIPTION, plan.description)
         self.assertFalse(plan.require_unlocked)
 
+    @patch(
+        "runway.cfngin.actions.base.BaseAction._stack_action", new_callable=PropertyMock
+    )
+    def test_prefetch_stacks(self, mock_stack_action: PropertyMock) -> None:
+        """Test _prefetch_stacks and _clear_prefetched_stacks."""
+        mock_stack_action.return_value = MagicMock()
+        context = mock_context(
+            namespace="test", extra_config_args=self.config_no_persist
+        )
+        provider = MagicMock()
+        action = BaseAction(
+            context=context, provider_builder=MockProviderBuilder(provider=provider)
+        )
+        plan = action._generate_plan()
+        action._prefetch_stacks(plan)
+        provider.prefetch_stacks.assert_called_once_with(["test-stack1", "test-stack2"])
+        action._clear_prefetched_stacks()
+        provider.clear_prefetched_stacks.assert_called_once_with()
+
+    def test_s3_stack_push(self) -> None:
+        """Test s3_stack_push using the index of existing templates."""
+        context = mock_context("mynamespace")
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(provider=self.provider),
+        )
+        existing = MockBlueprint(name="existing", context=context)
+        new = MockBlueprint(name="new", context=context)
+        new._rendered = "{}"
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [{"Key": "stack_templates/mynamespace-existing/x.json"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+            },
+            {"Bucket": ANY, "Prefix": "stack_templates/mynamespace"},
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [
+                    {
+                        "Key": "stack_templates/mynamespace-existing/"
+                        f"existing-{MOCK_VERSION}.json"
+                    }
+                ]
+            },
+            {
+                "Bucket": ANY,
+                "ContinuationToken": "token",
+                "Prefix": "stack_templates/mynamespace",
+            },
+        )
+        stubber.add_response("put_object", {})
+        with stubber:
+            action.s3_stack_push(existing)
+            action.s3_stack_push(new)
+            action.s3_stack_push(new)  # added to the index when pushed
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_list_denied(self) -> None:
+        """Test s3_stack_push when the bucket can't be listed."""
+        context = mock_context("mynamespace")
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(provider=self.provider),
+        )
+        blueprint = MockBlueprint(name="test", context=context)
+        blueprint._rendered = "{}"
+        stubber = Stubber(action.s3_conn)
+        stubber.add_client_error(
+            "list_objects_v2", "AccessDenied", http_status_code=403
+        )
+        stubber.add_client_error("head_object", "404", http_status_code=404)
+        stubber.add_response("put_object", {})
+        stubber.add_response("head_object", {})
+        with stubber:
+            action.s3_stack_push(blueprint)
+            action.s3_stack_push(blueprint)
+        stubber.assert_no_pending_responses()
+
     def test_stack_template_url(self) -> None:
         """Test stack template url."""
         context = mock_context("mynamespace")
@@ -262,6 +262,86 @@ class TestBuildAction(unittest.TestCase):
             plan.graph.to_dict(),
         )
 
+    def test_prefetch_lookups(self) -> None:
+        """Test _prefetch_lookups."""
+        context = self._get_context(
+            extra_config_args={
+                "stacks": [
+                    {
+                        "name": "vpc",
+                        "template_path": ".",
+                        "variables": {
+                            "a": "${rxref other::something}",
+                            "b": "${xref external::something}",
+                            "c": "${rxref vpc::something}",
+                            "d": "${xref ${envvar NAME}::something}",
+                            "e": "${ssm /param}",
+                            "f": "${rxref shared::something}",
+                        },
+                    },
+                    {"name": "other", "template_path": "."},
+                ]
+            }
+        )
+        provider = MagicMock()
+        deploy_action = deploy.Action(
+            context, provider_builder=MockProviderBuilder(provider=provider)  # type: ignore
+        )
+        plan = cast(Plan, deploy_action._Action__generate_plan())  # type: ignore
+        with patch.object(
+            deploy.SsmLookup, "prefetch"
+        ) as mock_ssm_prefetch, patch.object(
+            deploy.CfnLookup, "prefetch"
+        ) as mock_cfn_prefetch:
+            deploy_action._prefetch_lookups(plan)
+        lookups = mock_ssm_prefetch.call_args.args[0]
+        assert len(lookups) == 7
+        mock_ssm_prefetch.assert_called_once_with(lookups, context)
+        mock_cfn_prefetch.assert_called_once_with(lookups, context)
+        provider.output_cache.prefetch.assert_called_once_with(
+            provider.cloudformation, {"external", "namespace-shared"}
+        )
+
+    def test_push_templates(self) -> None:
+        """Test _push_templates."""
+        context = self._get_context(
+            extra_config_args={
+                "stacks": [
+                    {"name": "vpc", "template_path": "."},
+                    {"name": "app", "template_path": ".", "requires": ["vpc"]},
+                    {
+                        "name": "dns",
+                        "template_path": ".",
+                        "variables": {"a": "${xref external::something}"},
+                    },
+                    {"name": "disabled", "template_path": ".", "enabled": False},
+                    {"name": "locked", "template_path": ".", "locked": True},
+                    {
+                        "name": "other",
+                        "template_path": ".",
+                        "variables": {"a": "${ssm /param}"},
+                    },
+                ]
+            }
+        )
+        deploy_action = deploy.Action(
+            context,
+            provider_builder=MockProviderBuilder(provider=MagicMock()),  # type: ignore
+        )
+        plan = cast(Plan, deploy_action._Action__generate_plan())  # type: ignore
+        with patch("runway.cfngin.stack.Stack.resolve") as mock_resolve, patch.object(
+            deploy_action, "s3_stack_push", side_effect=[None, Exception]
+        ) as mock_push, patch(
+            "runway.cfngin.blueprints.raw.RawTemplateBlueprint.reset_template"
+        ) as mock_reset:
+            deploy_action._push_templates(plan, 1)
+        assert mock_resolve.call_count == 2
+        assert mock_reset.call_count == 2
+        assert sorted(call.args[0].name for call in mock_push.call_args_list) == [
+            "other",
+            "vpc",
+        ]
+
     def test_does_not_execute_plan_when_outline_specified(self) -> None:
         """Test does not execute plan when outline specified."""
         context = self._get_context()
@@ -278,6 +358,22 @@ class TestBuildAction(unittest.TestCase):
             deploy_action.run(outline=False)
             self.assertEqual(mock_generate_plan().execute.call_count, 1)
 
+    @patch("runway.cfngin.actions.deploy.handle_hooks")
+    def test_pre_run(self, mock_handle_hooks: MagicMock) -> None:
+        """Test pre_run."""
+        context = self._get_context()
+        deploy_action = deploy.Action(
+            context,
+            provider_builder=MockProviderBuilder(provider=self.provider),  # type: ignore
+        )
+        with patch.object(deploy_action, "ensure_cfn_bucket") as mock_ensure:
+            deploy_action.pre_run()
+            mock_ensure.assert_called_once_with()
+            deploy_action.pre_run(cfn_bucket_ensured=True)
+            deploy_action.pre_run(outline=True)
+            mock_ensure.assert_called_once_with()
+        self.assertEqual(mock_handle_hooks.call_count, 3)
+
     @patch(
         "runway.context.CfnginContext.persistent_graph_tags", new_callable=PropertyMock
     )
@@ -414,6 +510,7 @@ class TestLaunchStack(TestBuildAction):
             ]
 
         patch_object(self.provider, "get_stack", side_effect=get_stack)
+        patch_object(self.provider, "poll_stack", side_effect=get_stack)
         patch_object(self.provider, "update_stack")
         patch_object(self.provider, "create_stack")
         patch_object(self.provider, "destroy_stack")
@@ -538,8 +635,10 @@ class TestLaunchStack(TestBuildAction):
         # update should continue as SUBMITTED
         self._advance("UPDATE_IN_PROGRESS", SUBMITTED, "updating existing stack")
 
-        # update should finish with success
-        self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+        # update should finish with success, clearing cached SSM parameters
+        with patch.object(deploy.SsmLookup, "clear_cache") as mock_clear_cache:
+            self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+        mock_clear_cache.assert_called_once_with()
 
 
 class TestFunctions(unittest.TestCase):
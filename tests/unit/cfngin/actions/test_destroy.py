@@ -96,12 +96,14 @@ class TestDestroyAction(unittest.TestCase):
         # it being successfully deleted)
         provider = MagicMock()
         provider.get_stack.side_effect = StackDoesNotExist("mock")
+        provider.poll_stack.side_effect = StackDoesNotExist("mock")
         self.action.provider_builder = MockProviderBuilder(provider=provider)
         status = self.action._destroy_stack(MockStack("vpc"), status=PENDING)  # type: ignore
         # if we haven't processed the step (ie. has never been SUBMITTED,
         # should be skipped)
         self.assertEqual(status, SKIPPED)
         status = self.action._destroy_stack(MockStack("vpc"), status=SUBMITTED)  # type: ignore
+        provider.poll_stack.assert_called_once_with("vpc", self.action.cancel)
         # if we have processed the step and then can't find the stack, it means
         # we successfully deleted it
         self.assertEqual(status, COMPLETE)
@@ -153,12 +155,14 @@ class TestDestroyAction(unittest.TestCase):
         # simulate stack doesn't exist and we haven't submitted anything for
         # deletion
         mock_provider.get_stack.side_effect = StackDoesNotExist("mock")
+        mock_provider.poll_stack.side_effect = StackDoesNotExist("mock")
 
         step.run()
         self.assertEqual(step.status, SKIPPED)
 
         # simulate stack getting successfully deleted
         mock_provider.get_stack.side_effect = get_stack
+        mock_provider.poll_stack.side_effect = lambda name, _cancel: get_stack(name)
         mock_provider.is_stack_destroyed.return_value = False
         mock_provider.is_stack_in_progress.return_value = False
 
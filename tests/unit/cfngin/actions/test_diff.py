@@ -17,9 +17,12 @@ from runway.cfngin.actions.diff import (
     DictValue,
     diff_dictionaries,
     diff_parameters,
+    diff_templates,
+    format_template_diff,
+    get_changed_paths,
 )
 from runway.cfngin.providers.aws.default import Provider
-from runway.cfngin.status import SkippedStatus
+from runway.cfngin.status import COMPLETE, SkippedStatus
 
 from ..factories import MockProviderBuilder, MockThreadingEvent
 
@@ -123,6 +126,149 @@ class TestAction:
         mock_get_stack_changes.assert_called_once()
         assert result == expected
 
+    def test_diff_stack_fast(self, cfngin_context: MockCFNginContext) -> None:
+        """Test _diff_stack comparing templates locally."""
+        cfngin_context.env.cfngin_fast_diff = True
+        cfngin_context.env.cfngin_diff_change_set_stacks = ["inspect"]
+        provider = MagicMock(get_stack_diff=MagicMock(return_value={"a": "b"}))
+        action = Action(
+            context=cfngin_context,
+            provider_builder=MockProviderBuilder(provider=provider),
+            cancel=MockThreadingEvent(),  # type: ignore
+        )
+        stack = MagicMock(fqn="test-stack", locked=False)
+        stack.name = "test-stack"
+        with patch.object(action, "build_parameters", return_value=[]), patch.object(
+            action, "_template"
+        ):
+            assert action._diff_stack(stack) == COMPLETE
+            stack.name = "inspect"
+            assert action._diff_stack(stack) == COMPLETE
+        provider.get_stack_diff.assert_called_once_with(
+            stack, [], provider.get_deployed_stack_info.return_value
+        )
+        provider.get_stack_changes.assert_called_once()
+        stack.set_outputs.assert_any_call({"a": "b"})
+
+    def test_run_fast(self, cfngin_context: MockCFNginContext) -> None:
+        """Test run prefetching deployed templates."""
+        cfngin_context.env.cfngin_fast_diff = True
+        provider = MagicMock(
+            get_deployed_stack_info=MagicMock(side_effect=lambda fqn: (fqn, {}))
+        )
+        action = Action(
+            context=cfngin_context,
+            provider_builder=MockProviderBuilder(provider=provider),
+            cancel=MockThreadingEvent(),  # type: ignore
+        )
+        stacks = [MagicMock(fqn="stack0"), MagicMock(fqn="stack1")]
+        plan = MagicMock(steps=[MagicMock(stack=stack) for stack in stacks])
+        results = []
+        plan.execute.side_effect = lambda _: results.extend(
+            action._get_stack_info(provider, stack) for stack in stacks
+        )
+        with patch.object(action, "_generate_plan", return_value=plan):
+            action.run()
+        assert results == [("stack0", {}), ("stack1", {})]
+        assert provider.get_deployed_stack_info.call_count == 2
+        assert not action._stack_info
+
+
+class TestDiffTemplates:
+    """Tests for diff_templates and its formatting."""
+
+    OLD = {
+        "Parameters": {"Param": {"Type": "String"}},
+        "Resources": {
+            "Bucket": {"Type": "AWS::S3::Bucket"},
+            "Function": {
+                "Type": "AWS::Lambda::Function",
+                "Properties": {"Timeout": 3, "Code": {"S3Key": "a"}},
+            },
+        },
+        "Outputs": {"Arn": {"Value": {"Fn::GetAtt": ["Function", "Arn"]}}},
+    }
+    NEW = {
+        "Parameters": {"Param": {"Type": "String"}},
+        "Resources": {
+            "Function": {
+                "Type": "AWS::Lambda::Function",
+                "Properties": {"Code": {"S3Key": "b"}, "Timeout": 3, "Memory": 128},
+            },
+            "Queue": {"Type": "AWS::SQS::Queue"},
+        },
+    }
+
+    def test_diff_templates(self) -> None:
+        """Test diff_templates."""
+        result = diff_templates(self.OLD, self.NEW)
+        assert list(result) == ["Resources", "Outputs"]
+        assert [change.key for change in result["Resources"]] == [
+            "Bucket",
+            "Function",
+            "Queue",
+        ]
+        assert [change.status() for change in result["Resources"]] == [
+            DictValue.REMOVED,
+            DictValue.MODIFIED,
+            DictValue.ADDED,
+        ]
+        assert not diff_templates(self.OLD, self.OLD)
+
+    def test_diff_templates_other_sections(self) -> None:
+        """Test diff_templates with changes outside of the common sections."""
+        new = {
+            **self.OLD,
+            "Conditions": {"IsProd": {"Fn::Equals": ["prod", "prod"]}},
+            "Transform": "AWS::Serverless-2016-10-31",
+        }
+        result = diff_templates(self.OLD, new)
+        assert list(result) == ["Conditions", "Transform"]
+        assert result["Transform"] == [
+            DictValue("Transform", None, "AWS::Serverless-2016-10-31")
+        ]
+        assert format_template_diff(result).endswith(
+            "Conditions:\n+ IsProd\nTransform:\n+ Transform\n"
+        )
+
+    def test_diff_templates_only_mappings(self) -> None:
+        """Test diff_templates when only Mappings changes."""
+        old = {**self.OLD, "Mappings": {"Env": {"dev": {"Size": 1}}}}
+        new = {**self.OLD, "Mappings": {"Env": {"dev": {"Size": 2}}}}
+        result = diff_templates(old, new)
+        assert list(result) == ["Mappings"]
+        assert format_template_diff(result) == (
+            "--- Old Template\n"
+            "+++ New Template\n"
+            "******************\n"
+            "Mappings:\n"
+            "~ Env: dev.Size\n"
+        )
+
+    def test_format_template_diff(self) -> None:
+        """Test format_template_diff."""
+        assert format_template_diff(diff_templates(self.OLD, self.NEW)) == (
+            "--- Old Template\n"
+            "+++ New Template\n"
+            "******************\n"
+            "Resources:\n"
+            "- Bucket (AWS::S3::Bucket)\n"
+            "~ Function (AWS::Lambda::Function): Properties.Code.S3Key, "
+            "Properties.Memory\n"
+            "+ Queue (AWS::SQS::Queue)\n"
+            "Outputs:\n"
+            "- Arn\n"
+        )
+
+    def test_get_changed_paths(self) -> None:
+        """Test get_changed_paths."""
+        assert get_changed_paths({"a": 1}, {"a": 1}) == []
+        assert get_changed_paths({"a": {"b": 1, "c": 2}}, {"a": {"b": 2}}) == [
+            "a.b",
+            "a.c",
+        ]
+        assert get_changed_paths([1], [2], "a") == ["a"]
+
 
 class TestDictValueFormat(unittest.TestCase):
     """Tests for runway.cfngin.actions.diff.DictValue."""
@@ -18,6 +18,7 @@ from runway.cfngin.blueprints.base import (
     validate_allowed_values,
     validate_variable_type,
 )
+from runway.cfngin.blueprints.render_cache import RenderCache
 from runway.cfngin.blueprints.variables.types import (
     CFNCommaDelimitedList,
     CFNNumber,
@@ -35,6 +36,8 @@ from runway.cfngin.exceptions import (
 from runway.variables import Variable
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
     from runway.cfngin.blueprints.type_defs import BlueprintVariableTypeDef
@@ -236,6 +239,50 @@ class TestBlueprint:
             obj.variables, mock_read_value_from_path.return_value, obj.name
         )
 
+    def test_render_template_cache(
+        self, cfngin_context: CfnginContext, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test render_template using the render cache."""
+        cache = RenderCache(tmp_path)
+        mocker.patch(f"{MODULE}.get_render_cache", return_value=cache)
+        cfngin_context.env.cfngin_render_cache = True
+        create_template = Mock()
+
+        class _Blueprint(SampleBlueprint):
+            def create_template(self) -> None:
+                """Create template."""
+                create_template()
+                self.template.set_transform("AWS::Serverless-2016-10-31")
+                self.add_output("Var1", self.variables["Var1"])
+
+        obj = _Blueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([Variable("Var1", "val", "cfngin")])
+        version, rendered = obj.render_template()
+        assert cache.stats == {"hits": 0, "misses": 1}
+
+        cached = _Blueprint(name="test", context=cfngin_context)
+        cached.resolve_variables([Variable("Var1", "val", "cfngin")])
+        assert cached.render_template() == (version, rendered)
+        assert cache.stats == {"hits": 1, "misses": 1}
+        create_template.assert_called_once_with()
+        assert cached.output_definitions == {"Var1": {"Value": "val"}}
+        assert cached.requires_change_set
+
+        changed = _Blueprint(name="test", context=cfngin_context)
+        changed.resolve_variables([Variable("Var1", "other", "cfngin")])
+        assert changed.render_template()[0] != version
+        assert create_template.call_count == 2
+
+    def test_render_template_cache_disabled(
+        self, cfngin_context: CfnginContext, mocker: MockerFixture
+    ) -> None:
+        """Test render_template with the render cache disabled."""
+        mock_get_render_cache = mocker.patch(f"{MODULE}.get_render_cache")
+        obj = SampleBlueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([])
+        assert obj.render_template()
+        mock_get_render_cache.assert_not_called()
+
     def test_rendered(
         self, cfngin_context: CfnginContext, mocker: MockerFixture
     ) -> None:
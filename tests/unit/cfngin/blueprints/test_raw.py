@@ -300,6 +300,17 @@ class TestRawTemplateBlueprint:
             "test", cfngin_context, raw_template_path=tmp_path
         ).render_template() == (mock_version, mock_rendered)
 
+    def test_reset_template(
+        self, cfngin_context: CfnginContext, tmp_path: Path
+    ) -> None:
+        """Test reset_template."""
+        obj = RawTemplateBlueprint("test", cfngin_context, raw_template_path=tmp_path)
+        obj._rendered = "rendered"  # pylint: disable=protected-access
+        obj._version = "version"  # pylint: disable=protected-access
+        assert not obj.reset_template()
+        assert obj._rendered is None  # pylint: disable=protected-access
+        assert obj._version is None  # pylint: disable=protected-access
+
     def test_variables(self, cfngin_context: CfnginContext, tmp_path: Path) -> None:
         """Test variables."""
         obj = RawTemplateBlueprint("test", cfngin_context, raw_template_path=tmp_path)
@@ -0,0 +1,149 @@
+"""Test runway.cfngin.blueprints.render_cache."""
+# pylint: disable=no-self-use,protected-access
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, ClassVar, Dict
+
+from troposphere import Ref
+
+from runway.cfngin.blueprints import render_cache
+from runway.cfngin.blueprints.base import Blueprint, CFNParameter
+from runway.cfngin.blueprints.render_cache import (
+    RenderCache,
+    get_render_cache,
+    get_source_hash,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+    from runway.cfngin.blueprints.type_defs import BlueprintVariableTypeDef
+    from runway.context import CfnginContext
+
+MODULE = "runway.cfngin.blueprints.render_cache"
+
+
+class SampleBlueprint(Blueprint):
+    """Sample Blueprint to use for testing."""
+
+    VARIABLES: ClassVar[Dict[str, BlueprintVariableTypeDef]] = {
+        "Var0": {"type": str, "default": ""},
+    }
+
+    def create_template(self) -> None:
+        """Create template."""
+
+
+def make_blueprint(context: CfnginContext, value: Any, **kwargs: Any) -> Blueprint:
+    """Make a blueprint with resolved variables."""
+    blueprint = SampleBlueprint(name="test", context=context, **kwargs)
+    blueprint.variables = {"Var0": value}
+    return blueprint
+
+
+def create_cache(tmp_path: Path, *keys: str, **kwargs: Any) -> RenderCache:
+    """Create a render cache with an entry for each key."""
+    cache = RenderCache(tmp_path, **kwargs)
+    for key in keys:
+        cache.put(key, f"v-{key}", json.dumps({"Key": key}), blueprint=key)
+    return cache
+
+
+def test_get_render_cache(monkeypatch: MonkeyPatch) -> None:
+    """Test get_render_cache."""
+    monkeypatch.setattr(f"{MODULE}._RENDER_CACHE", None)
+    assert get_render_cache() is get_render_cache()
+
+
+def test_get_source_hash(mocker: MockerFixture) -> None:
+    """Test get_source_hash."""
+    mocker.patch.dict(render_cache._SOURCE_HASHES, clear=True)
+    result = get_source_hash(SampleBlueprint)
+    assert get_source_hash(SampleBlueprint) == result
+    assert get_source_hash(Blueprint) != result
+    assert len(render_cache._SOURCE_HASHES) == 2  # this file and base.py
+
+
+class TestRenderCache:
+    """Test RenderCache."""
+
+    def test_compute_key(self, cfngin_context: CfnginContext) -> None:
+        """Test compute_key."""
+        key = RenderCache.compute_key(make_blueprint(cfngin_context, "val"))
+        assert key
+        assert RenderCache.compute_key(make_blueprint(cfngin_context, "val")) == key
+        assert RenderCache.compute_key(make_blueprint(cfngin_context, "other")) != key
+        assert (
+            RenderCache.compute_key(
+                make_blueprint(cfngin_context, "val", mappings={"a": {"b": "c"}})
+            )
+            != key
+        )
+        assert RenderCache.compute_key(
+            make_blueprint(cfngin_context, [Ref("Foo"), CFNParameter("Bar", "baz")])
+        )
+
+    def test_compute_key_unsupported(self, cfngin_context: CfnginContext) -> None:
+        """Test compute_key with a variable value that can't be serialized."""
+        assert not RenderCache.compute_key(make_blueprint(cfngin_context, object()))
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test get."""
+        cache = create_cache(tmp_path, "key0")
+        assert cache.get("key0") == ("v-key0", '{"Key": "key0"}')
+        assert cache.get("key0")
+        assert not cache.get("key1")
+        assert cache.stats == {"hits": 2, "misses": 1}
+        assert cache.hit_rate == 2 / 3
+        assert [(entry.key, entry.hits) for entry in cache.entries] == [("key0", 2)]
+
+    def test_entries(self, tmp_path: Path) -> None:
+        """Test entries."""
+        assert not RenderCache(tmp_path / "missing").entries
+        cache = create_cache(tmp_path, "key0", "key1")
+        os.utime(tmp_path / "key1.json", (0, 0))
+        (tmp_path / "invalid.json").write_text("invalid")
+        assert [entry.key for entry in cache.entries] == ["key1", "key0"]
+        assert cache.entries[0].blueprint == "key1"
+        assert cache.size == 2 * len('{"Key": "key0"}')
+
+    def test_prune(self, tmp_path: Path) -> None:
+        """Test prune."""
+        cache = create_cache(tmp_path, "key0", "key1", "key2")
+        os.utime(tmp_path / "key1.json", (0, 0))
+        removed = cache.prune(cache.size - 1)
+        assert [entry.key for entry in removed] == ["key1"]
+        assert not (tmp_path / "key1.template").exists()
+        assert sorted(entry.key for entry in cache.entries) == ["key0", "key2"]
+        assert not cache.prune()
+        assert len(cache.prune(0)) == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_put_evicts(self, tmp_path: Path) -> None:
+        """Test put evicting entries once the cache is full."""
+        cache = create_cache(tmp_path, "key0", max_size=20)
+        os.utime(tmp_path / "key0.json", (0, 0))
+        cache.put("key1", "v", json.dumps({"Key": "key1"}))
+        assert [entry.key for entry in cache.entries] == ["key1"]
+        assert not list(tmp_path.glob(".tmp-*"))
+
+    def test_remove_missing(self, tmp_path: Path) -> None:
+        """Test remove with files that no longer exist."""
+        cache = create_cache(tmp_path, "key0")
+        entry = cache.entries[0]
+        (tmp_path / "key0.template").unlink()
+        cache.remove(entry)
+        assert not cache.entries
+        assert not cache.get("key0")
+
+    def test_put_error(self, tmp_path: Path) -> None:
+        """Test put when the cache directory can't be written to."""
+        (tmp_path / "file").touch()
+        cache = RenderCache(tmp_path / "file")
+        cache.put("key0", "v", "{}")
+        assert not cache.entries
@@ -140,14 +140,17 @@ class TestParameter:
         self,
         caplog: LogCaptureFixture,
         cfngin_context: CfnginContext,
+        mocker: MockerFixture,
         ssm_stubber: Stubber,
     ) -> None:
         """Test delete."""
         caplog.set_level(LogLevels.INFO, logger=MODULE)
+        mock_clear_cache = mocker.patch(f"{MODULE}.SsmLookup.clear_cache")
         ssm_stubber.add_response("delete_parameter", {}, {"Name": "test"})
         with ssm_stubber:
             assert Parameter(cfngin_context, name="test", type="String").delete()
         ssm_stubber.assert_no_pending_responses()
+        mock_clear_cache.assert_called_once_with("test")
         assert "deleted SSM Parameter test" in caplog.messages
 
     def test_delete_handle_parameter_not_found(
@@ -370,6 +373,7 @@ class TestParameter:
         """Test put."""
         caplog.set_level(LogLevels.INFO, MODULE)
         expected = {"Tier": "Standard", "Version": 1}
+        mock_clear_cache = mocker.patch(f"{MODULE}.SsmLookup.clear_cache")
         mock_get = mocker.patch.object(Parameter, "get", return_value={})
         ssm_stubber.add_response(
             "put_parameter",
@@ -394,6 +398,7 @@ class TestParameter:
                 == expected
             )
         mock_get.assert_called_once_with()
+        mock_clear_cache.assert_called_once_with("test")
         ssm_stubber.assert_no_pending_responses()
         assert "put SSM Parameter test" in caplog.messages
 
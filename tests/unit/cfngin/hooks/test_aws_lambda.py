@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 from zipfile import ZipFile
 
 import boto3
+import docker.errors
 import pytest
 from botocore.exceptions import ClientError
 from mock import ANY, MagicMock, patch
@@ -28,6 +29,11 @@ from runway.cfngin.exceptions import InvalidDockerizePipConfiguration
 from runway.cfngin.hooks.aws_lambda import (
     ZIP_PERMS_MASK,
     _calculate_hash,
+    _copy_code,
+    _dependency_cache_key,
+    _upload_code,
+    _zip_files,
+    _zip_package,
     copydir,
     dockerized_pip,
     find_requirements,
@@ -36,6 +42,7 @@ from runway.cfngin.hooks.aws_lambda import (
     should_use_docker,
     upload_lambda_functions,
 )
+from runway.cfngin.hooks.aws_lambda_cache import DependencyCache
 from runway.config import CfnginConfig
 from runway.context import CfnginContext
 
@@ -46,7 +53,9 @@ from ..factories import mock_provider
 if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
     from pytest import LogCaptureFixture, MonkeyPatch
+    from pytest_mock import MockerFixture
 
+MODULE = "runway.cfngin.hooks.aws_lambda"
 REGION = "us-east-1"
 ALL_FILES = (
     "f1/f1.py",
@@ -246,6 +255,59 @@ class TestLambdaHooks(unittest.TestCase):
         self.assertIsInstance(f2_code, Code)
         self.assert_s3_zip_file_list(f2_code.S3Bucket, f2_code.S3Key, F2_FILES)
 
+    @mock_s3
+    def test_max_workers(self) -> None:
+        """Test max_workers."""
+        with self.temp_directory_with_files() as temp_dir:
+            functions = {
+                "MyFunction": {"path": temp_dir.path + "/f1"},
+                "OtherFunction": {"path": temp_dir.path + "/f2"},
+                "LastFunction": {"path": temp_dir.path + "/f1"},
+            }
+            sequential = self.run_hook(functions=functions)
+            with patch(f"{MODULE}._upload_code", wraps=_upload_code) as upload:
+                results = self.run_hook(
+                    functions=functions, max_docker_workers=2, max_workers=3
+                )
+
+        self.assertEqual(list(results), list(functions))
+        for name, code in results.items():
+            self.assertEqual(code.to_dict(), sequential[name].to_dict())
+        self.assertEqual(upload.call_count, 2)
+        self.assert_s3_zip_file_list(
+            results["LastFunction"].S3Bucket,
+            results["LastFunction"].S3Key,
+            F1_FILES,
+        )
+
+    @mock_s3
+    def test_max_workers_invalid(self) -> None:
+        """Test max_workers invalid."""
+        for key in ["max_docker_workers", "max_workers"]:
+            for value in [0, "2", True]:
+                with ShouldRaise(
+                    ValueError(f"{key} option must be an integer greater than 0")
+                ):
+                    self.run_hook(functions={}, **{key: value})
+
+    @mock_s3
+    def test_build_error(self) -> None:
+        """Test an error building one function stops the others."""
+        with self.temp_directory_with_files() as temp_dir, patch(
+            f"{MODULE}._upload_code"
+        ) as upload:
+            with ShouldRaise(
+                ValueError("missing required property 'path' in function 'Invalid'")
+            ):
+                self.run_hook(
+                    functions={
+                        "MyFunction": {"path": temp_dir.path + "/f1"},
+                        "Invalid": {},
+                        "OtherFunction": {"path": temp_dir.path + "/f2"},
+                    }
+                )
+        upload.assert_not_called()
+
     @mock_s3
     def test_patterns_invalid(self) -> None:
         """Test patterns invalid."""
@@ -567,7 +629,7 @@ class TestLambdaHooks(unittest.TestCase):
     @patch("runway.cfngin.hooks.aws_lambda._find_files", MagicMock())
     @patch(
         "runway.cfngin.hooks.aws_lambda._zip_files",
-        MagicMock(return_value=("zip_contents", "content_hash")),
+        MagicMock(return_value=(StringIO(b"zip_contents"), "content_hash")),
     )
     @patch("runway.cfngin.hooks.aws_lambda._upload_code", MagicMock())
     @patch("runway.cfngin.hooks.aws_lambda.sys")
@@ -896,3 +958,203 @@ def test_copydir() -> None:
         assert tmp_dir.read(("src", "lib", "example_file")) == example_file
         assert tmp_dir.read(("dest", "example_file")) == example_file
         assert tmp_dir.read(("dest", "lib", "example_file")) == example_file
+
+
+def test_copy_code() -> None:
+    """Test _copy_code."""
+    s3_conn = MagicMock(
+        head_object=MagicMock(
+            side_effect=ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        )
+    )
+    source = Code(S3Bucket="bucket", S3Key="prefix/lambda-other-hash.zip")
+    code = _copy_code(s3_conn, source, "prefix/", "name", "hash", "private")
+    assert code.S3Bucket == "bucket"
+    assert code.S3Key == "prefix/lambda-name-hash.zip"
+    s3_conn.copy_object.assert_called_once_with(
+        ACL="private",
+        Bucket="bucket",
+        ContentType="application/zip",
+        CopySource={"Bucket": "bucket", "Key": "prefix/lambda-other-hash.zip"},
+        Key="prefix/lambda-name-hash.zip",
+    )
+
+
+def test_copy_code_exists() -> None:
+    """Test _copy_code object already exists."""
+    s3_conn = MagicMock()
+    source = Code(S3Bucket="bucket", S3Key="lambda-other-hash.zip")
+    _copy_code(s3_conn, source, "", "name", "hash", "private")
+    s3_conn.copy_object.assert_not_called()
+
+
+def test_upload_code() -> None:
+    """Test _upload_code."""
+    s3_conn = MagicMock(
+        head_object=MagicMock(
+            side_effect=ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        )
+    )
+    contents = StringIO(b"zip_contents")
+    code = _upload_code(
+        s3_conn, "bucket", "prefix/", "name", contents, "hash", "private"
+    )
+    assert code.S3Bucket == "bucket"
+    assert code.S3Key == "prefix/lambda-name-hash.zip"
+    s3_conn.upload_fileobj.assert_called_once_with(
+        contents,
+        "bucket",
+        "prefix/lambda-name-hash.zip",
+        ExtraArgs={"ACL": "private", "ContentType": "application/zip"},
+    )
+    _upload_code(
+        s3_conn, "bucket", "prefix/", "name", "zip_contents", "hash", "private"
+    )
+    assert s3_conn.upload_fileobj.call_args.args[0].read() == b"zip_contents"
+
+
+def test_upload_code_exists() -> None:
+    """Test _upload_code object already exists."""
+    s3_conn = MagicMock()
+    _upload_code(s3_conn, "bucket", "", "name", b"zip_contents", "hash", "private")
+    s3_conn.upload_fileobj.assert_not_called()
+
+
+def test_zip_files(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test _zip_files."""
+    monkeypatch.setattr(f"{MODULE}.ZIP_CHUNK_SIZE", 4)
+    monkeypatch.setattr(f"{MODULE}.ZIP_SPOOL_MAX_SIZE", 64)
+    files = {"b.py": b"print('b')" * 32, "a/script.sh": b"#!/bin/sh", "a/empty": b""}
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_bytes(content)
+    (tmp_path / "a/script.sh").chmod(0o700)
+
+    zip_data, content_hash = _zip_files(files, str(tmp_path))
+    assert content_hash == _calculate_hash(files, str(tmp_path))
+    assert zip_data._rolled  # type: ignore
+    with zip_data, ZipFile(zip_data, "r") as zip_file:
+        assert zip_file.namelist() == sorted(files)
+        for zip_info in zip_file.infolist():
+            assert zip_file.read(zip_info) == files[zip_info.filename]
+            perms = (zip_info.external_attr & ZIP_PERMS_MASK) >> 16
+            assert perms == (0o755 if zip_info.filename == "a/script.sh" else 0o644)
+
+
+def test_zip_package_cache_dependencies(
+    mocker: MockerFixture, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test _zip_package reusing cached dependencies."""
+    monkeypatch.setattr(f"{MODULE}.DOT_RUNWAY_DIR", tmp_path / ".runway")
+    monkeypatch.setattr(
+        "runway.cfngin.hooks.aws_lambda_cache.DEPENDENCY_CACHE_DIR", tmp_path / "cache"
+    )
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "app.py").write_text("app")
+    (src / "requirements.txt").write_text("foo==1.0")
+
+    def pip_install(cmd: List[str], **_: Any) -> None:
+        target = Path(cmd[cmd.index("--target") + 1])
+        (target / "foo").mkdir()
+        (target / "foo" / "__init__.py").write_text("foo")
+
+    mock_check_call = mocker.patch(
+        f"{MODULE}.subprocess.check_call", side_effect=pip_install
+    )
+    mocker.patch(f"{MODULE}._pip_has_no_color_option", return_value=True)
+    requirements_files = {
+        "requirements.txt": True,
+        "Pipfile": False,
+        "Pipfile.lock": False,
+    }
+    hashes = set()
+    for _ in range(2):
+        zip_data, content_hash = _zip_package(
+            str(src),
+            cache_dependencies=True,
+            includes=["**"],
+            requirements_files=requirements_files,
+        )
+        hashes.add(content_hash)
+        with zip_data, ZipFile(zip_data, "r") as zip_file:
+            assert sorted(zip_file.namelist()) == [
+                "app.py",
+                "foo/__init__.py",
+                "requirements.txt",
+            ]
+    mock_check_call.assert_called_once()
+    assert len(hashes) == 1
+    assert [entry.files for entry in DependencyCache().entries] == [1]
+
+    _zip_package(str(src), includes=["**"], requirements_files=requirements_files)[
+        0
+    ].close()
+    assert mock_check_call.call_count == 2
+
+    # unpinned requirements are resolved again
+    (src / "requirements.txt").write_text("foo>=1.0")
+    for _ in range(2):
+        _zip_package(
+            str(src),
+            cache_dependencies=True,
+            includes=["**"],
+            requirements_files=requirements_files,
+        )[0].close()
+    assert mock_check_call.call_count == 4
+
+
+def test_dependency_cache_key_docker(tmp_path: Path) -> None:
+    """Test _dependency_cache_key using docker."""
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("foo==1.0")
+    client = MagicMock()
+    client.images.get.return_value.id = "sha256:abc"
+    key = _dependency_cache_key(
+        str(requirements), client=client, dockerize_pip=True, runtime="python3.8"
+    )
+    client.images.get.assert_called_once_with("lambci/lambda:build-python3.8")
+    client.images.get.return_value.id = "sha256:def"
+    assert key and key != _dependency_cache_key(
+        str(requirements), client=client, dockerize_pip=True, runtime="python3.8"
+    )
+    client.images.get.side_effect = docker.errors.ImageNotFound("not found")
+    assert not _dependency_cache_key(
+        str(requirements), client=client, dockerize_pip=True, docker_image="foo"
+    )
+    assert not _dependency_cache_key(
+        str(requirements),
+        client=client,
+        dockerize_pip=True,
+        docker_file=str(tmp_path / "Dockerfile"),
+    )
+
+
+def test_zip_package_docker_semaphore(
+    mocker: MockerFixture, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test _zip_package holding the docker semaphore while running pip."""
+    monkeypatch.setattr(f"{MODULE}.DOT_RUNWAY_DIR", tmp_path / ".runway")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "requirements.txt").write_text("foo==1.0")
+    semaphore = MagicMock()
+    mock_dockerized_pip = mocker.patch(
+        f"{MODULE}.dockerized_pip",
+        side_effect=lambda *_, **__: semaphore.__enter__.assert_called_once(),
+    )
+    _zip_package(
+        str(src),
+        cache_dependencies=False,
+        docker_semaphore=semaphore,
+        dockerize_pip=True,
+        includes=["**"],
+        requirements_files={
+            "requirements.txt": True,
+            "Pipfile": False,
+            "Pipfile.lock": False,
+        },
+        runtime="python3.8",
+    )[0].close()
+    mock_dockerized_pip.assert_called_once()
+    semaphore.__exit__.assert_called_once()
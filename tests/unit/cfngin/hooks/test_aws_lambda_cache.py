@@ -0,0 +1,161 @@
+"""Tests for runway.cfngin.hooks.aws_lambda_cache."""
+# pylint: disable=no-self-use
+# pyright: basic
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from runway.cfngin.hooks.aws_lambda_cache import (
+    DEPENDENCY_CACHE_MAX_SIZE,
+    DependencyCache,
+    is_pinned,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+MODULE = "runway.cfngin.hooks.aws_lambda_cache"
+
+
+def create_files(root: Path, *files: str, size: int = 10) -> Path:
+    """Create files of a given size."""
+    for file_name in files:
+        (root / file_name).parent.mkdir(parents=True, exist_ok=True)
+        (root / file_name).write_bytes(b"0" * size)
+    return root
+
+
+class TestDependencyCache:
+    """Test DependencyCache."""
+
+    def test___init__(self, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        """Test __init__."""
+        monkeypatch.setattr(f"{MODULE}.DEPENDENCY_CACHE_DIR", tmp_path)
+        cache = DependencyCache()
+        assert cache.cache_dir == tmp_path
+        assert cache.max_size == DEPENDENCY_CACHE_MAX_SIZE
+        assert DependencyCache(tmp_path / "other", max_size=0).max_size == 0
+
+    def test_compute_key(self, tmp_path: Path) -> None:
+        """Test compute_key."""
+        requirements = tmp_path / "requirements.txt"
+        requirements.write_text("foo==1.0")
+        key = DependencyCache.compute_key(requirements, "pip", "3.8")
+        assert key == DependencyCache.compute_key(str(requirements), "pip", "3.8")
+        assert key != DependencyCache.compute_key(requirements, "pip", "3.9")
+        requirements.write_text("foo==1.1")
+        assert key != DependencyCache.compute_key(requirements, "pip", "3.8")
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test get."""
+        cache = DependencyCache(tmp_path / "cache")
+        assert not cache.get("key")
+        src = create_files(tmp_path / "src", "foo/__init__.py")
+        path = cache.put("key", src, ["foo/__init__.py"])
+        metadata_file = tmp_path / "cache" / "key.json"
+        os.utime(metadata_file, (0, 0))
+        assert cache.get("key") == path
+        assert metadata_file.stat().st_mtime > 0
+
+    def test_put(self, tmp_path: Path) -> None:
+        """Test put."""
+        cache = DependencyCache(tmp_path / "cache")
+        src = create_files(tmp_path / "src", "foo/__init__.py", "bar.py", "app.py")
+        path = cache.put("key", src, ["bar.py", "foo/__init__.py"])
+        assert path == tmp_path / "cache" / "key"
+        assert sorted(
+            str(p.relative_to(path)) for p in path.rglob("*") if p.is_file()
+        ) == ["bar.py", "foo/__init__.py"]
+        metadata = json.loads((tmp_path / "cache" / "key.json").read_text())
+        assert metadata["files"] == 2
+        assert metadata["size"] == 20
+        assert [entry.key for entry in cache.entries] == ["key"]
+        assert cache.size == 20
+        assert not list((tmp_path / "cache").glob(".tmp-*"))
+
+    def test_put_exists(self, tmp_path: Path) -> None:
+        """Test put when another build already added the key."""
+        cache = DependencyCache(tmp_path / "cache")
+        src = create_files(tmp_path / "src", "foo.py", "bar.py")
+        cache.put("key", src, ["foo.py"])
+        path = cache.put("key", src, ["bar.py"])
+        assert (path / "foo.py").is_file()
+        assert not (path / "bar.py").exists()
+        assert not list((tmp_path / "cache").glob(".tmp-*"))
+
+    def test_put_interrupted(self, tmp_path: Path) -> None:
+        """Test put replaces an entry left behind by an interrupted build."""
+        cache = DependencyCache(tmp_path / "cache")
+        create_files(tmp_path / "cache" / "key", "partial.py")
+        src = create_files(tmp_path / "src", "foo.py")
+        path = cache.put("key", src, ["foo.py"])
+        assert (path / "foo.py").is_file()
+        assert not (path / "partial.py").exists()
+        assert cache.get("key") == path
+
+    def test_prune(self, tmp_path: Path) -> None:
+        """Test prune."""
+        cache = DependencyCache(tmp_path / "cache", max_size=30)
+        src = create_files(tmp_path / "src", "foo.py")
+        for i, key in enumerate(["key0", "key1", "key2"]):
+            cache.put(key, src, ["foo.py"])
+            os.utime(tmp_path / "cache" / f"{key}.json", (i, i))
+        cache.get("key0")  # most recently used
+        removed = cache.prune(max_size=10)
+        assert [entry.key for entry in removed] == ["key1", "key2"]
+        assert [entry.key for entry in cache.entries] == ["key0"]
+        assert not (tmp_path / "cache" / "key1").exists()
+        assert not cache.prune()
+        assert cache.prune(max_size=0)
+        assert not cache.entries
+
+    def test_put_prunes(self, tmp_path: Path) -> None:
+        """Test put evicts the least recently used entries."""
+        cache = DependencyCache(tmp_path / "cache", max_size=25)
+        src = create_files(tmp_path / "src", "foo.py")
+        for i, key in enumerate(["key0", "key1"]):
+            cache.put(key, src, ["foo.py"])
+            os.utime(tmp_path / "cache" / f"{key}.json", (i, i))
+        cache.put("key2", src, ["foo.py"])
+        assert [entry.key for entry in cache.entries] == ["key1", "key2"]
+
+    def test_restore(self, tmp_path: Path) -> None:
+        """Test restore."""
+        cache = DependencyCache(tmp_path / "cache")
+        src = create_files(tmp_path / "src", "foo/__init__.py", "app.py")
+        path = cache.put("key", src, ["foo/__init__.py", "app.py"])
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "app.py").write_text("source")
+        assert DependencyCache.restore(path, dest) == 1
+        assert (dest / "foo" / "__init__.py").read_bytes() == b"0" * 10
+        assert (dest / "app.py").read_text() == "source"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", True),
+        ("# comment\nfoo==1.0\nbar[baz]===2.0  # comment", True),
+        ("-i https://pypi.org/simple\nfoo==1.0 ; python_version >= '3.6'", True),
+        ("foo==1.0 \\\n    --hash=sha256:abc \\\n    --hash=sha256:def", True),
+        ("foo", False),
+        ("foo>=1.0", False),
+        ("foo==1.*", False),
+        ("foo==1.0,<2", False),
+        ("-r other.txt", False),
+        ("-e git+https://github.com/foo/bar.git#egg=bar", False),
+        ("https://example.com/foo-1.0.tar.gz", False),
+    ],
+)
+def test_is_pinned(content: str, expected: bool, tmp_path: Path) -> None:
+    """Test is_pinned."""
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text(content)
+    assert is_pinned(requirements) is expected
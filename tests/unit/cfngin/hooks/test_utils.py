@@ -4,13 +4,15 @@
 from __future__ import annotations
 
 import queue
+import time
 import unittest
 from typing import TYPE_CHECKING, Any, Dict
 
 from mock import call, patch
 
-from runway.cfngin.hooks.utils import handle_hooks
+from runway.cfngin.hooks.utils import get_hook_dependencies, handle_hooks
 from runway.config.models.cfngin import CfnginHookDefinitionModel
+from runway.core.components._dependency_graph import DependencyGraph
 
 from ..factories import mock_context, mock_provider
 
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
     from mock import MagicMock
 
 HOOK_QUEUE = queue.Queue()
+TIMED_HOOK_QUEUE = queue.Queue()
 
 
 class TestHooks(unittest.TestCase):
@@ -89,7 +92,10 @@ class TestHooks(unittest.TestCase):
         handle_hooks("pre_deploy", hooks, self.provider, self.context)
         assert mock_load.call_count == 2
         mock_load.assert_has_calls(
-            [call(hooks[0].path, try_reload=True), call(hooks[1].path, try_reload=True)]
+            [
+                call(hooks[0].path, try_reload=True, if_modified=True),
+                call(hooks[1].path, try_reload=True, if_modified=True),
+            ]
         )
         good = HOOK_QUEUE.get_nowait()
         self.assertEqual(good["provider"].region, "us-east-1")
@@ -229,6 +235,121 @@ class TestHooks(unittest.TestCase):
             self.context.hook_data["my_hook_results"]["default_lookup"], "default_value"
         )
 
+    def test_get_hook_dependencies(self) -> None:
+        """Test get_hook_dependencies."""
+        hooks = [
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"value": "${hook_data vpc.id}"},
+                requires=["missing"],
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.result_hook", data_key="vpc"
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.context_hook",
+                requires=["tests.unit.cfngin.hooks.test_utils.mock_hook"],
+            ),
+        ]
+        with self.assertLogs("runway.cfngin.hooks.utils", "WARNING") as logs:
+            assert get_hook_dependencies(hooks) == [
+                ("0", []),
+                ("1", []),
+                ("2", ["0"]),
+            ]
+        assert "requires missing which is not a hook" in logs.output[0]
+
+    def test_get_hook_dependencies_hook_data(self) -> None:
+        """Test get_hook_dependencies only infers edges to earlier hooks."""
+        hooks = [
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"value": "${hook_data second.id::default=none}"},
+                data_key="first",
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"value": "${hook_data first.id::default=none}"},
+                data_key="second",
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"value": "${hook_data third.id::default=none}"},
+                data_key="third",
+                requires=["fourth"],
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                data_key="fourth",
+            ),
+        ]
+        assert get_hook_dependencies(hooks) == [
+            ("0", []),
+            ("1", ["0"]),
+            ("2", ["3"]),
+            ("3", []),
+        ]
+        assert DependencyGraph(get_hook_dependencies(hooks)).order == [
+            "0",
+            "1",
+            "3",
+            "2",
+        ]
+
+    def test_requires_order(self) -> None:
+        """Test hooks run after the hooks they require."""
+        hooks = [
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.timed_hook",
+                args={"name": "first"},
+                requires=["tests.unit.cfngin.hooks.test_utils.mock_hook"],
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"name": "second"},
+            ),
+        ]
+        handle_hooks("pre_deploy", hooks, self.provider, self.context)
+        assert HOOK_QUEUE.get_nowait()["name"] == "second"
+        assert TIMED_HOOK_QUEUE.get_nowait()[0] == "first"
+
+    def test_concurrent(self) -> None:
+        """Test independent hooks running concurrently."""
+        self.context.env.max_concurrent_cfngin_hooks = 3
+        hooks = [
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.timed_hook",
+                args={"name": name},
+                data_key=name,
+                requires=requires,
+            )
+            for name, requires in [("a", []), ("b", []), ("c", ["a", "b"])]
+        ]
+        handle_hooks("pre_deploy", hooks, self.provider, self.context)
+        times: Dict[str, Any] = {}
+        while not TIMED_HOOK_QUEUE.empty():
+            name, start, end = TIMED_HOOK_QUEUE.get_nowait()
+            times[name] = (start, end)
+        assert times["a"][0] < times["b"][1] and times["b"][0] < times["a"][1]
+        assert times["c"][0] >= max(times["a"][1], times["b"][1])
+
+    def test_concurrent_failure(self) -> None:
+        """Test hooks that depend on a failed hook are not run."""
+        self.context.env.max_concurrent_cfngin_hooks = 2
+        hooks = [
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.exception_hook"
+            ),
+            CfnginHookDefinitionModel(
+                path="tests.unit.cfngin.hooks.test_utils.mock_hook",
+                args={"name": "dependent"},
+                requires=["tests.unit.cfngin.hooks.test_utils.exception_hook"],
+            ),
+        ]
+        with self.assertRaises(Exception):
+            handle_hooks("pre_deploy", hooks, self.provider, self.context)
+        self.assertTrue(HOOK_QUEUE.empty())
+
 
 class MockHook:
     """Mock hook class."""
@@ -282,3 +403,11 @@ def result_hook(*args: Any, **kwargs: Any) -> Dict[str, str]:
 def kwargs_hook(*args: Any, **kwargs: Any) -> Any:
     """Kwargs hook."""
     return kwargs
+
+
+def timed_hook(*args: Any, name: str, **kwargs: Any) -> bool:
+    """Record when the hook started and finished."""
+    start = time.time()
+    time.sleep(0.05)
+    TIMED_HOOK_QUEUE.put((name, start, time.time()))
+    return True
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import copy
+import json
 import os.path
 import random
 import string
 import threading
+import time
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +29,8 @@ from runway.cfngin.providers.aws.default import (
     DEFAULT_CAPABILITIES,
     MAX_TAIL_RETRIES,
     Provider,
+    StackEventTailer,
+    StackStatusPoller,
     ask_for_approval,
     create_change_set,
     generate_cloudformation_args,
@@ -551,6 +555,52 @@ class TestProvider:
         )
         mock_get_events.assert_called_with("test", chronological=False)
 
+    def test_get_events(self, mocker: MockerFixture) -> None:
+        """Test get_events."""
+        mocker.patch.object(default, "GET_EVENTS_SLEEP", 0)
+        obj = Provider(MagicMock())
+        obj.cloudformation = MagicMock(
+            describe_stack_events=MagicMock(
+                side_effect=[
+                    {"StackEvents": [{"EventId": "2"}], "NextToken": "token"},
+                    {"StackEvents": [{"EventId": "1"}, {"EventId": "0"}]},
+                ]
+                * 2
+            )
+        )
+        assert [e["EventId"] for e in obj.get_events("test")] == ["0", "1", "2"]
+        obj.cloudformation.describe_stack_events.assert_called_with(
+            StackName="test", NextToken="token"
+        )
+        assert [e["EventId"] for e in obj.get_events("test", chronological=False)] == [
+            "2",
+            "1",
+            "0",
+        ]
+
+    def test_get_output_dict(self) -> None:
+        """Test get_output_dict."""
+        obj = Provider(get_session(region="us-east-1"))
+        stack = generate_describe_stacks_stack("test")
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "val"}]
+        assert obj.get_output_dict(stack) == {"Key": "val"}  # type: ignore
+        assert obj.output_cache.get("test") == {"Key": "val"}
+
+    def test_get_outputs(self, mocker: MockerFixture) -> None:
+        """Test get_outputs."""
+        session = get_session(region="us-east-1")
+        stack = generate_describe_stacks_stack("test")
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "val"}]
+        mock_get_stack = mocker.patch.object(Provider, "get_stack", return_value=stack)
+        obj = Provider(session)
+        assert obj.get_outputs("test") == {"Key": "val"}
+        # outputs are shared between providers of the same account and region
+        assert Provider(session).get_outputs("test") == {"Key": "val"}
+        mock_get_stack.assert_called_once_with("test")
+        obj._outputs["test"] = {"Key": "<inferred-change>"}
+        assert obj.get_outputs("test") == {"Key": "<inferred-change>"}
+        assert Provider(session).get_outputs("test") == {"Key": "val"}
+
     def test_get_rollback_status_reason(self, mocker: MockerFixture) -> None:
         """Test get_rollback_status_reason."""
         mock_get_event_by_resource_status = mocker.patch.object(
@@ -595,6 +645,251 @@ class TestProvider:
             is expected
         )
 
+    def test_poll_stack(self) -> None:
+        """Test poll_stack."""
+        cancel = threading.Event()
+        stack = generate_describe_stacks_stack("test")
+        obj = Provider(MagicMock())
+        obj.poller = MagicMock(wait=MagicMock(side_effect=[stack, None]))
+        assert obj.poll_stack("test", cancel) == stack
+        obj.poller.wait.assert_called_once_with("test", cancel)
+        with pytest.raises(exceptions.StackDoesNotExist):
+            obj.poll_stack("test", cancel)
+
+
+class TestStackEventTailer:
+    """Test StackEventTailer."""
+
+    @staticmethod
+    def event(event_id: str) -> Dict[str, Any]:
+        """Generate a stack event."""
+        return {"EventId": event_id, "StackName": "test"}
+
+    def test_read(self) -> None:
+        """Test _read only reads until a seen event is found."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stack_events.side_effect = [
+            {
+                "StackEvents": [self.event("2"), self.event("1")],
+                "NextToken": "token",
+            },
+            {"StackEvents": [self.event("0")]},
+            {
+                "StackEvents": [self.event("4"), self.event("2"), self.event("3")],
+                "NextToken": "token",
+            },
+        ]
+        obj = StackEventTailer(cloudformation)
+        record = default._TailedStack("test", MagicMock(), True, 5, 10)
+        with patch.object(default, "GET_EVENTS_SLEEP", 0):
+            assert [e["EventId"] for e in obj._read(record)] == ["0", "1", "2"]
+            assert [e["EventId"] for e in obj._read(record)] == ["3", "4"]
+        cloudformation.describe_stack_events.assert_called_with(StackName="test")
+        assert cloudformation.describe_stack_events.call_count == 3
+
+    def test_read_exclude_initial(self) -> None:
+        """Test _read only reads the first page when excluding initial events."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stack_events.side_effect = [
+            {"StackEvents": [self.event("1")], "NextToken": "token"},
+            {"StackEvents": [self.event("2"), self.event("1")]},
+        ]
+        obj = StackEventTailer(cloudformation)
+        record = default._TailedStack("test", MagicMock(), False, 5, 10)
+        assert not obj._read(record)
+        assert [e["EventId"] for e in obj._read(record)] == ["2"]
+        assert cloudformation.describe_stack_events.call_count == 2
+
+    def test_read_max_seen(self) -> None:
+        """Test the number of event IDs remembered is bounded."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stack_events.side_effect = [
+            {"StackEvents": [self.event(str(i)) for i in reversed(range(5))]},
+            {"StackEvents": [self.event("5"), self.event("4"), self.event("3")]},
+        ]
+        obj = StackEventTailer(cloudformation, max_seen=2)
+        record = default._TailedStack("test", MagicMock(), True, 5, obj.max_seen)
+        assert len(obj._read(record)) == 5
+        assert record.seen == {"3", "4"}
+        assert [e["EventId"] for e in obj._read(record)] == ["5"]
+        assert record.seen == {"4", "5"}
+        assert list(record.seen_order) == ["4", "5"]
+
+    def test_tail(self) -> None:
+        """Test tail shares a single thread between stacks."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stack_events.side_effect = lambda StackName: {
+            "StackEvents": [{"EventId": StackName, "StackName": StackName}]
+        }
+        obj = StackEventTailer(cloudformation)
+        cancel = threading.Event()
+        logged: List[str] = []
+        threads = [
+            threading.Thread(
+                target=obj.tail,
+                args=(name, cancel, lambda e: logged.append(e["EventId"])),
+            )
+            for name in ["stack0", "stack1"]
+        ]
+        for thread in threads:
+            thread.start()
+        while len(logged) < 2:
+            time.sleep(0.01)
+        assert sorted(logged) == ["stack0", "stack1"]
+        assert len([t for t in threading.enumerate() if t.name == "cfngin-tail"]) == 1
+        cancel.set()
+        for thread in threads:
+            thread.join(5)
+        assert not obj._stacks
+
+    def test_tail_error(self) -> None:
+        """Test tail raises errors from reading events."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stack_events.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "does not exist"}},
+            "DescribeStackEvents",
+        )
+        obj = StackEventTailer(cloudformation)
+        with pytest.raises(ClientError):
+            obj.tail("test", threading.Event(), MagicMock())
+        assert not obj._stacks
+
+
+class TestStackStatusPoller:
+    """Test StackStatusPoller."""
+
+    @staticmethod
+    def build_poller(cloudformation: MagicMock, **kwargs: Any) -> StackStatusPoller:
+        """Build a poller with short intervals."""
+        kwargs.setdefault("max_interval", 0.02)
+        kwargs.setdefault("min_interval", 0.01)
+        return StackStatusPoller(cloudformation, **kwargs)
+
+    def test_reset(self) -> None:
+        """Test reset lets the same status be returned for a new operation."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stacks.return_value = {
+            "Stacks": [
+                generate_describe_stacks_stack("test", stack_status="UPDATE_COMPLETE")
+            ]
+        }
+        obj = self.build_poller(cloudformation)
+        cancel = threading.Event()
+        obj.reset("test")  # not tracked yet
+        assert obj.wait("test", cancel)
+        obj.reset("test")
+        assert "test" not in obj._stacks
+        result = obj.wait("test", cancel)
+        assert result and result["StackStatus"] == "UPDATE_COMPLETE"
+        assert cloudformation.describe_stacks.call_count == 2
+
+    def test_wait(self) -> None:
+        """Test wait."""
+        statuses = iter(["CREATE_IN_PROGRESS", "CREATE_IN_PROGRESS", "CREATE_COMPLETE"])
+        cloudformation = MagicMock()
+        cloudformation.describe_stacks.side_effect = lambda **_: {
+            "Stacks": [
+                generate_describe_stacks_stack("test", stack_status=next(statuses))
+            ]
+        }
+        obj = self.build_poller(cloudformation)
+        cancel = threading.Event()
+        result = obj.wait("test", cancel)
+        assert result and result["StackStatus"] == "CREATE_IN_PROGRESS"
+        # unchanged status is not returned again
+        result = obj.wait("test", cancel)
+        assert result and result["StackStatus"] == "CREATE_COMPLETE"
+        assert cloudformation.describe_stacks.call_count == 3
+        cloudformation.describe_stacks.assert_called_with(StackName="test")
+        cloudformation.get_paginator.assert_not_called()
+
+    def test_wait_backoff(self) -> None:
+        """Test wait increases the interval while the status is unchanged."""
+        statuses = iter(["CREATE_IN_PROGRESS"] * 4 + ["CREATE_COMPLETE"])
+        cloudformation = MagicMock()
+        cloudformation.describe_stacks.side_effect = lambda **_: {
+            "Stacks": [
+                generate_describe_stacks_stack("test", stack_status=next(statuses))
+            ]
+        }
+        obj = self.build_poller(cloudformation, backoff=2, max_interval=0.03)
+        cancel = threading.Event()
+        obj.wait("test", cancel)
+        assert obj._stacks["test"].interval == 0.01
+        obj.wait("test", cancel)
+        # reset once the status changes
+        assert obj._stacks["test"].interval == 0.01
+        assert obj._stacks["test"].waiters == 0
+
+    def test_wait_cancel(self) -> None:
+        """Test wait returns when cancelled."""
+        cloudformation = MagicMock()
+        obj = self.build_poller(cloudformation, min_interval=60, max_interval=60)
+        cancel = threading.Event()
+        cancel.set()
+        assert not obj.wait("test", cancel)
+        cloudformation.describe_stacks.assert_not_called()
+
+    def test_wait_does_not_exist(self) -> None:
+        """Test wait stack does not exist."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stacks.side_effect = ClientError(
+            {
+                "Error": {
+                    "Code": "ValidationError",
+                    "Message": "Stack with id test does not exist",
+                }
+            },
+            "DescribeStacks",
+        )
+        obj = self.build_poller(cloudformation)
+        assert not obj.wait("test", threading.Event())
+        assert obj._stacks["test"].status == obj.DOES_NOT_EXIST
+
+    def test_wait_error(self) -> None:
+        """Test wait raises unexpected errors."""
+        cloudformation = MagicMock()
+        cloudformation.describe_stacks.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+            "DescribeStacks",
+        )
+        obj = self.build_poller(cloudformation)
+        with pytest.raises(ClientError):
+            obj.wait("test", threading.Event())
+        assert not obj._polling
+        assert obj._stacks["test"].refreshed_at == float("-inf")
+
+    def test_wait_sweep(self) -> None:
+        """Test stacks waited on concurrently are refreshed with a sweep."""
+        names = [f"stack{i}" for i in range(4)]
+        barrier = threading.Barrier(len(names))
+        cloudformation = MagicMock()
+        cloudformation.get_paginator.return_value.paginate.return_value = [
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(name)
+                    for name in names[:2] + ["other"]
+                ]
+            },
+            {"Stacks": [generate_describe_stacks_stack(names[2])]},
+        ]
+        obj = self.build_poller(cloudformation, min_interval=0.2, sweep_threshold=2)
+        results: Dict[str, Optional[StackTypeDef]] = {}
+
+        def wait(name: str) -> None:
+            barrier.wait()
+            results[name] = obj.wait(name, threading.Event())
+
+        threads = [threading.Thread(target=wait, args=(name,)) for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert all(results[name] for name in names[:3])
+        assert results[names[3]] is None
+        cloudformation.get_paginator.assert_called_once_with("describe_stacks")
+        cloudformation.describe_stacks.assert_not_called()
+
 
 class TestProviderDefaultMode(unittest.TestCase):
     """Tests for runway.cfngin.providers.aws.default default mode."""
@@ -708,6 +1003,67 @@ class TestProviderDefaultMode(unittest.TestCase):
 
         self.assertEqual(response["StackName"], stack_name)
 
+    def test_prefetch_stacks(self) -> None:
+        """Test prefetch_stacks."""
+        stack = generate_describe_stacks_stack("stack-a")
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "val"}]
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack], "NextToken": "1"}
+        )
+        self.stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(
+                        "stack-b", stack_status="DELETE_COMPLETE"
+                    ),
+                    generate_describe_stacks_stack("other"),
+                ]
+            },
+            {"NextToken": "1"},
+        )
+        self.stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack("stack-a")]},
+            {"StackName": "stack-a"},
+        )
+        with self.stubber:
+            assert (
+                self.provider.prefetch_stacks(["stack-a", "stack-b"], threshold=2) == 2
+            )
+            assert self.provider.get_stack("stack-a") is stack
+            with self.assertRaises(exceptions.StackDoesNotExist):
+                self.provider.get_stack("stack-b")
+            # only the first retrieval uses the prefetched description
+            assert self.provider.get_stack("stack-a") is not stack
+        self.stubber.assert_no_pending_responses()
+        assert self.provider.output_cache.get("stack-a") == {"Key": "val"}
+        assert self.provider.output_cache.get("other") == {}
+        assert self.provider.output_cache.swept
+
+    def test_prefetch_stacks_below_threshold(self) -> None:
+        """Test prefetch_stacks with fewer stacks than the threshold."""
+        with self.stubber:
+            assert not self.provider.prefetch_stacks(["stack-a"], threshold=2)
+        assert not self.provider.output_cache.swept
+
+    def test_prefetch_stacks_client_error(self) -> None:
+        """Test prefetch_stacks when stacks can't be described."""
+        self.stubber.add_client_error("describe_stacks", "AccessDenied")
+        with self.stubber:
+            assert not self.provider.prefetch_stacks(["stack-a"], threshold=1)
+        self.stubber.assert_no_pending_responses()
+        assert not self.provider._stack_snapshot
+
+    def test_clear_prefetched_stacks(self) -> None:
+        """Test clear_prefetched_stacks."""
+        self.stubber.add_response("describe_stacks", {"Stacks": []})
+        with self.stubber:
+            self.provider.prefetch_stacks(["stack-a"], threshold=1)
+        assert "stack-a" in self.provider._stack_snapshot
+        self.provider.clear_prefetched_stacks()
+        assert not self.provider._stack_snapshot
+
     def test_select_destroy_method(self) -> None:
         """Test select destroy method."""
         for i in [
@@ -994,6 +1350,126 @@ class TestProviderDefaultMode(unittest.TestCase):
             full_changeset=changes, params_diff=[], fqn=stack_name, answer="y"
         )
 
+    def test_get_deployed_stack_info(self) -> None:
+        """Test get_deployed_stack_info."""
+        stack_name = "MockStack"
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        )
+        self.stubber.add_response(
+            "get_template", generate_get_template("cfn_template.yaml")
+        )
+        self.stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(
+                        stack_name, stack_status="REVIEW_IN_PROGRESS"
+                    )
+                ]
+            },
+        )
+        self.stubber.add_client_error(
+            "describe_stacks",
+            service_message=f"Stack with id {stack_name} does not exist",
+        )
+        with self.stubber:
+            result = self.provider.get_deployed_stack_info(stack_name)
+            assert result
+            assert "Dummy" in json.loads(result[0])["Resources"]
+            assert not self.provider.get_deployed_stack_info(stack_name)
+            assert not self.provider.get_deployed_stack_info(stack_name)
+        self.stubber.assert_no_pending_responses()
+
+    @patch(
+        "runway.cfngin.providers.aws.default.format_template_diff",
+        return_value="template diff",
+    )
+    def test_get_stack_diff(self, mock_format_template_diff: MagicMock) -> None:
+        """Test get_stack_diff."""
+        stack_name = "MockStack"
+        mock_stack = generate_stack_object(
+            stack_name,
+            outputs={
+                "DummyId": {"Value": {"Ref": "Dummy"}},
+                "Other": {"Value": "other"},
+            },
+        )
+        old_template = {
+            "Resources": {
+                "Bucket": {"Type": "AWS::S3::Bucket"},
+                "Dummy": {"Type": "AWS::CloudFormation::WaitConditionHandle"},
+            },
+            "Outputs": {"DummyId": {"Value": {"Ref": "Dummy"}}},
+        }
+        new_template = copy.deepcopy(old_template)
+        new_template["Resources"]["Dummy"]["Properties"] = {"Name": "dummy"}
+        mock_stack.blueprint.rendered = json.dumps(new_template)
+        describe_stack = generate_describe_stacks_stack(stack_name)
+        describe_stack["Outputs"] = [
+            {"OutputKey": "DummyId", "OutputValue": "dummy-1234"},
+            {"OutputKey": "Other", "OutputValue": "other"},
+        ]
+        self.stubber.add_response("describe_stacks", {"Stacks": [describe_stack]})
+        with self.stubber:
+            result = self.provider.get_stack_diff(
+                mock_stack,
+                [{"ParameterKey": "Param1", "UsePreviousValue": True}],
+                (json.dumps(old_template), {"Param1": "value"}),
+            )
+        assert result == {
+            "DummyId": "<inferred-change: MockStack.DummyId={'Ref': 'Dummy'}>",
+            "Other": "other",
+        }
+        mock_format_template_diff.assert_called_once()
+        assert list(mock_format_template_diff.call_args.args[0]) == ["Resources"]
+
+    def test_get_stack_diff_no_changes(self) -> None:
+        """Test get_stack_diff without changes."""
+        mock_stack = generate_stack_object("MockStack")
+        mock_stack.blueprint.rendered = '{"Resources": {"A": {"Type": "B"}}}'
+        with self.assertRaises(exceptions.StackDidNotChange):
+            self.provider.get_stack_diff(
+                mock_stack,
+                [{"ParameterKey": "Param1", "ParameterValue": "value"}],
+                (
+                    "Resources:\n  A:\n    Type: B\n",
+                    {"Param1": "value"},
+                ),
+            )
+
+    def test_get_stack_diff_only_mappings(self) -> None:
+        """Test get_stack_diff when only Mappings changes."""
+        mock_stack = generate_stack_object("MockStack")
+        mock_stack.blueprint.rendered = (
+            '{"Mappings": {"Env": {"dev": {"Size": 2}}}, '
+            '"Resources": {"A": {"Type": "B"}}}'
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_describe_stacks_stack("MockStack")]}
+        )
+        with self.stubber:  # does not raise StackDidNotChange
+            self.provider.get_stack_diff(
+                mock_stack,
+                [],
+                (
+                    "Mappings:\n  Env:\n    dev:\n      Size: 1\n"
+                    "Resources:\n  A:\n    Type: B\n",
+                    {},
+                ),
+            )
+
+    def test_get_stack_diff_not_deployed(self) -> None:
+        """Test get_stack_diff for a stack that has not been deployed."""
+        mock_stack = generate_stack_object("MockStack")
+        mock_stack.blueprint.rendered = '{"Resources": {"A": {"Type": "B"}}}'
+        with self.stubber:  # does not call the API
+            result = self.provider.get_stack_diff(mock_stack, [], None)
+        assert result == {
+            "FakeOutput": "<inferred-change: MockStack.FakeOutput="
+            "{'Ref': 'FakeResource'}>"
+        }
+
     def test_tail_stack_retry_on_missing_stack(self) -> None:
         """Test tail stack retry on missing stack."""
         stack_name = "SlowToCreateStack"
@@ -181,6 +181,162 @@ class TestCFNgin:
             ]
         )
 
+    def test_deploy_concurrent(
+        self,
+        caplog: LogCaptureFixture,
+        cfngin_fixtures: Path,
+        mocker: MockerFixture,
+        tmp_path: Path,
+    ) -> None:
+        """Test deploy processing config files concurrently."""
+        caplog.set_level("ERROR", logger="runway.cfngin")
+        copy_basic_fixtures(cfngin_fixtures, tmp_path)
+        (tmp_path / "other.yml").write_text(
+            "namespace: other\nstacks:\n  other-stack:\n    template_path: t.yml\n"
+        )
+        mock_ensure_cfn_bucket = mocker.patch(
+            "runway.cfngin.actions.deploy.Action.ensure_cfn_bucket"
+        )
+        mock_run = mocker.patch(
+            "runway.cfngin.cfngin.DependencyGraph.run",
+            autospec=True,
+            return_value=(["basic.yml"], ["other.yml"]),
+        )
+        context = self.get_context()
+        context.env.max_concurrent_cfngin_configs = 2
+        context.env.vars["CI"] = "1"
+        cfngin = CFNgin(
+            ctx=context, parameters={"bucket_name": "bucket"}, sys_path=tmp_path
+        )
+        assert cfngin.max_concurrent_configs == 2
+
+        with pytest.raises(SystemExit) as excinfo:
+            cfngin.deploy(force=True)
+        assert excinfo.value.code == 1
+        mock_ensure_cfn_bucket.assert_called_once_with()
+        graph = mock_run.call_args.args[0]
+        assert graph.kind == "config file"
+        assert graph.names == ["basic.yml", "other.yml"]
+        assert mock_run.call_args.kwargs == {
+            "continue_on_error": False,
+            "max_workers": 2,
+        }
+        assert "failed config file(s): basic.yml" in caplog.messages
+        assert "skipped config file(s): other.yml" in caplog.messages
+
+    def test_destroy_concurrent(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test destroy processing dependent config files in reverse."""
+        (tmp_path / "a.yml").write_text(
+            "namespace: net\nstacks:\n  vpc:\n    template_path: t.yml\n"
+        )
+        (tmp_path / "b.yml").write_text(
+            "namespace: app\nstacks:\n  app:\n    template_path: t.yml\n"
+            "    variables:\n      VpcId: ${cfn net-vpc.VpcId}\n"
+        )
+        mocker.patch("runway.cfngin.actions.deploy.Action.ensure_cfn_bucket")
+        mock_run = mocker.patch(
+            "runway.cfngin.cfngin.DependencyGraph.run",
+            autospec=True,
+            return_value=([], []),
+        )
+        context = self.get_context()
+        context.env.max_concurrent_cfngin_configs = 2
+        context.env.vars["CI"] = "1"
+        cfngin = CFNgin(ctx=context, sys_path=tmp_path)
+
+        cfngin.deploy(force=True)
+        graph = mock_run.call_args.args[0]
+        assert graph.names == ["a.yml", "b.yml"]
+        assert graph.order == ["a.yml", "b.yml"]
+
+        cfngin.destroy(force=True)
+        graph = mock_run.call_args.args[0]
+        assert graph.names == ["b.yml", "a.yml"]
+        assert graph.dag.downstream("a.yml") == ["b.yml"]
+        assert graph.order == ["b.yml", "a.yml"]
+
+    @patch("runway.cfngin.actions.deploy.Action")
+    def test_deploy_ensure_cfn_bucket_once(
+        self,
+        mock_action: MagicMock,
+        cfngin_fixtures: Path,
+        tmp_path: Path,
+        patch_safehaven: MagicMock,  # pylint: disable=unused-argument
+    ) -> None:
+        """Test deploy only checking the CloudFormation bucket once."""
+        mock_instance = self.configure_mock_action_instance(mock_action)
+        mock_instance.bucket_name = "bucket"
+        copy_basic_fixtures(cfngin_fixtures, tmp_path)
+        copy_fixture(
+            src=cfngin_fixtures / "configs" / "basic.yml", dest=tmp_path / "basic2.yml"
+        )
+        cfngin = CFNgin(ctx=self.get_context(), sys_path=tmp_path)
+        cfngin.deploy()
+
+        mock_instance.ensure_cfn_bucket.assert_called_once_with()
+        assert mock_instance.execute.call_count == 2
+        mock_instance.execute.assert_called_with(
+            cfn_bucket_ensured=True, concurrency=0, tail=False
+        )
+        provider_builders = [
+            kwargs["provider_builder"] for _, kwargs in mock_action.call_args_list
+        ]
+        assert provider_builders[0] is provider_builders[1]
+
+    def test_get_config_dependencies(self, tmp_path: Path) -> None:
+        """Test _get_config_dependencies."""
+        configs = {
+            "vpc.yml": "namespace: net\nstacks:\n  vpc:\n    template_path: t.yml\n",
+            "app.yml": "namespace: app\nstacks:\n  app:\n    template_path: t.yml\n"
+            "    variables:\n      VpcId: ${cfn net-vpc.VpcId}\n",
+            "dns.yml": "namespace: dns\nstacks:\n  dns:\n    template_path: t.yml\n"
+            "    variables:\n      Id: ${xref net-vpc-dns::Id}\n"
+            "      Vpc: ${unknown net-vpc}\n",
+            "db.yml": "namespace: net\nstacks:\n  db:\n    template_path: t.yml\n",
+            "web.yml": "namespace: web\nstacks:\n  web:\n    template_path: t.yml\n"
+            "    variables:\n      Db: ${xref net-db::Endpoint}\n",
+        }
+        cfngin = CFNgin(ctx=self.get_context(), sys_path=tmp_path)
+        contexts = []
+        for name, content in configs.items():
+            (tmp_path / name).write_text(content)
+            contexts.append(cfngin.load(tmp_path / name))
+        assert cfngin._get_config_dependencies(contexts) == {
+            "vpc.yml": [],
+            "app.yml": ["vpc.yml"],
+            "dns.yml": [],
+            "db.yml": ["vpc.yml"],
+            "web.yml": ["db.yml"],
+        }
+
+    def test_get_referenced_stacks(self, tmp_path: Path) -> None:
+        """Test _get_referenced_stacks."""
+        (tmp_path / "app.yml").write_text(
+            "namespace: app\n"
+            "pre_deploy:\n"
+            "  - path: hooks.run\n"
+            "    args:\n"
+            "      vpc: ${cfn net-vpc.VpcId::region=us-west-2}\n"
+            "stacks:\n"
+            "  app:\n"
+            "    template_path: t.yml\n"
+            "    variables:\n"
+            "      Db: ${output db::Endpoint}\n"
+            "      Dns: ${rxref dns::Id}\n"
+            "      Subnets:\n"
+            "        - ${xref net-subnets::Public}\n"
+            "      Nested: ${cfn ${default stack::net-other}.Id}\n"
+            "      Text: prefix-${xref net-cache::Endpoint}\n"
+        )
+        cfngin = CFNgin(ctx=self.get_context(), sys_path=tmp_path)
+        assert cfngin._get_referenced_stacks(cfngin.load(tmp_path / "app.yml")) == {
+            "app-db",
+            "app-dns",
+            "net-cache",
+            "net-subnets",
+            "net-vpc",
+        }
+
     def test_load(self, cfngin_fixtures: Path, tmp_path: Path) -> None:
         """Test load."""
         copy_basic_fixtures(cfngin_fixtures, tmp_path)
@@ -1,7 +1,10 @@
 """Tests for runway.cfngin.dag."""
 # pyright: basic
+import copy
 import threading
-from typing import Any, List
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 import pytest
 
@@ -9,6 +12,7 @@ from runway.cfngin.dag import (
     DAG,
     DAGValidationError,
     ThreadedWalker,
+    ThreadPoolWalker,
     UnlimitedSemaphore,
 )
 
@@ -44,6 +48,57 @@ def test_add_edge(empty_dag: DAG) -> None:
     assert dag.graph == {"a": set("b"), "b": set()}
 
 
+@pytest.mark.parametrize(
+    "graph, edge, message",
+    [
+        ({"a": ["b"], "b": []}, ("b", "a"), "no independent nodes detected"),
+        ({"a": ["b"], "b": ["c"], "c": []}, ("c", "b"), "graph is not acyclic"),
+        ({"a": []}, ("a", "a"), "no independent nodes detected"),
+    ],
+)
+def test_add_edge_cycle(
+    edge: Tuple[str, str], empty_dag: DAG, graph: Dict[str, List[str]], message: str
+) -> None:
+    """Test add edge that would create a cycle."""
+    dag = empty_dag
+    dag.from_dict(graph)
+    expected = copy.deepcopy(dag.graph)
+    dag.topological_sort()  # cached reachability is used when available
+    with pytest.raises(DAGValidationError, match=f"^{message}$"):
+        dag.add_edge(*edge)
+    dag.invalidate()
+    with pytest.raises(DAGValidationError, match=f"^{message}$"):
+        dag.add_edge(*edge)
+    assert dag.graph == expected
+
+
+def test_cache_invalidated(empty_dag: DAG) -> None:
+    """Test cached information is updated when the graph changes."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": [], "c": []})
+    assert dag.topological_sort() == ["a", "c", "b"]
+    assert dag.all_downstreams("a") == ["b"]
+    dag.add_edge("b", "c")
+    assert dag.topological_sort() == ["a", "b", "c"]
+    assert dag.all_downstreams("a") == ["b", "c"]
+    dag.delete_edge("a", "b")
+    assert dag.all_downstreams("a") == []
+    dag.rename_edges("c", "d")
+    assert dag.all_downstreams("b") == ["d"]
+    dag.delete_node("d")
+    assert dag.topological_sort() == ["a", "b"]
+    dag.add_node("e")
+    assert dag.topological_sort() == ["a", "b", "e"]
+    dag.graph = OrderedDict([("x", {"y"}), ("y", set())])
+    assert dag.topological_sort() == ["x", "y"]
+    dag.graph["y"].add("z")
+    dag.graph["z"] = set()
+    dag.invalidate()
+    assert dag.all_downstreams("x") == ["y", "z"]
+    dag.topological_sort().clear()  # returns a copy of the cached order
+    assert dag.topological_sort() == ["x", "y", "z"]
+
+
 def test_from_dict(empty_dag: DAG) -> None:
     """Test from dict."""
     dag = empty_dag
@@ -104,6 +159,10 @@ def test_failed_validation(empty_dag: DAG) -> None:
 
     with pytest.raises(DAGValidationError):
         dag.from_dict({"a": ["b"], "b": ["a"]})
+    with pytest.raises(DAGValidationError, match="^graph is not acyclic$"):
+        dag.from_dict({"a": ["b"], "b": ["c"], "c": ["b"]})
+    with pytest.raises(KeyError):
+        dag.from_dict({"a": ["b"]})
 
 
 def test_downstream(basic_dag: DAG) -> None:
@@ -219,3 +278,91 @@ def test_threaded_walker(empty_dag: DAG) -> None:
 
     walker.walk(dag, walk_func)
     assert nodes in [["d", "c", "b", "a"], ["d", "b", "c", "a"]]
+
+
+def test_thread_pool_walker(empty_dag: DAG) -> None:
+    """Test ThreadPoolWalker."""
+    dag = empty_dag
+
+    walker = ThreadPoolWalker()
+
+    # b and c should be executed at the same time.
+    dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+
+    lock = threading.Lock()  # Protects nodes from concurrent access
+    nodes: List[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        with lock:
+            nodes.append(node)
+        return True
+
+    walker.walk(dag, walk_func)
+    assert nodes in [["d", "c", "b", "a"], ["d", "b", "c", "a"]]
+
+
+def test_thread_pool_walker_empty(empty_dag: DAG) -> None:
+    """Test ThreadPoolWalker with an empty graph."""
+    nodes: List[Any] = []
+    ThreadPoolWalker().walk(empty_dag, nodes.append)
+    assert not nodes
+
+
+def test_thread_pool_walker_exception(empty_dag: DAG) -> None:
+    """Test ThreadPoolWalker continues walking when walk_func raises."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": []})
+
+    nodes: List[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        nodes.append(node)
+        if node == "b":
+            raise ValueError("test")
+        return True
+
+    ThreadPoolWalker(1).walk(dag, walk_func)
+    assert nodes == ["b", "a"]
+
+
+def test_thread_pool_walker_max_workers(empty_dag: DAG) -> None:
+    """Test ThreadPoolWalker does not exceed max_workers."""
+    dag = empty_dag
+    dag.from_dict({str(i): [] for i in range(8)})
+
+    lock = threading.Lock()
+    running: List[int] = [0]
+    max_running: List[int] = [0]
+
+    def walk_func(_node: Any) -> bool:
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return True
+
+    ThreadPoolWalker(2).walk(dag, walk_func)
+    assert max_running[0] == 2
+
+
+def test_thread_pool_walker_max_workers_invalid() -> None:
+    """Test ThreadPoolWalker max_workers validation."""
+    with pytest.raises(ValueError):
+        ThreadPoolWalker(0)
+
+
+def test_thread_pool_walker_thread_name(empty_dag: DAG) -> None:
+    """Test ThreadPoolWalker names the worker thread after the node."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": []})
+
+    names: List[str] = []
+
+    def walk_func(_node: Any) -> bool:
+        names.append(threading.current_thread().name)
+        return True
+
+    ThreadPoolWalker().walk(dag, walk_func)
+    assert names == ["b", "a"]
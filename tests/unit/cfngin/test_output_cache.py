@@ -0,0 +1,158 @@
+"""Tests for runway.cfngin.output_cache."""
+# pylint: disable=no-self-use,protected-access
+# pyright: basic
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import boto3
+from botocore.stub import Stubber
+
+from runway.cfngin.output_cache import (
+    StackOutputCache,
+    clear_output_caches,
+    get_output_cache,
+)
+from runway.cfngin.session_cache import get_session
+
+if TYPE_CHECKING:
+    from mypy_boto3_cloudformation.client import CloudFormationClient
+    from pytest import LogCaptureFixture
+
+MODULE = "runway.cfngin.output_cache"
+
+
+def generate_stack(
+    name: str, status: str = "CREATE_COMPLETE", **outputs: str
+) -> Dict[str, Any]:
+    """Generate a stack returned by describe_stacks."""
+    return {
+        "CreationTime": "2021-01-01T00:00:00Z",
+        "Outputs": [{"OutputKey": k, "OutputValue": v} for k, v in outputs.items()],
+        "StackName": name,
+        "StackStatus": status,
+    }
+
+
+def setup_cfn_client() -> Tuple[CloudFormationClient, Stubber]:
+    """Create a CloudFormation client & Stubber."""
+    client = boto3.client("cloudformation", region_name="us-east-1")
+    return client, Stubber(client)
+
+
+def test_get_output_cache() -> None:
+    """Test get_output_cache."""
+    session = get_session(region="us-east-1", access_key="foo", secret_key="bar")
+    cache = get_output_cache(session)
+    assert isinstance(cache, StackOutputCache)
+    assert get_output_cache(session) is cache
+    assert (
+        get_output_cache(
+            get_session(region="us-west-2", access_key="foo", secret_key="bar")
+        )
+        is not cache
+    )
+    assert (
+        get_output_cache(
+            get_session(region="us-east-1", access_key="other", secret_key="bar")
+        )
+        is not cache
+    )
+    cache.set("test", {"Key": "val"})
+    clear_output_caches()
+    assert "test" not in cache  # still used by providers
+    assert get_output_cache(session) is not cache
+
+
+class TestStackOutputCache:
+    """Test StackOutputCache."""
+
+    def test_clear(self) -> None:
+        """Test clear."""
+        cache = StackOutputCache()
+        cache.set("test", {"Key": "val"})
+        cache.swept = True
+        cache.clear()
+        assert "test" not in cache
+        assert not cache.swept
+
+    def test_discard(self) -> None:
+        """Test discard."""
+        cache = StackOutputCache()
+        cache.set("test", {"Key": "val"})
+        cache.discard("test")
+        cache.discard("missing")
+        assert "test" not in cache
+
+    def test_get_outputs(self) -> None:
+        """Test get_outputs."""
+        client, stubber = setup_cfn_client()
+        cache = StackOutputCache()
+        stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_stack("test", Key="val")]},
+            {"StackName": "test"},
+        )
+        with stubber:
+            assert cache.get_outputs(client, "test") == {"Key": "val"}
+            assert cache.get_outputs(client, "test") == {"Key": "val"}
+        stubber.assert_no_pending_responses()
+        assert cache.stats == {"hits": 1, "misses": 1, "sweeps": 0}
+
+    def test_prefetch(self) -> None:
+        """Test prefetch."""
+        client, stubber = setup_cfn_client()
+        cache = StackOutputCache()
+        cache.set("cached", {})
+        stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_stack("stack0", Key="val")]}, {}
+        )
+        with stubber:
+            cache.prefetch(client, ["cached", "stack0"], threshold=2)
+            assert not cache.swept
+            cache.prefetch(client, ["stack0", "stack1"], threshold=2)
+            assert cache.swept
+            cache.prefetch(client, ["stack2", "stack3"], threshold=2)
+        stubber.assert_no_pending_responses()
+        assert cache.get("stack0") == {"Key": "val"}
+
+    def test_prefetch_error(self, caplog: LogCaptureFixture) -> None:
+        """Test prefetch ignores errors."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        client, stubber = setup_cfn_client()
+        cache = StackOutputCache()
+        stubber.add_client_error("describe_stacks", "AccessDenied")
+        with stubber:
+            cache.prefetch(client, ["stack0"], threshold=1)
+        assert not cache.swept
+        assert any(
+            msg.startswith("failed to cache the outputs of all stacks")
+            for msg in caplog.messages
+        )
+
+    def test_sweep(self) -> None:
+        """Test sweep."""
+        client, stubber = setup_cfn_client()
+        cache = StackOutputCache()
+        cache.set("stack1", {"Key": "new"})
+        pages: List[Dict[str, Any]] = [
+            {
+                "NextToken": "token",
+                "Stacks": [
+                    generate_stack("stack0", Key="val0"),
+                    generate_stack("deleted", "DELETE_COMPLETE", Key="val"),
+                ],
+            },
+            {"Stacks": [generate_stack("stack1", Key="old"), generate_stack("empty")]},
+        ]
+        stubber.add_response("describe_stacks", pages[0], {})
+        stubber.add_response("describe_stacks", pages[1], {"NextToken": "token"})
+        with stubber:
+            assert cache.sweep(client) == 3
+        stubber.assert_no_pending_responses()
+        assert cache.get("stack0") == {"Key": "val0"}
+        assert cache.get("stack1") == {"Key": "new"}
+        assert cache.get("empty") == {}
+        assert "deleted" not in cache
+        assert cache.stats["sweeps"] == 1
@@ -0,0 +1,211 @@
+"""Tests for runway.cfngin.session_cache."""
+# pylint: disable=no-self-use,protected-access,redefined-outer-name
+# pyright: basic
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, List, cast
+
+import pytest
+from botocore.config import Config
+from mock import MagicMock
+
+from runway.cfngin.session_cache import (
+    SESSION_POOL,
+    PooledSession,
+    SessionPool,
+    get_session,
+)
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.cfngin.session_cache"
+
+
+@pytest.fixture(scope="function")
+def mock_sso_botocore_session(mocker: MockerFixture) -> MagicMock:
+    """Mock runway.aws_sso_botocore.session.Session."""
+    return mocker.patch(f"{MODULE}.Session")
+
+
+def test_get_session(mocker: MockerFixture) -> None:
+    """Test get_session."""
+    mock_get_session = mocker.patch.object(SESSION_POOL, "get_session")
+    assert (
+        get_session("us-east-1", "profile", "key", "secret", "token")
+        == mock_get_session.return_value
+    )
+    mock_get_session.assert_called_once_with(
+        region="us-east-1",
+        profile="profile",
+        access_key="key",
+        secret_key="secret",
+        session_token="token",
+    )
+
+
+class TestPooledSession:
+    """Test PooledSession."""
+
+    def test_client(self) -> None:
+        """Test client."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        client = session.client("s3")
+        assert session.client("s3") is client
+        assert session.client("s3", region_name="us-west-2") is not client
+        assert session.client("sts") is not client
+        assert pool.stats["client_hits"] == 1
+        assert pool.stats["client_misses"] == 3
+
+    def test_client_not_cacheable(self) -> None:
+        """Test client with arguments that can't be part of a key."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        config = Config(retries={"max_attempts": 10})
+        assert session.client("s3", config=config) is not session.client(
+            "s3", config=config
+        )
+        assert session.client("s3", "us-east-1") is not session.client(
+            "s3", "us-east-1"
+        )
+        assert not pool.stats["client_hits"]
+        assert not pool.stats["client_misses"]
+
+    def test_client_not_cacheable_locked(self, mocker: MockerFixture) -> None:
+        """Test clients that are not reused are created while holding the lock."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        locked: List[bool] = []
+
+        def client(*_: Any, **__: Any) -> MagicMock:
+            thread = threading.Thread(
+                target=lambda: locked.append(not pool.lock.acquire(blocking=False))
+            )
+            thread.start()
+            thread.join()
+            return MagicMock()
+
+        mocker.patch("boto3.Session.client", side_effect=client)
+        mocker.patch("boto3.Session.resource", side_effect=client)
+        session.client("s3", config=Config(retries={"max_attempts": 10}))
+        session.resource("s3", config=Config(retries={"max_attempts": 10}))
+        assert locked == [True, True]
+
+    def test_client_threads(self) -> None:
+        """Test client creates a single client when called concurrently."""
+        session = SessionPool().get_session(region="us-east-1")
+        barrier = threading.Barrier(8)
+        clients: List[Any] = []
+
+        def get_client() -> None:
+            barrier.wait()
+            clients.append(session.client("s3"))
+
+        threads = [threading.Thread(target=get_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(client) for client in clients}) == 1
+
+
+class TestSessionPool:
+    """Test SessionPool."""
+
+    def test_clear(self) -> None:
+        """Test clear."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        pool.clear()
+        assert pool.stats == {
+            "client_hits": 0,
+            "client_misses": 0,
+            "expired": 0,
+            "hits": 0,
+            "misses": 0,
+        }
+        assert pool.get_session(region="us-east-1") is not session
+
+    def test_get_session(self, mock_sso_botocore_session: MagicMock) -> None:
+        """Test get_session."""
+        pool = SessionPool()
+        session = pool.get_session(
+            region="us-east-1",
+            access_key="foo",
+            secret_key="bar",
+            session_token="foobar",
+        )
+        assert isinstance(session, PooledSession)
+        assert session._session is mock_sso_botocore_session.return_value
+        mock_sso_botocore_session.return_value.set_credentials.assert_called_once_with(
+            "foo", "bar", "foobar"
+        )
+        cred_provider = cast(
+            MagicMock, session._session.get_component.return_value  # type: ignore
+        )
+        cred_provider.get_provider.assert_called_once_with("assume-role")
+        assert cred_provider.get_provider.return_value.cache == {}
+        assert pool.stats["misses"] == 1
+
+    def test_get_session_api_stats(self, mocker: MockerFixture) -> None:
+        """Test get_session registers handlers to count AWS API calls."""
+        mock_register = mocker.patch(f"{MODULE}._api_stats.register")
+        session = SessionPool().get_session(region="us-east-1")
+        mock_register.assert_called_once_with(session)
+
+    def test_get_session_rate_limiter(self, mocker: MockerFixture) -> None:
+        """Test get_session registers handlers to limit the rate of AWS API calls."""
+        mock_register = mocker.patch(f"{MODULE}._rate_limiter.register")
+        session = SessionPool().get_session(region="us-east-1")
+        mock_register.assert_called_once_with(session)
+
+    def test_get_session_key(self, monkeypatch: MonkeyPatch) -> None:
+        """Test get_session reuses sessions with the same key."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        assert pool.get_session(region="us-east-1") is session
+        assert pool.get_session(region="us-west-2") is not session
+        assert pool.get_session(region="us-east-1", access_key="foo") is not session
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "changed")
+        assert pool.get_session(region="us-east-1") is not session
+        assert pool.stats["hits"] == 1
+        assert pool.stats["misses"] == 4
+
+    def test_get_session_key_region_env(self, monkeypatch: MonkeyPatch) -> None:
+        """Test get_session without a region uses the region of the environment."""
+        monkeypatch.delenv("AWS_REGION", raising=False)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        pool = SessionPool()
+        session = pool.get_session()
+        assert pool.get_session() is session
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
+        assert pool.get_session() is not session
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        assert pool.get_session() is not session
+        assert pool.get_session(region="us-east-1") is not session
+
+    def test_get_session_expired_credentials(self, mocker: MockerFixture) -> None:
+        """Test get_session replaces sessions with expired credentials."""
+        pool = SessionPool()
+        session = pool.get_session(region="us-east-1")
+        credentials = mocker.patch.object(session._session, "_credentials")
+        credentials._seconds_remaining.return_value = 60
+        assert pool.get_session(region="us-east-1") is session
+        credentials._seconds_remaining.return_value = 0
+        assert pool.get_session(region="us-east-1") is not session
+        assert pool.stats["expired"] == 1
+
+    def test_get_session_ttl(self, mocker: MockerFixture) -> None:
+        """Test get_session replaces sessions older than the ttl."""
+        mock_monotonic = mocker.patch(f"{MODULE}.time.monotonic", return_value=0)
+        pool = SessionPool(ttl=10)
+        session = pool.get_session(region="us-east-1")
+        mock_monotonic.return_value = 10
+        assert pool.get_session(region="us-east-1") is session
+        mock_monotonic.return_value = 11
+        assert pool.get_session(region="us-east-1") is not session
+        assert pool.stats["expired"] == 1
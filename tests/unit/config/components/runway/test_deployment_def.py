@@ -18,6 +18,29 @@ from runway.config.models.runway import (
 class TestRunwayDeploymentDefinition:
     """Test runway.config.components.runway._deployment_dev.RunwayDeploymentDefinition."""
 
+    def test_lookups(self) -> None:
+        """Test lookups includes lookups of modules and child modules."""
+        obj = RunwayDeploymentDefinition.parse_obj(
+            {
+                "env_vars": {"key": "${ssm /deployment}"},
+                "modules": [
+                    {
+                        "name": "parent",
+                        "parallel": [
+                            {"path": "./", "parameters": {"key": "${ssm /child}"}}
+                        ],
+                    },
+                    {"path": "./", "parameters": {"key": "${ssm /module}"}},
+                ],
+                "regions": ["us-east-1"],
+            }
+        )
+        assert [lookup.lookup_query.value for lookup in obj.lookups] == [
+            "/deployment",
+            "/child",
+            "/module",
+        ]
+
     @pytest.mark.parametrize(
         "data, expected",
         [
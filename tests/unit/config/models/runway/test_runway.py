@@ -2,7 +2,7 @@
 # pylint: disable=no-self-use,too-few-public-methods
 # pyright: basic
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import pytest
 import yaml
@@ -107,6 +107,45 @@ class TestRunwayConfigDefinitionModel:
         assert obj["deployments"][0]["name"] == "deployment_1"
         assert obj["deployments"][1]["name"] == "test-name"
 
+    @pytest.mark.parametrize(
+        "depends_on, expected",
+        [
+            ([], None),
+            (["first"], None),
+            (["second"], "deployment second can't depend on itself"),
+            (["missing"], "deployment second depends on missing which is not defined"),
+            (
+                ["duplicate"],
+                "deployment second depends on duplicate which is defined more than once",
+            ),
+        ],
+    )
+    def test_validate_deployment_depends_on(
+        self, depends_on: List[str], expected: Optional[str]
+    ) -> None:
+        """Test _validate_deployment_depends_on."""
+        data = {
+            "deployments": [
+                {"name": name, "modules": ["sampleapp.cfn"], "regions": ["us-east-1"]}
+                for name in ["first", "duplicate", "duplicate"]
+            ]
+            + [
+                {
+                    "name": "second",
+                    "depends_on": depends_on,
+                    "modules": ["sampleapp.cfn"],
+                    "regions": ["us-east-1"],
+                }
+            ]
+        }
+        if not expected:
+            obj = RunwayConfigDefinitionModel.parse_obj(data)
+            assert obj.deployments[3].depends_on == depends_on
+            return
+        with pytest.raises(ValidationError) as excinfo:
+            RunwayConfigDefinitionModel.parse_obj(data)
+        assert excinfo.value.errors()[0]["msg"] == expected
+
     def test_convert_runway_version(self) -> None:
         """Test _convert_runway_version."""
         assert RunwayConfigDefinitionModel(  # handle string
@@ -195,6 +234,7 @@ class TestRunwayDeploymentDefinitionModel:
         assert obj.account_alias is None
         assert obj.account_id is None
         assert isinstance(obj.assume_role, RunwayAssumeRoleDefinitionModel)
+        assert obj.depends_on == []
         assert obj.env_vars == {}
         assert obj.environments == {}
         assert obj.modules == []
@@ -231,6 +271,32 @@ class TestRunwayDeploymentDefinitionModel:
         obj = RunwayDeploymentDefinitionModel.parse_obj(data)
         assert obj[field] == data[field]
 
+    def test_validate_module_depends_on(self) -> None:
+        """Test _validate_module_depends_on."""
+        obj = RunwayDeploymentDefinitionModel.parse_obj(
+            {
+                "modules": [
+                    {"name": "app", "path": "app.cfn", "depends_on": ["vpc"]},
+                    {"name": "vpc", "path": "vpc.cfn"},
+                ],
+                "regions": ["us-east-1"],
+            }
+        )
+        assert obj.modules[0].depends_on == ["vpc"]
+        with pytest.raises(ValidationError) as excinfo:
+            RunwayDeploymentDefinitionModel.parse_obj(
+                {
+                    "modules": [
+                        {"name": "app", "path": "app.cfn", "depends_on": ["db"]}
+                    ],
+                    "regions": ["us-east-1"],
+                }
+            )
+        assert (
+            excinfo.value.errors()[0]["msg"]
+            == "module app depends on db which is not defined"
+        )
+
     def test_validate_regions(self) -> None:
         """Test _validate_regions."""
         with pytest.raises(ValidationError):
@@ -315,6 +381,10 @@ class TestRunwayFutureDefinitionModel:
         assert errors[0]["loc"] == ("invalid",)
         assert errors[0]["msg"] == "extra fields not permitted"
 
+    def test_field_defaults(self) -> None:
+        """Test field defaults."""
+        assert RunwayFutureDefinitionModel().dependency_graph is False
+
 
 class TestRunwayModuleDefinitionModel:
     """Test runway.config.models.runway.RunwayModuleDefinitionModel."""
@@ -332,6 +402,7 @@ class TestRunwayModuleDefinitionModel:
         """Test field defaults."""
         obj = RunwayModuleDefinitionModel()
         assert not obj.class_path
+        assert obj.depends_on == []
         assert obj.environments == {}
         assert obj.env_vars == {}
         assert obj.name == "undefined"
@@ -10,8 +10,12 @@ from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, cast
 import pytest
 import yaml
 
+from runway._rate_limiter import RATE_LIMITER
+from runway.cfngin.output_cache import clear_output_caches
+from runway.cfngin.session_cache import SESSION_POOL
 from runway.config import RunwayConfig
 from runway.core.components import DeployEnvironment
+from runway.lookups.handlers.ssm import SsmLookup
 
 from .factories import (
     MockCFNginContext,
@@ -36,7 +40,7 @@ TEST_ROOT = Path(os.path.dirname(os.path.realpath(__file__)))
 # pylint: disable=unused-argument
 def pytest_ignore_collect(path: Any, config: Config) -> bool:
     """Determine if this directory should have its tests collected."""
-    if config.option.functional:
+    if config.option.benchmark or config.option.functional:
         return True
     return cast(bool, config.option.integration_only)
 
@@ -72,6 +76,20 @@ def aws_credentials() -> Iterator[None]:
     saved_env.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Iterator[None]:
+    """Prevent process-wide caches (e.g. stubbed clients) leaking between tests."""
+    RATE_LIMITER.clear()
+    SESSION_POOL.clear()
+    SsmLookup.clear_cache()
+    clear_output_caches()
+    yield
+    RATE_LIMITER.clear()
+    SESSION_POOL.clear()
+    SsmLookup.clear_cache()
+    clear_output_caches()
+
+
 @pytest.fixture(scope="package")
 def fixture_dir() -> str:
     """Path to the fixture directory."""
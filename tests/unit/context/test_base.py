@@ -3,12 +3,9 @@
 # pyright: basic
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
-
-import boto3
-import pytest
-from mock import MagicMock
+from typing import TYPE_CHECKING
 
+from runway.cfngin.session_cache import SESSION_POOL
 from runway.context._base import BaseContext
 from runway.context.sys_info import SystemInfo
 from runway.core.components import DeployEnvironment
@@ -16,8 +13,6 @@ from runway.core.components import DeployEnvironment
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
-MODULE = "runway.context._base"
-
 TEST_BOTO3_CREDS = {
     "aws_access_key_id": "foo",
     "aws_secret_access_key": "bar",
@@ -30,20 +25,6 @@ TEST_ENV_CREDS = {
 }
 
 
-@pytest.fixture(scope="function")
-def mock_boto3_session(mocker: MockerFixture) -> MagicMock:
-    """Mock boto3.Session."""
-    mock_session = MagicMock(autospec=boto3.Session)
-    mocker.patch(f"{MODULE}.boto3", Session=mock_session)
-    return mock_session
-
-
-@pytest.fixture(scope="function")
-def mock_sso_botocore_session(mocker: MockerFixture) -> MagicMock:
-    """Mock runway.aws_sso_botocore.session.Session."""
-    return mocker.patch(f"{MODULE}.Session")
-
-
 class TestBaseContext:
     """Test runway.context._base.BaseContext."""
 
@@ -92,74 +73,40 @@ class TestBaseContext:
         mocker.patch.object(self.env, "ci", True)
         assert ctx.is_noninteractive
 
-    def test_get_session(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
+    def test_get_session(self, mocker: MockerFixture) -> None:
         """Test get_session."""
+        mock_get_session = mocker.patch.object(SESSION_POOL, "get_session")
         ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session() == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name=None,
-        )
-        mock_boto3_session.return_value._session.get_component.assert_called_once_with(
-            "credential_provider"
+        assert ctx.get_session() == mock_get_session.return_value
+        mock_get_session.assert_called_once_with(
+            region=None,
+            profile=None,
+            access_key=None,
+            secret_key=None,
+            session_token=None,
         )
-        cred_provider = cast(
-            MagicMock,
-            mock_boto3_session.return_value._session.get_component.return_value,
-        )
-        cred_provider.get_provider.assert_called_once_with("assume-role")
-        provider = cast(MagicMock, cred_provider.get_provider.return_value)
-        assert provider.cache == {}
 
-    def test_get_session_with_creds(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
-        """Test get_session with credentials."""
+    def test_get_session_pooled(self) -> None:
+        """Test get_session reuses sessions."""
         ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(**TEST_BOTO3_CREDS) == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=TEST_BOTO3_CREDS["aws_access_key_id"],
-            aws_secret_access_key=TEST_BOTO3_CREDS["aws_secret_access_key"],
-            aws_session_token=TEST_BOTO3_CREDS["aws_session_token"],
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name=None,
-        )
+        session = ctx.get_session(region="us-east-2")
+        assert ctx.get_session(region="us-east-2") is session
+        assert ctx.get_session(region="us-west-2") is not session
 
-    def test_get_session_with_profile(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
-        """Test get_session with profile."""
+    def test_get_session_with_creds(self, mocker: MockerFixture) -> None:
+        """Test get_session with credentials."""
+        mock_get_session = mocker.patch.object(SESSION_POOL, "get_session")
         ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(profile="something") == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name="something",
+        assert (
+            ctx.get_session(profile="something", region="us-east-2", **TEST_BOTO3_CREDS)
+            == mock_get_session.return_value
         )
-
-    def test_get_session_with_region(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
-        """Test get_session with region."""
-        ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(region="us-east-2") == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name="us-east-2",
-            profile_name=None,
+        mock_get_session.assert_called_once_with(
+            region="us-east-2",
+            profile="something",
+            access_key=TEST_BOTO3_CREDS["aws_access_key_id"],
+            secret_key=TEST_BOTO3_CREDS["aws_secret_access_key"],
+            session_token=TEST_BOTO3_CREDS["aws_session_token"],
         )
 
     def test_sys_info(self) -> None:
@@ -27,12 +27,16 @@ class TestRunwayContext:
         """Test copy."""
         mocker.patch.object(RunwayContext, "_inject_profile_credentials")
         mock_copy = mocker.patch.object(self.env, "copy", return_value="new")
-        obj = RunwayContext(command="test", deploy_environment=self.env)
+        worker_pool = MagicMock()
+        obj = RunwayContext(
+            command="test", deploy_environment=self.env, worker_pool=worker_pool
+        )
         obj_copy = obj.copy()
 
         assert obj_copy != obj
         assert obj_copy.command == obj_copy.command
         assert obj_copy.env == "new"
+        assert obj_copy.worker_pool is worker_pool
         mock_copy.assert_called_once_with()
 
     def test_echo_detected_environment(self, mocker: MockerFixture) -> None:
@@ -0,0 +1,116 @@
+"""Test runway.core.components._dependency_graph."""
+# pylint: disable=no-self-use
+# pyright: basic
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING, Dict, List
+
+import pytest
+
+from runway.cfngin.dag import DAGValidationError
+from runway.core.components._dependency_graph import DependencyGraph
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import LogCaptureFixture
+
+DEFINITIONS: Dict[str, List[str]] = {
+    "app": ["database", "vpc"],
+    "vpc": [],
+    "database": ["vpc"],
+    "dns": [],
+}
+
+
+class TestDependencyGraph:
+    """Test DependencyGraph."""
+
+    def test___init__(self) -> None:
+        """Test __init__."""
+        obj = DependencyGraph(DEFINITIONS.items())
+        assert obj.names == ["app", "vpc", "database", "dns"]
+        assert sorted(obj.dag.downstream("app")) == ["database", "vpc"]
+        assert obj.dag.downstream("vpc") == []
+
+    def test___init__cycle(self) -> None:
+        """Test __init__ with circular dependencies."""
+        with pytest.raises(DAGValidationError):
+            DependencyGraph([("a", ["b"]), ("b", ["c"]), ("c", ["b"])])
+
+    def test___init__duplicate(self) -> None:
+        """Test __init__ with duplicate names."""
+        with pytest.raises(ValueError) as excinfo:
+            DependencyGraph([("a", []), ("a", [])], kind="module")
+        assert str(excinfo.value).startswith("module a is defined more than once")
+
+    def test___init__missing_dependency(self) -> None:
+        """Test __init__ with a dependency that is not in the graph."""
+        assert DependencyGraph([("a", ["missing"])]).dag.downstream("a") == []
+
+    def test_order(self) -> None:
+        """Test order."""
+        assert DependencyGraph(DEFINITIONS.items()).order == [
+            "vpc",
+            "database",
+            "app",
+            "dns",
+        ]
+
+    def test_order_reverse(self) -> None:
+        """Test order with reverse dependencies."""
+        assert DependencyGraph(
+            reversed(list(DEFINITIONS.items())), reverse=True
+        ).order == ["dns", "app", "database", "vpc"]
+
+    def test_run(self, tmp_path: Path) -> None:
+        """Test run."""
+
+        def func(name: str) -> None:
+            time.sleep(0.05 if name == "vpc" else 0)
+            (tmp_path / name).write_text(str(time.time()))
+
+        obj = DependencyGraph(DEFINITIONS.items())
+        assert obj.run(func, max_workers=4) == ([], [])
+        finished = {name: float((tmp_path / name).read_text()) for name in DEFINITIONS}
+        assert finished["vpc"] < finished["database"] < finished["app"]
+        assert finished["dns"] < finished["vpc"]  # did not wait on vpc
+
+    def test_run_continue_on_error(
+        self, caplog: LogCaptureFixture, tmp_path: Path
+    ) -> None:
+        """Test run with continue_on_error."""
+        caplog.set_level(logging.WARNING, logger="runway")
+
+        def func(name: str) -> None:
+            if name == "database":
+                sys.exit(1)
+            (tmp_path / name).touch()
+
+        obj = DependencyGraph(DEFINITIONS.items())
+        assert obj.run(func, continue_on_error=True) == (["database"], ["app"])
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["dns", "vpc"]
+        assert "app:skipped; a dependency failed" in caplog.messages
+
+    def test_run_fail_fast(self, caplog: LogCaptureFixture, tmp_path: Path) -> None:
+        """Test run stops starting processes after a failure."""
+        caplog.set_level(logging.WARNING, logger="runway")
+
+        def func(name: str) -> None:
+            if name == "vpc":
+                raise ValueError("failed")
+            (tmp_path / name).touch()
+
+        obj = DependencyGraph(DEFINITIONS.items(), log_prefix="test")
+        assert obj.run(func) == (["vpc"], ["database", "app", "dns"])
+        assert not list(tmp_path.iterdir())
+        assert "test.dns:skipped; another deployment failed" in caplog.messages
+
+    def test_run_max_workers_invalid(self) -> None:
+        """Test run with an invalid max_workers."""
+        with pytest.raises(ValueError) as excinfo:
+            DependencyGraph(DEFINITIONS.items()).run(print, max_workers=0)
+        assert str(excinfo.value) == "max_workers must be greater than 0"
@@ -201,6 +201,85 @@ class TestDeployEnvironment:
         assert obj.max_concurrent_cfngin_stacks == 5
         assert obj.vars["RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS"] == "5"
 
+    def test_max_concurrent_cfngin_hooks(self) -> None:
+        """Test max_concurrent_cfngin_hooks."""
+        obj = DeployEnvironment(environ={})
+        assert obj.max_concurrent_cfngin_hooks == 1
+        obj.max_concurrent_cfngin_hooks = 4
+        assert obj.max_concurrent_cfngin_hooks == 4
+        assert obj.vars["RUNWAY_MAX_CONCURRENT_CFNGIN_HOOKS"] == "4"
+
+    def test_max_concurrent_lookups(self) -> None:
+        """Test max_concurrent_lookups."""
+        obj = DeployEnvironment(environ={})
+        assert obj.max_concurrent_lookups == 10
+        obj.max_concurrent_lookups = 1
+        assert obj.max_concurrent_lookups == 1
+        assert obj.vars["RUNWAY_MAX_CONCURRENT_LOOKUPS"] == "1"
+
+    def test_max_concurrent_cfngin_configs(self) -> None:
+        """Test max_concurrent_cfngin_configs."""
+        obj = DeployEnvironment(environ={})
+        assert obj.max_concurrent_cfngin_configs == 1
+        obj.max_concurrent_cfngin_configs = 4
+        assert obj.max_concurrent_cfngin_configs == 4
+        assert obj.vars["RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS"] == "4"
+
+    def test_cfngin_diff_change_set_stacks(self) -> None:
+        """Test cfngin_diff_change_set_stacks."""
+        obj = DeployEnvironment(environ={})
+        assert obj.cfngin_diff_change_set_stacks == []
+        obj.cfngin_diff_change_set_stacks = ["stack0", "stack1"]
+        assert obj.vars["RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS"] == "stack0,stack1"
+        assert DeployEnvironment(
+            environ={"RUNWAY_CFNGIN_DIFF_CHANGE_SET_STACKS": " stack0, ,stack1 "}
+        ).cfngin_diff_change_set_stacks == ["stack0", "stack1"]
+
+    def test_cfngin_fast_diff(self) -> None:
+        """Test cfngin_fast_diff."""
+        obj = DeployEnvironment(environ={})
+        assert obj.cfngin_fast_diff is False
+        obj.cfngin_fast_diff = True
+        assert obj.cfngin_fast_diff is True
+        assert obj.vars["RUNWAY_CFNGIN_FAST_DIFF"] == "true"
+
+    def test_cfngin_render_cache(self) -> None:
+        """Test cfngin_render_cache."""
+        obj = DeployEnvironment(environ={})
+        assert obj.cfngin_render_cache is False
+        obj.cfngin_render_cache = True
+        assert obj.cfngin_render_cache is True
+        assert obj.vars["RUNWAY_CFNGIN_RENDER_CACHE"] == "true"
+        assert DeployEnvironment(
+            environ={"RUNWAY_CFNGIN_RENDER_CACHE": "1"}
+        ).cfngin_render_cache
+
+    def test_continue_on_error(self) -> None:
+        """Test continue_on_error."""
+        obj = DeployEnvironment(environ={})
+        assert obj.continue_on_error is False
+        obj.continue_on_error = True
+        assert obj.continue_on_error is True
+        assert obj.vars["RUNWAY_CONTINUE_ON_ERROR"] == "true"
+        assert DeployEnvironment(
+            environ={"RUNWAY_CONTINUE_ON_ERROR": "1"}
+        ).continue_on_error
+
+    def test_max_concurrent_deployments(self, mocker: MockerFixture) -> None:
+        """Test max_concurrent_deployments."""
+        mock_cpu_count = MagicMock(return_value=4)
+        mocker.patch(f"{MODULE}.os.cpu_count", mock_cpu_count)
+        obj = DeployEnvironment(environ={})
+
+        assert obj.max_concurrent_deployments == 4
+
+        mock_cpu_count.return_value = 62
+        assert obj.max_concurrent_deployments == 61
+
+        obj.max_concurrent_deployments = 12
+        assert obj.max_concurrent_deployments == 12
+        assert obj.vars["RUNWAY_MAX_CONCURRENT_DEPLOYMENTS"] == "12"
+
     def test_max_concurrent_modules(self, mocker: MockerFixture) -> None:
         """Test max_concurrent_modules."""
         mock_cpu_count = MagicMock(return_value=4)
@@ -9,12 +9,14 @@ from typing import TYPE_CHECKING, Any, Dict, List, cast
 import pytest
 from mock import ANY, MagicMock, PropertyMock, call
 
+from runway._logging import PrefixFilter
 from runway.config.components.runway import (
     RunwayDeploymentDefinition,
     RunwayVariablesDefinition,
 )
 from runway.config.models.runway import RunwayFutureDefinitionModel
 from runway.core.components import Deployment
+from runway.core.components._dependency_graph import DependencyGraph
 from runway.exceptions import UnresolvedVariable
 from runway.variables import Variable
 
@@ -226,8 +228,8 @@ class TestDeployment:
         )
         assert not obj.deploy()
         assert (
-            "unnamed_deployment:processing regions in parallel... (output will be interwoven)"
-            in caplog.messages
+            "unnamed_deployment:processing regions in parallel... "
+            "(output will be prefixed with the region)" in caplog.messages
         )
         mock_mp_context.assert_called_once_with("fork")
         mock_futures.ProcessPoolExecutor.assert_called_once_with(
@@ -235,10 +237,39 @@ class TestDeployment:
             mp_context=mock_mp_context.return_value,
         )
         executor.submit.assert_has_calls(
-            [call(obj.run, "deploy", "us-east-1"), call(obj.run, "deploy", "us-west-2")]
+            [
+                call(PrefixFilter.call, "us-east-1", obj.run, "deploy", "us-east-1"),
+                call(PrefixFilter.call, "us-west-2", obj.run, "deploy", "us-west-2"),
+            ]
         )
         assert executor.submit.return_value.result.call_count == 2
 
+    def test_deploy_async_worker_pool(
+        self,
+        caplog: LogCaptureFixture,
+        fx_deployments: YamlLoaderDeployment,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test deploy async using the worker pool."""
+        caplog.set_level(logging.INFO, logger="runway")
+        mock_futures = mocker.patch(f"{MODULE}.concurrent.futures")
+        mocker.patch.object(Deployment, "use_async", True)
+        runway_context.worker_pool = MagicMock(available=True)
+
+        obj = Deployment(
+            context=runway_context,
+            definition=fx_deployments.load("simple_parallel_regions"),
+        )
+        assert not obj.deploy()
+        assert "unnamed_deployment:processing regions in parallel..." in caplog.messages
+        mock_futures.ProcessPoolExecutor.assert_not_called()
+        runway_context.worker_pool.map.assert_called_once_with(
+            obj.run,
+            [("deploy", "us-east-1"), ("deploy", "us-west-2")],
+            max_concurrent=runway_context.env.max_concurrent_regions,
+        )
+
     def test_deploy_sync(
         self,
         caplog: LogCaptureFixture,
@@ -462,13 +493,19 @@ class TestDeployment:
     ) -> None:
         """Test run_list."""
         dep0 = MagicMock()
+        dep0.lookups = ["lookup0"]
         dep0.modules = ["module"]
         dep1 = MagicMock()
+        dep1.lookups = ["lookup1"]
         dep1.modules = []
         deployments = [dep0, dep1]
 
         mock_action = MagicMock()
         mocker.patch.object(Deployment, action, mock_action)
+        mock_clear_cache = mocker.patch(f"{MODULE}.SsmLookup.clear_cache")
+        mock_clear_output_caches = mocker.patch(f"{MODULE}.clear_output_caches")
+        mock_prefetch = mocker.patch(f"{MODULE}.SsmLookup.prefetch")
+        mock_cfn_prefetch = mocker.patch(f"{MODULE}.CfnLookup.prefetch")
         mock_vars = MagicMock()
 
         assert not Deployment.run_list(
@@ -484,4 +521,127 @@ class TestDeployment:
         dep1.resolve.assert_called_once_with(
             runway_context, variables=mock_vars, pre_process=True
         )
+        assert mock_clear_cache.call_count == 2
+        mock_prefetch.assert_has_calls(
+            [call(["lookup0"], runway_context), call(["lookup1"], runway_context)]
+        )
+        mock_cfn_prefetch.assert_has_calls(
+            [call(["lookup0"], runway_context), call(["lookup1"], runway_context)]
+        )
+        assert mock_clear_output_caches.call_count == 2
         mock_action.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "action, expected_order",
+        [("deploy", ["vpc", "app"]), ("destroy", ["app", "vpc"])],
+    )
+    def test_run_list_dependency_graph(
+        self,
+        action: RunwayActionTypeDef,
+        expected_order: List[str],
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test run_list using a dependency graph."""
+        deployments = [
+            MagicMock(depends_on=["vpc"], lookups=[]),
+            MagicMock(depends_on=[], lookups=[]),
+        ]
+        deployments[0].name = "app"
+        deployments[1].name = "vpc"
+        if action == "destroy":
+            deployments.reverse()
+        mocker.patch(f"{MODULE}.SsmLookup.prefetch")
+        mocker.patch(f"{MODULE}.CfnLookup.prefetch")
+        processed: List[str] = []
+        mock_process = mocker.patch.object(
+            Deployment,
+            "_Deployment__process",
+            side_effect=lambda **kwargs: processed.append(kwargs["definition"].name),
+        )
+
+        def run(graph: DependencyGraph, func: Any, **_: Any) -> Any:
+            for name in graph.order:
+                func(name)
+            return [], []
+
+        mock_run = mocker.patch.object(
+            DependencyGraph, "run", autospec=True, side_effect=run
+        )
+        runway_context.env.max_concurrent_deployments = 2
+        future = RunwayFutureDefinitionModel(dependency_graph=True)
+
+        assert not Deployment.run_list(
+            action=action,
+            context=runway_context,
+            deployments=deployments,  # type: ignore
+            future=future,
+            variables=MagicMock(),
+        )
+        assert processed == expected_order
+        mock_run.assert_called_once_with(
+            ANY, ANY, continue_on_error=False, max_workers=2
+        )
+        assert mock_process.call_count == 2
+
+        processed.clear()
+        mock_run.reset_mock()
+        assert not Deployment.run_list(
+            action="plan",
+            context=runway_context,
+            deployments=deployments,  # type: ignore
+            future=future,
+            variables=MagicMock(),
+        )
+        assert processed == (
+            expected_order if action == "deploy" else list(reversed(expected_order))
+        )
+        mock_run.assert_not_called()
+
+    def test_run_list_dependency_graph_failed(
+        self,
+        caplog: LogCaptureFixture,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test run_list using a dependency graph when a deployment fails."""
+        caplog.set_level(logging.ERROR, logger="runway")
+        deployment = MagicMock(depends_on=[], lookups=[])
+        deployment.name = "vpc"
+        mocker.patch(f"{MODULE}.DependencyGraph.run", return_value=(["vpc"], ["app"]))
+        with pytest.raises(SystemExit) as excinfo:
+            Deployment.run_list(
+                action="deploy",
+                context=runway_context,
+                deployments=[deployment],
+                future=RunwayFutureDefinitionModel(dependency_graph=True),
+                variables=MagicMock(),
+            )
+        assert excinfo.value.code == 1
+        assert "skipped deployment(s): app" in caplog.messages
+        assert "failed deployment(s): vpc" in caplog.messages
+
+    def test_run_list_dependency_graph_invalid(
+        self,
+        caplog: LogCaptureFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test run_list using a dependency graph with circular dependencies."""
+        caplog.set_level(logging.ERROR, logger="runway")
+        deployments = [
+            MagicMock(depends_on=["b"], lookups=[]),
+            MagicMock(depends_on=["a"], lookups=[]),
+        ]
+        deployments[0].name = "a"
+        deployments[1].name = "b"
+        with pytest.raises(SystemExit):
+            Deployment.run_list(
+                action="deploy",
+                context=runway_context,
+                deployments=deployments,  # type: ignore
+                future=RunwayFutureDefinitionModel(dependency_graph=True),
+                variables=MagicMock(),
+            )
+        assert caplog.messages[0].startswith(
+            "unable to determine the order of deployments"
+        )
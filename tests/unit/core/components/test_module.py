@@ -8,9 +8,12 @@ from typing import TYPE_CHECKING, Any, List, Optional, cast
 
 import pytest
 import yaml
-from mock import MagicMock, call
+from mock import ANY, MagicMock, call
 
+from runway._logging import PrefixFilter
+from runway.config.models.runway import RunwayFutureDefinitionModel
 from runway.core.components import Deployment, Module
+from runway.core.components._dependency_graph import DependencyGraph
 from runway.core.components._module import validate_environment
 
 if TYPE_CHECKING:
@@ -19,6 +22,8 @@ if TYPE_CHECKING:
     from pytest import LogCaptureFixture
     from pytest_mock import MockerFixture
 
+    from runway.core.type_defs import RunwayActionTypeDef
+
     from ...factories import MockRunwayContext, YamlLoaderDeployment
 
 MODULE = "runway.core.components._module"
@@ -354,7 +359,7 @@ class TestModule:
         assert not obj.deploy()
         assert (
             "parallel_parent:processing modules in parallel... (output "
-            "will be interwoven)" in caplog.messages
+            "will be prefixed with the module name)" in caplog.messages
         )
         mock_mp_context.assert_called_once_with("fork")
         mock_futures.ProcessPoolExecutor.assert_called_once_with(
@@ -363,12 +368,48 @@ class TestModule:
         )
         executor.submit.assert_has_calls(
             [
-                call(obj.child_modules[0].run, "deploy"),
-                call(obj.child_modules[1].run, "deploy"),
+                call(
+                    PrefixFilter.call,
+                    obj.child_modules[0].name,
+                    obj.child_modules[0].run,
+                    "deploy",
+                ),
+                call(
+                    PrefixFilter.call,
+                    obj.child_modules[1].name,
+                    obj.child_modules[1].run,
+                    "deploy",
+                ),
             ]
         )
         assert executor.submit.return_value.result.call_count == 2
 
+    def test_deploy_async_worker_pool(
+        self,
+        caplog: LogCaptureFixture,
+        fx_deployments: YamlLoaderDeployment,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test deploy async using the worker pool."""
+        caplog.set_level(logging.INFO, logger="runway")
+        mock_futures = mocker.patch(f"{MODULE}.concurrent.futures")
+        mocker.patch.object(Module, "use_async", True)
+        runway_context.worker_pool = MagicMock(available=True)
+
+        obj = Module(
+            context=runway_context,
+            definition=fx_deployments.load("simple_parallel_module").modules[0],
+        )
+        assert not obj.deploy()
+        assert "parallel_parent:processing modules in parallel..." in caplog.messages
+        mock_futures.ProcessPoolExecutor.assert_not_called()
+        runway_context.worker_pool.map.assert_called_once_with(
+            Module.run,
+            [(obj.child_modules[0], "deploy"), (obj.child_modules[1], "deploy")],
+            max_concurrent=runway_context.env.max_concurrent_modules,
+        )
+
     def test_deploy_sync(
         self,
         caplog: LogCaptureFixture,
@@ -539,6 +580,8 @@ class TestModule:
     ) -> None:
         """Test run."""
         mock_change_dir = mocker.patch(f"{MODULE}.change_dir")
+        mock_clear_cache = mocker.patch(f"{MODULE}.SsmLookup.clear_cache")
+        mock_clear_output_caches = mocker.patch(f"{MODULE}.clear_output_caches")
         mock_type = MagicMock()
         mock_inst = MagicMock()
         mock_inst.deploy = MagicMock()
@@ -561,11 +604,14 @@ class TestModule:
             mod.ctx, module_root=tmp_path, **mod.payload
         )
         mock_inst["deploy"].assert_called_once_with()
+        mock_clear_cache.assert_called_once_with()
+        mock_clear_output_caches.assert_called_once_with()
 
         del mock_inst.deploy
         with pytest.raises(SystemExit) as excinfo:
             assert mod.run("deploy")
         assert excinfo.value.code == 1
+        assert mock_clear_cache.call_count == 2
 
     def test_run_list(
         self,
@@ -581,10 +627,79 @@ class TestModule:
             modules=fx_deployments.load("simple_parallel_module").modules,
             variables=MagicMock(),
             deployment=MagicMock(),
-            future=MagicMock(),
+            future=RunwayFutureDefinitionModel(),
         )
         assert mock_deploy.call_count == 2
 
+    @pytest.mark.parametrize("action", ["deploy", "plan"])
+    def test_run_list_dependency_graph(
+        self,
+        action: RunwayActionTypeDef,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test run_list using a dependency graph."""
+        modules = [MagicMock(depends_on=["vpc"]), MagicMock(depends_on=[])]
+        modules[0].name = "app"
+        modules[1].name = "vpc"
+        deployment = MagicMock()
+        deployment.name = "test"
+        processed: List[str] = []
+        mocker.patch.object(
+            Module,
+            "__init__",
+            lambda self, definition, **_: setattr(self, "name", definition.name),
+        )
+        mocker.patch.object(Module, action, lambda self: processed.append(self.name))
+
+        def run(graph: DependencyGraph, func: Any, **_: Any) -> Any:
+            assert graph.log_prefix == "test"
+            for name in graph.order:
+                func(name)
+            return [], []
+
+        mock_run = mocker.patch.object(
+            DependencyGraph, "run", autospec=True, side_effect=run
+        )
+        runway_context.env.max_concurrent_modules = 2
+        assert not Module.run_list(
+            action=action,
+            context=runway_context,
+            modules=modules,  # type: ignore
+            variables=MagicMock(),
+            deployment=deployment,
+            future=RunwayFutureDefinitionModel(dependency_graph=True),
+        )
+        assert processed == ["vpc", "app"]
+        if action == "deploy":
+            mock_run.assert_called_once_with(
+                ANY, ANY, continue_on_error=False, max_workers=2
+            )
+        else:
+            mock_run.assert_not_called()
+
+    def test_run_list_dependency_graph_failed(
+        self,
+        caplog: LogCaptureFixture,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test run_list using a dependency graph when a module fails."""
+        caplog.set_level(logging.ERROR, logger="runway")
+        module = MagicMock(depends_on=[])
+        module.name = "vpc"
+        mocker.patch(f"{MODULE}.DependencyGraph.run", return_value=(["vpc"], []))
+        with pytest.raises(SystemExit) as excinfo:
+            Module.run_list(
+                action="destroy",
+                context=runway_context,
+                modules=[module],
+                variables=MagicMock(),
+                future=RunwayFutureDefinitionModel(dependency_graph=True),
+            )
+        assert excinfo.value.code == 1
+        assert caplog.messages == ["failed module(s): vpc"]
+
 
 @pytest.mark.parametrize(
     "env_def, expected, expected_logs",
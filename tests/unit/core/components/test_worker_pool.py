@@ -0,0 +1,218 @@
+"""Test runway.core.components._worker_pool."""
+# pylint: disable=no-self-use,protected-access
+# pyright: basic
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import pickle
+import sys
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import pytest
+
+from runway.core.components._worker_pool import WorkerPool, _TaskLogHandler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import LogCaptureFixture, MonkeyPatch
+
+LOGGER = logging.getLogger("runway.test_worker_pool")
+
+
+def double(value: int) -> int:
+    """Return double the value after logging a few messages."""
+    for step in range(3):
+        LOGGER.info("%s:%s", value, step)
+        time.sleep(0.01 * (3 - value))
+    return value * 2
+
+
+def fail(value: int) -> int:
+    """Raise an error for odd values."""
+    if value % 2:
+        raise ValueError(f"odd {value}")
+    return value
+
+
+def exit_worker(code: int) -> None:
+    """Exit the process without returning a result."""
+    os._exit(code)  # pylint: disable=protected-access
+
+
+def pid(_: int) -> int:
+    """Return the PID of the process."""
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def get_state() -> Tuple[bool, bool, Optional[str]]:
+    """Get state changed by other tasks."""
+    return (
+        "runway_test_worker_pool_module" in sys.modules,
+        any(path.startswith("/runway-test") for path in sys.path),
+        LOGGER.handlers[0].name if LOGGER.handlers else None,
+    )
+
+
+def import_module(path: str, name: str) -> int:
+    """Import a module from a path and change other state of the process."""
+    sys.path.insert(0, path)
+    sys.path.append("/runway-test")
+    LOGGER.addHandler(logging.NullHandler())
+    LOGGER.handlers[-1].name = "task"
+    return importlib.import_module(name).VALUE
+
+
+def pop_env(name: str) -> Optional[str]:
+    """Remove an environment variable and return its value."""
+    return os.environ.pop(name, None)
+
+
+def set_env(name: str) -> None:
+    """Set an environment variable."""
+    os.environ[name] = "set"
+
+
+def record_time(path: Path, name: str) -> None:
+    """Record the start and end time of a call."""
+    start = time.time()
+    time.sleep(0.1)
+    (path / name).write_text(f"{start} {time.time()}")
+
+
+def make_record(task: int, msg: str, done: bool = False) -> logging.LogRecord:
+    """Make a record like those sent by a worker process."""
+    return logging.makeLogRecord(
+        {
+            "levelno": logging.INFO,
+            "msg": msg,
+            "name": LOGGER.name,
+            "runway_task": task,
+            "runway_task_done": done,
+        }
+    )
+
+
+class TestTaskLogHandler:
+    """Test _TaskLogHandler."""
+
+    def test_emit(self, caplog: LogCaptureFixture) -> None:
+        """Test emit."""
+        caplog.set_level(logging.INFO, logger=LOGGER.name)
+        handler = _TaskLogHandler()
+        for record in [
+            make_record(1, "1a"),
+            make_record(2, "2a"),
+            make_record(0, "0a"),
+            make_record(1, "1b"),
+            make_record(2, "2b"),
+            make_record(2, "", done=True),
+            make_record(1, "", done=True),
+            make_record(0, "0b"),
+            make_record(0, "", done=True),
+        ]:
+            handler.emit(record)
+        assert caplog.messages == ["1a", "1b", "2a", "2b", "0a", "0b"]
+        assert handler.wait([0, 1, 2], timeout=0)
+        assert not handler._done
+
+    def test_flush_all(self, caplog: LogCaptureFixture) -> None:
+        """Test flush_all."""
+        caplog.set_level(logging.INFO, logger=LOGGER.name)
+        handler = _TaskLogHandler()
+        handler.emit(make_record(0, "0a"))
+        handler.emit(make_record(1, "1a"))
+        assert caplog.messages == ["0a"]
+        assert not handler.wait([0, 1], timeout=0)
+        handler.flush_all()
+        assert caplog.messages == ["0a", "1a"]
+
+
+class TestWorkerPool:
+    """Test WorkerPool."""
+
+    def test_available(self) -> None:
+        """Test available."""
+        obj = WorkerPool(2)
+        assert obj.available
+        obj_copy = pickle.loads(pickle.dumps(obj))
+        assert obj_copy.max_workers == 2
+        assert obj_copy.available
+        obj_copy._pid = -1
+        assert not obj_copy.available
+        with pytest.raises(RuntimeError):
+            obj_copy.map(double, [(1,)])
+
+    def test_map(self, caplog: LogCaptureFixture) -> None:
+        """Test map."""
+        caplog.set_level(logging.INFO, logger=LOGGER.name)
+        with WorkerPool(3) as obj:
+            assert obj.map(double, [(value,) for value in range(3)]) == [0, 2, 4]
+        messages = [msg for msg in caplog.messages if ":" in msg]
+        assert len(messages) == 9
+        tasks: List[str] = []
+        for msg in messages:  # output of each call is kept together
+            if not tasks or tasks[-1] != msg.split(":")[0]:
+                tasks.append(msg.split(":")[0])
+        assert sorted(tasks) == ["0", "1", "2"]
+
+    def test_map_max_concurrent(self, tmp_path: Path) -> None:
+        """Test map with max_concurrent."""
+        with WorkerPool(3) as obj:
+            obj.map(
+                record_time,
+                [(tmp_path, "a"), (tmp_path, "b"), (tmp_path, "c")],
+                max_concurrent=1,
+            )
+        times = [
+            [float(i) for i in (tmp_path / name).read_text().split()] for name in "abc"
+        ]
+        assert times[0][1] <= times[1][0]
+        assert times[1][1] <= times[2][0]
+
+    def test_map_raise(self) -> None:
+        """Test map raising the first error."""
+        with WorkerPool(2) as obj, pytest.raises(ValueError) as excinfo:
+            obj.map(fail, [(0,), (1,), (3,)])
+        assert str(excinfo.value) == "odd 1"
+
+    def test_map_exit(self) -> None:
+        """Test map when a worker process exits unexpectedly."""
+        with WorkerPool(1) as obj:
+            with pytest.raises(RuntimeError) as excinfo:
+                obj.map(exit_worker, [(3,)])
+            assert str(excinfo.value) == "a worker process exited unexpectedly"
+            assert not obj._executor
+            assert obj.map(double, [(1,)]) == [2]
+
+    def test_map_reset_state(self, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        """Test map resetting the state of workers between tasks."""
+        monkeypatch.delenv("RUNWAY_TEST_WORKER_POOL", raising=False)
+        module = tmp_path / "runway_test_worker_pool_module.py"
+        module.write_text("VALUE = 1\n")
+        with WorkerPool(1) as obj:
+            obj.map(set_env, [("RUNWAY_TEST_WORKER_POOL",)])
+            assert obj.map(pop_env, [("RUNWAY_TEST_WORKER_POOL",)]) == [None]
+            monkeypatch.setenv("RUNWAY_TEST_WORKER_POOL", "main")
+            monkeypatch.chdir(tmp_path)
+            assert obj.map(pop_env, [("RUNWAY_TEST_WORKER_POOL",)]) == ["main"]
+            assert obj.map(os.getcwd, [()]) == [str(tmp_path)]
+            assert obj.map(import_module, [(str(tmp_path), module.stem)]) == [1]
+            module.write_text("VALUE = 2\n")
+            assert obj.map(import_module, [(str(tmp_path), module.stem)]) == [2]
+            assert obj.map(get_state, [()]) == [(False, False, None)]
+        assert os.environ["RUNWAY_TEST_WORKER_POOL"] == "main"
+
+    def test_map_reuse_workers(self) -> None:
+        """Test map reusing worker processes."""
+        with WorkerPool(2) as obj:
+            first = set(obj.map(pid, [(i,) for i in range(2)]))
+            second = set(obj.map(pid, [(i,) for i in range(2)]))
+            assert obj._executor
+        assert not obj._executor
+        assert os.getpid() not in first
+        assert second.issubset(first)
@@ -0,0 +1,204 @@
+"""Test runway.core.providers.aws.s3._helpers.sync_strategy.checksum."""
+# pylint: disable=no-self-use,protected-access
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+from mock import Mock
+
+from runway.core.providers.aws.s3._helpers.file_generator import FileStats
+from runway.core.providers.aws.s3._helpers.sync_strategy.checksum import (
+    ChecksumIndex,
+    ChecksumSync,
+    calculate_etag,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.providers.aws.s3._helpers.sync_strategy.checksum"
+MiB = 1024**2
+
+
+def test_calculate_etag(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test calculate_etag."""
+    monkeypatch.setattr(f"{MODULE}.READ_SIZE", 3 * MiB)
+    content = os.urandom(12 * MiB)
+    test_file = tmp_path / "test"
+    test_file.write_bytes(content)
+    assert calculate_etag(test_file) == hashlib.md5(content).hexdigest()
+    parts = [content[: 5 * MiB], content[5 * MiB : 10 * MiB], content[10 * MiB :]]
+    assert (
+        calculate_etag(test_file, 5 * MiB)
+        == hashlib.md5(
+            b"".join(hashlib.md5(part).digest() for part in parts)
+        ).hexdigest()
+        + "-3"
+    )
+    # chunksize is adjusted to the minimum part size
+    assert calculate_etag(test_file, 1024).endswith("-3")
+    assert calculate_etag(test_file, 6 * MiB).endswith("-2")
+
+
+class TestChecksumIndex:
+    """Test ChecksumIndex."""
+
+    def test_get_etag(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test get_etag."""
+        mock_calculate_etag = mocker.patch(
+            f"{MODULE}.calculate_etag", side_effect=["etag0", "etag1-1", "etag2"]
+        )
+        test_file = tmp_path / "test"
+        test_file.write_text("test")
+        index = ChecksumIndex(tmp_path / "index.json")
+        assert index.get_etag(test_file) == "etag0"
+        assert index.get_etag(test_file) == "etag0"
+        assert index.get_etag(test_file, 8) == "etag1-1"
+        assert index.stats == {"hits": 1, "misses": 2}
+        os.utime(test_file, (0, 0))
+        assert index.get_etag(test_file) == "etag2"
+        assert mock_calculate_etag.call_count == 3
+        assert list(
+            index.entries[str(test_file)]["etags"]  # changed file replaces entry
+        ) == ["0"]
+
+    def test_save(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test save."""
+        mocker.patch(f"{MODULE}.calculate_etag", return_value="etag")
+        index_file = tmp_path / "cache" / "index.json"
+        test_file = tmp_path / "test"
+        test_file.write_text("test")
+        removed_file = tmp_path / "removed"
+        removed_file.write_text("removed")
+        index = ChecksumIndex(index_file)
+        index.save()
+        assert not index_file.exists()
+        index.get_etag(test_file)
+        index.get_etag(removed_file)
+        removed_file.unlink()
+        index.save()
+        assert list(json.loads(index_file.read_text())) == [str(test_file)]
+        assert not list(index_file.parent.glob(".tmp-*"))
+
+        loaded = ChecksumIndex(index_file)
+        assert loaded.get_etag(test_file) == "etag"
+        assert loaded.stats["hits"] == 1
+
+    def test_entries_invalid(self, tmp_path: Path) -> None:
+        """Test entries when the file can't be read."""
+        index_file = tmp_path / "index.json"
+        index_file.write_text("invalid")
+        assert ChecksumIndex(index_file).entries == {}
+        assert ChecksumIndex(tmp_path / "missing.json").entries == {}
+
+
+class TestChecksumSync:
+    """Test ChecksumSync."""
+
+    def test___init__(self, tmp_path: Path) -> None:
+        """Test __init__."""
+        index = ChecksumIndex(tmp_path / "index.json")
+        obj = ChecksumSync(index=index, multipart_chunksize="1024")
+        assert obj.index is index
+        assert obj.multipart_chunksize == 1024
+        assert obj.sync_type == "file_at_src_and_dest"
+        assert ChecksumSync().multipart_chunksize == 8 * MiB
+
+    def test_close(self) -> None:
+        """Test close."""
+        index = Mock()
+        ChecksumSync(index=index).close()
+        index.save.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "etag, chunksize, expected",
+        [
+            ('"etag"', None, True),
+            ('"etag-2"', 1024, True),
+            ('"other"', None, False),
+            ('"other-2"', 1024, False),
+            ("", None, False),
+        ],
+    )
+    def test_compare_checksum(
+        self, chunksize: Optional[int], etag: str, expected: bool
+    ) -> None:
+        """Test compare_checksum."""
+        index = Mock(get_etag=Mock(return_value="etag-2" if chunksize else "etag"))
+        local_file = FileStats(src="/test", src_type="local")
+        s3_object = FileStats(
+            src="bucket/test", response_data={"ETag": etag}, src_type="s3"  # type: ignore
+        )
+        obj = ChecksumSync(index=index, multipart_chunksize=1024)
+        assert obj.compare_checksum(local_file, s3_object) is expected
+        assert obj.compare_checksum(s3_object, local_file) is expected
+        if etag:
+            index.get_etag.assert_called_with("/test", chunksize)
+
+    def test_compare_checksum_error(self) -> None:
+        """Test compare_checksum unable to read the local file."""
+        index = Mock(get_etag=Mock(side_effect=OSError))
+        assert not ChecksumSync(index=index).compare_checksum(
+            FileStats(src="/test", src_type="local"),
+            FileStats(src="", response_data={"ETag": "etag"}, src_type="s3"),  # type: ignore
+        )
+
+    def test_compare_checksum_s3_to_s3(self) -> None:
+        """Test compare_checksum between S3 objects."""
+        s3_object = FileStats(
+            src="", response_data={"ETag": "etag"}, src_type="s3"  # type: ignore
+        )
+        assert not ChecksumSync(index=Mock()).compare_checksum(s3_object, s3_object)
+
+    @pytest.mark.parametrize(
+        "src, dest", [(None, None), (Mock(), None), (None, Mock())]
+    )
+    def test_compare_checksum_raise_value_error(
+        self, dest: Optional[FileStats], src: Optional[FileStats]
+    ) -> None:
+        """Test compare_checksum."""
+        with pytest.raises(ValueError) as excinfo:
+            ChecksumSync(index=Mock()).compare_checksum(src, dest)
+        assert str(excinfo.value) == "src_file and dest_file must not be None"
+
+    @pytest.mark.parametrize(
+        "is_size, is_checksum, expected",
+        [
+            (True, True, False),
+            (True, False, True),
+            (False, True, True),
+            (False, False, True),
+        ],
+    )
+    def test_determine_should_sync(
+        self, expected: bool, is_checksum: bool, is_size: bool, mocker: MockerFixture
+    ) -> None:
+        """Test determine_should_sync."""
+        src_file = FileStats(src="")
+        dest_file = FileStats(src="")
+        mock_compare_size = mocker.patch.object(
+            ChecksumSync, "compare_size", return_value=is_size
+        )
+        mock_compare_checksum = mocker.patch.object(
+            ChecksumSync, "compare_checksum", return_value=is_checksum
+        )
+        assert (
+            ChecksumSync(index=Mock()).determine_should_sync(src_file, dest_file)
+            is expected
+        )
+        mock_compare_size.assert_called_once_with(src_file, dest_file)
+        if is_size:
+            mock_compare_checksum.assert_called_once_with(src_file, dest_file)
+        else:
+            mock_compare_checksum.assert_not_called()
+
+    def test_name(self) -> None:
+        """Test name."""
+        assert ChecksumSync().name == "checksum"
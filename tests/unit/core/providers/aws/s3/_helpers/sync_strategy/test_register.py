@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from mock import Mock, call
 
 from runway.core.providers.aws.s3._helpers.sync_strategy import (
+    ChecksumSync,
     DeleteSync,
     ExactTimestampsSync,
     SizeOnlySync,
@@ -26,11 +27,17 @@ def test_register_sync_strategies(mocker: MockerFixture) -> None:
     """Test register_sync_strategies."""
     mock_register = mocker.patch(f"{MODULE}.register_sync_strategy", Mock())
     session = Mock()
-    assert not register_sync_strategies(session)
+    assert (
+        register_sync_strategies(
+            session, runtime_config={"multipart_chunksize": 1024}  # type: ignore
+        )
+        == [mock_register.return_value] * 4
+    )
     mock_register.assert_has_calls(
         [
             call(session, SizeOnlySync),
             call(session, ExactTimestampsSync),
+            call(session, ChecksumSync, multipart_chunksize=1024),
             call(session, DeleteSync, "file_not_at_src"),
         ],
         any_order=False,
@@ -42,13 +49,16 @@ def test_register_sync_strategy() -> None:
     session = Mock()
     strategy_object = Mock()
     strategy_cls = Mock(return_value=strategy_object)
-    assert not register_sync_strategy(session, strategy_cls, "sync_type")  # type: ignore
-    strategy_cls.assert_called_once_with("sync_type")
+    assert (
+        register_sync_strategy(session, strategy_cls, "sync_type", key="val")  # type: ignore
+        == strategy_object
+    )
+    strategy_cls.assert_called_once_with("sync_type", key="val")
     strategy_object.register_strategy.assert_called_once_with(session)
 
 
 def test_register_sync_strategy_default() -> None:
     """Test register_sync_strategy."""
     strategy_cls = Mock()
-    assert not register_sync_strategy(Mock(), strategy_cls)
+    assert register_sync_strategy(Mock(), strategy_cls)
     strategy_cls.assert_called_once_with("file_at_src_and_dest")
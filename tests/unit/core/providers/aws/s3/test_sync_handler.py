@@ -30,8 +30,9 @@ class TestS3SyncHandler:
         self, mocker: MockerFixture, runway_context: MockRunwayContext
     ) -> None:
         """Test run."""
+        strategy = Mock()
         mock_register_sync_strategies = mocker.patch(
-            f"{MODULE}.register_sync_strategies"
+            f"{MODULE}.register_sync_strategies", return_value=[strategy]
         )
         mock_action = mocker.patch(f"{MODULE}.ActionArchitecture")
         transfer_config = mocker.patch.object(
@@ -39,7 +40,9 @@ class TestS3SyncHandler:
         )
         obj = S3SyncHandler(runway_context, dest="", src="")
         assert not obj.run()
-        mock_register_sync_strategies.assert_called_once_with(obj._botocore_session)
+        mock_register_sync_strategies.assert_called_once_with(
+            obj._botocore_session, runtime_config=transfer_config
+        )
         mock_action.assert_called_once_with(
             session=obj._session,
             botocore_session=obj._botocore_session,
@@ -48,6 +51,7 @@ class TestS3SyncHandler:
             runtime_config=transfer_config,
         )
         mock_action().run.assert_called_once_with()
+        strategy.close.assert_called_once_with()
 
     def test_transfer_config(
         self, mocker: MockerFixture, runway_context: MockRunwayContext
@@ -35,6 +35,11 @@ class TestRunway:
         assert result.ignore_git_branch == runway_config.ignore_git_branch
         assert result.variables == runway_config.variables
         assert result.ctx == runway_context
+        assert result.ctx.worker_pool is result.worker_pool
+        assert result.worker_pool.max_workers == max(
+            runway_context.env.max_concurrent_modules,
+            runway_context.env.max_concurrent_regions,
+        )
 
     def test___init___undetermined_version(
         self,
@@ -90,6 +95,22 @@ class TestRunway:
             variables=runway_config.variables,
         )
 
+    def test_deploy_shutdown_worker_pool(
+        self,
+        mocker: MockerFixture,
+        runway_config: MockRunwayConfig,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test deploy shuts down the worker pool when it fails."""
+        mock_deployment = mocker.patch(f"{MODULE}.components.Deployment")
+        mock_deployment.run_list.side_effect = SystemExit(1)
+        obj = Runway(runway_config, runway_context)  # type: ignore
+        mock_shutdown = mocker.patch.object(obj.worker_pool, "shutdown")
+
+        with pytest.raises(SystemExit):
+            obj.deploy()
+        mock_shutdown.assert_called_once_with()
+
     def test_destroy(
         self,
         mocker: MockerFixture,
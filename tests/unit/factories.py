@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, MutableMapping, Optional, Tup
 import boto3
 import yaml
 from botocore.client import BaseClient
+from botocore.credentials import Credentials
 from botocore.stub import Stubber
 from mock import MagicMock
 from packaging.specifiers import SpecifierSet
@@ -60,6 +61,16 @@ class MockBoto3Session:
         self.profile_name = profile_name
         self.region_name = region_name
 
+    def get_credentials(self) -> Optional[Credentials]:
+        """Return the credentials the session was created with, if any."""
+        if not self.aws_access_key_id:
+            return None
+        return Credentials(
+            self.aws_access_key_id,
+            self.aws_secret_access_key,  # type: ignore
+            self.aws_session_token,
+        )
+
     def assert_client_called_with(self, service_name: str, **kwargs: Any) -> None:
         """Assert a client was created with the provided kwargs."""
         key = "{}.{}".format(service_name, kwargs.get("region_name", self.region_name))
@@ -208,12 +219,17 @@ class MockRunwayContext(RunwayContext):
         *,
         command: Optional[RunwayActionTypeDef] = None,
         deploy_environment: Any = None,
+        worker_pool: Any = None,
         **_: Any,
     ) -> None:
         """Instantiate class."""
         if not deploy_environment:
             deploy_environment = DeployEnvironment(environ={}, explicit_name="test")
-        super().__init__(command=command, deploy_environment=deploy_environment)
+        super().__init__(
+            command=command,
+            deploy_environment=deploy_environment,
+            worker_pool=worker_pool,
+        )
         self._boto3_test_client = MutableMap()
         self._boto3_test_stubber = MutableMap()
         self._use_concurrent = True
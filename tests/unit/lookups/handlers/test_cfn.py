@@ -12,12 +12,14 @@ import boto3
 import pytest
 from botocore.exceptions import ClientError
 from botocore.stub import Stubber
-from mock import MagicMock
+from mock import MagicMock, call
 
 from runway.cfngin.exceptions import StackDoesNotExist
+from runway.cfngin.output_cache import StackOutputCache
 from runway.cfngin.providers.aws.default import Provider
 from runway.exceptions import OutputDoesNotExist
 from runway.lookups.handlers.cfn import TYPE_NAME, CfnLookup, OutputQuery
+from runway.variables import Variable
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudformation.client import CloudFormationClient
@@ -26,6 +28,8 @@ if TYPE_CHECKING:
 
     from ...factories import MockRunwayContext
 
+MODULE = "runway.lookups.handlers.cfn"
+
 
 def generate_describe_stacks_stack(
     stack_name: str,
@@ -79,6 +83,7 @@ class TestCfnLookup:
         mock_should_use = mocker.patch.object(
             CfnLookup, "should_use_provider", side_effect=[True, False]
         )
+        mock_get_output_cache = mocker.patch(f"{MODULE}.get_output_cache")
         mock_context = MagicMock(name="context")
         mock_session = MagicMock(name="session")
         mock_context.get_session.return_value = mock_session
@@ -112,7 +117,10 @@ class TestCfnLookup:
         mock_should_use.assert_called_with({"region": region}, None)
         mock_context.get_session.assert_called_once_with(region=region)
         mock_session.client.assert_called_once_with("cloudformation")
-        mock_get_stack_output.assert_called_once_with(mock_session, query)
+        mock_get_output_cache.assert_called_once_with(mock_session)
+        mock_get_stack_output.assert_called_once_with(
+            mock_session, query, mock_get_output_cache.return_value
+        )
         mock_format_results.assert_called_with("cls.success", region=region)
 
     @pytest.mark.parametrize(
@@ -143,6 +151,7 @@ class TestCfnLookup:
         mock_session = MagicMock(name="session")
         mock_context.get_session.return_value = mock_session
         mock_session.client.return_value = mock_session
+        mock_get_output_cache = mocker.patch(f"{MODULE}.get_output_cache")
         mocker.patch.object(CfnLookup, "get_stack_output", MagicMock())
         CfnLookup.get_stack_output.side_effect = exception
 
@@ -172,7 +181,9 @@ class TestCfnLookup:
 
         mock_context.get_session.assert_called_once()
         mock_session.client.assert_called_once_with("cloudformation")
-        CfnLookup.get_stack_output.assert_called_once_with(mock_session, query)
+        CfnLookup.get_stack_output.assert_called_once_with(
+            mock_session, query, mock_get_output_cache.return_value
+        )
 
     @pytest.mark.parametrize(
         "exception, default",
@@ -268,6 +279,34 @@ class TestCfnLookup:
             in caplog.messages
         )
 
+    def test_get_stack_output_cache(self) -> None:
+        """Test get_stack_output with an output cache."""
+        client, stubber = setup_cfn_client()
+        cache = StackOutputCache()
+        stack_name = "test-stack"
+        outputs = {"output1": "val1", "output2": "val2"}
+
+        stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack(stack_name, outputs)]},
+            {"StackName": stack_name},
+        )
+
+        with stubber:
+            assert (
+                CfnLookup.get_stack_output(
+                    client, OutputQuery(stack_name, "output1"), cache
+                )
+                == "val1"
+            )
+            assert (
+                CfnLookup.get_stack_output(
+                    client, OutputQuery(stack_name, "output2"), cache
+                )
+                == "val2"
+            )
+        stubber.assert_no_pending_responses()
+
     def test_get_stack_output_clienterror(self, caplog: LogCaptureFixture) -> None:
         """Test get_stack_output raising ClientError."""
         caplog.set_level(logging.DEBUG, logger="runway.lookups.handlers.cfn")
@@ -312,6 +351,50 @@ class TestCfnLookup:
             in caplog.messages
         )
 
+    def test_prefetch(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext
+    ) -> None:
+        """Test prefetch."""
+        mock_get_output_cache = mocker.patch(f"{MODULE}.get_output_cache")
+        cache = mock_get_output_cache.return_value
+        mocker.patch.object(runway_context, "get_session")
+        variable = Variable(
+            "test",
+            [
+                "${cfn stack0.output}",
+                "${cfn stack1.output::region=us-west-2}",
+                "${cfn stack0.other}",
+                "${cfn ${env NAME}.output}",
+                "${env NAME}",
+            ],
+            "runway",
+        )
+        CfnLookup.prefetch(variable.lookups, runway_context)
+        runway_context.get_session.assert_has_calls(
+            [call(region=None), call(region="us-west-2")], any_order=True
+        )
+        client = runway_context.get_session.return_value.client.return_value
+        cache.prefetch.assert_has_calls(
+            [call(client, {"stack0"}), call(client, {"stack1"})], any_order=True
+        )
+        assert cache.prefetch.call_count == 2
+
+    def test_prefetch_error(
+        self,
+        caplog: LogCaptureFixture,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+    ) -> None:
+        """Test prefetch ignores errors."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        mocker.patch.object(
+            runway_context, "get_session", side_effect=Exception("error")
+        )
+        CfnLookup.prefetch(
+            Variable("test", "${cfn stack.output}", "runway").lookups, runway_context
+        )
+        assert "failed to prefetch stack outputs: error" in caplog.messages
+
     @pytest.mark.parametrize(
         "args, provider",
         [
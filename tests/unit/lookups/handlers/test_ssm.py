@@ -11,6 +11,7 @@ import pytest
 import yaml
 
 from runway.exceptions import FailedVariableLookup
+from runway.lookups.handlers.ssm import SsmLookup
 from runway.variables import Variable
 
 if TYPE_CHECKING:
@@ -72,6 +73,7 @@ class TestSsmLookup:
             cfngin_var.resolve(context=cfngin_context)
             assert cfngin_var.value == value
 
+            SsmLookup.clear_cache()
             runway_var.resolve(context=runway_context)
             assert runway_var.value == value
 
@@ -105,6 +107,42 @@ class TestSsmLookup:
             assert var.value == value
             stub.assert_no_pending_responses()
 
+    def test_cache(self, runway_context: MockRunwayContext) -> None:
+        """Test parameters are only retrieved once."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        stubber.add_response(
+            "get_parameter",
+            get_parameter_response(name, "test value"),
+            get_parameter_request(name),
+        )
+        variables = [
+            Variable("var0", "${ssm %s}" % name, variable_type="runway"),
+            Variable("var1", "${ssm %s::transform=str}" % name, variable_type="runway"),
+        ]
+
+        with stubber as stub:
+            for var in variables:
+                var.resolve(context=runway_context)
+                assert var.value == "test value"
+            stub.assert_no_pending_responses()
+        assert list(SsmLookup.cache) == [(None, "us-east-1", name, True)]
+
+    def test_clear_cache(self) -> None:
+        """Test clear_cache."""
+        SsmLookup.cache.update(
+            {
+                (None, "us-east-1", "/test/0", True): {},
+                ("key", "us-east-1", "/test/0", True): {},
+                (None, "us-west-2", "/test/0", True): {},
+                (None, "us-east-1", "/test/1", True): {},
+            }
+        )
+        SsmLookup.clear_cache("/test/0")
+        assert list(SsmLookup.cache) == [(None, "us-east-1", "/test/1", True)]
+        SsmLookup.clear_cache()
+        assert not SsmLookup.cache
+
     def test_different_region(self, runway_context: MockRunwayContext) -> None:
         """Test Lookup in region other than that set in Context."""
         name = "/test/param"
@@ -169,6 +207,7 @@ class TestSsmLookup:
                     get_parameter_response(name, dumped_value),
                     get_parameter_request(name),
                 )
+                SsmLookup.clear_cache()
 
                 with stubber as stub:
                     var.resolve(context=runway_context)
@@ -192,3 +231,87 @@ class TestSsmLookup:
 
         assert "ParameterNotFound" in str(err.value.__cause__)
         stub.assert_no_pending_responses()
+
+    def test_prefetch(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch."""
+        names = [f"/test/param{i:02}" for i in range(12)]
+        stubber = runway_context.add_stubber("ssm")
+        west_stubber = runway_context.add_stubber("ssm", region="us-west-2")
+        variables = [
+            Variable(
+                "test_var",
+                {
+                    "params": ["${ssm %s}" % name for name in names],
+                    "duplicate": "${ssm %s::transform=str}" % names[0],
+                    "nested": "${ssm /test/${env DEPLOY_ENVIRONMENT}}",
+                    "other": "${env DEPLOY_ENVIRONMENT}",
+                    "selector": "${ssm /test/version:2}",
+                },
+                variable_type="runway",
+            ),
+            Variable("west", "${ssm /test/west::region=us-west-2}", "runway"),
+        ]
+
+        def parameter(name: str, value: str, selector: str = "") -> Dict[str, Any]:
+            result = get_parameter_response(name, value)["Parameter"]
+            del result["Selector"]  # only returned when provided in the request
+            if selector:
+                result["Selector"] = selector
+            return result
+
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [parameter(name, name) for name in names[:10]]},
+            {"Names": names[:10], "WithDecryption": True},
+        )
+        stubber.add_response(
+            "get_parameters",
+            {
+                "Parameters": [
+                    parameter(names[10], names[10]),
+                    parameter("/test/version", "v2", ":2"),
+                ],
+                "InvalidParameters": [names[11]],
+            },
+            {"Names": [*names[10:], "/test/version:2"], "WithDecryption": True},
+        )
+        west_stubber.add_response(
+            "get_parameters",
+            {"Parameters": [parameter("/test/west", "west")]},
+            {"Names": ["/test/west"], "WithDecryption": True},
+        )
+
+        with stubber as stub, west_stubber as west_stub:
+            SsmLookup.prefetch(
+                [lookup for var in variables for lookup in var.lookups],
+                runway_context,
+            )
+            stub.assert_no_pending_responses()
+            west_stub.assert_no_pending_responses()
+
+        assert sorted(SsmLookup.cache) == sorted(
+            [(None, "us-east-1", name, True) for name in names[:-1]]
+            + [
+                (None, "us-east-1", "/test/version:2", True),
+                (None, "us-west-2", "/test/west", True),
+            ]
+        )
+        assert (
+            SsmLookup.cache[(None, "us-east-1", "/test/version:2", True)]["Value"]
+            == "v2"
+        )
+
+    def test_prefetch_error(
+        self, caplog: pytest.LogCaptureFixture, runway_context: MockRunwayContext
+    ) -> None:
+        """Test prefetch errors are ignored."""
+        caplog.set_level("DEBUG", logger="runway.lookups.handlers.ssm")
+        stubber = runway_context.add_stubber("ssm")
+        stubber.add_client_error("get_parameters", "AccessDeniedException")
+        with stubber:
+            SsmLookup.prefetch(
+                Variable("test", "${ssm /test/param}", "runway").lookups,
+                runway_context,
+            )
+        assert not SsmLookup.cache
+        assert "failed to prefetch SSM parameters" in caplog.text
@@ -12,6 +12,7 @@ import pytest
 from runway.module.utils import (
     NPM_BIN,
     NPX_BIN,
+    format_command_for_tracing,
     format_npm_command_for_logging,
     generate_node_command,
     run_module_command,
@@ -25,6 +26,24 @@ if TYPE_CHECKING:
 MODULE = "runway.module.utils"
 
 
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ([], ""),
+        (["/usr/bin/terraform", "apply", "-auto-approve"], "terraform apply"),
+        (["npx", "--package", "aws-cdk", "cdk", "deploy", "*"], "npx cdk deploy"),
+        (["sls", "deploy", "--stage", "test"], "sls deploy"),
+        (["sls", "deploy", "--token", "abc123"], "sls deploy"),
+        (["sls", "--stage=test", "deploy"], "sls deploy"),
+        (["terraform", "init", "-backend-config", "bucket=secret"], "terraform init"),
+        (["npx", "-c", "cdk deploy --secret"], "npx"),
+    ],
+)
+def test_format_command_for_tracing(command: List[str], expected: str) -> None:
+    """Test format_command_for_tracing."""
+    assert format_command_for_tracing(command) == expected
+
+
 @pytest.mark.parametrize(
     "command, expected",
     [
@@ -0,0 +1,213 @@
+"""Test runway._api_stats."""
+# pylint: disable=no-self-use,redefined-outer-name
+# pyright: basic
+from __future__ import annotations
+
+import json
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+
+from runway import _api_stats
+from runway._api_stats import ApiStats, OperationStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from botocore.awsrequest import AWSPreparedRequest
+    from pytest_mock import MockerFixture
+
+THROTTLED = (
+    400,
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>"
+    b"<Message>Rate exceeded</Message></Error></ErrorResponse>",
+)
+VALIDATION_ERROR = (
+    400,
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>ValidationError</Code>"
+    b"<Message>Stack does not exist</Message></Error></ErrorResponse>",
+)
+DESCRIBE_STACKS = (
+    200,
+    b"<DescribeStacksResponse><DescribeStacksResult><Stacks/>"
+    b"</DescribeStacksResult></DescribeStacksResponse>",
+)
+
+
+class MockRawResponse:
+    """Mock the raw response of an HTTP request."""
+
+    def __init__(self, body: bytes) -> None:
+        """Instantiate class."""
+        self.body = body
+
+    def stream(self, **_: Any) -> Iterator[bytes]:
+        """Stream the body."""
+        yield self.body
+
+
+@pytest.fixture
+def api_stats() -> Iterator[ApiStats]:
+    """Start counting AWS API calls."""
+    yield _api_stats.start()
+    _api_stats.stop()
+
+
+def create_client(responses: List[Tuple[int, bytes]]) -> Any:
+    """Create a CloudFormation client that returns responses without sending requests."""
+    session = boto3.Session(
+        aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+    )
+    _api_stats.register(session)
+    client = session.client("cloudformation")
+
+    def send(request: AWSPreparedRequest, **_: Any) -> AWSResponse:
+        status_code, body = responses.pop(0)
+        return AWSResponse(request.url, status_code, {}, MockRawResponse(body))
+
+    client.meta.events.register("before-send", send)
+    return client
+
+
+class TestApiStats:
+    """Test ApiStats."""
+
+    def test_format_table(self) -> None:
+        """Test format_table."""
+        stats = ApiStats()
+        stats.record("s3", "PutObject", "us-east-1", 20)
+        stats.record("cloudformation", "DescribeStacks", "us-east-1", 3)
+        stats.record("cloudformation", "DescribeStacks", "us-east-1", 7, retries=1)
+        assert stats.format_table().splitlines() == [
+            "SERVICE         OPERATION       REGION     CALLS  ERRORS  RETRIES"
+            "  THROTTLES  AVG MS  P95 MS  MAX MS",
+            "cloudformation  DescribeStacks  us-east-1      2       0        1"
+            "          0       5    <=10       7",
+            "s3              PutObject       us-east-1      1       0        0"
+            "          0      20    <=25      20",
+            "TOTAL                                          3       0        1"
+            "          0      10    <=25      20",
+        ]
+
+    def test_merge(self) -> None:
+        """Test merge."""
+        stats = ApiStats()
+        stats.record("s3", "PutObject", "us-east-1", 20, error=True, throttles=1)
+        other = ApiStats()
+        other.record("s3", "PutObject", "us-east-1", 40, retries=2)
+        other.record("s3", "GetObject", "us-west-2", 1)
+        stats.merge(json.loads(json.dumps(other.to_dict())))
+        result = stats.operations[("s3", "PutObject", "us-east-1")]
+        assert (result.calls, result.errors, result.retries, result.throttles) == (
+            2,
+            1,
+            2,
+            1,
+        )
+        assert result.max_ms == 40
+        assert result.total_ms == 60
+        assert stats.operations[("s3", "GetObject", "us-west-2")].calls == 1
+        assert stats.total.calls == 3
+
+    def test_to_dict(self) -> None:
+        """Test to_dict."""
+        stats = ApiStats()
+        stats.record("s3", "PutObject", "us-east-1", 20)
+        result = stats.to_dict()
+        assert result["latency_buckets_ms"] == list(_api_stats.LATENCY_BUCKETS)
+        assert result["operations"] == [
+            {
+                "operation": "PutObject",
+                "region": "us-east-1",
+                "service": "s3",
+                **stats.operations[("s3", "PutObject", "us-east-1")].to_dict(),
+            }
+        ]
+        assert result["total"]["calls"] == 1
+
+    def test_write_json(self, tmp_path: Path) -> None:
+        """Test write_json."""
+        stats = ApiStats()
+        stats.record("s3", "PutObject", "us-east-1", 20)
+        stats.write_json(tmp_path / "stats.json")
+        assert json.loads((tmp_path / "stats.json").read_text()) == stats.to_dict()
+
+
+class TestOperationStats:
+    """Test OperationStats."""
+
+    def test_percentile(self) -> None:
+        """Test percentile."""
+        stats = OperationStats()
+        assert stats.percentile(95) == _api_stats.LATENCY_BUCKETS[0]
+        for latency in [1, 2, 3, 30, 20000]:
+            stats.record(latency, error=False, retries=0, throttles=0)
+        assert stats.percentile(50) == 5
+        assert stats.percentile(80) == 50
+        assert stats.percentile(95) is None
+
+    def test_record(self) -> None:
+        """Test record."""
+        stats = OperationStats()
+        stats.record(5, error=True, retries=2, throttles=1)
+        stats.record(6.5, error=False, retries=0, throttles=0)
+        assert stats.avg_ms == 5.75
+        assert stats.calls == 2
+        assert stats.errors == 1
+        assert stats.histogram[:3] == [1, 1, 0]
+        assert stats.max_ms == 6.5
+        assert stats.retries == 2
+        assert stats.throttles == 1
+
+
+def test_disabled() -> None:
+    """Test calls are not counted when disabled."""
+    assert not _api_stats.enabled()
+    client = create_client([DESCRIBE_STACKS])
+    client.describe_stacks()
+    assert _api_stats.stop() is None
+
+
+def test_error(api_stats: ApiStats) -> None:
+    """Test counting a call that returns an error."""
+    client = create_client([VALIDATION_ERROR])
+    with pytest.raises(client.exceptions.ClientError):
+        client.describe_stacks(StackName="foo")
+    result = api_stats.operations[("cloudformation", "DescribeStacks", "us-east-1")]
+    assert (result.calls, result.errors, result.retries, result.throttles) == (
+        1,
+        1,
+        0,
+        0,
+    )
+
+
+def test_fork(api_stats: ApiStats) -> None:
+    """Test stats of forked processes are merged when stopped."""
+    api_stats.record("s3", "PutObject", "us-east-1", 1)
+    process = multiprocessing.get_context("fork").Process(
+        target=api_stats.record, args=("s3", "PutObject", "us-east-1", 2)
+    )
+    process.start()
+    process.join()
+    assert api_stats.operations[("s3", "PutObject", "us-east-1")].calls == 1
+    assert _api_stats.stop() is api_stats
+    assert api_stats.operations[("s3", "PutObject", "us-east-1")].calls == 2
+
+
+def test_throttled(api_stats: ApiStats, mocker: MockerFixture) -> None:
+    """Test counting a call that is retried after being throttled."""
+    mocker.patch("botocore.endpoint.time.sleep")
+    assert _api_stats.enabled()
+    client = create_client([THROTTLED, DESCRIBE_STACKS])
+    assert client.describe_stacks()["Stacks"] == []
+    result = api_stats.operations[("cloudformation", "DescribeStacks", "us-east-1")]
+    assert (result.calls, result.errors, result.retries, result.throttles) == (
+        1,
+        0,
+        1,
+        1,
+    )
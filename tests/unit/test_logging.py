@@ -0,0 +1,64 @@
+"""Test runway._logging."""
+# pylint: disable=no-self-use
+# pyright: basic
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from mock import Mock
+
+from runway._logging import PrefixFilter
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class TestPrefixFilter:
+    """Test PrefixFilter."""
+
+    def test_filter(self) -> None:
+        """Test filter."""
+        record = logging.makeLogRecord({"msg": "message %s", "args": ("arg",)})
+        obj = PrefixFilter("prefix")
+        assert obj.filter(record)
+        assert obj.filter(record)  # record handled by a second handler
+        assert record.getMessage() == "[prefix] message arg"
+
+    def test_call(self, mocker: MockerFixture) -> None:
+        """Test call."""
+        mock_install = mocker.patch.object(PrefixFilter, "install")
+        func = Mock(return_value="success")
+        assert PrefixFilter.call("prefix", func, "arg0", "arg1") == "success"
+        mock_install.assert_called_once_with("prefix")
+        func.assert_called_once_with("arg0", "arg1")
+
+    def test_install(self, mocker: MockerFixture) -> None:
+        """Test install."""
+        mocker.patch.object(PrefixFilter, "installed", "")
+        logger = logging.getLogger("runway.test_prefix_filter")
+        handler = logging.NullHandler()
+        logger.addHandler(handler)
+        try:
+            PrefixFilter.install("outer")
+            PrefixFilter.install("inner")
+            assert [f.prefix for f in handler.filters] == ["inner"]  # type: ignore
+            assert PrefixFilter.installed == "inner"
+        finally:
+            logger.removeHandler(handler)
+            for logger_ in [logging.getLogger()] + [
+                i
+                for i in logging.Logger.manager.loggerDict.values()
+                if isinstance(i, logging.Logger)
+            ]:
+                for handler_ in logger_.handlers:
+                    for filter_ in list(handler_.filters):
+                        if isinstance(filter_, PrefixFilter):
+                            handler_.removeFilter(filter_)
+
+    def test_nested(self, mocker: MockerFixture) -> None:
+        """Test nested."""
+        mocker.patch.object(PrefixFilter, "installed", "")
+        assert PrefixFilter.nested("child") == "child"
+        mocker.patch.object(PrefixFilter, "installed", "parent")
+        assert PrefixFilter.nested("child") == "parent.child"
@@ -0,0 +1,177 @@
+"""Test runway._rate_limiter."""
+# pylint: disable=no-self-use,protected-access
+# pyright: basic
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from mock import MagicMock
+
+from runway import _rate_limiter
+from runway._rate_limiter import (
+    DECREASE_FACTOR,
+    INCREASE_PER_SECOND,
+    MAX_RATE,
+    MIN_RATE,
+    RATE_LIMITER,
+    RateLimiter,
+    TokenBucket,
+    get_api_family,
+)
+
+if TYPE_CHECKING:
+    from botocore.awsrequest import AWSPreparedRequest
+    from pytest import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+MODULE = "runway._rate_limiter"
+
+THROTTLED = (
+    400,
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>"
+    b"<Message>Rate exceeded</Message></Error></ErrorResponse>",
+)
+DESCRIBE_STACKS = (
+    200,
+    b"<DescribeStacksResponse><DescribeStacksResult><Stacks/>"
+    b"</DescribeStacksResult></DescribeStacksResponse>",
+)
+
+
+class MockRawResponse:
+    """Mock the raw response of an HTTP request."""
+
+    def __init__(self, body: bytes) -> None:
+        """Instantiate class."""
+        self.body = body
+
+    def stream(self, **_: Any) -> Iterator[bytes]:
+        """Stream the body."""
+        yield self.body
+
+
+@pytest.fixture
+def mock_time(mocker: MockerFixture) -> MagicMock:
+    """Mock time so that sleeping advances the clock."""
+    clock = [1000.0]
+
+    def sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    mock_time = mocker.patch(f"{MODULE}.time")
+    mock_time.monotonic.side_effect = lambda: clock[0]
+    mock_time.sleep.side_effect = sleep
+    mock_time.clock = clock
+    return mock_time
+
+
+def create_client(responses: List[Tuple[int, bytes]]) -> Any:
+    """Create a CloudFormation client that returns responses without sending requests."""
+    session = boto3.Session(
+        aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+    )
+    _rate_limiter.register(session)
+    client = session.client("cloudformation")
+
+    def send(request: AWSPreparedRequest, **_: Any) -> AWSResponse:
+        status_code, body = responses.pop(0)
+        return AWSResponse(request.url, status_code, {}, MockRawResponse(body))
+
+    client.meta.events.register("before-send", send)
+    return client
+
+
+class TestRateLimiter:
+    """Test RateLimiter."""
+
+    def test_get_bucket(self) -> None:
+        """Test get_bucket."""
+        limiter = RateLimiter()
+        bucket = limiter.get_bucket("foo", "us-east-1", "cloudformation:read")
+        assert bucket.key == ("foo", "us-east-1", "cloudformation:read")
+        assert limiter.get_bucket("foo", "us-east-1", "cloudformation:read") is bucket
+        assert limiter.get_bucket("bar", "us-east-1", "cloudformation:read") != bucket
+        limiter.clear()
+        assert limiter.get_bucket("foo", "us-east-1", "cloudformation:read") != bucket
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_acquire_not_limiting(self, mock_time: MagicMock) -> None:
+        """Test acquire does not wait before a call is throttled."""
+        bucket = TokenBucket(("foo", "us-east-1", "cloudformation:read"))
+        assert not any(bucket.acquire() for _ in range(50))
+        mock_time.sleep.assert_not_called()
+
+    def test_acquire_limiting(self, mock_time: MagicMock) -> None:
+        """Test acquire waits for tokens once a call is throttled."""
+        bucket = TokenBucket(("foo", "us-east-1", "cloudformation:read"))
+        for _ in range(10):
+            bucket.acquire()
+        bucket.on_throttle()
+        assert bucket.limiting
+        assert bucket.rate == 10 * DECREASE_FACTOR
+        start = mock_time.clock[0]
+        for _ in range(7):
+            bucket.acquire()
+        assert mock_time.clock[0] - start == pytest.approx(1)
+
+    def test_on_success(self, mock_time: MagicMock) -> None:
+        """Test on_success increases the rate over time."""
+        bucket = TokenBucket(("foo", "us-east-1", "cloudformation:read"))
+        bucket.on_success()
+        assert not bucket.limiting
+        bucket.on_throttle()
+        rate = bucket.rate
+        mock_time.clock[0] += 10
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(rate + 10 * INCREASE_PER_SECOND)
+        mock_time.clock[0] += MAX_RATE / INCREASE_PER_SECOND
+        bucket.on_success()
+        assert not bucket.limiting
+
+    def test_on_throttle(self, mock_time: MagicMock) -> None:
+        """Test on_throttle."""
+        bucket = TokenBucket(("foo", "us-east-1", "cloudformation:read"))
+        bucket.on_throttle()
+        assert bucket.limiting
+        assert bucket.rate == MIN_RATE
+        bucket.rate = 10
+        bucket.on_throttle()  # within cooldown
+        assert bucket.rate == 10
+        mock_time.clock[0] += 5
+        bucket.on_throttle()
+        assert bucket.rate == 10 * DECREASE_FACTOR
+
+
+def test_get_api_family() -> None:
+    """Test get_api_family."""
+    assert get_api_family("cloudformation", "DescribeStacks") == "cloudformation:read"
+    assert get_api_family("s3", "GetObject") == "s3:read"
+    assert get_api_family("s3", "ListObjectsV2") == "s3:read"
+    assert get_api_family("cloudformation", "UpdateStack") == "cloudformation:write"
+
+
+def test_register(mocker: MockerFixture) -> None:
+    """Test register adjusts the bucket of calls from throttled responses."""
+    mocker.patch("botocore.endpoint.time.sleep")
+    client = create_client([DESCRIBE_STACKS, THROTTLED, DESCRIBE_STACKS])
+    client.describe_stacks()
+    bucket = RATE_LIMITER.get_bucket("foo", "us-east-1", "cloudformation:read")
+    assert not bucket.limiting
+    client.describe_stacks()
+    assert bucket.limiting
+
+
+def test_register_disabled(monkeypatch: MonkeyPatch, mocker: MockerFixture) -> None:
+    """Test register when disabled."""
+    mocker.patch("botocore.endpoint.time.sleep")
+    monkeypatch.setenv("RUNWAY_ADAPTIVE_RATE_LIMIT", "false")
+    assert not _rate_limiter.enabled()
+    client = create_client([THROTTLED, DESCRIBE_STACKS])
+    client.describe_stacks()
+    assert not RATE_LIMITER._buckets
@@ -0,0 +1,123 @@
+"""Test runway._tracing."""
+# pylint: disable=no-self-use,redefined-outer-name
+# pyright: basic
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+import pytest
+
+from runway import _tracing
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def load_events(path: Path) -> List[Dict[str, Any]]:
+    """Load the events of a trace file, excluding metadata events."""
+    data = path.read_text()
+    if not data.rstrip().endswith("]"):
+        data = data.rstrip().rstrip(",") + "]"
+    return [event for event in json.loads(data) if event["ph"] != "M"]
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Iterator[Path]:
+    """Start tracing to a file."""
+    path = tmp_path / "trace.json"
+    _tracing.start(path)
+    yield path
+    _tracing.stop()
+
+
+def test_complete(trace_file: Path) -> None:
+    """Test complete."""
+    _tracing.complete("name", "category", 1.0, 1.5, key="value")
+    _tracing.stop()
+    assert load_events(trace_file) == [
+        {
+            "args": {"key": "value"},
+            "cat": "category",
+            "dur": 500000,
+            "name": "name",
+            "ph": "X",
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "ts": 1000000,
+        }
+    ]
+
+
+def test_disabled(tmp_path: Path) -> None:
+    """Test functions when tracing is disabled."""
+    assert not _tracing.enabled()
+    with _tracing.span("name", "category") as span:
+        assert span is _tracing.span("other", "category")
+    _tracing.complete("name", "category", 0, 1)
+    _tracing.instant("name", "category")
+    _tracing.stop()
+    assert not list(tmp_path.iterdir())
+
+
+def test_instant(trace_file: Path) -> None:
+    """Test instant."""
+    _tracing.instant("name", "category", key="value")
+    _tracing.stop()
+    (event,) = load_events(trace_file)
+    assert event["args"] == {"key": "value"}
+    assert event["name"] == "name"
+    assert event["ph"] == "i"
+
+
+def test_span(trace_file: Path) -> None:
+    """Test span."""
+    assert _tracing.enabled()
+    with _tracing.span("outer", "category", key="value"):
+        with pytest.raises(ValueError):
+            with _tracing.span("inner", "category"):
+                raise ValueError
+    _tracing.stop()
+    inner, outer = load_events(trace_file)
+    assert inner["args"] == {"error": "ValueError"}
+    assert inner["name"] == "inner"
+    assert outer["args"] == {"key": "value"}
+    assert outer["name"] == "outer"
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+
+
+def test_start(tmp_path: Path) -> None:
+    """Test start."""
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    try:
+        assert _tracing.start(first).path == first
+        assert _tracing.start(second).path == second
+    finally:
+        _tracing.stop()
+    assert json.loads(first.read_text())
+    assert json.loads(second.read_text())
+
+
+def test_stop_incomplete_file_is_readable(trace_file: Path) -> None:
+    """Test events written before stop is called can be read."""
+    _tracing.instant("name", "category")
+    assert [event["name"] for event in load_events(trace_file)] == ["name"]
+
+
+def test_traced(trace_file: Path) -> None:
+    """Test traced."""
+
+    @_tracing.traced("category", lambda value, **_: f"name {value}")
+    def func(value: int, *, other: int = 0) -> int:
+        return value + other
+
+    assert func(1, other=2) == 3
+    _tracing.stop()
+    assert func(2) == 2
+    (event,) = load_events(trace_file)
+    assert event["cat"] == "category"
+    assert event["name"] == "name 1"
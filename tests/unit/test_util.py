@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import datetime
+import importlib
 import json
 import logging
 import os
@@ -26,6 +27,8 @@ from runway.utils import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest import LogCaptureFixture, MonkeyPatch
 
 MODULE = "runway.utils"
@@ -359,6 +362,32 @@ def test_load_object_from_string() -> None:
         assert load_object_from_string(obj_path, try_reload=True) == "us-west-2"
 
 
+def test_load_object_from_string_if_modified(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test load_object_from_string only reloading modified modules."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module_file = tmp_path / "runway_test_reload_module.py"
+    module_file.write_text("VALUE = 1\n")
+    obj_path = "runway_test_reload_module.VALUE"
+    mock_reload = MagicMock(side_effect=importlib.reload)
+    monkeypatch.setattr(f"{MODULE}.importlib.reload", mock_reload)
+    try:
+        assert load_object_from_string(obj_path, try_reload=True, if_modified=True) == 1
+        assert load_object_from_string(obj_path, try_reload=True, if_modified=True) == 1
+        mock_reload.assert_not_called()
+
+        module_file.write_text("VALUE = 200\n")
+        assert (
+            load_object_from_string(obj_path, try_reload=True, if_modified=True) == 200
+        )
+        mock_reload.assert_called_once()
+        assert load_object_from_string(obj_path, try_reload=True) == 200
+        assert mock_reload.call_count == 2
+    finally:
+        sys.modules.pop("runway_test_reload_module", None)
+
+
 def test_load_object_from_string_reload_conditions(monkeypatch: MonkeyPatch) -> None:
     """Test load_object_from_string reload conditions."""
     mock_reload = MagicMock()
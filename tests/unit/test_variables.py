@@ -3,6 +3,7 @@
 # pyright: basic
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any, ClassVar, List, Union
 
 import pytest
@@ -67,6 +68,35 @@ class MockLookupHandler(LookupHandler):
         return side_effect
 
 
+class MockConcurrentLookupHandler(LookupHandler):
+    """Mock lookup handler that can be resolved concurrently.
+
+    Queries starting with ``wait`` wait for another query starting with
+    ``wait`` to be resolved at the same time.
+
+    """
+
+    barrier: ClassVar[threading.Barrier] = threading.Barrier(2, timeout=5)
+    calls: ClassVar[List[str]] = []
+    concurrent = True
+
+    @classmethod
+    def handle(  # pylint: disable=arguments-differ
+        cls,
+        value: str,
+        context: Union[CfnginContext, RunwayContext],
+        *__args: Any,
+        **__kwargs: Any,
+    ) -> Any:
+        """Perform the lookup."""
+        cls.calls.append(value)
+        if value.startswith("wait"):
+            cls.barrier.wait()
+        if value == "fail":
+            raise ValueError(value)
+        return f"{value} ({threading.current_thread().name})"
+
+
 @pytest.fixture(autouse=True, scope="function")
 def patch_lookups(mocker: MockerFixture) -> None:
     """Patch registered lookups."""
@@ -74,14 +104,63 @@ def patch_lookups(mocker: MockerFixture) -> None:
         # mocked = {k: MockLookupHandler for k in registry}
         # mocked["test"] = MockLookupHandler
         # mocker.patch.dict(registry, mocked)
-        mocker.patch.dict(registry, {"test": MockLookupHandler})
+        mocker.patch.dict(
+            registry,
+            {"concurrent": MockConcurrentLookupHandler, "test": MockLookupHandler},
+        )
+    mocker.patch.object(
+        MockConcurrentLookupHandler, "barrier", threading.Barrier(2, timeout=5)
+    )
+    mocker.patch.object(MockConcurrentLookupHandler, "calls", [])
 
 
 def test_resolve_variables(cfngin_context: MockCFNginContext) -> None:
     """Test resolve_variables."""
-    variable = MagicMock()
-    assert not resolve_variables([variable], cfngin_context)
-    variable.resolve.assert_called_once_with(context=cfngin_context, provider=None)
+    variables = [
+        Variable("Param0", "${concurrent wait0}"),
+        Variable("Param1", "${test query}"),
+        Variable("Param2", ["${concurrent wait0}", "${concurrent wait1}", "val"]),
+        Variable("Param3", "${concurrent ${test query}}"),
+    ]
+    assert not resolve_variables(variables, cfngin_context)
+    assert variables[0].value.startswith("wait0 (lookup")
+    assert variables[1].value == "resolved"
+    assert variables[2].value[0] == variables[0].value
+    assert variables[2].value[1].startswith("wait1 (lookup")
+    assert variables[2].value[2] == "val"
+    assert variables[3].value == "resolved (MainThread)"
+    assert sorted(MockConcurrentLookupHandler.calls) == ["resolved", "wait0", "wait1"]
+
+
+def test_resolve_variables_failed(cfngin_context: MockCFNginContext) -> None:
+    """Test resolve_variables raises for the first variable that failed."""
+    variables = [
+        Variable("Param0", "${concurrent val}"),
+        Variable("Param1", "${concurrent fail}"),
+        Variable("Param2", "${test query}"),
+        Variable("Param3", "${concurrent fail}"),
+    ]
+    with pytest.raises(FailedVariableLookup) as excinfo:
+        resolve_variables(variables, cfngin_context)
+    assert excinfo.value.variable is variables[1]
+    assert variables[0].resolved
+    assert not variables[2].resolved
+
+
+def test_resolve_variables_max_concurrent_lookups(
+    cfngin_context: MockCFNginContext,
+) -> None:
+    """Test resolve_variables without threads when max_concurrent_lookups is 1."""
+    cfngin_context.env.max_concurrent_lookups = 1
+    variables = [
+        Variable("Param0", "${concurrent val0}"),
+        Variable("Param1", "${concurrent val1}"),
+    ]
+    resolve_variables(variables, cfngin_context)
+    assert [variable.value for variable in variables] == [
+        "val0 (MainThread)",
+        "val1 (MainThread)",
+    ]
 
 
 class TestVariables:
@@ -95,6 +174,21 @@ class TestVariables:
         )
         assert Variable("Param", "val").dependencies == {"test"}
 
+    def test_lookups(self) -> None:
+        """Test lookups."""
+        assert not Variable("Param", "val").lookups
+        obj = Variable(
+            "Param",
+            {"key": ["${env ${var name}}", "val"], "other": "prefix ${var other}"},
+            "runway",
+        )
+        assert [lookup.lookup_name.value for lookup in obj.lookups] == [
+            "var",
+            "env",
+            "var",
+        ]
+        assert obj.lookups[1].lookup_query.lookups == [obj.lookups[0]]
+
     def test_get(self, mocker: MockerFixture) -> None:
         """Test get."""
         obj = Variable("Para", {"key": "val"})
@@ -219,9 +313,9 @@ class TestVariables:
         """Test resolve FailedLookup."""
         context = MagicMock()
         provider = MagicMock()
-        obj = Variable("Param", "val")
+        obj = Variable("Param", {"key": "${test query}"})
         lookup_error = FailedLookup("something", KeyError("cause"))  # type: ignore
-        mocker.patch.object(obj._value, "resolve", side_effect=lookup_error)
+        mocker.patch.object(VariableValueLookup, "resolve", side_effect=lookup_error)
         with pytest.raises(FailedVariableLookup) as excinfo:
             obj.resolve(context, provider, kwarg="something")
         assert excinfo.value.cause == lookup_error
@@ -235,13 +329,21 @@ class TestVariables:
         """Test resolve."""
         context = MagicMock()
         provider = MagicMock()
-        obj = Variable("Param", "val")
-        mock_resolve = mocker.patch.object(obj._value, "resolve")
+        obj = Variable("Param", ["val", {"key": "${test ${test query}}"}])
+        mock_resolve = mocker.patch.object(VariableValueLookup, "resolve")
         assert not obj.resolve(context, provider, kwarg="something")
         mock_resolve.assert_called_once_with(
             context, provider=provider, variables=None, kwarg="something"
         )
 
+    def test_resolve_literal(self, mocker: MockerFixture) -> None:
+        """Test resolve a value that does not contain lookups."""
+        mock_resolve = mocker.patch.object(VariableValueLiteral, "resolve")
+        obj = Variable("Param", {"key": ["val", 1]})
+        assert not obj.resolve(MagicMock(), MagicMock())
+        mock_resolve.assert_not_called()
+        assert obj.resolved
+
     def test_simple_lookup(self) -> None:
         """Test simple lookup."""
         var = Variable("Param1", "${test query}")
@@ -302,6 +404,31 @@ class TestVariableValue:
         assert obj.value == "test"
         assert isinstance(obj, VariableValueLiteral)
 
+    def test_parse_obj_str_cached(self) -> None:
+        """Test parse_obj str creates new values from the cached parse result."""
+        value = "prefix-${test ${test query}}-${test other}"
+        obj0 = VariableValue.parse_obj(value)
+        obj1 = VariableValue.parse_obj(value)
+        assert obj0 is not obj1
+        assert repr(obj0) == repr(obj1)
+        assert obj0.lookups[0] is not obj1.lookups[0]
+        obj0.resolve(MagicMock())
+        assert obj0.value == "prefix-resolved-resolved"
+        assert not obj1.resolved
+        assert obj0[0] is obj1[0]  # literals are reused
+
+    def test_parse_obj_str_cached_unknown_lookup_type(self) -> None:
+        """Test parse_obj str raises UnknownLookupType when parsed from cache."""
+        for _ in range(2):
+            with pytest.raises(UnknownLookupType):
+                VariableValue.parse_obj("${invalid query}")
+
+    def test_parse_obj_str_variable_type(self) -> None:
+        """Test parse_obj str variable_type is not shared by the cache."""
+        value = "${test query}"
+        assert VariableValue.parse_obj(value, "cfngin").variable_type == "cfngin"
+        assert VariableValue.parse_obj(value, "runway").variable_type == "runway"
+
     def test_repr(self) -> None:
         """Test __repr__."""
         with pytest.raises(NotImplementedError):
@@ -862,11 +989,13 @@ class TestVariableValueLookup:
             VariableValueLookup, "_resolve", return_value=None
         )
         mock_resolve_query = mocker.patch.object(VariableValueLiteral, "resolve")
+        mock_span = mocker.patch("runway.variables._tracing.span")
         obj = VariableValueLookup(
             VariableValueLiteral("test"), VariableValueLiteral("query")
         )
         assert not obj.resolve(**kwargs)  # type: ignore
         mock_resolve_query.assert_called_once_with(**kwargs)
+        mock_span.assert_called_once_with("test", "lookup")  # query not recorded
         mock_handle.assert_called_once_with("query", **kwargs)
         mock_resolve.assert_called_once_with("resolved")
 